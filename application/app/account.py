@@ -0,0 +1,911 @@
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Vertical, Horizontal, ScrollableContainer
+from textual.screen import Screen
+from textual.widgets import Button, Header, Label, Input, Select, RadioButton, RichLog, Log, RadioSet
+from app.frontend import LoadJob, load, error_exit_page, popup_output_page, conditional_input_page, exit_page
+import app.assets as assets
+import app.frontend as fe
+import back.backend as be
+
+# Account section: identities, deposits, withdrawals, transfers and the treasurer, imported when the section is first opened
+
+class create_identity_page(Screen):
+    def compose(self) -> ComposeResult:
+        img = assets.image("snet_logo.png", assets.LOGO_SIZE)
+        yield ScrollableContainer(
+            Horizontal(
+                RichLog(id="create_identity_page_left_block").write(img),
+                Vertical(
+                    Label("Get started with the TUI", id="create_identity_page_info_label_1"),
+                    Label("Fill in all the fields and connect your Web3 account", id="create_identity_page_info_label_2"),
+                    Horizontal(
+                        Label("Identity", id="create_identity_page_name_label"),
+                        Input(placeholder="Identity Name", id="org_identity_input"),
+                        id="create_identity_name_div",
+                        classes="create_identity_div"
+                    ),
+                    Horizontal(
+                        Label("Type", id="create_identity_page_type_label"),
+                        Select(options=(("RPC", "rpc"), ("Mnemonic", "mnemonic"), ("Key", "key"), ("Trezor", "trezor"), ("Ledger", "ledger"), ("Keystore", "keystore")), prompt="Select Identity Type", id="create_identity_type_select"),
+                        id="create_identity_type_div",
+                        classes="create_identity_div"
+                    ),
+                    Horizontal(
+                        Label("Network", id="create_identity_page_network_label"),
+                        Select(options=(("Sepolia", "Sepolia"), ("Mainnet", "Mainnet")), prompt="Select Network", id="network_select"),
+                        id="create_identity_network_div",
+                        classes="create_identity_div"
+                    ),
+                    Horizontal(
+                        Label("Misc.        ", id="create_identity_page_misc_label"),
+                        Input(placeholder="Please select your identity type first", id="create_identity_misc_input"),
+                        id="create_identity_misc_div",
+                        classes="create_identity_div"
+                    ),                    
+                    Horizontal(
+                        Button("Back", id="create_identity_back_button"),
+                        Button("Create Identity", id="create_identity_button"),
+                        id="create_identity_button_div",
+                        classes="create_identity_div"
+                    ),
+                    id="create_identity_right_div",
+                    classes="create_identity_right_div_class"
+                ),
+                id="create_identity_outer_div"
+            ),
+            id="create_identity",
+            classes="create_identity_full_page"
+        )
+
+    def print_net_list(self, network_list) -> None:
+        if network_list == "retrieve_error":
+            fe.error_exit_label = "ERROR: Could not find network list, please check CLI installation and run the command 'snet network list'"
+            self.app.switch_screen(error_exit_page())
+        elif network_list == "cancel":
+            self.app.pop_screen() 
+        else:
+            self.query_one("#network_select", expect_type=Select).set_options((line, line) for line in network_list)
+
+    def on_mount(self) -> None:
+        self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_misc_div").get_child_by_id("create_identity_misc_input").visible = False
+        self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_misc_div").get_child_by_id("create_identity_page_misc_label").visible = False
+
+        self.app.submit(LoadJob(load.network_list, on_result=self.print_net_list, aprx_time="5s."))
+
+    @on(Select.Changed)
+    def on_select_changed(self, event: Select.Changed) -> None:
+        if event.select.id == "create_identity_type_select":
+            inpt: Input = self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_misc_div").get_child_by_id("create_identity_misc_input")
+            label: Label = self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_misc_div").get_child_by_id("create_identity_page_misc_label")
+            val = event.value
+
+            if val == "rpc":
+                inpt.visible = False
+                label.visible = False
+            elif val == "mnemonic":
+                inpt.visible = True
+                label.visible = True
+                inpt.placeholder = "BIP39 mnemonic seed phrase"
+                label.update("Seed Phrase  ")
+            elif val == "key":
+                inpt.visible = True
+                label.visible = True
+                inpt.placeholder = "Hex-encoded wallet private key" 
+                label.update("Private Key  ")
+            elif val == "trezor":
+                inpt.visible = False
+                label.visible = False
+            elif val == "ledger":
+                inpt.visible = False
+                label.visible = False
+            elif val == "keystore":
+                inpt.visible = True
+                label.visible = True
+                inpt.placeholder = "Path of the JSON encrypted keystore file"
+                label.update("Keystore path")
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page()) 
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            if errCode == 0:
+                fe.popup_output = output
+                if len(fe.popup_output) == 0:
+                    fe.popup_output = f"Identity created!'"
+                self.app.navigate("account")
+                self.app.push_screen(popup_output_page())
+            else:
+                fe.popup_output = output
+                if len(fe.popup_output) == 0:
+                    fe.popup_output = "ERROR: There was an error while creating the identity"
+                self.app.back_to(identity_page)
+                self.app.push_screen(popup_output_page()) 
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "create_identity_button":
+            id_name = self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_name_div").get_child_by_id("org_identity_input").value
+            network = self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_network_div").get_child_by_id("network_select").value
+            type = self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_type_div").get_child_by_id("create_identity_type_select").value
+            misc_inp = self.get_child_by_id("create_identity").get_child_by_id("create_identity_outer_div").get_child_by_id("create_identity_right_div").get_child_by_id("create_identity_misc_div").get_child_by_id("create_identity_misc_input").value
+
+            if not isinstance(id_name, str) or len(id_name) == 0:
+                fe.popup_output = "ERROR: Organization Identity cannot be blank."
+                self.app.push_screen(popup_output_page())
+            elif network == Select.BLANK:
+                fe.popup_output = "ERROR: Please select an identity network"
+                self.app.push_screen(popup_output_page())
+            elif type == Select.BLANK:
+                fe.popup_output = "ERROR: Please select an identity type" 
+                self.app.push_screen(popup_output_page())
+            if type in {"mnemonic", "key", "keystore"} and (not isinstance(misc_inp, str) or len(misc_inp) == 0):
+                fe.popup_output = "ERROR: Please input the additional information (Wallet Key, or Seed Phrase, or Keystore Path) before proceeding"
+                self.app.push_screen(popup_output_page())
+            else:
+                params = {"create_id_name": id_name, "create_id_input": misc_inp, "create_id_type": type, "create_id_net": network}
+
+                self.app.submit(LoadJob(load.create_id_page, params, on_result=self.on_res, aprx_time="5s."))
+        elif event.button.id == "create_identity_back_button":
+            self.app.pop_screen()
+                
+class account_page(Screen):
+    needs_refresh = True
+
+    def compose(self) -> ComposeResult:
+        
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Account Page", id="account_page_title"),
+                Label("Account Info:", id="account_page_info_label"),
+                Label("log_output", id="account_page_info_log"),
+                Horizontal(
+                    Button("Deposit", id="account_page_deposit_button"),
+                    Button("Withdraw", id="account_page_withdraw_button"),
+                    Button("Transfer", id="account_page_transfer_button"),
+                    id="account_page_top_button_div",
+                    classes="account_page_button_div"
+                ),
+                Horizontal(
+                    Button("Treasurer", id="account_treasurer_button"),
+                    Button("Identity Settings", id="account_page_identity_settings_button"),
+                    id="account_page_bottom_button_div",
+                    classes="account_page_button_div"
+                ),
+                id="account_page_content",
+                classes="content_page"
+            ),
+            id="account_page"
+        )
+
+    def print_info(self, account_info) -> None:
+        if account_info == "cancel":
+            self.app.go_back()
+        elif account_info == "retrieve_error":
+            fe.error_exit_label = "ERROR: Could not retrieve account information, please ensure you have created a valid identity and set it to your default identity"
+            self.app.push_screen(error_exit_page()) 
+        else:
+            self.query_one("#account_page_info_log", expect_type=Label).update(f"Account: {account_info['account']}\nETH: {account_info['ETH']}\nAGIX: {account_info['AGIX']}\nMPE: {account_info['MPE']}")
+
+    def on_screen_resume(self) -> None:
+        # Installed page: the info is reloaded each time it is opened, not when a page on top of it closes
+        if not self.needs_refresh:
+            return
+        self.needs_refresh = False
+        self.app.submit(LoadJob(load.account_info, on_result=self.print_info, aprx_time="5s."))
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "account_page_identity_settings_button":
+            self.app.push_screen(identity_page())
+        elif event.button.id == "account_page_deposit_button":
+            self.app.push_screen(account_deposit_page())
+        elif event.button.id == "account_page_withdraw_button":
+            self.app.push_screen(account_withdraw_page())
+        elif event.button.id == "account_page_transfer_button":
+            self.app.push_screen(account_transfer_page())
+        elif event.button.id == "account_treasurer_button":
+            self.app.switch_screen(treasurer_page())
+
+class treasurer_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Treasurer Page", id="treasurer_page_title"),
+                Horizontal(
+                    Button("Claim", id="treasurer_claim_button"),
+                    Button("Claim Expired", id="treasurer_claim_exp_button"),
+                    id="treasurer_upper_button_div",
+                    classes="treasurer_button_div"
+                ),
+                Horizontal(
+                    Button("Claim All", id="treasurer_claim_all_button"),
+                    id="treasurer_lower_button_div",
+                    classes="treasurer_button_div"
+                ),
+                Button("Back", id="treasurer_back_button"),
+                id="treasurer_page_content",
+                classes="content_page"
+            ),
+            id="treasurer_page"
+        )
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "treasurer_back_button":
+            self.app.navigate("account")
+        elif event.button.id == "treasurer_claim_button":
+            self.app.push_screen(treasurer_claim_page())
+        elif event.button.id == "treasurer_claim_exp_button":
+            self.app.push_screen(treasurer_claim_expr_page())
+        elif event.button.id == "treasurer_claim_all_button":
+            self.app.push_screen(treasurer_claim_all_page())
+
+
+class treasurer_claim_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Payment Claim Page", id="treasurer_claim_page_title"),
+                Horizontal(
+                    Label("Channels to claim", id="treasurer_claim_channels_label", classes="treasurer_claim_page_label"),
+                    Input(placeholder="Channels to claim", id="treasurer_claim_channels_input", classes="treasurer_claim_page_input"),
+                    id="treasurer_claim_channels_div",
+                    classes="treasurer_claim_page_div"
+                ),
+                Horizontal(
+                    Label("Daemon Endpoint", id="treasurer_claim_endpoint_label", classes="treasurer_claim_page_label"),
+                    Input(placeholder="Daemon Endpoint", id="treasurer_claim_endpoint_input", classes="treasurer_claim_page_input"),
+                    id="treasurer_claim_endpoint_div",
+                    classes="treasurer_claim_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="treasurer_claim_index_label", classes="treasurer_claim_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="treasurer_claim_index_input", classes="treasurer_claim_page_input"),
+                    id="treasurer_claim_index_div",
+                    classes="treasurer_claim_page_div"
+                ),
+                Horizontal(
+                    Label("Claim Batch Size", id="treasurer_claim_batch_label", classes="treasurer_claim_page_label"),
+                    Input(placeholder="[OPTIONAL] Channels claimed per multiChannelClaim transaction (one transaction per channel if empty)", id="treasurer_claim_batch_input", classes="treasurer_claim_page_input"),
+                    id="treasurer_claim_batch_div",
+                    classes="treasurer_claim_page_div"
+                ),
+                Label("Run Options", id="treasurer_claim_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="treasurer_claim_quiet_radio", classes="treasurer_claim_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="treasurer_claim_verbose_radio", classes="treasurer_claim_page_radio"),
+                    id="treasurer_claim_radio_set"
+                ),
+                Horizontal(
+                    Button("Back", id="treasurer_claim_back_button"),
+                    Button("Claim", id="treasurer_claim_confirm_button"),
+                    id="treasurer_claim_page_button_div",
+                    classes="treasurer_claim_page_div"
+                ),
+                id="treasurer_claim_page_content",
+                classes="content_page"
+            ),
+            id="treasurer_claim_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "treasurer_claim_back_button":
+            self.app.back_to(treasurer_page)
+        elif event.button.id == "treasurer_claim_confirm_button":
+            channels = self.get_child_by_id("treasurer_claim_page").get_child_by_id("treasurer_claim_page_content").get_child_by_id("treasurer_claim_channels_div").get_child_by_id("treasurer_claim_channels_input").value
+            endpoint = self.get_child_by_id("treasurer_claim_page").get_child_by_id("treasurer_claim_page_content").get_child_by_id("treasurer_claim_endpoint_div").get_child_by_id("treasurer_claim_endpoint_input").value
+            wallet_index = self.get_child_by_id("treasurer_claim_page").get_child_by_id("treasurer_claim_page_content").get_child_by_id("treasurer_claim_index_div").get_child_by_id("treasurer_claim_index_input").value
+            batch_size = self.get_child_by_id("treasurer_claim_page").get_child_by_id("treasurer_claim_page_content").get_child_by_id("treasurer_claim_batch_div").get_child_by_id("treasurer_claim_batch_input").value
+            quiet = self.get_child_by_id("treasurer_claim_page").get_child_by_id("treasurer_claim_page_content").get_child_by_id("treasurer_claim_radio_set").get_child_by_id("treasurer_claim_quiet_radio").value
+            verbose = self.get_child_by_id("treasurer_claim_page").get_child_by_id("treasurer_claim_page_content").get_child_by_id("treasurer_claim_radio_set").get_child_by_id("treasurer_claim_verbose_radio").value
+
+            if not isinstance(channels, str) or len(channels) <= 0:
+                fe.popup_output = "ERROR: Please input the channels to claim"
+                self.app.push_screen(popup_output_page())
+            elif not isinstance(endpoint, str) or len(endpoint) <= 0: 
+                fe.popup_output = "ERROR: Please input daemon endpoint"
+                self.app.push_screen(popup_output_page())
+            else:
+                params = {"channels": channels, "endpoint": endpoint, "wallet": wallet_index, "quiet": quiet, "verbose": verbose, "batch": batch_size}
+                self.app.submit(LoadJob(load.treasurer_claim, params, on_result=self.on_res, aprx_time="10s."))
+
+class treasurer_claim_all_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Claim All Payments Page", id="treasurer_claim_all_page_title"),
+                Horizontal(
+                    Label("Daemon Endpoint", id="treasurer_claim_all_endpoint_label", classes="treasurer_claim_all_page_label"),
+                    Input(placeholder="Daemon Endpoint", id="treasurer_claim_all_endpoint_input", classes="treasurer_claim_all_page_input"),
+                    id="treasurer_claim_all_endpoint_div",
+                    classes="treasurer_claim_all_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="treasurer_claim_all_index_label", classes="treasurer_claim_all_page_label"),
+                    Input(placeholder="[OPTIONAL] Account to use for signing (defaults to session.identity.default_wallet_index)", id="treasurer_claim_all_index_input", classes="treasurer_claim_all_page_input"),
+                    id="treasurer_claim_all_index_div",
+                    classes="treasurer_claim_all_page_div"
+                ),
+                Horizontal(
+                    Label("Claim Batch Size", id="treasurer_claim_all_batch_label", classes="treasurer_claim_all_page_label"),
+                    Input(placeholder="[OPTIONAL] Channels claimed per multiChannelClaim transaction (one transaction per channel if empty)", id="treasurer_claim_all_batch_input", classes="treasurer_claim_all_page_input"),
+                    id="treasurer_claim_all_batch_div",
+                    classes="treasurer_claim_all_page_div"
+                ),
+                Label("Run Options", id="treasurer_claim_all_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="treasurer_claim_all_quiet_radio", classes="treasurer_claim_all_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="treasurer_claim_all_verbose_radio", classes="treasurer_claim_all_page_radio"),
+                    id="treasurer_claim_all_radio_set"
+                ),
+                Horizontal(
+                    Button("Back", id="treasurer_claim_all_back_button"),
+                    Button("Claim", id="treasurer_claim_all_confirm_button"),
+                    id="treasurer_claim_all_page_button_div",
+                    classes="treasurer_claim_all_page_div"
+                ),
+                id="treasurer_claim_all_page_content",
+                classes="content_page"
+            ),
+            id="treasurer_claim_all_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "treasurer_claim_all_back_button":
+            self.app.back_to(treasurer_page)
+        elif event.button.id == "treasurer_claim_all_confirm_button":
+            endpoint = self.get_child_by_id("treasurer_claim_all_page").get_child_by_id("treasurer_claim_all_page_content").get_child_by_id("treasurer_claim_all_endpoint_div").get_child_by_id("treasurer_claim_all_endpoint_input").value
+            wallet_index = self.get_child_by_id("treasurer_claim_all_page").get_child_by_id("treasurer_claim_all_page_content").get_child_by_id("treasurer_claim_all_index_div").get_child_by_id("treasurer_claim_all_index_input").value
+            batch_size = self.get_child_by_id("treasurer_claim_all_page").get_child_by_id("treasurer_claim_all_page_content").get_child_by_id("treasurer_claim_all_batch_div").get_child_by_id("treasurer_claim_all_batch_input").value
+            quiet = self.get_child_by_id("treasurer_claim_all_page").get_child_by_id("treasurer_claim_all_page_content").get_child_by_id("treasurer_claim_all_radio_set").get_child_by_id("treasurer_claim_all_quiet_radio").value
+            verbose = self.get_child_by_id("treasurer_claim_all_page").get_child_by_id("treasurer_claim_all_page_content").get_child_by_id("treasurer_claim_all_radio_set").get_child_by_id("treasurer_claim_all_verbose_radio").value
+            
+            if not isinstance(endpoint, str) or len(endpoint) <= 0:
+                fe.popup_output = "ERROR: Daemon endpoint is a required input"
+                self.app.push_screen(popup_output_page())
+            else:
+                params = {"ep": endpoint, "wallet": wallet_index, "quiet": quiet, "verbose": verbose, "batch": batch_size}
+                self.app.submit(LoadJob(load.treasurer_claim_all, params, on_result=self.on_res, aprx_time="10s."))
+            
+class treasurer_claim_expr_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Claim expired payments Page", id="treasurer_claim_expr_page_title"),
+                Horizontal(
+                    Label("Daemon Endpoint", id="treasurer_claim_expr_endpoint_label", classes="treasurer_claim_expr_page_label"),
+                    Input(placeholder="Daemon Endpoint", id="treasurer_claim_expr_endpoint_input", classes="treasurer_claim_expr_page_input"),
+                    id="treasurer_claim_expr_endpoint_div",
+                    classes="treasurer_claim_expr_page_div"
+                ),
+                Horizontal(
+                    Label("Expir. Threshold", id="treasurer_claim_expr_threshold_label", classes="treasurer_claim_expr_page_label"),
+                    Input(placeholder="[OPTIONAL] Service expiration threshold in blocks (default is 34560 ~ 6 days with 15s/block)", id="treasurer_claim_expr_threshold_input", classes="treasurer_claim_expr_page_input"),
+                    id="treasurer_claim_expr_threshold_div",
+                    classes="treasurer_claim_expr_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="treasurer_claim_expr_index_label", classes="treasurer_claim_expr_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="treasurer_claim_expr_index_input", classes="treasurer_claim_expr_page_input"),
+                    id="treasurer_claim_expr_index_div",
+                    classes="treasurer_claim_expr_page_div"
+                ),
+                Horizontal(
+                    Label("Claim Batch Size", id="treasurer_claim_expr_batch_label", classes="treasurer_claim_expr_page_label"),
+                    Input(placeholder="[OPTIONAL] Channels claimed per multiChannelClaim transaction (one transaction per channel if empty)", id="treasurer_claim_expr_batch_input", classes="treasurer_claim_expr_page_input"),
+                    id="treasurer_claim_expr_batch_div",
+                    classes="treasurer_claim_expr_page_div"
+                ),
+                Label("Run Options", id="treasurer_claim_expr_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="treasurer_claim_expr_quiet_radio", classes="treasurer_claim_expr_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="treasurer_claim_expr_verbose_radio", classes="treasurer_claim_expr_page_radio"),
+                    id="treasurer_claim_expr_radio_set"
+                ),
+                Horizontal(
+                    Button("Back", id="treasurer_claim_expr_back_button"),
+                    Button("Claim", id="treasurer_claim_expr_confirm_button"),
+                    id="treasurer_claim_expr_page_button_div",
+                    classes="treasurer_claim_expr_page_div"
+                ),
+                id="treasurer_claim_expr_page_content",
+                classes="content_page"
+            ),
+            id="treasurer_claim_expr_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "treasurer_claim_expr_back_button":
+            self.app.back_to(treasurer_page)
+        elif event.button.id == "treasurer_claim_expr_confirm_button":
+            threshold = self.get_child_by_id("treasurer_claim_expr_page").get_child_by_id("treasurer_claim_expr_page_content").get_child_by_id("treasurer_claim_expr_threshold_div").get_child_by_id("treasurer_claim_expr_threshold_input").value
+            endpoint = self.get_child_by_id("treasurer_claim_expr_page").get_child_by_id("treasurer_claim_expr_page_content").get_child_by_id("treasurer_claim_expr_endpoint_div").get_child_by_id("treasurer_claim_expr_endpoint_input").value
+            wallet_index = self.get_child_by_id("treasurer_claim_expr_page").get_child_by_id("treasurer_claim_expr_page_content").get_child_by_id("treasurer_claim_expr_index_div").get_child_by_id("treasurer_claim_expr_index_input").value
+            batch_size = self.get_child_by_id("treasurer_claim_expr_page").get_child_by_id("treasurer_claim_expr_page_content").get_child_by_id("treasurer_claim_expr_batch_div").get_child_by_id("treasurer_claim_expr_batch_input").value
+            quiet = self.get_child_by_id("treasurer_claim_expr_page").get_child_by_id("treasurer_claim_expr_page_content").get_child_by_id("treasurer_claim_expr_radio_set").get_child_by_id("treasurer_claim_expr_quiet_radio").value
+            verbose = self.get_child_by_id("treasurer_claim_expr_page").get_child_by_id("treasurer_claim_expr_page_content").get_child_by_id("treasurer_claim_expr_radio_set").get_child_by_id("treasurer_claim_expr_verbose_radio").value
+
+            if not isinstance(endpoint, str) or len(endpoint) <= 0:
+                fe.popup_output = "ERROR: Daemon endpoint is a required input"
+                self.app.push_screen(popup_output_page())
+            else:
+                params = {"thres": threshold, "ep": endpoint, "wallet": wallet_index, "quiet": quiet, "verbose": verbose, "batch": batch_size}
+                self.app.submit(LoadJob(load.treasurer_claim_expr, params, on_result=self.on_res, aprx_time="10s."))
+
+class identity_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Identity Page", id="identity_page_title"),
+                Label("Identity Info Section:", id="identity_page_log_label"),
+                Log(id="identity_page_log", auto_scroll=False),
+                Button("Create Identity Page", id="identity_page_create_identity_button"),
+                Label("Identity Delete Section:", id="identity_page_delete_label"),
+                Input(placeholder="Identity name to delete", id="identity_page_delete_input"),
+                Button("Delete Identity", id="identity_page_delete_identity_button"),
+                Button("Back", id="identity_page_back_button"),
+                id="identity_page_content",
+                classes="content_page"
+            ),
+            id="identity_page"
+        )
+
+    def id_list_update(self, idList: str) -> None:
+        if idList != "cancel":
+            self.query_one(Log).write(f"Identity List:\n\n{idList}")
+        else:
+            self.app.pop_screen()
+
+    def on_mount(self) -> None:
+        self.app.submit(LoadJob(load.id_page, on_result=self.id_list_update, aprx_time="5s."))
+    
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            if len(output) == 0 and errCode == 0:
+                output = f"Identity deleted!"
+            fe.popup_output = output
+            self.app.switch_screen(identity_page())
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "identity_page_create_identity_button":
+            self.app.push_screen(create_identity_page())
+        elif event.button.id == "identity_page_back_button":
+            self.app.navigate("account")
+        elif event.button.id == "identity_page_delete_identity_button":
+            id_name = self.get_child_by_id("identity_page").get_child_by_id("identity_page_content").get_child_by_id("identity_page_delete_input").value
+            if not isinstance(id_name, str) or len(id_name) == 0:
+                fe.popup_output = "ERROR: Please enter the name of the Identity to be deleted"
+                self.app.push_screen(popup_output_page())
+            else:
+                params = {"id": id_name}
+                self.app.submit(LoadJob(load.identity_delete, params, on_result=self.on_res, aprx_time="5s."))
+
+class account_deposit_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Deposit AGIX Tokens", id="account_deposit_page_title"),
+                Horizontal(
+                    Label("Amount to Deposit", id="account_deposit_amount_label", classes="account_deposit_page_label"),
+                    Input(placeholder="Amount of AGIX tokens to deposit in MPE wallet", id="account_deposit_amount_input", classes="account_deposit_page_input"),
+                    id="account_deposit_amount_div",
+                    classes="account_deposit_page_div"
+                ),
+                Horizontal(
+                    Label("Token Address", id="account_deposit_contract_label", classes="account_deposit_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of SingularityNetToken contract, if not specified we read address from 'networks'", id="account_deposit_contract_input", classes="account_deposit_page_input"),
+                    id="account_deposit_contract_div",
+                    classes="account_deposit_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="account_deposit_mpe_label", classes="account_deposit_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from 'networks'", id="account_deposit_mpe_input", classes="account_deposit_page_input"),
+                    id="account_deposit_mpe_div",
+                    classes="account_deposit_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="account_deposit_index_label", classes="account_deposit_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="account_deposit_index_input", classes="account_deposit_page_input"),
+                    id="account_deposit_index_div",
+                    classes="account_deposit_page_div"
+                ),
+                Label("Run Options", id="account_deposit_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="account_deposit_quiet_radio", classes="account_deposit_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="account_deposit_verbose_radio", classes="account_deposit_page_radio"),
+                    id="account_deposit_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="account_deposit_back_button"),
+                    Button(label="Deposit", id="account_deposit_confirm_button"),
+                    id="account_deposit_button_div",
+                    classes="account_deposit_page_div"
+                ),
+                id="account_deposit_page_content",
+                classes="content_page"
+            ),
+            id="account_deposit_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())     
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "account_deposit_back_button":
+            self.app.navigate("account")
+        elif event.button.id == "account_deposit_confirm_button":
+            agi_amount = self.get_child_by_id("account_deposit_page").get_child_by_id("account_deposit_page_content").get_child_by_id("account_deposit_amount_div").get_child_by_id("account_deposit_amount_input").value
+            contract_address = self.get_child_by_id("account_deposit_page").get_child_by_id("account_deposit_page_content").get_child_by_id("account_deposit_contract_div").get_child_by_id("account_deposit_contract_input").value
+            mpe_address = self.get_child_by_id("account_deposit_page").get_child_by_id("account_deposit_page_content").get_child_by_id("account_deposit_mpe_div").get_child_by_id("account_deposit_mpe_input").value
+            wallet_index = self.get_child_by_id("account_deposit_page").get_child_by_id("account_deposit_page_content").get_child_by_id("account_deposit_index_div").get_child_by_id("account_deposit_index_input").value
+            quiet = self.get_child_by_id("account_deposit_page").get_child_by_id("account_deposit_page_content").get_child_by_id("account_deposit_radio_set").get_child_by_id("account_deposit_quiet_radio").value
+            verbose = self.get_child_by_id("account_deposit_page").get_child_by_id("account_deposit_page_content").get_child_by_id("account_deposit_radio_set").get_child_by_id("account_deposit_verbose_radio").value
+
+            params = {
+                "agi": agi_amount, 
+                "cont_addr": contract_address,
+                "mpe_addr": mpe_address,
+                "wallet": wallet_index,
+                "quiet": quiet,
+                "verbose": verbose,
+            }
+            self.app.submit(LoadJob(load.account_deposit, params, on_result=self.on_res, aprx_time="10s."))
+
+class account_withdraw_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Withdraw AGIX Tokens", id="account_withdraw_page_title"),
+                Horizontal(
+                    Label("Amount", id="account_withdraw_amount_label", classes="account_withdraw_page_label"),
+                    Input(placeholder="Amount of AGIX tokens to withdraw from MPE wallet", id="account_withdraw_amount_input", classes="account_withdraw_page_input"),
+                    id="account_withdraw_amount_div",
+                    classes="account_withdraw_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="account_withdraw_mpe_label", classes="account_withdraw_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from 'networks'", id="account_withdraw_mpe_input", classes="account_withdraw_page_input"),
+                    id="account_withdraw_mpe_div",
+                    classes="account_withdraw_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="account_withdraw_index_label", classes="account_withdraw_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="account_withdraw_index_input", classes="account_withdraw_page_input"),
+                    id="account_withdraw_index_div",
+                    classes="account_withdraw_page_div"
+                ),
+                Label("Run Options", id="account_withdraw_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="account_withdraw_quiet_radio", classes="account_withdraw_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="account_withdraw_verbose_radio", classes="account_withdraw_page_radio"),
+                    id="account_withdraw_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="account_withdraw_back_button"),
+                    Button(label="Withdraw", id="account_withdraw_confirm_button"),
+                    id="account_withdraw_button_div",
+                    classes="account_withdraw_page_div"
+                ),
+                id="account_withdraw_page_content",
+                classes="content_page"
+            ),
+            id="account_withdraw_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "account_withdraw_back_button":
+            self.app.navigate("account")
+        elif event.button.id == "account_withdraw_confirm_button":
+            agi_amount = self.get_child_by_id("account_withdraw_page").get_child_by_id("account_withdraw_page_content").get_child_by_id("account_withdraw_amount_div").get_child_by_id("account_withdraw_amount_input").value
+            mpe_address = self.get_child_by_id("account_withdraw_page").get_child_by_id("account_withdraw_page_content").get_child_by_id("account_withdraw_mpe_div").get_child_by_id("account_withdraw_mpe_input").value
+            wallet_index = self.get_child_by_id("account_withdraw_page").get_child_by_id("account_withdraw_page_content").get_child_by_id("account_withdraw_index_div").get_child_by_id("account_withdraw_index_input").value
+            quiet = self.get_child_by_id("account_withdraw_page").get_child_by_id("account_withdraw_page_content").get_child_by_id("account_withdraw_radio_set").get_child_by_id("account_withdraw_quiet_radio").value
+            verbose = self.get_child_by_id("account_withdraw_page").get_child_by_id("account_withdraw_page_content").get_child_by_id("account_withdraw_radio_set").get_child_by_id("account_withdraw_verbose_radio").value
+
+            params = {
+                "agi": agi_amount, 
+                "mpe_addr": mpe_address,
+                "wallet": wallet_index,
+                "quiet": quiet,
+                "verbose": verbose,
+            }
+            self.app.submit(LoadJob(load.account_withdraw, params, on_result=self.on_res, aprx_time="10s."))
+
+class account_transfer_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("account"),
+            ScrollableContainer(
+                Label("Transfer AGIX Tokens", id="account_transfer_page_title"),
+                Horizontal(
+                    Label("Receiver Address", id="account_transfer_addr_label", classes="account_transfer_page_label"),
+                    Input(placeholder="Address of the receiver", id="account_transfer_addr_input", classes="account_transfer_page_input"),
+                    id="account_transfer_addr_div",
+                    classes="account_transfer_page_div"
+                ),
+                Horizontal(
+                    Label("Amount to Transfer", id="account_transfer_amount_label", classes="account_transfer_page_label"),
+                    Input(placeholder="Amount of AGIX tokens to be transferred to another account inside MPE wallet", id="account_transfer_amount_input", classes="account_transfer_page_input"),
+                    id="account_transfer_amount_div",
+                    classes="account_transfer_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="account_transfer_mpe_label", classes="account_transfer_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from 'networks'", id="account_transfer_mpe_input", classes="account_transfer_page_input"),
+                    id="account_transfer_mpe_div",
+                    classes="account_transfer_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="account_transfer_index_label", classes="account_transfer_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="account_transfer_index_input", classes="account_transfer_page_input"),
+                    id="account_transfer_index_div",
+                    classes="account_transfer_page_div"
+                ),
+                Label("Run Options", id="account_transfer_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="account_transfer_quiet_radio", classes="account_transfer_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="account_transfer_verbose_radio", classes="account_transfer_page_radio"),
+                    id="account_transfer_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="account_transfer_back_button"),
+                    Button(label="Transfer", id="account_transfer_confirm_button"),
+                    id="account_transfer_button_div",
+                    classes="account_transfer_page_div"
+                ),
+                id="account_transfer_page_content",
+                classes="content_page"
+            ),
+            id="account_transfer_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "account_transfer_back_button":
+            self.app.navigate("account")
+        elif event.button.id == "account_transfer_confirm_button":
+            agi_amount = self.get_child_by_id("account_transfer_page").get_child_by_id("account_transfer_page_content").get_child_by_id("account_transfer_amount_div").get_child_by_id("account_transfer_amount_input").value
+            reciever_addr = self.get_child_by_id("account_transfer_page").get_child_by_id("account_transfer_page_content").get_child_by_id("account_transfer_addr_div").get_child_by_id("account_transfer_addr_input").value
+            mpe_address = self.get_child_by_id("account_transfer_page").get_child_by_id("account_transfer_page_content").get_child_by_id("account_transfer_mpe_div").get_child_by_id("account_transfer_mpe_input").value
+            wallet_index = self.get_child_by_id("account_transfer_page").get_child_by_id("account_transfer_page_content").get_child_by_id("account_transfer_index_div").get_child_by_id("account_transfer_index_input").value
+            quiet = self.get_child_by_id("account_transfer_page").get_child_by_id("account_transfer_page_content").get_child_by_id("account_transfer_radio_set").get_child_by_id("account_transfer_quiet_radio").value
+            verbose = self.get_child_by_id("account_transfer_page").get_child_by_id("account_transfer_page_content").get_child_by_id("account_transfer_radio_set").get_child_by_id("account_transfer_verbose_radio").value
+
+            params = {
+                "agi": agi_amount,
+                "rec_addr": reciever_addr,
+                "mpe_addr": mpe_address,
+                "wallet": wallet_index,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+
+            self.app.submit(LoadJob(load.account_transfer, params, on_result=self.on_res, aprx_time="10s."))
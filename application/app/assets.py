@@ -0,0 +1,93 @@
+import hashlib
+import json
+import os
+import sys
+from rich.segment import Segment, Segments
+from rich.style import Style
+
+# Pre-rendered image assets. Rendering a PNG with rich_pixels decodes and scales it with PIL and
+# builds one styled segment per cell, so the segments are kept on disk, keyed by the image's hash
+# and the target size, and only a miss imports PIL. Rendered images are also kept in memory, a
+# screen composed again reuses them as they are.
+#
+# Usage (renders the logos at the sizes the TUI uses, e.g. when building a release):
+#   python -m app.assets
+
+CACHE_DIR = os.path.join(os.environ.get("SNET_TUI_DATA_DIR", os.path.join(os.path.expanduser("~"), ".snet", "tui")), "assets")
+
+LOGO_SIZE = (32, 45)
+PRERENDER = {
+    "snet_logo.png": [LOGO_SIZE],
+    "snet_logo_up.png": [LOGO_SIZE]
+}
+
+_rendered = {}
+
+
+def asset_path(name):
+    # Same layout as frontend.resource_path, also inside a PyInstaller bundle
+    base_path = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, "assets", name)
+
+
+def _cache_path(digest, size):
+    return os.path.join(CACHE_DIR, f"{digest[:32]}-{size[0]}x{size[1]}-fullcell.json")
+
+
+def _render(path, size):
+    # The only place PIL is needed
+    from PIL import Image
+    from rich_pixels import FullcellRenderer
+    with Image.open(path) as source:
+        return list(FullcellRenderer().render(source, size))
+
+
+def _load(cache_path):
+    try:
+        with open(cache_path) as f:
+            return [Segment(text, Style.parse(style) if style else None) for text, style in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _store(cache_path, segments):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump([[segment.text, str(segment.style) if segment.style else None] for segment in segments], f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def image_digest(name):
+    with open(asset_path(name), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def image(name, size=LOGO_SIZE):
+    # Renderable of assets/`name` scaled to size (width, height), for RichLog.write() and friends
+    path = asset_path(name)
+    digest = image_digest(name)
+    key = (digest, tuple(size))
+    if key not in _rendered:
+        cache_path = _cache_path(digest, size)
+        segments = _load(cache_path)
+        if segments is None:
+            segments = _render(path, size)
+            _store(cache_path, segments)
+        _rendered[key] = Segments(segments)
+    return _rendered[key]
+
+
+def main():
+    for name, sizes in PRERENDER.items():
+        for size in sizes:
+            image(name, size)
+            print(f"{name} {size[0]}x{size[1]}: {_cache_path(image_digest(name), size)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
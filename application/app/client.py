@@ -0,0 +1,2293 @@
+from textual import on
+from textual.app import ComposeResult
+from textual.containers import Horizontal, ScrollableContainer
+from textual.screen import Screen
+from textual.widgets import Button, Header, Label, Input, RadioButton, Log, RadioSet, DataTable
+from app.frontend import LoadJob, load, popup_output_page, conditional_input_page, exit_page
+import app.frontend as fe
+import back.backend as be
+
+# Client section: service calls and payment channels, imported when the section is first opened
+
+class client_page(Screen):
+    needs_refresh = True
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Client Page", id="client_page_title"),
+                Label("Initialized Channels Info:", id="client_page_log_label"),
+                Log(id="client_page_info_log", auto_scroll=False),
+                Horizontal(
+                    Button(label="Call", id="client_page_call_button", classes="client_page_button"),
+                    Button(label="Call low level", id="client_page_call_low_button", classes="client_page_button"),
+                    id="client_page_upper_button_div",
+                    classes="client_page_div"
+                ),
+                Horizontal(
+                    Button(label="Channels", id="client_page_channel_button", classes="client_page_button"),
+                    Button(label="Get channel state", id="client_page_channel_state_button", classes="client_page_button"),
+                    id="client_page_lower_button_div",
+                    classes="client_page_div"
+                ),
+                id="client_page_content",
+                classes="content_page"
+            ),
+            id="client_page"
+        )
+    
+    def print_info(self, channels) -> None:
+        if channels == "cancel":
+            self.app.go_back()
+        elif channels == "retrieve_error":
+            fe.popup_output = "ERROR: Could not retrieve initialized channel information"
+            self.app.push_screen(popup_output_page()) 
+        else:
+            log = self.query_one("#client_page_info_log", expect_type=Log)
+            log.clear()
+            log.write(f"My Initialized channels:\n\n{be.format_channel_records(channels)}")
+
+    def on_screen_resume(self) -> None:
+        # Installed page: the info is reloaded each time it is opened, not when a page on top of it closes
+        if not self.needs_refresh:
+            return
+        self.needs_refresh = False
+        self.app.submit(LoadJob(load.init_channels, on_result=self.print_info, aprx_time="10s."))
+     
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "client_page_call_button":
+            self.app.push_screen(client_call_page())
+        elif event.button.id == "client_page_call_low_button":
+            self.app.push_screen(client_call_low_page())
+        elif event.button.id == "client_page_channel_state_button":
+            self.app.push_screen(client_channel_state_page())
+        elif event.button.id == "client_page_channel_button":
+            self.app.push_screen(channel_page())
+
+class client_call_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Client Call Server Page", id="client_call_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="client_call_org_id_label", classes="client_call_page_label"),
+                    Input(placeholder="Id of the organization", id="client_call_org_id_input", classes="client_call_page_input"),
+                    id="client_call_page_org_id_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Service ID", id="client_call_service_id_label", classes="client_call_page_label"),
+                    Input(placeholder="Id of service", id="client_call_service_id_input", classes="client_call_page_input"),
+                    id="client_call_page_service_id_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Service Method", id="client_call_method_label", classes="client_call_page_label"),
+                    Input(placeholder="Target service's method name to call", id="client_call_method_input", classes="client_call_page_input"),
+                    id="client_call_page_method_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Parameters", id="client_call_params_label", classes="client_call_page_label"),
+                    Input(placeholder="Path to file containing JSON-serialized parameters object", id="client_call_params_input", classes="client_call_page_input"),
+                    id="client_call_page_params_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="client_call_pay_group_label", classes="client_call_page_label"),
+                    Input(placeholder="Payment group of the service", id="client_call_pay_group_input", classes="client_call_page_input"),
+                    id="client_call_page_pay_group_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Proto Service", id="client_call_service_label", classes="client_call_page_label"),
+                    Input(placeholder="[OPTIONAL] It should be specified in case of method name conflict.", id="client_call_service_input", classes="client_call_page_input"),
+                    id="client_call_page_service_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="client_call_mpe_addr_label", classes="client_call_page_label"),
+                    Input(placeholder="[OPTIONAL] If not specified we read address from “networks”", id="client_call_mpe_addr_input", classes="client_call_page_input"),
+                    id="client_call_page_mpe_addr_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Save File Path", id="client_call_file_name_label", classes="client_call_page_label"),
+                    Input(placeholder="[OPTIONAL] Name/Path of file to save response to", id="client_call_save_file_name_input", classes="client_call_page_input"),
+                    id="client_call_page_file_name_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Service Endpoint", id="client_call_endpoint_label", classes="client_call_page_label"),
+                    Input(placeholder="[OPTIONAL] (by default we read it from metadata)", id="client_call_endpoint_input", classes="client_call_page_input"),
+                    id="client_call_page_endpoint_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Channel ID", id="client_call_channel_id_label", classes="client_call_page_label"),
+                    Input(placeholder="[OPTIONAL] (in case of multiple initialized channels for same payment group)", id="client_call_channel_id_input", classes="client_call_page_input"),
+                    id="client_call_page_channel_id_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Block Number", id="client_call_from_block_label", classes="client_call_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block (for channel searching). Default = 0", id="client_call_from_block_input", classes="client_call_page_input"),
+                    id="client_call_page_from_block_div",
+                    classes="client_call_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="client_call_wallet_index_label", classes="client_call_page_label"),
+                    Input(placeholder="[OPTIONAL] (defaults to session.identity.default_wallet_index)", id="client_call_wallet_index_input", classes="client_call_page_input"),
+                    id="client_call_page_wallet_index_div",
+                    classes="client_call_page_div"
+                ),
+                Label("Run Options", id="client_call_page_run_options_label"),
+                RadioButton(label="Skip check for service update", id="client_call_skip_update_check_radio"),
+                Horizontal(
+                    Button(label="Back", id="client_call_back_button"),
+                    Button(label="View Server Call Price", id="client_call_view_price_button"),
+                    id="client_call_page_button_div",
+                    classes="client_call_page_div"
+                ),
+                id="client_call_page_content",
+                classes="content_page"
+            ),
+            id="client_call_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="1 minute"))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "client_call_back_button":
+            self.app.navigate("client")
+        elif event.button.id == "client_call_view_price_button":
+            org_id = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_org_id_div").get_child_by_id("client_call_org_id_input").value
+            serv_id = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_service_id_div").get_child_by_id("client_call_service_id_input").value
+            group_name = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_pay_group_div").get_child_by_id("client_call_pay_group_input").value
+            method = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_method_div").get_child_by_id("client_call_method_input").value
+            params = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_params_div").get_child_by_id("client_call_params_input").value
+            proto_serv = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_service_div").get_child_by_id("client_call_service_input").value
+            mpe_addr = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_mpe_addr_div").get_child_by_id("client_call_mpe_addr_input").value
+            file_name = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_file_name_div").get_child_by_id("client_call_save_file_name_input").value
+            endpoint = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_endpoint_div").get_child_by_id("client_call_endpoint_input").value
+            channel_id = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_channel_id_div").get_child_by_id("client_call_channel_id_input").value
+            from_block = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_from_block_div").get_child_by_id("client_call_from_block_input").value
+            wallet_index = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_page_wallet_index_div").get_child_by_id("client_call_wallet_index_input").value
+            skip_update = self.get_child_by_id("client_call_page").get_child_by_id("client_call_page_content").get_child_by_id("client_call_skip_update_check_radio").value
+
+            params = {
+                "org_id": org_id,
+                "serv_id": serv_id,
+                "group_name": group_name,
+                "method": method,
+                "params": params,
+                "proto_serv": proto_serv,
+                "mpe_addr": mpe_addr,
+                "file": file_name,
+                "ep": endpoint,
+                "chan_id": channel_id,
+                "block": from_block,
+                "wallet": wallet_index,
+                "skip": skip_update
+            }
+            self.app.submit(LoadJob(load.client_call, params, on_result=self.on_res, aprx_time="1 minute"))
+
+class client_call_low_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Client Call Server (Low Level function) Page", id="client_call_low_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="client_call_low_page_org_id_label", classes="client_call_low_page_label"),
+                    Input(placeholder="Id of the organization", id="client_call_low_org_id_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_org_id_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Service ID", id="client_call_low_page_service_id_label", classes="client_call_low_page_label"),
+                    Input(placeholder="Id of service", id="client_call_low_service_id_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_service_id_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Channel ID", id="client_call_low_page_channel_id_label", classes="client_call_low_page_label"),
+                    Input(placeholder="The Channel Id", id="client_call_low_channel_id_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_channel_id_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Nonce", id="client_call_low_page_nonce_label", classes="client_call_low_page_label"),
+                    Input(placeholder="Nonce of the channel", id="client_call_low_nonce_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_nonce_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Amount of AGIX", id="client_call_low_page_cogs_label", classes="client_call_low_page_label"),
+                    Input(placeholder="Amount in AGIX", id="client_call_low_cogs_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_cogs_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Service Method", id="client_call_low_page_method_label", classes="client_call_low_page_label"),
+                    Input(placeholder="Target service's method name to call", id="client_call_low_method_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_method_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Parameters", id="client_call_low_page_params_label", classes="client_call_low_page_label"),
+                    Input(placeholder="Path to file containing JSON-serialized parameters object", id="client_call_low_params_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_params_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="client_call_low_page_pay_group_label", classes="client_call_low_page_label"),
+                    Input(placeholder="Name of the payment group", id="client_call_low_pay_group_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_pay_group_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Proto Service", id="client_call_low_page_service_label", classes="client_call_low_page_label"),
+                    Input(placeholder="[OPTIONAL] Name of protobuf service to call. It should be specified in case of method name conflict.", id="client_call_low_service_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_service_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="client_call_low_page_mpe_addr_label", classes="client_call_low_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="client_call_low_mpe_addr_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_mpe_addr_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("File Path", id="client_call_low_page_file_name_label", classes="client_call_low_page_label"),
+                    Input(placeholder="[OPTIONAL] Path/Name of file to save response to", id="client_call_low_save_file_name_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_file_name_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Service Endpoint", id="client_call_low_page_service_endpoint_label", classes="client_call_low_page_label"),
+                    Input(placeholder="[OPTIONAL] Service endpoint (by default we read it from metadata)", id="client_call_low_endpoint_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_endpoint_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="client_call_low_page_wallet_index_label", classes="client_call_low_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling (defaults to session.identity.default_wallet_index)", id="client_call_low_wallet_index_input", classes="client_call_low_page_input"),
+                    id="client_call_low_page_wallet_index_div",
+                    classes="client_call_low_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="client_call_low_back_button"),
+                    Button(label="View Server Low-Level Call Price", id="client_call_low_view_price_button"),
+                    id="client_call_low_page_button_div",
+                    classes="client_call_low_page_div"
+                ),
+                id="client_call_low_page_content",
+                classes="content_page"
+            ),
+            id="client_call_low_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "client_call_low_back_button":
+            self.app.navigate("client")
+        elif event.button.id == "client_call_low_view_price_button":
+            org_id = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_org_id_div").get_child_by_id("client_call_low_org_id_input").value
+            serv_id = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_service_id_div").get_child_by_id("client_call_low_service_id_input").value
+            group_name = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_pay_group_div").get_child_by_id("client_call_low_pay_group_input").value
+            channel_id = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_channel_id_div").get_child_by_id("client_call_low_channel_id_input").value
+            nonce = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_nonce_div").get_child_by_id("client_call_low_nonce_input").value
+            cog_amt = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_cogs_div").get_child_by_id("client_call_low_cogs_input").value
+            method = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_method_div").get_child_by_id("client_call_low_method_input").value
+            params = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_params_div").get_child_by_id("client_call_low_params_input").value
+            proto_serv = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_service_div").get_child_by_id("client_call_low_service_input").value
+            mpe_addr = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_mpe_addr_div").get_child_by_id("client_call_low_mpe_addr_input").value
+            file_name = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_file_name_div").get_child_by_id("client_call_low_save_file_name_input").value
+            endpoint = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_endpoint_div").get_child_by_id("client_call_low_endpoint_input").value
+            wallet_index = self.get_child_by_id("client_call_low_page").get_child_by_id("client_call_low_page_content").get_child_by_id("client_call_low_page_wallet_index_div").get_child_by_id("client_call_low_wallet_index_input").value
+
+            params = {
+                "org_id": org_id,
+                "serv_id": serv_id,
+                "group_name": group_name,
+                "chan_id": channel_id,
+                "nonce": nonce,
+                "cogs": cog_amt,
+                "method": method,
+                "params": params,
+                "proto_serv": proto_serv,
+                "mpe_addr": mpe_addr,
+                "file": file_name,
+                "ep": endpoint,
+                "wallet": wallet_index,
+            }
+            self.app.submit(LoadJob(load.client_call_low, params, on_result=self.on_res, aprx_time="1 minute"))
+
+class client_channel_state_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Client Channel State Page", id="client_channel_state_page_title"),
+                Horizontal(
+                    Label("Channel ID", id="client_channel_state_page_channel_id_label", classes="client_channel_state_page_label"),
+                    Input(placeholder="The Channel Id", id="client_channel_state_id_input", classes="client_channel_state_page_input"),
+                    id="client_channel_state_page_channel_id_div",
+                    classes="client_channel_state_page_div"
+                ),
+                
+                Horizontal(
+                    Label("Service Endpoint", id="client_channel_state_page_endpoint_label", classes="client_channel_state_page_label"),
+                    Input(placeholder="Service endpoint", id="client_channel_state_endpoint_input", classes="client_channel_state_page_input"),
+                    id="client_channel_state_page_endpoint_div",
+                    classes="client_channel_state_page_div"
+                ),
+                
+                Horizontal(
+                    Label("MPE Address", id="client_channel_state_page_mpe_addr_label", classes="client_channel_state_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="client_channel_state_mpe_addr_input", classes="client_channel_state_page_input"),
+                    id="client_channel_state_page_mpe_addr_div",
+                    classes="client_channel_state_page_div"
+                ),
+                
+                Horizontal(
+                    Label("Wallet Index", id="client_channel_state_page_wallet_index_label", classes="client_channel_state_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling (defaults to session.identity.default_wallet_index)", id="client_channel_state_wallet_index_input", classes="client_channel_state_page_input"),
+                    id="client_channel_state_page_wallet_index_div",
+                    classes="client_channel_state_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="client_channel_state_back_button"),
+                    Button(label="Get Channel State", id="client_channel_state_submit_button"),
+                    id="client_channel_state_page_button_div",
+                    classes="client_channel_state_page_div"
+                ),
+                id="client_channel_state_page_content",
+                classes="content_page"
+            ),
+            id="client_channel_state_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "client_channel_state_back_button":
+            self.app.navigate("client")
+        elif event.button.id == "client_channel_state_submit_button":
+            channel_id = self.get_child_by_id("client_channel_state_page").get_child_by_id("client_channel_state_page_content").get_child_by_id("client_channel_state_page_channel_id_div").get_child_by_id("client_channel_state_id_input").value
+            endpoint = self.get_child_by_id("client_channel_state_page").get_child_by_id("client_channel_state_page_content").get_child_by_id("client_channel_state_page_endpoint_div").get_child_by_id("client_channel_state_endpoint_input").value
+            mpe_addr = self.get_child_by_id("client_channel_state_page").get_child_by_id("client_channel_state_page_content").get_child_by_id("client_channel_state_page_mpe_addr_div").get_child_by_id("client_channel_state_mpe_addr_input").value
+            wallet_index = self.get_child_by_id("client_channel_state_page").get_child_by_id("client_channel_state_page_content").get_child_by_id("client_channel_state_page_wallet_index_div").get_child_by_id("client_channel_state_wallet_index_input").value
+
+            params = {
+                "chan_id": channel_id,
+                "ep": endpoint,
+                "addr": mpe_addr,
+                "wallet": wallet_index
+            }
+            self.app.submit(LoadJob(load.get_channel_state, params, on_result=self.on_res, aprx_time="20s."))
+
+class channel_page(Screen):
+    # Channels from the last print-initialized, and the column the table is sorted by
+    channels = []
+    sort_column = None
+    sort_reverse = False
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Page", id="channel_page_title"),
+                Label("Initialized Channels Info:", id="channel_page_log_label"),
+                Input(placeholder="Filter by channel ID, organization or group", id="channel_page_filter_input"),
+                DataTable(id="channel_page_channel_table", cursor_type="row", zebra_stripes=True),
+                Horizontal(
+                    Button(label="Initialize/Open", id="channel_page_init_open_button", classes="channel_page_button"),
+                    Button(label="Extend", id="channel_page_extend_button", classes="channel_page_button"),
+                    id="channel_page_upper_button_div",
+                    classes="channel_page_div"
+                ),
+                
+                Horizontal(
+                    Button(label="Print", id="channel_page_print_button", classes="channel_page_button"),
+                    Button(label="Claim", id="channel_page_claim_button", classes="channel_page_button"),
+                    id="channel_page_lower_button_div",
+                    classes="channel_page_div"
+                ),
+                Button(label="Back", id="channel_page_back_button"),
+                id="channel_page_content",
+                classes="content_page"
+            ),
+            id="channel_page"
+        )
+
+    def print_info(self, channels) -> None:
+        if channels == "cancel":
+            self.app.pop_screen() 
+        elif channels == "retrieve_error":
+            fe.popup_output = "ERROR: Could not retrieve initialized channel information"
+            self.app.push_screen(popup_output_page()) 
+        else:
+            self.channels = channels
+            self.query_one("#channel_page_log_label", expect_type=Label).update(f"My Initialized channels: {len(channels)}")
+            self.show_channels()
+
+    def show_channels(self) -> None:
+        # Filtering and sorting only work on the records already loaded, no CLI call is made
+        phrase = self.query_one("#channel_page_filter_input", expect_type=Input).value
+        table = self.query_one("#channel_page_channel_table", expect_type=DataTable)
+        table.clear()
+        table.add_rows(channel.row() for channel in be.filter_channels(self.channels, phrase))
+        if self.sort_column:
+            table.sort(self.sort_column, reverse=self.sort_reverse)
+
+    @on(Input.Changed, "#channel_page_filter_input")
+    def on_filter_changed(self, event: Input.Changed) -> None:
+        self.show_channels()
+
+    @on(DataTable.HeaderSelected, "#channel_page_channel_table")
+    def on_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        # Selecting the sorted column again flips the order
+        column = event.column_key.value
+        self.sort_reverse = not self.sort_reverse if self.sort_column == column else False
+        self.sort_column = column
+        event.data_table.sort(column, reverse=self.sort_reverse)
+
+    def on_mount(self) -> None:
+        table = self.query_one("#channel_page_channel_table", expect_type=DataTable)
+        for field, title in be.CHANNEL_COLUMNS:
+            table.add_column(title, key=field)
+
+        self.app.submit(LoadJob(load.init_channels, on_result=self.print_info, aprx_time="10s."))
+ 
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_page_back_button":
+            self.app.navigate("client")
+        elif event.button.id == "channel_page_init_open_button":
+            self.app.push_screen(channel_init_open_page())
+        elif event.button.id == "channel_page_extend_button":
+            self.app.push_screen(channel_extend_page())
+        elif event.button.id == "channel_page_print_button":
+            self.app.push_screen(channel_print_page())
+        elif event.button.id == "channel_page_claim_button":
+            self.app.push_screen(channel_claim_page())
+    
+class channel_init_open_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Initialize/Open Page", id="channel_init_open_page_title"),
+                Horizontal(
+                    Button(label="Initialize", id="channel_init_open_page_init_button", classes="channel_init_open_page_button"),
+                    Button(label="Initialize Metadata", id="channel_init_open_page_init_meta_button", classes="channel_init_open_page_button"),
+                    id="channel_init_open_page_upper_button_div",
+                    classes="channel_init_open_page_div"
+                ),
+                Horizontal(
+                    Button(label="Open Initialize", id="channel_init_open_page_open_init_button", classes="channel_init_open_page_button"),
+                    Button(label="Open Initialize Metadata", id="channel_init_open_page_open_init_meta_button", classes="channel_init_open_page_button"),
+                    id="channel_init_open_page_lower_button_div",
+                    classes="channel_init_open_page_div"
+                ),
+                Button(label="Back", id="channel_init_open_page_back_button"),
+                id="channel_init_open_page_content",
+                classes="content_page"
+            ),
+            id="channel_init_open_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_init_open_page_back_button":
+            self.app.back_to(channel_page)
+        elif event.button.id == "channel_init_open_page_init_button":
+            self.app.push_screen(channel_init_page())
+        elif event.button.id == "channel_init_open_page_init_meta_button":
+            self.app.push_screen(channel_init_metadata_page())
+        elif event.button.id == "channel_init_open_page_open_init_button":
+            self.app.push_screen(channel_open_init_page())
+        elif event.button.id == "channel_init_open_page_open_init_meta_button":
+            self.app.push_screen(channel_open_init_meta_page())
+
+class channel_init_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Initialize Page", id="channel_init_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_init_page_org_id_label", classes="channel_init_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_init_page_org_id_input", classes="channel_init_page_input"),
+                    id="channel_init_page_org_id_div",
+                    classes="channel_init_page_div"
+                ),
+                Horizontal(
+                    Label("Channel ID", id="channel_init_page_channel_id_label", classes="channel_init_page_label"),
+                    Input(placeholder="The Channel Id", id="channel_init_page_channel_id_input", classes="channel_init_page_input"),
+                    id="channel_init_page_channel_id_div",
+                    classes="channel_init_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="channel_init_page_group_label", classes="channel_init_page_label"),
+                    Input(placeholder="Name of the payment group", id="channel_init_page_group_input", classes="channel_init_page_input"),
+                    id="channel_init_page_group_div",
+                    classes="channel_init_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_init_page_registry_label", classes="channel_init_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from “networks”", id="channel_init_page_registry_input", classes="channel_init_page_input"),
+                    id="channel_init_page_registry_div",
+                    classes="channel_init_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_init_page_mpe_addr_label", classes="channel_init_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="channel_init_page_mpe_addr_input", classes="channel_init_page_input"),
+                    id="channel_init_page_mpe_addr_div",
+                    classes="channel_init_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_init_page_back_button"),
+                    Button(label="Initialize", id="channel_init_print_confirm_button"),
+                    id="channel_init_page_button_div",
+                    classes="channel_init_page_div"
+                ),
+                id="channel_init_content_page",
+                classes="content_page"
+            ),
+            id="channel_init_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_init_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_init_print_confirm_button":
+            org_id = self.get_child_by_id("channel_init_page").get_child_by_id("channel_init_content_page").get_child_by_id("channel_init_page_org_id_div").get_child_by_id("channel_init_page_org_id_input").value
+            group = self.get_child_by_id("channel_init_page").get_child_by_id("channel_init_content_page").get_child_by_id("channel_init_page_group_div").get_child_by_id("channel_init_page_group_input").value
+            channel_id = self.get_child_by_id("channel_init_page").get_child_by_id("channel_init_content_page").get_child_by_id("channel_init_page_channel_id_div").get_child_by_id("channel_init_page_channel_id_input").value
+            registry = self.get_child_by_id("channel_init_page").get_child_by_id("channel_init_content_page").get_child_by_id("channel_init_page_registry_div").get_child_by_id("channel_init_page_registry_input").value
+            mpe_addr = self.get_child_by_id("channel_init_page").get_child_by_id("channel_init_content_page").get_child_by_id("channel_init_page_mpe_addr_div").get_child_by_id("channel_init_page_mpe_addr_input").value
+            self.get_child_by_id("channel_init_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+
+            params = {
+                "org_id": org_id,
+                "group": group,
+                "chan_id": channel_id,
+                "registry": registry,
+                "addr": mpe_addr
+            }
+            self.app.submit(LoadJob(load.init_channel, params, on_result=self.on_res, aprx_time="20s."))
+
+class channel_init_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Initialize Metadata Page", id="channel_init_metadata_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_init_metadata_page_org_id_label", classes="channel_init_metadata_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_init_metadata_page_org_id_input", classes="channel_init_metadata_page_input"),
+                    id="channel_init_metadata_page_org_id_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Channel ID", id="channel_init_metadata_page_channel_id_label", classes="channel_init_metadata_page_label"),
+                    Input(placeholder="The Channel Id", id="channel_init_metadata_page_channel_id_input", classes="channel_init_metadata_page_input"),
+                    id="channel_init_metadata_page_channel_id_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata Path", id="channel_init_metadata_page_file_path_label", classes="channel_init_metadata_page_label"),
+                    Input(placeholder="Service metadata json file path", id="channel_init_metadata_page_file_path_input", classes="channel_init_metadata_page_input"),
+                    id="channel_init_metadata_page_file_path_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="channel_init_metadata_page_group_label", classes="channel_init_metadata_page_label"),
+                    Input(placeholder="Name of the payment group", id="channel_init_metadata_page_group_input", classes="channel_init_metadata_page_input"),
+                    id="channel_init_metadata_page_group_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_init_metadata_page_registry_label", classes="channel_init_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from “networks”", id="channel_init_metadata_page_registry_input", classes="channel_init_metadata_page_input"),
+                    id="channel_init_metadata_page_registry_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_init_metadata_page_mpe_addr_label", classes="channel_init_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="channel_init_metadata_page_mpe_addr_input", classes="channel_init_metadata_page_input"),
+                    id="channel_init_metadata_page_mpe_addr_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_init_metadata_page_wallet_index_label", classes="channel_init_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling (defaults to session.identity.default_wallet_index)", id="channel_init_metadata_page_wallet_index_input", classes="channel_init_metadata_page_input"),
+                    id="channel_init_metadata_page_wallet_index_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_init_metadata_page_back_button"),
+                    Button(label="Initialize", id="channel_init_metadata_print_confirm_button"),
+                    id="channel_init_metadata_page_button_div",
+                    classes="channel_init_metadata_page_div"
+                ),
+                id="channel_init_metadata_content_page",
+                classes="content_page"
+            ),
+            id="channel_init_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_init_metadata_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_init_metadata_print_confirm_button":
+            org_id = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("channel_init_metadata_content_page").get_child_by_id("channel_init_metadata_page_org_id_div").get_child_by_id("channel_init_metadata_page_org_id_input").value
+            group = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("channel_init_metadata_content_page").get_child_by_id("channel_init_metadata_page_group_div").get_child_by_id("channel_init_metadata_page_group_input").value
+            channel_id = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("channel_init_metadata_content_page").get_child_by_id("channel_init_metadata_page_channel_id_div").get_child_by_id("channel_init_metadata_page_channel_id_input").value
+            registry = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("channel_init_metadata_content_page").get_child_by_id("channel_init_metadata_page_registry_div").get_child_by_id("channel_init_metadata_page_registry_input").value
+            meta_file = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("channel_init_metadata_content_page").get_child_by_id("channel_init_metadata_page_file_path_div").get_child_by_id("channel_init_metadata_page_file_path_input").value
+            mpe_addr = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("channel_init_metadata_content_page").get_child_by_id("channel_init_metadata_page_mpe_addr_div").get_child_by_id("channel_init_metadata_page_mpe_addr_input").value
+            wallet_index = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("channel_init_metadata_content_page").get_child_by_id("channel_init_metadata_page_wallet_index_div").get_child_by_id("channel_init_metadata_page_wallet_index_input").value
+            client_nav_button = self.get_child_by_id("channel_init_metadata_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav")
+            client_nav_button.focus()
+
+            params = {
+                "org_id": org_id,
+                "group": group,
+                "chan_id": channel_id,
+                "registry": registry,
+                "addr": mpe_addr,
+                "file": meta_file,
+                "wallet": wallet_index
+            }
+            self.app.submit(LoadJob(load.channel_init_meta, params, on_result=self.on_res, aprx_time="10s."))
+
+class channel_open_init_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Open Initialize Page", id="channel_open_init_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_open_init_page_org_id_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_open_init_page_org_id_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_org_id_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="channel_open_init_page_group_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="Name of the payment group", id="channel_open_init_page_group_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_group_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("AGIX Amount", id="channel_open_init_page_agi_amount_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="Amount of AGIX tokens to put in the new channel", id="channel_open_init_page_agi_amount_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_agi_amount_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("Expiration Time", id="channel_open_init_page_expr_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="Expiration time in blocks (<int>), or in blocks related to the current_block (+<int>blocks), or in days related to the current_block and assuming 15 sec/block (+<int>days)", id="channel_open_init_page_expr_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_expr_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_open_init_page_registry_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from “networks”", id="channel_open_init_page_registry_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_registry_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("Signer Address", id="channel_open_init_page_signer_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="[OPTIONAL] Signer for the channel (by default is equal to the sender)", id="channel_open_init_page_signer_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_signer_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_open_init_page_mpe_addr_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="channel_open_init_page_mpe_addr_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_mpe_addr_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("Block Number", id="channel_open_init_page_block_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block (for channel searching)", id="channel_open_init_page_block_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_block_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_open_init_page_wallet_index_label", classes="channel_open_init_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="channel_open_init_page_wallet_index_input", classes="channel_open_init_page_input"),
+                    id="channel_open_init_page_wallet_index_div",
+                    classes="channel_open_init_page_div"
+                ),
+                Label("Run Options", id="channel_open_init_page_run_options_label"),
+                RadioButton(label="Force", id="channel_open_init_page_force_radio"),
+                RadioButton(label="Open New Anyway", id="channel_open_init_page_new_anyway_radio"),
+                RadioSet(
+                    RadioButton(label="Quiet Print", id="channel_open_init_page_quiet_radio"),
+                    RadioButton(label="Verbose Print", id="channel_open_init_page_verbose_radio"),
+                    id="channel_open_init_page_quiet_verbose_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_open_init_page_back_button"),
+                    Button(label="Open and Initialize", id="channel_open_init_page_confirm_button"),
+                    id="channel_open_init_page_button_div",
+                    classes="channel_open_init_page_div"
+                ),
+                id="channel_open_init_content_page",
+                classes="content_page"
+            ),
+            id="channel_open_init_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_open_init_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_open_init_page_confirm_button":
+            
+            org_id = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_org_id_div").get_child_by_id("channel_open_init_page_org_id_input").value
+            group = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_group_div").get_child_by_id("channel_open_init_page_group_input").value
+            agi_amount = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_agi_amount_div").get_child_by_id("channel_open_init_page_agi_amount_input").value
+            expr = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_expr_div").get_child_by_id("channel_open_init_page_expr_input").value
+            registry = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_registry_div").get_child_by_id("channel_open_init_page_registry_input").value
+            mpe_addr = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_mpe_addr_div").get_child_by_id("channel_open_init_page_mpe_addr_input").value
+            signer = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_signer_div").get_child_by_id("channel_open_init_page_signer_input").value
+            block = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_block_div").get_child_by_id("channel_open_init_page_block_input").value
+            wallet_index = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_wallet_index_div").get_child_by_id("channel_open_init_page_wallet_index_input").value
+            force = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_force_radio").value
+            open_anyway = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_new_anyway_radio").value
+            quiet = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_quiet_verbose_set").get_child_by_id("channel_open_init_page_quiet_radio").value
+            verbose = self.get_child_by_id("channel_open_init_page").get_child_by_id("channel_open_init_content_page").get_child_by_id("channel_open_init_page_quiet_verbose_set").get_child_by_id("channel_open_init_page_verbose_radio").value
+            client_nav_button = self.get_child_by_id("channel_open_init_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav")
+            client_nav_button.focus()
+            
+            params = {
+                "org_id": org_id,
+                "group": group,
+                "agi": agi_amount,
+                "expr": expr,
+                "registry": registry,
+                "addr": mpe_addr,
+                "signer": signer,
+                "block": block,
+                "force": force,
+                "open": open_anyway, 
+                "quiet": quiet,
+                "verbose": verbose,
+                "wallet": wallet_index,
+            }
+            self.app.submit(LoadJob(load.channel_open_init, params, on_result=self.on_res, aprx_time="10s."))
+
+class channel_open_init_meta_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Open Initialize Metadata Page", id="channel_open_init_meta_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_open_init_meta_page_org_id_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_open_init_meta_page_org_id_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_org_id_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="channel_open_init_meta_page_group_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="Name of the payment group.", id="channel_open_init_meta_page_group_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_group_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("AGIX Amount", id="channel_open_init_meta_page_agi_amount_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="Amount of AGIX tokens to put in the new channel", id="channel_open_init_meta_page_agi_amount_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_agi_amount_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("Expiration Time", id="channel_open_init_meta_page_expr_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="Expiration time in blocks (<int>), or in blocks related to the current_block (+<int>blocks), or in days related to the current_block and assuming 15 sec/block (+<int>days)", id="channel_open_init_meta_page_expr_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_expr_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata Path", id="channel_open_init_meta_page_meta_path_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="Service metadata json file path", id="channel_open_init_meta_page_meta_path_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_meta_path_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_open_init_meta_page_registry_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from “networks”", id="channel_open_init_meta_page_registry_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_registry_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("Signer Address", id="channel_open_init_meta_page_signer_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="[OPTIONAL] Signer for the channel (by default is equal to the sender)", id="channel_open_init_meta_page_signer_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_signer_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_open_init_meta_page_mpe_addr_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="channel_open_init_meta_page_mpe_addr_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_mpe_addr_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("Start Block", id="channel_open_init_meta_page_block_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block (for channel searching)", id="channel_open_init_meta_page_block_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_block_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_open_init_meta_page_wallet_index_label", classes="channel_open_init_meta_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="channel_open_init_meta_page_wallet_index_input", classes="channel_open_init_meta_page_input"),
+                    id="channel_open_init_meta_page_wallet_index_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                Label("Run Options", id="channel_open_init_meta_page_run_options_label"),
+                RadioButton(label="Force", id="channel_open_init_meta_page_force_radio"),
+                RadioButton(label="Open New Anyway", id="channel_open_init_meta_page_new_anyway_radio"),
+                RadioSet(
+                    RadioButton(label="Quiet Print", id="channel_open_init_meta_page_quiet_radio"),
+                    RadioButton(label="Verbose Print", id="channel_open_init_meta_page_verbose_radio"),
+                    id="channel_open_init_meta_page_quiet_verbose_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_open_init_meta_page_back_button"),
+                    Button(label="Open and Initialize", id="channel_open_init_meta_page_confirm_button"),
+                    id="channel_open_init_meta_page_button_div",
+                    classes="channel_open_init_meta_page_div"
+                ),
+                id="channel_open_init_meta_content_page",
+                classes="content_page"
+            ),
+            id="channel_open_init_meta_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="20s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_open_init_meta_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_open_init_meta_page_confirm_button":
+
+            org_id = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_org_id_div").get_child_by_id("channel_open_init_meta_page_org_id_input").value
+            group = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_group_div").get_child_by_id("channel_open_init_meta_page_group_input").value
+            agi_amount = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_agi_amount_div").get_child_by_id("channel_open_init_meta_page_agi_amount_input").value
+            expr = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_expr_div").get_child_by_id("channel_open_init_meta_page_expr_input").value
+            meta_path = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_meta_path_div").get_child_by_id("channel_open_init_meta_page_meta_path_input").value
+            registry = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_registry_div").get_child_by_id("channel_open_init_meta_page_registry_input").value
+            mpe_addr = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_mpe_addr_div").get_child_by_id("channel_open_init_meta_page_mpe_addr_input").value
+            signer = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_signer_div").get_child_by_id("channel_open_init_meta_page_signer_input").value
+            block = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_block_div").get_child_by_id("channel_open_init_meta_page_block_input").value
+            wallet_index = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_wallet_index_div").get_child_by_id("channel_open_init_meta_page_wallet_index_input").value
+            force = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_force_radio").value
+            open_anyway = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_new_anyway_radio").value
+            quiet = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_quiet_verbose_set").get_child_by_id("channel_open_init_meta_page_quiet_radio").value
+            verbose = self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("channel_open_init_meta_content_page").get_child_by_id("channel_open_init_meta_page_quiet_verbose_set").get_child_by_id("channel_open_init_meta_page_verbose_radio").value
+            self.get_child_by_id("channel_open_init_meta_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+            
+            params = {
+                "id": org_id,
+                "group": group,
+                "agi": agi_amount,
+                "expr": expr,
+                "path": meta_path,
+                "reg": registry,
+                "addr": mpe_addr,
+                "signer": signer,
+                "block": block,
+                "wallet": wallet_index,
+                "force": force,
+                "open": open_anyway,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+            self.app.submit(LoadJob(load.channel_open_init_meta, params, on_result=self.on_res, aprx_time="20s."))
+
+class channel_extend_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Extend Page", id="channel_extend_page_title"),
+                Horizontal(
+                    Button(label="Extend Add", id="channel_extend_page_extend_add_button", classes="channel_extend_page_button"),
+                    Button(label="Extend Add Org", id="channel_extend_page_extend_add_org_button", classes="channel_extend_page_button"),
+                    id="channel_extend_page_button_div",
+                    classes="channel_extend_page_div"
+                ),
+                Button(label="Back", id="channel_extend_page_back_button"),
+                id="channel_extend_page_content",
+                classes="content_page"
+            ),
+            id="channel_extend_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_extend_page_back_button":
+            self.app.back_to(channel_page)
+        elif event.button.id == "channel_extend_page_extend_add_button":
+            self.app.push_screen(channel_extend_add_page())
+        elif event.button.id == "channel_extend_page_extend_add_org_button":
+            self.app.push_screen(channel_extend_add_org_page())
+
+class channel_extend_add_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Extend Add Page", id="channel_extend_add_page_title"),
+                Horizontal(
+                    Label("Channel ID", id="channel_extend_add_page_channel_id_label", classes="channel_extend_add_page_label"),
+                    Input(placeholder="The Channel Id", id="channel_extend_add_page_channel_id_input", classes="channel_extend_add_page_input"),
+                    id="channel_extend_add_page_channel_id_div",
+                    classes="channel_extend_add_page_div"
+                ),
+                Horizontal(
+                    Label("Expiration Time", id="channel_extend_add_page_expr_label", classes="channel_extend_add_page_label"),
+                    Input(placeholder="[OPTIONAL] Expiration time in blocks or days", id="channel_extend_add_page_expr_input", classes="channel_extend_add_page_input"),
+                    id="channel_extend_add_page_expr_div",
+                    classes="channel_extend_add_page_div"
+                ),
+                Horizontal(
+                    Label("AGIX Amount", id="channel_extend_add_page_agi_amount_label", classes="channel_extend_add_page_label"),
+                    Input(placeholder="[OPTIONAL] Amount of AGIX tokens to add", id="channel_extend_add_page_agi_amount_input", classes="channel_extend_add_page_input"),
+                    id="channel_extend_add_page_agi_amount_div",
+                    classes="channel_extend_add_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_extend_add_page_mpe_addr_label", classes="channel_extend_add_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_extend_add_page_mpe_addr_input", classes="channel_extend_add_page_input"),
+                    id="channel_extend_add_page_mpe_addr_div",
+                    classes="channel_extend_add_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_extend_add_page_wallet_index_label", classes="channel_extend_add_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing", id="channel_extend_add_page_wallet_index_input", classes="channel_extend_add_page_input"),
+                    id="channel_extend_add_page_wallet_index_div",
+                    classes="channel_extend_add_page_div"
+                ),
+                Label("Run Options", id="channel_extend_add_page_run_options_label"),
+                RadioButton(label="Force", id="channel_extend_add_page_force_radio"),
+                RadioSet(
+                    RadioButton(label="Quiet Print", id="channel_extend_add_page_quiet_radio"),
+                    RadioButton(label="Verbose Print", id="channel_extend_add_page_verbose_radio"),
+                    id="channel_extend_add_page_quiet_verbose_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_extend_add_page_back_button"),
+                    Button(label="Extend and Add", id="channel_extend_add_page_confirm_button"),
+                    id="channel_extend_add_page_button_div",
+                    classes="channel_extend_add_page_div"
+                ),
+                id="channel_extend_add_content_page",
+                classes="content_page"
+            ),
+            id="channel_extend_add_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                
+                self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_extend_add_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_extend_add_page_confirm_button":
+            channel_id = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_channel_id_div").get_child_by_id("channel_extend_add_page_channel_id_input").value
+            expr = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_expr_div").get_child_by_id("channel_extend_add_page_expr_input").value
+            agi_amount = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_agi_amount_div").get_child_by_id("channel_extend_add_page_agi_amount_input").value
+            mpe_addr = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_mpe_addr_div").get_child_by_id("channel_extend_add_page_mpe_addr_input").value
+            wallet_index = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_wallet_index_div").get_child_by_id("channel_extend_add_page_wallet_index_input").value
+            force = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_force_radio").value
+            quiet = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_quiet_verbose_set").get_child_by_id("channel_extend_add_page_quiet_radio").value
+            verbose = self.get_child_by_id("channel_extend_add_page").get_child_by_id("channel_extend_add_content_page").get_child_by_id("channel_extend_add_page_quiet_verbose_set").get_child_by_id("channel_extend_add_page_verbose_radio").value
+            client_nav_button = self.get_child_by_id("channel_extend_add_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav")
+            client_nav_button.focus()
+            
+            params = {
+                "id": channel_id,
+                "expr": expr,
+                "agi": agi_amount,
+                "addr": mpe_addr,
+                "wallet": wallet_index,
+                "force": force,
+                "quiet": quiet,
+                "verbsoe": verbose
+            }
+            self.app.submit(LoadJob(load.channel_extend_add, params, on_result=self.on_res, aprx_time="10s."))
+
+class channel_extend_add_org_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Extend Add For Organization Page", id="channel_extend_add_org_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_extend_add_org_page_org_id_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_extend_add_org_page_org_id_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_org_id_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group Name", id="channel_extend_add_org_page_group_name_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="Name of the payment group", id="channel_extend_add_org_page_group_name_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_group_name_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_extend_add_org_page_registry_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract", id="channel_extend_add_org_page_registry_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_registry_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_extend_add_org_page_mpe_addr_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_extend_add_org_page_mpe_addr_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_mpe_addr_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("Channel ID", id="channel_extend_add_org_page_channel_id_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="[OPTIONAL] The Channel Id", id="channel_extend_add_org_page_channel_id_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_channel_id_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("Start Block", id="channel_extend_add_org_page_from_block_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block", id="channel_extend_add_org_page_from_block_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_from_block_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("Expiration Time", id="channel_extend_add_org_page_expr_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Expiration time in blocks or days", id="channel_extend_add_org_page_expr_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_expr_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("AGIX Tokens Amount", id="channel_extend_add_org_page_agi_amount_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Amount of AGIX tokens to add", id="channel_extend_add_org_page_agi_amount_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_agi_amount_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_extend_add_org_page_wallet_index_label", classes="channel_extend_add_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing", id="channel_extend_add_org_page_wallet_index_input", classes="channel_extend_add_org_page_input"),
+                    id="channel_extend_add_org_page_wallet_index_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                Label("Run Options", id="channel_extend_add_org_page_run_options_label"),
+                RadioButton(label="Force", id="channel_extend_add_org_page_force_radio"),
+                RadioSet(
+                    RadioButton(label="Quiet Print", id="channel_extend_add_org_page_quiet_radio"),
+                    RadioButton(label="Verbose Print", id="channel_extend_add_org_page_verbose_radio"),
+                    id="channel_extend_add_org_page_quiet_verbose_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_extend_add_org_page_back_button"),
+                    Button(label="Extend and Add", id="channel_extend_add_org_page_confirm_button"),
+                    id="channel_extend_add_org_page_button_div",
+                    classes="channel_extend_add_org_page_div"
+                ),
+                id="channel_extend_add_org_content_page",
+                classes="content_page"
+            ),
+            id="channel_extend_add_org_page"
+        )
+    
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode, command = result
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_extend_add_org_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_extend_add_org_page_confirm_button":
+            org_id = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_org_id_div").get_child_by_id("channel_extend_add_org_page_org_id_input").value
+            group_name = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_group_name_div").get_child_by_id("channel_extend_add_org_page_group_name_input").value
+            registry = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_registry_div").get_child_by_id("channel_extend_add_org_page_registry_input").value
+            mpe_addr = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_mpe_addr_div").get_child_by_id("channel_extend_add_org_page_mpe_addr_input").value
+            channel_id = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_channel_id_div").get_child_by_id("channel_extend_add_org_page_channel_id_input").value
+            from_block = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_from_block_div").get_child_by_id("channel_extend_add_org_page_from_block_input").value
+            expr = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_expr_div").get_child_by_id("channel_extend_add_org_page_expr_input").value
+            agi_amount = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_agi_amount_div").get_child_by_id("channel_extend_add_org_page_agi_amount_input").value
+            wallet_index = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_wallet_index_div").get_child_by_id("channel_extend_add_org_page_wallet_index_input").value
+            force = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_force_radio").value
+            quiet = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_quiet_verbose_set").get_child_by_id("channel_extend_add_org_page_quiet_radio").value
+            verbose = self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("channel_extend_add_org_content_page").get_child_by_id("channel_extend_add_org_page_quiet_verbose_set").get_child_by_id("channel_extend_add_org_page_verbose_radio").value
+            self.get_child_by_id("channel_extend_add_org_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+
+            params = {
+                "id": org_id,
+                "group": group_name,
+                "reg": registry,
+                "addr": mpe_addr,
+                "chan_id": channel_id,
+                "block": from_block,
+                "expr": expr,
+                "force": force,
+                "agi": agi_amount,
+                "wallet": wallet_index,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+            self.app.submit(LoadJob(load.channel_extend_add_org, params, on_result=self.on_res, aprx_time="10s."))
+
+class channel_print_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Print Page", id="channel_print_page_title"),
+                Horizontal(
+                    Button(label="Print Initialized", id="channel_print_page_print_init_button", classes="channel_print_page_button"),
+                    Button(label="Print Initialized Filter Org", id="channel_print_page_print_init_filter_org_button", classes="channel_print_page_button"),
+                    Button(label="Print All Filter Sender", id="channel_print_page_print_all_filt_send_button", classes="channel_print_page_button"),
+                    id="channel_print_page_upper_button_div",
+                    classes="channel_print_page_div"
+                ),
+                Horizontal(
+                    Button(label="Print All Filter Recipient", id="channel_print_page_print_all_filt_reci_button", classes="channel_print_page_button"),
+                    Button(label="Print All Filter Group", id="channel_print_page_print_all_filt_group_button", classes="channel_print_page_button"),
+                    Button(label="Print All Filter Group Sender", id="channel_print_page_print_all_filt_group_sender_button", classes="channel_print_page_button"),
+                    id="channel_print_page_lower_button_div",
+                    classes="channel_print_page_div"
+                ),
+                Button(label="Back", id="channel_print_page_back_button"),
+                id="channel_print_page_content",
+                classes="content_page"
+            ),
+            id="channel_ _page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_print_page_back_button":
+            self.app.back_to(channel_page)
+        elif event.button.id == "channel_print_page_print_init_button":
+            self.app.push_screen(channel_print_init_page())
+        elif event.button.id == "channel_print_page_print_init_filter_org_button":
+            self.app.push_screen(channel_print_init_filter_org_page())
+        elif event.button.id == "channel_print_page_print_all_filt_send_button":
+            self.app.push_screen(channel_print_all_filter_sender_page())
+        elif event.button.id == "channel_print_page_print_all_filt_reci_button":
+            self.app.push_screen(channel_print_all_filter_recipient_page())
+        elif event.button.id == "channel_print_page_print_all_filt_group_button":
+            self.app.push_screen(channel_print_all_filter_group_page())
+        elif event.button.id == "channel_print_page_print_all_filt_group_sender_button":
+            self.app.push_screen(channel_print_all_filter_group_sender_page())
+
+class channel_print_init_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Print Initialized Page", id="channel_print_initialized_page_title"),
+                Horizontal(
+                    Label("MPE Address", id="channel_print_initialized_page_mpe_addr_label", classes="channel_print_initialized_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_print_initialized_page_mpe_addr_input", classes="channel_print_initialized_page_input"),
+                    id="channel_print_initialized_page_mpe_addr_div",
+                    classes="channel_print_initialized_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_print_initialized_page_registry_label", classes="channel_print_initialized_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract", id="channel_print_initialized_page_registry_input", classes="channel_print_initialized_page_input"),
+                    id="channel_print_initialized_page_registry_div",
+                    classes="channel_print_initialized_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_print_initialized_page_wallet_index_label", classes="channel_print_initialized_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use", id="channel_print_initialized_page_wallet_index_input", classes="channel_print_initialized_page_input"),
+                    id="channel_print_initialized_page_wallet_index_div",
+                    classes="channel_print_initialized_page_div"
+                ),
+                Label("Run Options", id="channel_print_initialized_page_run_options_label"),
+                RadioButton(label="Only Print Ids", id="channel_print_initialized_page_only_id_radio"),
+                RadioSet(
+                    RadioButton(label="Filter by Sender", id="channel_print_initialized_page_filter_sender_radio"),
+                    RadioButton(label="Filter by Signer", id="channel_print_initialized_page_filter_signer_radio"),
+                    RadioButton(label="Filter by My Channels", id="channel_print_initialized_page_filter_my_radio"),
+                    id="channel_print_initialized_page_filter_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_print_initialized_page_back_button"),
+                    Button(label="Print", id="channel_print_initialized_page_confirm_button"),
+                    id="channel_print_initialized_page_button_div",
+                    classes="channel_print_initialized_page_div"
+                ),
+                id="channel_print_initialized_content_page",
+                classes="content_page"
+            ),
+            id="channel_print_initialized_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_print_initialized_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_print_initialized_page_confirm_button":
+            only_id = self.get_child_by_id("channel_print_initialized_page").get_child_by_id("channel_print_initialized_content_page").get_child_by_id("channel_print_initialized_page_only_id_radio").value
+            filter_sender = self.get_child_by_id("channel_print_initialized_page").get_child_by_id("channel_print_initialized_content_page").get_child_by_id("channel_print_initialized_page_filter_set").get_child_by_id("channel_print_initialized_page_filter_sender_radio").value
+            filter_signer = self.get_child_by_id("channel_print_initialized_page").get_child_by_id("channel_print_initialized_content_page").get_child_by_id("channel_print_initialized_page_filter_set").get_child_by_id("channel_print_initialized_page_filter_signer_radio").value
+            filter_my = self.get_child_by_id("channel_print_initialized_page").get_child_by_id("channel_print_initialized_content_page").get_child_by_id("channel_print_initialized_page_filter_set").get_child_by_id("channel_print_initialized_page_filter_my_radio").value
+            mpe_addr = self.get_child_by_id("channel_print_initialized_page").get_child_by_id("channel_print_initialized_content_page").get_child_by_id("channel_print_initialized_page_mpe_addr_div").get_child_by_id("channel_print_initialized_page_mpe_addr_input").value
+            registry = self.get_child_by_id("channel_print_initialized_page").get_child_by_id("channel_print_initialized_content_page").get_child_by_id("channel_print_initialized_page_registry_div").get_child_by_id("channel_print_initialized_page_registry_input").value
+            wallet_index = self.get_child_by_id("channel_print_initialized_page").get_child_by_id("channel_print_initialized_content_page").get_child_by_id("channel_print_initialized_page_wallet_index_div").get_child_by_id("channel_print_initialized_page_wallet_index_input").value
+            self.get_child_by_id("channel_print_initialized_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+
+            params = {
+                "only_id": only_id,
+                "filter_sender": filter_sender,
+                "filter_signer": filter_signer,
+                "filter_my": filter_my,
+                "mpe_addr": mpe_addr,
+                "registry": registry,
+                "wallet_index": wallet_index
+            }
+            self.app.submit(LoadJob(load.channel_print_initialized, params, on_result=self.on_res, aprx_time="10s.", background=True))
+            
+
+class channel_print_init_filter_org_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Print Initialized Channels for Organization Page", id="channel_print_initialized_filter_org_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_print_initialized_filter_org_page_org_id_label", classes="channel_print_initialized_filter_org_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_print_initialized_filter_org_page_org_id_input", classes="channel_print_initialized_filter_org_page_input"),
+                    id="channel_print_initialized_filter_org_page_org_id_div",
+                    classes="channel_print_initialized_filter_org_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="channel_print_initialized_filter_org_page_group_label", classes="channel_print_initialized_filter_org_page_label"),
+                    Input(placeholder="Name of the payment group", id="channel_print_initialized_filter_org_page_group_input", classes="channel_print_initialized_filter_org_page_input"),
+                    id="channel_print_initialized_filter_org_page_group_div",
+                    classes="channel_print_initialized_filter_org_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_print_initialized_filter_org_page_registry_label", classes="channel_print_initialized_filter_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract", id="channel_print_initialized_filter_org_page_registry_input", classes="channel_print_initialized_filter_org_page_input"),
+                    id="channel_print_initialized_filter_org_page_registry_div",
+                    classes="channel_print_initialized_filter_org_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_print_initialized_filter_org_page_mpe_addr_label", classes="channel_print_initialized_filter_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_print_initialized_filter_org_page_mpe_addr_input", classes="channel_print_initialized_filter_org_page_input"),
+                    id="channel_print_initialized_filter_org_page_mpe_addr_div",
+                    classes="channel_print_initialized_filter_org_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_print_initialized_filter_org_page_wallet_index_label", classes="channel_print_initialized_filter_org_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling", id="channel_print_initialized_filter_org_page_wallet_index_input", classes="channel_print_initialized_filter_org_page_input"),
+                    id="channel_print_initialized_filter_org_page_wallet_index_div",
+                    classes="channel_print_initialized_filter_org_page_div"
+                ),
+                Label("Run Options", id="channel_print_initialized_filter_org_page_run_options_label"),
+                RadioButton(label="Only Print Ids", id="channel_print_initialized_filter_org_page_only_id_radio"),
+                RadioSet(
+                    RadioButton(label="Filter by Sender", id="channel_print_initialized_filter_org_page_filter_sender_radio"),
+                    RadioButton(label="Filter by Signer", id="channel_print_initialized_filter_org_page_filter_signer_radio"),
+                    RadioButton(label="Filter by My Channels", id="channel_print_initialized_filter_org_page_filter_my_radio"),
+                    id="channel_print_initialized_filter_org_page_filter_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_print_initialized_filter_org_page_back_button"),
+                    Button(label="Print", id="channel_print_initialized_filter_org_page_confirm_button"),
+                    id="channel_print_initialized_filter_org_page_button_div",
+                    classes="channel_print_initialized_filter_org_page_div"
+                ),
+                id="channel_print_initialized_filter_org_content_page",
+                classes="content_page"
+            ),
+            id="channel_print_initialized_filter_org_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_print_initialized_filter_org_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_print_initialized_filter_org_page_confirm_button":
+            org_id = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_org_id_div").get_child_by_id("channel_print_initialized_filter_org_page_org_id_input").value
+            group = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_group_div").get_child_by_id("channel_print_initialized_filter_org_page_group_input").value
+            registry = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_registry_div").get_child_by_id("channel_print_initialized_filter_org_page_registry_input").value
+            mpe_addr = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_mpe_addr_div").get_child_by_id("channel_print_initialized_filter_org_page_mpe_addr_input").value
+            wallet_index = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_wallet_index_div").get_child_by_id("channel_print_initialized_filter_org_page_wallet_index_input").value
+            only_id = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_only_id_radio").value
+            filter_sender = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_filter_set").get_child_by_id("channel_print_initialized_filter_org_page_filter_sender_radio").value
+            filter_signer = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_filter_set").get_child_by_id("channel_print_initialized_filter_org_page_filter_signer_radio").value
+            filter_my = self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("channel_print_initialized_filter_org_content_page").get_child_by_id("channel_print_initialized_filter_org_page_filter_set").get_child_by_id("channel_print_initialized_filter_org_page_filter_my_radio").value
+            self.get_child_by_id("channel_print_initialized_filter_org_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+            
+            params = {
+                "org_id": org_id,
+                "group": group,
+                "registry": registry,
+                "only_id": only_id,
+                "filter_sender": filter_sender,
+                "filter_signer": filter_signer,
+                "filter_my": filter_my,
+                "mpe_addr": mpe_addr,
+                "wallet_index": wallet_index
+            }
+            self.app.submit(LoadJob(load.channel_print_initialized_filter_org, params, on_result=self.on_res, aprx_time="10s.", background=True))
+
+class channel_print_all_filter_sender_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Print All Channels for Sender Page", id="channel_print_all_filter_sender_page_title"),
+                Horizontal(
+                    Label("MPE Address", id="channel_print_all_filter_sender_page_mpe_addr_label", classes="channel_print_all_filter_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_print_all_filter_sender_page_mpe_addr_input", classes="channel_print_all_filter_sender_page_input"),
+                    id="channel_print_all_filter_sender_page_mpe_addr_div",
+                    classes="channel_print_all_filter_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Start Block", id="channel_print_all_filter_sender_page_block_label", classes="channel_print_all_filter_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block", id="channel_print_all_filter_sender_page_block_input", classes="channel_print_all_filter_sender_page_input"),
+                    id="channel_print_all_filter_sender_page_block_div",
+                    classes="channel_print_all_filter_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Sender Account", id="channel_print_all_filter_sender_page_sender_label", classes="channel_print_all_filter_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Account to set as sender", id="channel_print_all_filter_sender_page_sender_input", classes="channel_print_all_filter_sender_page_input"),
+                    id="channel_print_all_filter_sender_page_sender_div",
+                    classes="channel_print_all_filter_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_print_all_filter_sender_page_wallet_index_label", classes="channel_print_all_filter_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling", id="channel_print_all_filter_sender_page_wallet_index_input", classes="channel_print_all_filter_sender_page_input"),
+                    id="channel_print_all_filter_sender_page_wallet_index_div",
+                    classes="channel_print_all_filter_sender_page_div"
+                ),
+                Label("Run Options", id="channel_print_all_filter_sender_page_run_options_label"),
+                RadioButton(label="Only Print Ids", id="channel_print_all_filter_sender_page_only_id_radio"),
+                Horizontal(
+                    Button(label="Back", id="channel_print_all_filter_sender_page_back_button"),
+                    Button(label="Print", id="channel_print_all_filter_sender_page_confirm_button"),
+                    id="channel_print_all_filter_sender_page_button_div",
+                    classes="channel_print_all_filter_sender_page_div"
+                ),
+                id="channel_print_all_filter_sender_content_page",
+                classes="content_page"
+            ),
+            id="channel_print_all_filter_sender_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_print_all_filter_sender_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_print_all_filter_sender_page_confirm_button":
+            only_id = self.get_child_by_id("channel_print_all_filter_sender_page").get_child_by_id("channel_print_all_filter_sender_content_page").get_child_by_id("channel_print_all_filter_sender_page_only_id_radio").value
+            mpe_addr = self.get_child_by_id("channel_print_all_filter_sender_page").get_child_by_id("channel_print_all_filter_sender_content_page").get_child_by_id("channel_print_all_filter_sender_page_mpe_addr_div").get_child_by_id("channel_print_all_filter_sender_page_mpe_addr_input").value
+            from_block = self.get_child_by_id("channel_print_all_filter_sender_page").get_child_by_id("channel_print_all_filter_sender_content_page").get_child_by_id("channel_print_all_filter_sender_page_block_div").get_child_by_id("channel_print_all_filter_sender_page_block_input").value
+            sender = self.get_child_by_id("channel_print_all_filter_sender_page").get_child_by_id("channel_print_all_filter_sender_content_page").get_child_by_id("channel_print_all_filter_sender_page_sender_div").get_child_by_id("channel_print_all_filter_sender_page_sender_input").value
+            wallet_index = self.get_child_by_id("channel_print_all_filter_sender_page").get_child_by_id("channel_print_all_filter_sender_content_page").get_child_by_id("channel_print_all_filter_sender_page_wallet_index_div").get_child_by_id("channel_print_all_filter_sender_page_wallet_index_input").value
+            self.get_child_by_id("channel_print_all_filter_sender_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+
+            params = {
+                "only_id": only_id,
+                "mpe_addr": mpe_addr,
+                "from_block": from_block,
+                "sender": sender,
+                "wallet_index": wallet_index
+            }
+            self.app.submit(LoadJob(load.channel_print_all_filter_sender, params, on_result=self.on_res, aprx_time="10s.", background=True))
+
+class channel_print_all_filter_recipient_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Print All Channels for Recipient Page", id="channel_print_all_filter_recipient_page_title"),
+                Horizontal(
+                    Label("MPE Address", id="channel_print_all_filter_recipient_page_mpe_addr_label", classes="channel_print_all_filter_recipient_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_print_all_filter_recipient_page_mpe_addr_input", classes="channel_print_all_filter_recipient_page_input"),
+                    id="channel_print_all_filter_recipient_page_mpe_addr_div",
+                    classes="channel_print_all_filter_recipient_page_div"
+                ),
+                Horizontal(
+                    Label("Block Number", id="channel_print_all_filter_recipient_page_block_label", classes="channel_print_all_filter_recipient_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block", id="channel_print_all_filter_recipient_page_block_input", classes="channel_print_all_filter_recipient_page_input"),
+                    id="channel_print_all_filter_recipient_page_block_div",
+                    classes="channel_print_all_filter_recipient_page_div"
+                ),
+                Horizontal(
+                    Label("Recipient", id="channel_print_all_filter_recipient_page_recipient_label", classes="channel_print_all_filter_recipient_page_label"),
+                    Input(placeholder="[OPTIONAL] Account to set as recipient", id="channel_print_all_filter_recipient_page_recipient_input", classes="channel_print_all_filter_recipient_page_input"),
+                    id="channel_print_all_filter_recipient_page_recipient_div",
+                    classes="channel_print_all_filter_recipient_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_print_all_filter_recipient_page_wallet_index_label", classes="channel_print_all_filter_recipient_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling", id="channel_print_all_filter_recipient_page_wallet_index_input", classes="channel_print_all_filter_recipient_page_input"),
+                    id="channel_print_all_filter_recipient_page_wallet_index_div",
+                    classes="channel_print_all_filter_recipient_page_div"
+                ),
+                Label("Run Options", id="channel_print_all_filter_recipient_page_run_options_label"),
+                RadioButton(label="Only Print Ids", id="channel_print_all_filter_recipient_page_only_id_radio"),
+                Horizontal(
+                    Button(label="Back", id="channel_print_all_filter_recipient_page_back_button"),
+                    Button(label="Print", id="channel_print_all_filter_recipient_page_confirm_button"),
+                    id="channel_print_all_filter_recipient_page_button_div",
+                    classes="channel_print_all_filter_recipient_page_div"
+                ),
+                id="channel_print_all_filter_recipient_content_page",
+                classes="content_page"
+            ),
+            id="channel_print_all_filter_recipient_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_print_all_filter_recipient_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_print_all_filter_recipient_page_confirm_button":
+            only_id = self.get_child_by_id("channel_print_all_filter_recipient_page").get_child_by_id("channel_print_all_filter_recipient_content_page").get_child_by_id("channel_print_all_filter_recipient_page_only_id_radio").value
+            mpe_addr = self.get_child_by_id("channel_print_all_filter_recipient_page").get_child_by_id("channel_print_all_filter_recipient_content_page").get_child_by_id("channel_print_all_filter_recipient_page_mpe_addr_div").get_child_by_id("channel_print_all_filter_recipient_page_mpe_addr_input").value
+            from_block = self.get_child_by_id("channel_print_all_filter_recipient_page").get_child_by_id("channel_print_all_filter_recipient_content_page").get_child_by_id("channel_print_all_filter_recipient_page_block_div").get_child_by_id("channel_print_all_filter_recipient_page_block_input").value
+            recipient = self.get_child_by_id("channel_print_all_filter_recipient_page").get_child_by_id("channel_print_all_filter_recipient_content_page").get_child_by_id("channel_print_all_filter_recipient_page_recipient_div").get_child_by_id("channel_print_all_filter_recipient_page_recipient_input").value
+            wallet_index = self.get_child_by_id("channel_print_all_filter_recipient_page").get_child_by_id("channel_print_all_filter_recipient_content_page").get_child_by_id("channel_print_all_filter_recipient_page_wallet_index_div").get_child_by_id("channel_print_all_filter_recipient_page_wallet_index_input").value
+            self.get_child_by_id("channel_print_all_filter_recipient_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+
+            params = {
+                "only_id": only_id,
+                "mpe_addr": mpe_addr,
+                "from_block": from_block,
+                "recipient": recipient,
+                "wallet_index": wallet_index
+            }
+            self.app.submit(LoadJob(load.channel_print_all_filter_recipient, params, on_result=self.on_res, aprx_time="10s.", background=True))
+
+class channel_print_all_filter_group_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Print All Channels for Group Page", id="channel_print_all_filter_group_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_print_all_filter_group_page_org_id_label", classes="channel_print_all_filter_group_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_print_all_filter_group_page_org_id_input", classes="channel_print_all_filter_group_page_input"),
+                    id="channel_print_all_filter_group_page_org_id_div",
+                    classes="channel_print_all_filter_group_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="channel_print_all_filter_group_page_group_label", classes="channel_print_all_filter_group_page_label"),
+                    Input(placeholder="Name of the payment group", id="channel_print_all_filter_group_page_group_input", classes="channel_print_all_filter_group_page_input"),
+                    id="channel_print_all_filter_group_page_group_div",
+                    classes="channel_print_all_filter_group_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_print_all_filter_group_page_registry_label", classes="channel_print_all_filter_group_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract", id="channel_print_all_filter_group_page_registry_input", classes="channel_print_all_filter_group_page_input"),
+                    id="channel_print_all_filter_group_page_registry_div",
+                    classes="channel_print_all_filter_group_page_div"
+                ),
+                Horizontal(
+                    Label("Start Block", id="channel_print_all_filter_group_page_block_label", classes="channel_print_all_filter_group_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block", id="channel_print_all_filter_group_page_block_input", classes="channel_print_all_filter_group_page_input"),
+                    id="channel_print_all_filter_group_page_block_div",
+                    classes="channel_print_all_filter_group_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_print_all_filter_group_page_mpe_addr_label", classes="channel_print_all_filter_group_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="channel_print_all_filter_group_page_mpe_addr_input", classes="channel_print_all_filter_group_page_input"),
+                    id="channel_print_all_filter_group_page_mpe_addr_div",
+                    classes="channel_print_all_filter_group_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_print_all_filter_group_page_wallet_index_label", classes="channel_print_all_filter_group_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling", id="channel_print_all_filter_group_page_wallet_index_input", classes="channel_print_all_filter_group_page_input"),
+                    id="channel_print_all_filter_group_page_wallet_index_div",
+                    classes="channel_print_all_filter_group_page_div"
+                ),
+                Label("Run Options", id="channel_print_all_filter_group_page_run_options_label"),
+                RadioButton(label="Only Print Ids", id="channel_print_all_filter_group_page_only_id_radio"),
+                Horizontal(
+                    Button(label="Back", id="channel_print_all_filter_group_page_back_button"),
+                    Button(label="Print", id="channel_print_all_filter_group_page_confirm_button"),
+                    id="channel_print_all_filter_group_page_button_div",
+                    classes="channel_print_all_filter_group_page_div"
+                ),
+                id="channel_print_all_filter_group_content_page",
+                classes="content_page"
+            ),
+            id="channel_print_all_filter_group_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_print_all_filter_group_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_print_all_filter_group_page_confirm_button":
+            org_id = self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("channel_print_all_filter_group_content_page").get_child_by_id("channel_print_all_filter_group_page_org_id_div").get_child_by_id("channel_print_all_filter_group_page_org_id_input").value
+            group = self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("channel_print_all_filter_group_content_page").get_child_by_id("channel_print_all_filter_group_page_group_div").get_child_by_id("channel_print_all_filter_group_page_group_input").value
+            registry = self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("channel_print_all_filter_group_content_page").get_child_by_id("channel_print_all_filter_group_page_registry_div").get_child_by_id("channel_print_all_filter_group_page_registry_input").value
+            from_block = self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("channel_print_all_filter_group_content_page").get_child_by_id("channel_print_all_filter_group_page_block_div").get_child_by_id("channel_print_all_filter_group_page_block_input").value
+            wallet_index = self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("channel_print_all_filter_group_content_page").get_child_by_id("channel_print_all_filter_group_page_wallet_index_div").get_child_by_id("channel_print_all_filter_group_page_wallet_index_input").value
+            mpe_addr = self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("channel_print_all_filter_group_content_page").get_child_by_id("channel_print_all_filter_group_page_mpe_addr_div").get_child_by_id("channel_print_all_filter_group_page_mpe_addr_input").value
+            only_id = self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("channel_print_all_filter_group_content_page").get_child_by_id("channel_print_all_filter_group_page_only_id_radio").value
+            self.get_child_by_id("channel_print_all_filter_group_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+
+            params = {
+                "org_id": org_id,
+                "group": group,
+                "registry": registry,
+                "only_id": only_id,
+                "mpe_addr": mpe_addr,
+                "from_block": from_block,
+                "wallet_index": wallet_index
+            }
+            self.app.submit(LoadJob(load.channel_print_all_filter_group, params, on_result=self.on_res, aprx_time="10s.", background=True))
+
+class channel_print_all_filter_group_sender_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Print All Channels for Group and Sender Page", id="channel_print_all_filter_group_sender_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="channel_print_all_filter_group_sender_page_org_id_label", classes="channel_print_all_filter_group_sender_page_label"),
+                    Input(placeholder="Id of the Organization", id="channel_print_all_filter_group_sender_page_org_id_input", classes="channel_print_all_filter_group_sender_page_input"),
+                    id="channel_print_all_filter_group_sender_page_org_id_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="channel_print_all_filter_group_sender_page_group_label", classes="channel_print_all_filter_group_sender_page_label"),
+                    Input(placeholder="Name of the payment group", id="channel_print_all_filter_group_sender_page_group_input", classes="channel_print_all_filter_group_sender_page_input"),
+                    id="channel_print_all_filter_group_sender_page_group_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="channel_print_all_filter_group_sender_page_registry_label", classes="channel_print_all_filter_group_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract", id="channel_print_all_filter_group_sender_page_registry_input", classes="channel_print_all_filter_group_sender_page_input"),
+                    id="channel_print_all_filter_group_sender_page_registry_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_print_all_filter_group_sender_page_mpe_addr_label", classes="channel_print_all_filter_group_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_print_all_filter_group_sender_page_mpe_addr_input", classes="channel_print_all_filter_group_sender_page_input"),
+                    id="channel_print_all_filter_group_sender_page_mpe_addr_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Start Block", id="channel_print_all_filter_group_sender_page_block_label", classes="channel_print_all_filter_group_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block", id="channel_print_all_filter_group_sender_page_block_input", classes="channel_print_all_filter_group_sender_page_input"),
+                    id="channel_print_all_filter_group_sender_page_block_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Sender", id="channel_print_all_filter_group_sender_page_sender_label", classes="channel_print_all_filter_group_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Account to set as sender", id="channel_print_all_filter_group_sender_page_sender_input", classes="channel_print_all_filter_group_sender_page_input"),
+                    id="channel_print_all_filter_group_sender_page_sender_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_print_all_filter_group_sender_page_wallet_index_label", classes="channel_print_all_filter_group_sender_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for calling", id="channel_print_all_filter_group_sender_page_wallet_index_input", classes="channel_print_all_filter_group_sender_page_input"),
+                    id="channel_print_all_filter_group_sender_page_wallet_index_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                Label("Run Options", id="channel_print_all_filter_group_sender_page_run_options_label"),
+                RadioButton(label="Only Print Ids", id="channel_print_all_filter_group_sender_page_only_id_radio"),
+                Horizontal(
+                    Button(label="Back", id="channel_print_all_filter_group_sender_page_back_button"),
+                    Button(label="Print", id="channel_print_all_filter_group_sender_page_confirm_button"),
+                    id="channel_print_all_filter_group_sender_page_button_div",
+                    classes="channel_print_all_filter_group_sender_page_div"
+                ),
+                id="channel_print_all_filter_group_sender_content_page",
+                classes="content_page"
+            ),
+            id="channel_print_all_filter_group_sender_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_print_all_filter_group_sender_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_print_all_filter_group_sender_page_confirm_button":
+            org_id = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_org_id_div").get_child_by_id("channel_print_all_filter_group_sender_page_org_id_input").value
+            group = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_group_div").get_child_by_id("channel_print_all_filter_group_sender_page_group_input").value
+            registry = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_registry_div").get_child_by_id("channel_print_all_filter_group_sender_page_registry_input").value
+            mpe_addr = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_mpe_addr_div").get_child_by_id("channel_print_all_filter_group_sender_page_mpe_addr_input").value
+            from_block = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_block_div").get_child_by_id("channel_print_all_filter_group_sender_page_block_input").value
+            sender = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_sender_div").get_child_by_id("channel_print_all_filter_group_sender_page_sender_input").value
+            wallet_index = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_wallet_index_div").get_child_by_id("channel_print_all_filter_group_sender_page_wallet_index_input").value
+            only_id = self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("channel_print_all_filter_group_sender_content_page").get_child_by_id("channel_print_all_filter_group_sender_page_only_id_radio").value
+            self.get_child_by_id("channel_print_all_filter_group_sender_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+            
+            params = {
+                "org_id": org_id,
+                "group": group,
+                "registry": registry,
+                "only_id": only_id,
+                "mpe_addr": mpe_addr,
+                "from_block": from_block,
+                "sender": sender,
+                "wallet_index": wallet_index
+            }
+            self.app.submit(LoadJob(load.channel_print_all_filter_group_sender, params, on_result=self.on_res, aprx_time="10s.", background=True))
+
+class channel_claim_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Claim Page", id="channel_claim_page_title"),
+                Horizontal(
+                    Button(label="Claim Timeout", id="channel_claim_page_to_button", classes="channel_claim_page_button"),
+                    Button(label="Claim ALL Timeout", id="channel_claim_page_to_all_button", classes="channel_claim_page_button"),
+                    id="channel_claim_page_button_div",
+                    classes="channel_claim_page_div"
+                ),
+                Button(label="Back", id="channel_claim_page_back_button"),
+                id="channel_claim_page_content",
+                classes="content_page"
+            ),
+            id="channel_claim_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_claim_page_back_button":
+            self.app.back_to(channel_page)
+        elif event.button.id == "channel_claim_page_to_button":
+            self.app.push_screen(channel_claim_to_page())
+        elif event.button.id == "channel_claim_page_to_all_button":
+            self.app.push_screen(channel_claim_to_all_page())
+
+class channel_claim_to_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Claim Timeout Page", id="channel_claim_timeout_page_title"),
+                Horizontal(
+                    Label("Channel ID", id="channel_claim_timeout_page_channel_id_label", classes="channel_claim_timeout_page_label"),
+                    Input(placeholder="The Channel Id", id="channel_claim_timeout_page_channel_id_input", classes="channel_claim_timeout_page_input"),
+                    id="channel_claim_timeout_page_channel_id_div",
+                    classes="channel_claim_timeout_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="channel_claim_timeout_page_mpe_addr_label", classes="channel_claim_timeout_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_claim_timeout_page_mpe_addr_input", classes="channel_claim_timeout_page_input"),
+                    id="channel_claim_timeout_page_mpe_addr_div",
+                    classes="channel_claim_timeout_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_claim_timeout_page_wallet_index_label", classes="channel_claim_timeout_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing", id="channel_claim_timeout_page_wallet_index_input", classes="channel_claim_timeout_page_input"),
+                    id="channel_claim_timeout_page_wallet_index_div",
+                    classes="channel_claim_timeout_page_div"
+                ),
+                Label("Run Options", id="channel_claim_timeout_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet Print", id="channel_claim_timeout_page_quiet_radio"),
+                    RadioButton(label="Verbose Print", id="channel_claim_timeout_page_verbose_radio"),
+                    id="channel_claim_timeout_page_quiet_verbose_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_claim_timeout_page_back_button"),
+                    Button(label="Claim", id="channel_claim_timeout_page_confirm_button"),
+                    id="channel_claim_timeout_page_button_div",
+                    classes="channel_claim_timeout_page_div"
+                ),
+                id="channel_claim_timeout_content_page",
+                classes="content_page"
+            ),
+            id="channel_claim_timeout_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode, command = result
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="20s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_claim_timeout_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_claim_timeout_page_confirm_button":
+            channel_id = self.get_child_by_id("channel_claim_timeout_page").get_child_by_id("channel_claim_timeout_content_page").get_child_by_id("channel_claim_timeout_page_channel_id_div").get_child_by_id("channel_claim_timeout_page_channel_id_input").value
+            mpe_addr = self.get_child_by_id("channel_claim_timeout_page").get_child_by_id("channel_claim_timeout_content_page").get_child_by_id("channel_claim_timeout_page_mpe_addr_div").get_child_by_id("channel_claim_timeout_page_mpe_addr_input").value
+            wallet_index = self.get_child_by_id("channel_claim_timeout_page").get_child_by_id("channel_claim_timeout_content_page").get_child_by_id("channel_claim_timeout_page_wallet_index_div").get_child_by_id("channel_claim_timeout_page_wallet_index_input").value
+            quiet = self.get_child_by_id("channel_claim_timeout_page").get_child_by_id("channel_claim_timeout_content_page").get_child_by_id("channel_claim_timeout_page_quiet_verbose_set").get_child_by_id("channel_claim_timeout_page_quiet_radio").value
+            verbose = self.get_child_by_id("channel_claim_timeout_page").get_child_by_id("channel_claim_timeout_content_page").get_child_by_id("channel_claim_timeout_page_quiet_verbose_set").get_child_by_id("channel_claim_timeout_page_verbose_radio").value
+            self.get_child_by_id("channel_claim_timeout_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+
+            params = {
+                "channel_id": channel_id,
+                "mpe_addr": mpe_addr,
+                "wallet_index": wallet_index,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+            self.app.submit(LoadJob(load.channel_claim_timeout, params, on_result=self.on_res, aprx_time="20s."))
+
+class channel_claim_to_all_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("client"),
+            ScrollableContainer(
+                Label("Channel Claim Timeout All Page", id="channel_claim_timeout_all_page_title"),
+                Horizontal(
+                    Label("MPE Address", id="channel_claim_timeout_all_page_mpe_addr_label", classes="channel_claim_timeout_all_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract", id="channel_claim_timeout_all_page_mpe_addr_input", classes="channel_claim_timeout_all_page_input"),
+                    id="channel_claim_timeout_all_page_mpe_addr_div",
+                    classes="channel_claim_timeout_all_page_div"
+                ),
+                Horizontal(
+                    Label("From Block", id="channel_claim_timeout_all_page_from_block_label", classes="channel_claim_timeout_all_page_label"),
+                    Input(placeholder="[OPTIONAL] Start searching from this block", id="channel_claim_timeout_all_page_from_block_input", classes="channel_claim_timeout_all_page_input"),
+                    id="channel_claim_timeout_all_page_from_block_div",
+                    classes="channel_claim_timeout_all_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="channel_claim_timeout_all_page_wallet_index_label", classes="channel_claim_timeout_all_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing", id="channel_claim_timeout_all_page_wallet_index_input", classes="channel_claim_timeout_all_page_input"),
+                    id="channel_claim_timeout_all_page_wallet_index_div",
+                    classes="channel_claim_timeout_all_page_div"
+                ),
+                Label("Run Options", id="channel_claim_timeout_all_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet Print", id="channel_claim_timeout_all_page_quiet_radio"),
+                    RadioButton(label="Verbose Print", id="channel_claim_timeout_all_page_verbose_radio"),
+                    id="channel_claim_timeout_all_page_quiet_verbose_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="channel_claim_timeout_all_page_back_button"),
+                    Button(label="Claim", id="channel_claim_timeout_all_page_confirm_button"),
+                    id="channel_claim_timeout_all_page_button_div",
+                    classes="channel_claim_timeout_all_page_div"
+                ),
+                id="channel_claim_timeout_all_content_page",
+                classes="content_page"
+            ),
+            id="channel_claim_timeout_all_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "channel_claim_timeout_all_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "channel_claim_timeout_all_page_confirm_button":
+            mpe_addr = self.get_child_by_id("channel_claim_timeout_all_page").get_child_by_id("channel_claim_timeout_all_content_page").get_child_by_id("channel_claim_timeout_all_page_mpe_addr_div").get_child_by_id("channel_claim_timeout_all_page_mpe_addr_input").value
+            from_block = self.get_child_by_id("channel_claim_timeout_all_page").get_child_by_id("channel_claim_timeout_all_content_page").get_child_by_id("channel_claim_timeout_all_page_from_block_div").get_child_by_id("channel_claim_timeout_all_page_from_block_input").value
+            wallet_index = self.get_child_by_id("channel_claim_timeout_all_page").get_child_by_id("channel_claim_timeout_all_content_page").get_child_by_id("channel_claim_timeout_all_page_wallet_index_div").get_child_by_id("channel_claim_timeout_all_page_wallet_index_input").value
+            quiet = self.get_child_by_id("channel_claim_timeout_all_page").get_child_by_id("channel_claim_timeout_all_content_page").get_child_by_id("channel_claim_timeout_all_page_quiet_verbose_set").get_child_by_id("channel_claim_timeout_all_page_quiet_radio").value
+            verbose = self.get_child_by_id("channel_claim_timeout_all_page").get_child_by_id("channel_claim_timeout_all_content_page").get_child_by_id("channel_claim_timeout_all_page_quiet_verbose_set").get_child_by_id("channel_claim_timeout_all_page_verbose_radio").value
+            self.get_child_by_id("channel_claim_timeout_all_page").get_child_by_id("nav_sidebar").get_child_by_id("client_page_nav").focus()
+            
+            params = {
+                "mpe_addr": mpe_addr,
+                "block": from_block,
+                "wallet_index": wallet_index,
+                "quiet": quiet,
+                "verbose": verbose
+            }            
+            self.app.submit(LoadJob(load.channel_claim_timeout_all, params, on_result=self.on_res, aprx_time="10s."))
+            
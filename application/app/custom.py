@@ -0,0 +1,104 @@
+from textual.app import ComposeResult
+from textual.containers import Horizontal, ScrollableContainer
+from textual.screen import Screen
+from textual.widgets import Button, Header, Label, Input, RadioButton
+from app.frontend import LoadJob, load, popup_output_page, conditional_input_page, exit_page
+import app.frontend as fe
+import back.backend as be
+
+# Custom command section, imported when the section is first opened
+
+class custom_command_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("custom"),
+            ScrollableContainer(
+                Label("Custom CLI Command Page", id="custom_command_page_title"),
+                Horizontal(
+                    Label("Root Command", id="custom_command_root_label", classes="custom_command_page_label"),
+                    Input(placeholder="Eg: account, channel, client, contract, sdk, etc.", id="custom_command_root_input", classes="custom_command_page_input"),
+                    id="custom_command_root_div",
+                    classes="custom_command_page_div"
+                ),
+                Horizontal(
+                    Label("Sub-command", id="custom_command_sub_label", classes="custom_command_page_label"),
+                    Input(placeholder="Eg: deposit, withdraw, MultiPartyEscrow balances, etc.", id="custom_command_sub_input", classes="custom_command_page_input"),
+                    id="custom_command_sub_div",
+                    classes="custom_command_page_div"
+                ),
+                Horizontal(
+                    Label("Command Arguments", id="custom_command_args_label", classes="custom_command_page_label"),
+                    Input(placeholder="Separated by spaces (In the order of: [POSITIONAL] [NAMED] [OPTIONAL])", id="custom_command_args_input", classes="custom_command_page_input"),
+                    id="custom_command_args_div",
+                    classes="custom_command_page_div"
+                ),
+                Horizontal(
+                    Label("Working Directory", id="custom_command_dir_label", classes="custom_command_page_label"),
+                    Input(placeholder="[OPTIONAL] (default: sNET-TUI directory)", id="custom_cwd_input", classes="custom_command_page_input"),
+                    id="custom_command_dir_div",
+                    classes="custom_command_page_div"
+                ),
+                Label("Run Options", id="custom_command_page_run_options_label"),
+                RadioButton(label="Print Traceback", id="custom_command_traceback_radio"),
+                Horizontal(
+                    Button("Run Custom Command", id="custom_command_confirm_button"),
+                    id="custom_command_run_div",
+                    classes="custom_command_page_div"
+                ),
+                id="custom_command_page_content",
+                classes="content_page"
+            ),
+            id="custom_command_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            conditionalCheck = result[0]
+            output = result[1]
+            errCode = result[2]
+            if conditionalCheck:
+                command = result[3]
+                if errCode == 0:
+                    self.app.push_screen(conditional_input_page(command, output, aprx_time="Unknown"))
+                else:
+                    fe.popup_output = output
+                    self.app.push_screen(popup_output_page())
+            else: 
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "custom_command_confirm_button":
+            root = self.get_child_by_id("custom_command_page").get_child_by_id("custom_command_page_content").get_child_by_id("custom_command_root_div").get_child_by_id("custom_command_root_input").value
+            sub = self.get_child_by_id("custom_command_page").get_child_by_id("custom_command_page_content").get_child_by_id("custom_command_sub_div").get_child_by_id("custom_command_sub_input").value
+            args = self.get_child_by_id("custom_command_page").get_child_by_id("custom_command_page_content").get_child_by_id("custom_command_args_div").get_child_by_id("custom_command_args_input").value
+            cwd = self.get_child_by_id("custom_command_page").get_child_by_id("custom_command_page_content").get_child_by_id("custom_command_dir_div").get_child_by_id("custom_cwd_input").value
+            traceback = self.get_child_by_id("custom_command_page").get_child_by_id("custom_command_page_content").get_child_by_id("custom_command_traceback_radio").value
+            self.get_child_by_id("custom_command_page").get_child_by_id("nav_sidebar").get_child_by_id("custom_command_page_nav").focus()
+
+            params = {
+                "root": root,
+                "sub": sub,
+                "args": args,
+                "cwd": cwd,
+                "trace": traceback
+            }
+            self.app.submit(LoadJob(load.custom_command, params, on_result=self.on_res, aprx_time="Unknown"))
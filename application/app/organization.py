@@ -0,0 +1,1471 @@
+from textual.app import ComposeResult
+from textual.containers import Horizontal, ScrollableContainer
+from textual.screen import Screen
+from textual.widgets import Button, Header, Label, Input, Select, RadioButton, Log, RadioSet
+from app.frontend import LoadJob, load, popup_output_page, conditional_input_page, exit_page
+import app.frontend as fe
+import back.backend as be
+
+# Organization section: metadata, groups, members and organization management, imported when the section is first opened
+
+class filecoin_key_page(Screen):
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert(""),
+            ScrollableContainer(
+                Label("FileCoin API Key Set Page", id="filecoin_key_page_title"),
+                Horizontal(
+                    Label("FileCoin API Key", id="filecoin_key_page_key_label", classes="filecoin_key_page_label"),
+                    Input(placeholder="FileCoin API Key", id="filecoin_key_page_key_input", classes="filecoin_key_page_input"),
+                    id="filecoin_key_page_key_div",
+                    classes="filecoin_key_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="filecoin_key_page_back_button"),
+                    Button(label="Set Key", id="filecoin_key_page_set_button"),
+                    id="filecoin_key_page_button_div",
+                    classes="filecoin_key_page_div"
+                ),
+                id="filecoin_key_page_content",
+                classes="content_page"
+            ),
+            id="filecoin_key_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "cancel":
+            pass
+        else:
+            fe.popup_output = str(result)
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "filecoin_key_page_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "filecoin_key_page_set_button":
+            filecoin_key = self.get_child_by_id("filecoin_key_page").get_child_by_id("filecoin_key_page_content").get_child_by_id("filecoin_key_page_key_div").get_child_by_id("filecoin_key_page_key_input").value
+            
+            params = {"filecoin_key": filecoin_key}
+            self.app.submit(LoadJob(load.filecoin_key_set, params, on_result=self.on_res, aprx_time="5s."))
+
+class organization_page(Screen):
+    needs_refresh = True
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Organization Page", id="organization_page_title"),
+                Label("Organization Info:", id="organization_page_log_label"),
+                Log(id="org_metadata_info_log", auto_scroll=False),
+                Horizontal(
+                    Button(label="Metadata", id="organization_page_metadata_button"),
+                    Button(label="Groups", id="organization_page_groups_button"),
+                    id="organization_page_top_button_div",
+                    classes="organization_page_button_div"
+                ),
+                Horizontal(
+                    Button(label="Members", id="organization_page_members_button"),
+                    Button(label="Manage", id="organization_page_create_delete_button"),
+                    id="organization_page_bottom_button_div",
+                    classes="organization_page_button_div"
+                ),
+                Button(label="FileCoin Key", id="organization_page_filecoin_key_button"),
+                id="organization_page_content",
+                classes="content_page"
+            ),
+            id="organization_page"
+        )
+    
+    def print_info(self, org_info) -> None:
+        if org_info == "cancel":
+            self.app.go_back()
+        else:
+            log = self.query_one("#org_metadata_info_log", expect_type=Log)
+            log.clear()
+            log.write(f"My Organizations:\n\n{org_info}")
+
+    def on_screen_resume(self) -> None:
+        # Installed page: the info is reloaded each time it is opened, not when a page on top of it closes
+        if not self.needs_refresh:
+            return
+        self.needs_refresh = False
+        self.app.submit(LoadJob(load.my_org_list, on_result=self.print_info, aprx_time="30s."))
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "organization_page_metadata_button":
+            self.app.push_screen(org_metadata_page())
+        elif event.button.id == "organization_page_groups_button":
+            self.app.push_screen(org_groups_page())
+        elif event.button.id == "organization_page_members_button":
+            self.app.push_screen(members_page())
+        elif event.button.id == "organization_page_create_delete_button":
+            self.app.push_screen(org_manage_page())
+        elif event.button.id == "organization_page_filecoin_key_button":
+            self.app.push_screen(filecoin_key_page())
+
+
+class org_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Organization Metadata Page", id="org_metadata_page_title"),
+                Horizontal(
+                    Button(label="Print Metadata", id="org_metadata_page_print_button"),
+                    Button(label="Initialize Metadata", id="org_metadata_page_init_button"),
+                    Button(label="Add Description", id="org_metadata_add_desc_button"),
+                    id="org_metadata_page_upper_div",
+                    classes="org_metadata_page_div"
+                ),
+                Horizontal(
+                    Button(label="Manage Assets", id="org_metadata_assets_button"),
+                    Button(label="Manage Contacts", id="org_metadata_contacts_button"),
+                    Button(label="Update Metadata", id="org_metadata_update_button"),
+                    id="org_metadata_page_lower_div",
+                    classes="org_metadata_page_div"
+                ),
+                Button(label="Back", id="org_metadata_back_button"),
+                id="org_metadata_page_content",
+                classes="content_page"
+            ),
+            id="org_metadata_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "org_metadata_back_button":
+            self.app.navigate("organization")
+        elif event.button.id == "org_metadata_page_print_button":
+            self.app.push_screen(print_org_metadata_page())
+        elif event.button.id == "org_metadata_page_init_button":
+            self.app.push_screen(init_org_metadata_page())
+        elif event.button.id == "org_metadata_add_desc_button":
+            self.app.push_screen(add_org_metadata_desc_page())
+        elif event.button.id == "org_metadata_assets_button":
+            self.app.push_screen(manage_org_assets_page())
+        elif event.button.id == "org_metadata_contacts_button":
+            self.app.push_screen(manage_org_contacts_page())
+        elif event.button.id == "org_metadata_update_button":
+            self.app.push_screen(update_org_metadata_page())
+
+class print_org_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Organization Metadata Page", id="print_org_metadata_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="print_org_metadata_id_label", classes="print_org_metadata_page_label"),
+                    Input(placeholder="Organization ID", id="print_org_metadata_id_input", classes="print_org_metadata_page_input"),
+                    id="print_org_metadata_page_id_div",
+                    classes="print_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="print_org_metadata_back_button"),
+                    Button(label="View Metadata", id="print_org_metadata_confirm_button"),
+                    id="print_org_metadata_page_button_div",
+                    classes="print_org_metadata_page_div"
+                ),
+                id="print_org_metadata_page_content",
+                classes="content_page"
+            ),
+            id="print_org_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "print_org_metadata_confirm_button":
+            org_id = self.get_child_by_id("print_org_metadata_page").get_child_by_id("print_org_metadata_page_content").get_child_by_id("print_org_metadata_page_id_div").get_child_by_id("print_org_metadata_id_input").value
+
+            params = {"org_id": org_id}
+            self.app.submit(LoadJob(load.print_org_meta, params, on_result=self.on_res, aprx_time="5s."))
+        elif event.button.id == "print_org_metadata_back_button":
+            self.app.pop_screen()
+
+class init_org_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Initialize Metadata Page", id="init_org_metadata_page_title"),
+                Horizontal(
+                    Label("Organization Name", id="init_org_metadata_name_label", classes="init_org_metadata_page_label"),
+                    Input(placeholder="Input Organization name (The one you defined during the ETCD setup)", id="init_org_metadata_name_input", classes="init_org_metadata_page_input"),
+                    id="init_org_metadata_page_name_div",
+                    classes="init_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Organization ID", id="init_org_metadata_id_label", classes="init_org_metadata_page_label"),
+                    Input(placeholder="Define your unique organization ID (You must reuse this in your Daemon configuration)", id="init_org_metadata_id_input", classes="init_org_metadata_page_input"),
+                    id="init_org_metadata_page_id_div",
+                    classes="init_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata Path", id="init_org_metadata_meta_path_label", classes="init_org_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Organization metadata json file path (default 'organization_metadata.json' saved to TUI directory if unspecified)", id="init_org_metadata_meta_path_input", classes="init_org_metadata_page_input"),
+                    id="init_org_metadata_page_meta_path_div",
+                    classes="init_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="init_org_metadata_registry_label", classes="init_org_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from 'networks'", id="init_org_metadata_registry_input", classes="init_org_metadata_page_input"),
+                    id="init_org_metadata_page_registry_div",
+                    classes="init_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Organization Type", id="init_org_metadata_type_label", classes="init_org_metadata_page_label"),
+                    Select(options=((line, line) for line in """Individual\nOrganization""".splitlines()), prompt="Select Organization Type", id="init_org_metadata_type_select", classes="init_org_metadata_page_input"),
+                    id="init_org_metadata_page_type_div",
+                    classes="init_org_metadata_page_div"
+                ),
+                Label("File Storage Selection", id="init_org_metadata_file_storage_label", classes="init_org_metadata_page_label"),
+                RadioSet(
+                    RadioButton(label="IPFS", id="init_org_metadata_file_storage_ipfs_radio", classes="init_org_metadata_page_radio", value=True),
+                    RadioButton(label="Filecoin", id="init_org_metadata_file_storage_filecoin_radio", classes="init_org_metadata_page_radio"),
+                    id="init_org_metadata_file_storage_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="init_org_metadata_back_button"),
+                    Button(label="Initialize", id="init_org_metadata_confirm_button"),
+                    id="init_org_metadata_page_button_div",
+                    classes="init_org_metadata_page_div"
+                ),
+                id="init_org_metadata_page_content",
+                classes="content_page"
+            ),
+            id="init_org_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "init_org_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "init_org_metadata_confirm_button":
+            org_name = self.get_child_by_id("init_org_metadata_page").get_child_by_id("init_org_metadata_page_content").get_child_by_id("init_org_metadata_page_name_div").get_child_by_id("init_org_metadata_name_input").value
+            org_id = self.get_child_by_id("init_org_metadata_page").get_child_by_id("init_org_metadata_page_content").get_child_by_id("init_org_metadata_page_id_div").get_child_by_id("init_org_metadata_id_input").value
+            meta_file = self.get_child_by_id("init_org_metadata_page").get_child_by_id("init_org_metadata_page_content").get_child_by_id("init_org_metadata_page_meta_path_div").get_child_by_id("init_org_metadata_meta_path_input").value
+            reg_addr = self.get_child_by_id("init_org_metadata_page").get_child_by_id("init_org_metadata_page_content").get_child_by_id("init_org_metadata_page_registry_div").get_child_by_id("init_org_metadata_registry_input").value
+            org_type = self.get_child_by_id("init_org_metadata_page").get_child_by_id("init_org_metadata_page_content").get_child_by_id("init_org_metadata_page_type_div").get_child_by_id("init_org_metadata_type_select").value
+            ipfs = self.get_child_by_id("init_org_metadata_page").get_child_by_id("init_org_metadata_page_content").get_child_by_id("init_org_metadata_file_storage_radio_set").get_child_by_id("init_org_metadata_file_storage_ipfs_radio").value
+            filecoin = self.get_child_by_id("init_org_metadata_page").get_child_by_id("init_org_metadata_page_content").get_child_by_id("init_org_metadata_file_storage_radio_set").get_child_by_id("init_org_metadata_file_storage_filecoin_radio").value
+
+            params = {
+                "name": org_name,
+                "id": org_id,
+                "file": meta_file,
+                "reg": reg_addr,
+                "type": org_type,
+                "ipfs": ipfs,
+                "filecoin": filecoin
+            }
+            self.app.submit(LoadJob(load.init_org_metadata, params, on_result=self.on_res, aprx_time="10s."))
+
+class add_org_metadata_desc_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Add Metadata Description Page", id="add_org_metadata_desc_title"),
+                Horizontal(
+                    Label("Long Description", id="add_org_metadata_desc_long_label", classes="add_org_metadata_desc_page_label"),
+                    Input(placeholder="Description about organization", id="add_org_metadata_desc_long_input", classes="add_org_metadata_desc_page_input"),
+                    id="add_org_metadata_desc_long_div",
+                    classes="add_org_metadata_desc_page_div"
+                ),
+                Horizontal(
+                    Label("Short Description", id="add_org_metadata_desc_short_label", classes="add_org_metadata_desc_page_label"),
+                    Input(placeholder="Short description about organization", id="add_org_metadata_desc_short_input", classes="add_org_metadata_desc_page_input"),
+                    id="add_org_metadata_desc_short_div",
+                    classes="add_org_metadata_desc_page_div"
+                ),
+                Horizontal(
+                    Label("Organization URL", id="add_org_metadata_desc_url_label", classes="add_org_metadata_desc_page_label"),
+                    Input(placeholder="URL for Organization", id="add_org_metadata_desc_url_input", classes="add_org_metadata_desc_page_input"),
+                    id="add_org_metadata_desc_url_div",
+                    classes="add_org_metadata_desc_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File Path", id="add_org_metadata_desc_path_label", classes="add_org_metadata_desc_page_label"),
+                    Input(placeholder="[OPTIONAL] Service metadata json file name (default service_metadata.json)", id="add_org_metadata_desc_path_input", classes="add_org_metadata_desc_page_input"),
+                    id="add_org_metadata_desc_path_div",
+                    classes="add_org_metadata_desc_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="add_org_metadata_desc_back_button"),
+                    Button(label="Add Description", id="add_org_metadata_desc_confirm_button"),
+                    id="add_org_metadata_desc_button_div",
+                    classes="add_org_metadata_desc_page_div"
+                ),
+                id="add_org_metadata_desc_page_content",
+                classes="content_page"
+            ),
+            id="add_org_metadata_desc_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "add_org_metadata_desc_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "add_org_metadata_desc_confirm_button":
+            long_desc = self.get_child_by_id("add_org_metadata_desc_page").get_child_by_id("add_org_metadata_desc_page_content").get_child_by_id("add_org_metadata_desc_long_div").get_child_by_id("add_org_metadata_desc_long_input").value
+            short_desc = self.get_child_by_id("add_org_metadata_desc_page").get_child_by_id("add_org_metadata_desc_page_content").get_child_by_id("add_org_metadata_desc_short_div").get_child_by_id("add_org_metadata_desc_short_input").value
+            url = self.get_child_by_id("add_org_metadata_desc_page").get_child_by_id("add_org_metadata_desc_page_content").get_child_by_id("add_org_metadata_desc_url_div").get_child_by_id("add_org_metadata_desc_url_input").value
+            meta_path = self.get_child_by_id("add_org_metadata_desc_page").get_child_by_id("add_org_metadata_desc_page_content").get_child_by_id("add_org_metadata_desc_path_div").get_child_by_id("add_org_metadata_desc_path_input").value
+
+            params = {
+                "long": long_desc,
+                "short": short_desc,
+                "url": url,
+                "path": meta_path
+            }
+            
+            self.app.submit(LoadJob(load.add_org_metadata_desc, params, on_result=self.on_res, aprx_time="10s."))
+
+class manage_org_assets_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Manage Assets Page", id="manage_org_assets_title"),
+                Horizontal(
+                    Label("Hero Image Path", id="manage_org_assets_path_label", classes="manage_org_assets_page_label"),
+                    Input(placeholder="Hero_image Asset File Path", id="manage_org_assets_path_input", classes="manage_org_assets_page_input"),
+                    id="manage_org_assets_path_div",
+                    classes="manage_org_assets_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="manage_org_assets_meta_label", classes="manage_org_assets_page_label"),
+                    Input(placeholder="[OPTIONAL] Service metadata json file (default service_metadata.json) Default: 'organization_metadata.json'", id="manage_org_assets_meta_input", classes="manage_org_assets_page_input"),
+                    id="manage_org_assets_meta_div",
+                    classes="manage_org_assets_page_div"
+                ),
+                Horizontal(
+                    Button(label="Remove ALL Assets", id="manage_org_assets_remove_button"),
+                    Button(label="Add Asset", id="manage_org_assets_confirm_button"),
+                    id="manage_org_assets_button_div",
+                    classes="manage_org_assets_page_div"
+                ),
+                Button(label="Back", id="manage_org_assets_back_button"),
+                id="manage_org_assets_page_content",
+                classes="content_page"
+            ),
+            id="manage_org_assets_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        asset_file_path = self.get_child_by_id("manage_org_assets_page").get_child_by_id("manage_org_assets_page_content").get_child_by_id("manage_org_assets_path_div").get_child_by_id("manage_org_assets_path_input").value
+        metadata_file_name = self.get_child_by_id("manage_org_assets_page").get_child_by_id("manage_org_assets_page_content").get_child_by_id("manage_org_assets_meta_div").get_child_by_id("manage_org_assets_meta_input").value
+
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "manage_org_assets_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "manage_org_assets_confirm_button":
+            params = {
+                "name": metadata_file_name,
+                "path": asset_file_path
+            }
+            self.app.submit(LoadJob(load.org_assets_add, params, on_result=self.on_res, aprx_time="10s."))
+        elif event.button.id == "manage_org_assets_remove_button":
+            params = {
+                "name": metadata_file_name
+            }
+            self.app.submit(LoadJob(load.org_assets_remove, params, on_result=self.on_res, aprx_time="10s."))
+
+class manage_org_contacts_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Manage Contacts Page", id="manage_org_contacts_page_title"),
+                Horizontal(
+                    Label("Contact Type", id="manage_org_contacts_type_label", classes="manage_org_contacts_page_label"),
+                    Input(placeholder="Contact type of organization", id="manage_org_contacts_type_input", classes="manage_org_contacts_page_input"),
+                    id="manage_org_contacts_type_div",
+                    classes="manage_org_contacts_page_div"
+                ),
+                Horizontal(
+                    Label("Phone Number", id="manage_org_contacts_phone_label", classes="manage_org_contacts_page_label"),
+                    Input(placeholder="[Technically OPTIONAL] Phone number for contact with country code", id="manage_org_contacts_phone_input", classes="manage_org_contacts_page_input"),
+                    id="manage_org_contacts_phone_div",
+                    classes="manage_org_contacts_page_div"
+                ),
+                Horizontal(
+                    Label("Email ID", id="manage_org_contacts_email_label", classes="manage_org_contacts_page_label"),
+                    Input(placeholder="[Technically OPTIONAL] Email ID for contact", id="manage_org_contacts_email_input", classes="manage_org_contacts_page_input"),
+                    id="manage_org_contacts_email_div",
+                    classes="manage_org_contacts_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="manage_org_contacts_meta_label", classes="manage_org_contacts_page_label"),
+                    Input(placeholder="[OPTIONAL] Service metadata json file (default service_metadata.json) Default: 'organization_metadata.json'", id="manage_org_contacts_meta_input", classes="manage_org_contacts_page_input"),
+                    id="manage_org_contacts_meta_div",
+                    classes="manage_org_contacts_page_div"
+                ),
+                Horizontal(
+                    Button(label="Remove all contacts", id="manage_org_contacts_remove_button"),
+                    Button(label="Add contact", id="manage_org_contacts_confirm_button"),
+                    id="manage_org_contacts_button_div",
+                    classes="manage_org_contacts_page_div"
+                ),
+                Button(label="Back", id="manage_org_contacts_back_button"),
+                id="manage_org_contacts_page_content",
+                classes="content_page"
+            ),
+            id="manage_org_contacts_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        contact_type = self.get_child_by_id("manage_org_contacts_page").get_child_by_id("manage_org_contacts_page_content").get_child_by_id("manage_org_contacts_type_div").get_child_by_id("manage_org_contacts_type_input").value
+        phone = self.get_child_by_id("manage_org_contacts_page").get_child_by_id("manage_org_contacts_page_content").get_child_by_id("manage_org_contacts_phone_div").get_child_by_id("manage_org_contacts_phone_input").value
+        email = self.get_child_by_id("manage_org_contacts_page").get_child_by_id("manage_org_contacts_page_content").get_child_by_id("manage_org_contacts_email_div").get_child_by_id("manage_org_contacts_email_input").value
+        metadata_file = self.get_child_by_id("manage_org_contacts_page").get_child_by_id("manage_org_contacts_page_content").get_child_by_id("manage_org_contacts_meta_div").get_child_by_id("manage_org_contacts_meta_input").value
+
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account") 
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization") 
+        elif event.button.id == "services_page_nav": 
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav": 
+            self.app.push_screen(exit_page())
+        elif event.button.id == "manage_org_contacts_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "manage_org_contacts_confirm_button":
+            params = {
+                "type": contact_type,
+                "phone": phone,
+                "email": email,
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.org_contacts_add, params, on_result=self.on_res, aprx_time="5s."))
+        elif event.button.id == "manage_org_contacts_remove_button":
+            params = {
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.org_contacts_remove, params, on_result=self.on_res, aprx_time="5s."))
+
+class update_org_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Update Metadata Page", id="update_org_metadata_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="update_org_metadata_id_label", classes="update_org_metadata_page_label"),
+                    Input(placeholder="Your Organization ID", id="update_org_metadata_id_input", classes="update_org_metadata_page_input"),
+                    id="update_org_metadata_id_div",
+                    classes="update_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="update_org_metadata_file_label", classes="update_org_metadata_page_label"),
+                    Input(placeholder="Service metadata json file (default service_metadata.json) Default: 'organization_metadata.json'", id="update_org_metadata_file_input", classes="update_org_metadata_page_input"),
+                    id="update_org_metadata_file_div",
+                    classes="update_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Members List", id="update_org_metadata_mems_label", classes="update_org_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] List of members to be added to the organization", id="update_org_metadata_mems_input", classes="update_org_metadata_page_input"),
+                    id="update_org_metadata_mems_div",
+                    classes="update_org_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="update_org_metadata_index_label", classes="update_org_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="update_org_metadata_index_input", classes="update_org_metadata_page_input"),
+                    id="update_org_metadata_index_div",
+                    classes="update_org_metadata_page_div"
+                ),
+                Label("Run Options", id="update_org_metadata_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="update_org_metadata_quiet_radio", classes="update_org_metadata_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="update_org_metadata_verbose_radio", classes="update_org_metadata_page_radio"),
+                    id="update_org_metadata_radio_set"
+                ),
+                Label("File Storage Selection", id="update_org_metadata_file_storage_label", classes="update_org_metadata_page_label"),
+                RadioSet(
+                    RadioButton(label="IPFS", id="update_org_metadata_file_storage_ipfs_radio", classes="update_org_metadata_page_radio", value=True),
+                    RadioButton(label="Filecoin", id="update_org_metadata_file_storage_filecoin_radio", classes="update_org_metadata_page_radio"),
+                    id="update_org_metadata_file_storage_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="update_org_metadata_back_button"),
+                    Button(label="Update Metadata on Blockchain", id="update_org_metadata_confirm_button"),
+                    id="update_org_metadata_page_button_div",
+                    classes="update_org_metadata_page_div"
+                ),
+                id="update_org_metadata_page_content",
+                classes="content_page"
+            ),
+            id="update_org_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())        
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "update_org_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "update_org_metadata_confirm_button":
+            org_id = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_id_div").get_child_by_id("update_org_metadata_id_input").value
+            file_name = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_file_div").get_child_by_id("update_org_metadata_file_input").value
+            mem_list = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_mems_div").get_child_by_id("update_org_metadata_mems_input").value
+            index = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_index_div").get_child_by_id("update_org_metadata_index_input").value
+            quiet = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_radio_set").get_child_by_id("update_org_metadata_quiet_radio").value
+            verbose = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_radio_set").get_child_by_id("update_org_metadata_verbose_radio").value
+            ipfs = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_file_storage_radio_set").get_child_by_id("update_org_metadata_file_storage_ipfs_radio").value
+            filecoin = self.get_child_by_id("update_org_metadata_page").get_child_by_id("update_org_metadata_page_content").get_child_by_id("update_org_metadata_file_storage_radio_set").get_child_by_id("update_org_metadata_file_storage_filecoin_radio").value
+
+            params = {
+                "id": org_id,
+                "file": file_name,
+                "mems": mem_list,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose,
+                "ipfs": ipfs,
+                "filecoin": filecoin
+            }
+            self.app.submit(LoadJob(load.update_org_meta, params, on_result=self.on_res, aprx_time="45s."))
+
+class org_groups_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Organization Groups Page", id="org_groups_page_title"),
+                Horizontal(
+                    Button(label="Add a Group", id="org_groups_add_button"),
+                    Button(label="Update Group", id="org_groups_update_button"),
+                    id="org_groups_page_button_div"
+                ),
+                Button(label="Back", id="org_groups_back_button"),
+                id="org_groups_page_content",
+                classes="content_page"
+            ),
+            id="org_groups_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "org_groups_back_button":
+            self.app.navigate("organization")
+        elif event.button.id == "org_groups_add_button":
+            self.app.push_screen(add_org_group_page())
+        elif event.button.id == "org_groups_update_button":
+            self.app.push_screen(update_org_group_page())
+
+class add_org_group_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Add Organization Group Page", id="add_org_group_title"),
+                Horizontal(
+                    Label("Group Name", id="add_org_group_name_label", classes="add_org_group_label"),
+                    Input(placeholder="Group Name", id="add_org_group_name_input", classes="add_org_group_input"),
+                    id="add_org_group_name_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Payment Address", id="add_org_group_pay_addr_label", classes="add_org_group_label"),
+                    Input(placeholder="Payment Address", id="add_org_group_pay_addr_input", classes="add_org_group_input"),
+                    id="add_org_group_pay_addr_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Endpoints", id="add_org_group_endpoint_label", classes="add_org_group_label"),
+                    Input(placeholder="Endpoints (space separated if multiple, DO NOT add brackets '[]')", id="add_org_group_endpoint_input", classes="add_org_group_input"),
+                    id="add_org_group_endpoint_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="add_org_group_metadata_file_label", classes="add_org_group_label"),
+                    Input(placeholder="Service metadata json file", id="add_org_group_metadata_file_input", classes="add_org_group_input"),
+                    id="add_org_group_metadata_file_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Expir. Threshold", id="add_org_group_pay_expr_threshold_label", classes="add_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Payment Expiration threshold. Default: 100", id="add_org_group_pay_expr_threshold_input", classes="add_org_group_input"),
+                    id="add_org_group_pay_expr_threshold_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Channel Storage", id="add_org_group_pay_chann_storage_label", classes="add_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Storage channel for payment. Default: 'etcd'", id="add_org_group_pay_chann_storage_input", classes="add_org_group_input"),
+                    id="add_org_group_pay_chann_storage_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Connection Timeout", id="add_org_group_pay_chann_conn_to_label", classes="add_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Payment channel connection timeout. Default: '100s'", id="add_org_group_pay_chann_conn_to_input", classes="add_org_group_input"),
+                    id="add_org_group_pay_chann_conn_to_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Request Timeout", id="add_org_group_pay_chann_req_to_label", classes="add_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Payment channel request timeout. Default: '5s'", id="add_org_group_pay_chann_req_to_input", classes="add_org_group_input"),
+                    id="add_org_group_pay_chann_req_to_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="add_org_group_registry_label", classes="add_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from 'networks'", id="add_org_group_registry_input", classes="add_org_group_input"),
+                    id="add_org_group_registry_div",
+                    classes="add_org_group_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="add_org_group_back_button"),
+                    Button(label="Add Group", id="add_org_group_confirm_button"),
+                    id="add_org_group_button_div",
+                    classes="add_org_group_div"
+                ),
+                id="add_org_group_content",
+                classes="content_page"
+            ),
+            id="add_org_group_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            if errCode == 0:
+                self.app.navigate("organization")
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "add_org_group_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "add_org_group_confirm_button":
+            group_name = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_name_div").get_child_by_id("add_org_group_name_input").value
+            pay_addr = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_pay_addr_div").get_child_by_id("add_org_group_pay_addr_input").value
+            endpoints = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_endpoint_div").get_child_by_id("add_org_group_endpoint_input").value
+            payment_expiration_threshold = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_pay_expr_threshold_div").get_child_by_id("add_org_group_pay_expr_threshold_input").value
+            pay_chann_storage_type = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_pay_chann_storage_div").get_child_by_id("add_org_group_pay_chann_storage_input").value
+            pay_chann_conn_to = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_pay_chann_conn_to_div").get_child_by_id("add_org_group_pay_chann_conn_to_input").value
+            pay_chann_req_to = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_pay_chann_req_to_div").get_child_by_id("add_org_group_pay_chann_req_to_input").value
+            reg_addr = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_registry_div").get_child_by_id("add_org_group_registry_input").value
+            metadata_file = self.get_child_by_id("add_org_group_page").get_child_by_id("add_org_group_content").get_child_by_id("add_org_group_metadata_file_div").get_child_by_id("add_org_group_metadata_file_input").value
+
+            params = {
+                "name": group_name,
+                "pay_addr": pay_addr,
+                "eps": endpoints,
+                "expr_thres": payment_expiration_threshold,
+                "store_type": pay_chann_storage_type,
+                "conn_to": pay_chann_conn_to,
+                "req_to": pay_chann_req_to,
+                "reg_addr": reg_addr,
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.org_group_add, params, on_result=self.on_res, aprx_time="10s."))
+            
+class update_org_group_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Update Organization Group Page", id="update_org_group_title"),
+                Horizontal(
+                    Label("Group Id  ", id="update_org_group_name_label", classes="update_org_group_label"),
+                    Input(placeholder="Group ID", id="update_org_group_name_input", classes="update_org_group_input"),
+                    id="update_org_group_name_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="update_org_group_metadata_file_label", classes="update_org_group_label"),
+                    Input(placeholder="Service metadata json file (default service_metadata.json) Default: 'organization_metadata.json'", id="update_org_group_metadata_file_input", classes="update_org_group_input"),
+                    id="update_org_group_metadata_file_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Payment Address", id="update_org_group_pay_addr_label", classes="update_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Payment Address", id="update_org_group_pay_addr_input", classes="update_org_group_input"),
+                    id="update_org_group_pay_addr_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Endpoints", id="update_org_group_endpoint_label", classes="update_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Endpoints (space separated if multiple, DO NOT add brackets '[]')", id="update_org_group_endpoint_input", classes="update_org_group_input"),
+                    id="update_org_group_endpoint_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Expir. Threshold", id="update_org_group_pay_expr_threshold_label", classes="update_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Payment Expiration threshold. Default: 100", id="update_org_group_pay_expr_threshold_input", classes="update_org_group_input"),
+                    id="update_org_group_pay_expr_threshold_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Storage Channel", id="update_org_group_pay_chann_storage_label", classes="update_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Storage channel for payment. Default: 'etcd'", id="update_org_group_pay_chann_storage_input", classes="update_org_group_input"),
+                    id="update_org_group_pay_chann_storage_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Connection Timeout", id="update_org_group_pay_chann_conn_to_label", classes="update_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Payment channel connection timeout. Default: '100s'", id="update_org_group_pay_chann_conn_to_input", classes="update_org_group_input"),
+                    id="update_org_group_pay_chann_conn_to_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Request Timeout", id="update_org_group_pay_chann_req_to_label", classes="update_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Payment channel request timeout. Default: '5s'", id="update_org_group_pay_chann_req_to_input", classes="update_org_group_input"),
+                    id="update_org_group_pay_chann_req_to_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="update_org_group_registry_label", classes="update_org_group_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from 'networks'", id="update_org_group_registry_input", classes="update_org_group_input"),
+                    id="update_org_group_registry_div",
+                    classes="update_org_group_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="update_org_group_back_button"),
+                    Button(label="Update Group", id="update_org_group_confirm_button"),
+                    id="update_org_group_button_div",
+                    classes="update_org_group_div"
+                ),
+                id="update_org_group_content",
+                classes="content_page"
+            ),
+            id="update_org_group_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            if errCode == 0:
+                self.app.navigate("organization")
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "update_org_group_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "update_org_group_confirm_button":
+            group_name = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_name_div").get_child_by_id("update_org_group_name_input").value
+            pay_addr = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_pay_addr_div").get_child_by_id("update_org_group_pay_addr_input").value
+            endpoints = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_endpoint_div").get_child_by_id("update_org_group_endpoint_input").value
+            payment_expiration_threshold = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_pay_expr_threshold_div").get_child_by_id("update_org_group_pay_expr_threshold_input").value
+            pay_chann_storage_type = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_pay_chann_storage_div").get_child_by_id("update_org_group_pay_chann_storage_input").value
+            pay_chann_conn_to = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_pay_chann_conn_to_div").get_child_by_id("update_org_group_pay_chann_conn_to_input").value
+            pay_chann_req_to = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_pay_chann_req_to_div").get_child_by_id("update_org_group_pay_chann_req_to_input").value
+            reg_addr = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_registry_div").get_child_by_id("update_org_group_registry_input").value
+            metadata_file = self.get_child_by_id("update_org_group_page").get_child_by_id("update_org_group_content").get_child_by_id("update_org_group_metadata_file_div").get_child_by_id("update_org_group_metadata_file_input").value
+
+            params = {
+                "name": group_name,
+                "pay_addr": pay_addr,
+                "eps": endpoints,
+                "expr_thres": payment_expiration_threshold,
+                "store_type": pay_chann_storage_type,
+                "conn_to": pay_chann_conn_to,
+                "req_to": pay_chann_req_to,
+                "reg_addr": reg_addr,
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.org_group_update, params, on_result=self.on_res, aprx_time="10s."))
+
+class members_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Organization Members Page", id="members_page_title"),
+                Horizontal(
+                    Button(label="Manage Members", id="members_manage_button"),
+                    Button(label="Change Organization Owner", id="members_change_owner_button"),
+                    id="members_page_button_div"
+                ),
+                Button(label="Back", id="members_back_button"),
+                id="members_page_content",
+                classes="content_page"
+            ),
+            id="members_page"
+        )
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "members_back_button":
+            self.app.navigate("organization")
+        elif event.button.id == "members_manage_button":
+            self.app.push_screen(manage_members_page())
+        elif event.button.id == "members_change_owner_button":
+            self.app.push_screen(change_org_owner_page())
+
+class manage_members_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Manage Members Page", id="manage_members_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="manage_members_id_label", classes="manage_members_page_label"),
+                    Input(placeholder="Id of the Organization", id="manage_members_id_input", classes="manage_members_page_input"),
+                    id="manage_members_id_div",
+                    classes="manage_members_page_div"
+                ),
+                Horizontal(
+                    Label("Member List", id="manage_members_mem_list_label", classes="manage_members_page_label"),
+                    Input(placeholder="List of members to be added to/removed from the organization", id="manage_members_mem_list_input", classes="manage_members_page_input"),
+                    id="manage_members_mem_list_div",
+                    classes="manage_members_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="manage_members_index_label", classes="manage_members_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="manage_members_index_input", classes="manage_members_page_input"),
+                    id="manage_members_index_div",
+                    classes="manage_members_page_div"
+                ),
+                Label("Run Options", id="manage_members_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="manage_members_quiet_radio", classes="manage_members_radio"),
+                    RadioButton(label="Verbose transaction printing", id="manage_members_verbose_radio", classes="manage_members_radio"),
+                    id="manage_members_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Remove Member(s)", id="manage_members_remove_button"),
+                    Button(label="Add Member(s)", id="manage_members_add_button"),
+                    id="manage_members_page_button_div",
+                    classes="manage_members_page_div"
+                ),
+                Button(label="Back", id="manage_members_back_button"),
+                id="manage_members_page_content",
+                classes="content_page"
+            ),
+            id="manage_members_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        org_id = self.get_child_by_id("manage_members_page").get_child_by_id("manage_members_page_content").get_child_by_id("manage_members_id_div").get_child_by_id("manage_members_id_input").value
+        mem_list = self.get_child_by_id("manage_members_page").get_child_by_id("manage_members_page_content").get_child_by_id("manage_members_mem_list_div").get_child_by_id("manage_members_mem_list_input").value
+        index = self.get_child_by_id("manage_members_page").get_child_by_id("manage_members_page_content").get_child_by_id("manage_members_index_div").get_child_by_id("manage_members_index_input").value
+        quiet = self.get_child_by_id("manage_members_page").get_child_by_id("manage_members_page_content").get_child_by_id("manage_members_radio_set").get_child_by_id("manage_members_quiet_radio").value
+        verbose = self.get_child_by_id("manage_members_page").get_child_by_id("manage_members_page_content").get_child_by_id("manage_members_radio_set").get_child_by_id("manage_members_verbose_radio").value
+
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "manage_members_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "manage_members_add_button":
+            params = {
+                "id": org_id,
+                "mems": mem_list,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+            self.app.submit(LoadJob(load.org_members_add, params, on_result=self.on_res, aprx_time="10s."))
+        elif event.button.id == "manage_members_remove_button":
+            params = {
+                "id": org_id,
+                "mems": mem_list,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose 
+            }
+            self.app.submit(LoadJob(load.org_members_remove, params, on_result=self.on_res, aprx_time="10s."))
+
+class change_org_owner_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Organization Owner Page", id="change_org_owner_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="change_org_owner_id_label", classes="change_org_owner_page_label"),
+                    Input(placeholder="Id of the Organization", id="change_org_owner_id_input", classes="change_org_owner_page_input"),
+                    id="change_org_owner_page_id_div",
+                    classes="change_org_owner_page_div"
+                ),
+                Horizontal(
+                    Label("New Owner Address", id="change_org_owner_new_addr_label", classes="change_org_owner_page_label"),
+                    Input(placeholder="Address of the new Organization's owner", id="change_org_owner_new_addr_input", classes="change_org_owner_page_input"),
+                    id="change_org_owner_page_new_addr_div",
+                    classes="change_org_owner_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="change_org_owner_index_label", classes="change_org_owner_page_label"),
+                    Input(placeholder="[OPTIONAL] Account to use for signing (defaults to session.identity.default_wallet_index)", id="change_org_owner_index_input", classes="change_org_owner_page_input"),
+                    id="change_org_owner_page_index_div",
+                    classes="change_org_owner_page_div"
+                ),
+                Label("Run Options", id="change_org_owner_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="change_org_owner_quiet_radio"),
+                    RadioButton(label="Verbose transaction printing", id="change_org_owner_verbose_radio"),
+                    id="change_org_owner_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="change_org_owner_back_button"),
+                    Button(label="Change Owner", id="change_org_owner_confirm_button"),
+                    id="change_org_owner_page_button_div",
+                    classes="change_org_owner_page_div"
+                ),
+                id="change_org_owner_page_content",
+                classes="content_page"
+            ),
+            id="change_org_owner_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="10s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())   
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "change_org_owner_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "change_org_owner_confirm_button":
+            org_id = self.get_child_by_id("change_org_owner_page").get_child_by_id("change_org_owner_page_content").get_child_by_id("change_org_owner_page_id_div").get_child_by_id("change_org_owner_id_input").value
+            new_addr = self.get_child_by_id("change_org_owner_page").get_child_by_id("change_org_owner_page_content").get_child_by_id("change_org_owner_page_new_addr_div").get_child_by_id("change_org_owner_new_addr_input").value
+            index = self.get_child_by_id("change_org_owner_page").get_child_by_id("change_org_owner_page_content").get_child_by_id("change_org_owner_page_index_div").get_child_by_id("change_org_owner_index_input").value
+            quiet = self.get_child_by_id("change_org_owner_page").get_child_by_id("change_org_owner_page_content").get_child_by_id("change_org_owner_radio_set").get_child_by_id("change_org_owner_quiet_radio").value
+            verbose = self.get_child_by_id("change_org_owner_page").get_child_by_id("change_org_owner_page_content").get_child_by_id("change_org_owner_radio_set").get_child_by_id("change_org_owner_verbose_radio").value
+
+            params = {
+                "id": org_id,
+                "addr": new_addr,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+            self.app.submit(LoadJob(load.org_change_owner, params, on_result=self.on_res, aprx_time="10s."))
+
+class org_manage_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Organization Management Page", id="org_manage_page_title"),
+                Horizontal(
+                    Button(label="Create Organization", id="org_manage_add_button"),
+                    Button(label="Delete Organization", id="org_manage_delete_button"),
+                    id="org_manage_page_button_div"
+                ),
+                Button(label="Back", id="org_manage_back_button"),
+                id="org_manage_page_content",
+                classes="content_page"
+            ),
+            id="org_manage_page"
+        )
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "org_manage_back_button":
+            self.app.navigate("organization")
+        elif event.button.id == "org_manage_add_button":
+            self.app.push_screen(org_manage_create_page())
+        elif event.button.id == "org_manage_delete_button":
+            self.app.push_screen(org_manage_delete_page())
+
+class org_manage_create_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Create Organization Page", id="org_manage_create_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="org_manage_create_id_label", classes="org_manage_create_page_label"),
+                    Input(placeholder="Your Organization ID", id="org_manage_create_id_input", classes="org_manage_create_page_input"),
+                    id="org_manage_create_id_div",
+                    classes="org_manage_create_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File Path", id="org_manage_create_file_label", classes="org_manage_create_page_label"),
+                    Input(placeholder="Organization metadata json file path", id="org_manage_create_file_input", classes="org_manage_create_page_input"),
+                    id="org_manage_create_file_div",
+                    classes="org_manage_create_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Address", id="org_reg_addr_label", classes="org_manage_create_page_label"),
+                    Input(placeholder="[OPTIONAL] Registry contract address", id="org_reg_addr_input", classes="org_manage_create_page_input"),
+                    id="org_reg_addr_div",
+                    classes="org_manage_create_page_div"
+                ),
+                Horizontal(
+                    Label("Member List", id="org_manage_create_mems_label", classes="org_manage_create_page_label"),
+                    Input(placeholder="[OPTIONAL] List of members to be added to the organization", id="org_manage_create_mems_input", classes="org_manage_create_page_input"),
+                    id="org_manage_create_mems_div",
+                    classes="org_manage_create_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="org_manage_create_index_label", classes="org_manage_create_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="org_manage_create_index_input", classes="org_manage_create_page_input"),
+                    id="org_manage_create_index_div",
+                    classes="org_manage_create_page_div"
+                ),
+                Label("Run Options", id="org_manage_create_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="org_manage_create_quiet_radio", classes="org_manage_create_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="org_manage_create_verbose_radio", classes="org_manage_create_page_radio"),
+                    id="org_manage_create_radio_set"
+                ),
+                Label("File Storage Selection", id="org_manage_create_file_storage_label", classes="org_manage_create_page_label"),
+                RadioSet(
+                    RadioButton(label="IPFS", id="org_manage_create_file_storage_ipfs_radio", classes="org_manage_create_page_radio", value=True),
+                    RadioButton(label="Filecoin", id="org_manage_create_file_storage_filecoin_radio", classes="org_manage_create_page_radio"),
+                    id="org_manage_create_file_storage_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="org_manage_create_back_button"),
+                    Button(label="Create Organization", id="org_manage_create_confirm_button"),
+                    id="org_manage_create_page_button_div",
+                    classes="org_manage_create_page_div"
+                ),
+                id="org_manage_create_page_content",
+                classes="content_page"
+            ),
+            id="org_manage_create_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="30s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "org_manage_create_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "org_manage_create_confirm_button":
+            org_id = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_id_div").get_child_by_id("org_manage_create_id_input").value
+            reg_addr = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_reg_addr_div").get_child_by_id("org_reg_addr_input").value
+            file_name = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_file_div").get_child_by_id("org_manage_create_file_input").value
+            mem_list = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_mems_div").get_child_by_id("org_manage_create_mems_input").value
+            index = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_index_div").get_child_by_id("org_manage_create_index_input").value
+            quiet = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_radio_set").get_child_by_id("org_manage_create_quiet_radio").value
+            verbose = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_radio_set").get_child_by_id("org_manage_create_verbose_radio").value
+            ipfs = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_file_storage_radio_set").get_child_by_id("org_manage_create_file_storage_ipfs_radio").value
+            filecoin = self.get_child_by_id("org_manage_create_page").get_child_by_id("org_manage_create_page_content").get_child_by_id("org_manage_create_file_storage_radio_set").get_child_by_id("org_manage_create_file_storage_filecoin_radio").value
+
+            params = {
+                "id": org_id,
+                "reg_addr": reg_addr,
+                "file": file_name,
+                "mems": mem_list,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose,
+                "ipfs": ipfs,
+                "filecoin": filecoin
+            }
+            self.app.submit(LoadJob(load.org_create, params, on_result=self.on_res, aprx_time="30s."))
+
+class org_manage_delete_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("org"),
+            ScrollableContainer(
+                Label("Delete Organization Page", id="org_manage_delete_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="org_manage_delete_id_label", classes="org_manage_delete_page_label"),
+                    Input(placeholder="Your Organization ID", id="org_manage_delete_id_input", classes="org_manage_delete_page_input"),
+                    id="org_manage_delete_id_div",
+                    classes="org_manage_delete_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="org_manage_delete_index_label", classes="org_manage_delete_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="org_manage_delete_index_input", classes="org_manage_delete_page_input"),
+                    id="org_manage_delete_index_div",
+                    classes="org_manage_delete_page_div"
+                ),
+                Horizontal(
+                    Label("Contract Address", id="org_manage_reg_addr_label", classes="org_manage_delete_page_label"),
+                    Input(placeholder="[OPTIONAL] registry contract address (defaults to session.current_registry_at)", id="org_manage_delete_reg_addr_input", classes="org_manage_delete_page_input"),
+                    id="org_manage_delete_reg_addr_div",
+                    classes="org_manage_delete_page_div"
+                ),
+                Label("Run Options", id="org_manage_delete_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="org_manage_delete_quiet_radio", classes="org_manage_delete_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="org_manage_delete_verbose_radio", classes="org_manage_delete_page_radio"),
+                    id="org_manage_delete_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="org_manage_delete_back_button"),
+                    Button(label="Delete Organization", id="org_manage_delete_confirm_button"),
+                    id="org_manage_delete_page_button_div",
+                    classes="org_manage_delete_page_div"
+                ),
+                id="org_manage_delete_page_content",
+                classes="content_page"
+            ),
+            id="org_manage_delete_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="20s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "org_manage_delete_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "org_manage_delete_confirm_button":
+            org_id = self.get_child_by_id("org_manage_delete_page").get_child_by_id("org_manage_delete_page_content").get_child_by_id("org_manage_delete_id_div").get_child_by_id("org_manage_delete_id_input").value
+            index = self.get_child_by_id("org_manage_delete_page").get_child_by_id("org_manage_delete_page_content").get_child_by_id("org_manage_delete_index_div").get_child_by_id("org_manage_delete_index_input").value
+            reg_addr = self.get_child_by_id("org_manage_delete_page").get_child_by_id("org_manage_delete_page_content").get_child_by_id("org_manage_delete_reg_addr_div").get_child_by_id("org_manage_delete_reg_addr_input").value
+            quiet = self.get_child_by_id("org_manage_delete_page").get_child_by_id("org_manage_delete_page_content").get_child_by_id("org_manage_delete_radio_set").get_child_by_id("org_manage_delete_quiet_radio").value
+            verbose = self.get_child_by_id("org_manage_delete_page").get_child_by_id("org_manage_delete_page_content").get_child_by_id("org_manage_delete_radio_set").get_child_by_id("org_manage_delete_verbose_radio").value
+
+            params = {
+                "id": org_id,
+                "index": index,
+                "reg_addr": reg_addr,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+            self.app.submit(LoadJob(load.org_delete, params, on_result=self.on_res, aprx_time="20s."))
@@ -0,0 +1,208 @@
+import atexit
+import cProfile
+import functools
+import inspect
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from textual.screen import Screen
+
+# Opt-in profiling of the TUI's own code. Once enabled, every compose() and on_mount() of a screen
+# and every load screen worker runs under cProfile, and each call is written to its own .pstats
+# file, so a stalled screen or a slow output parser can be looked at on the machine where it
+# happens. Async code is only profiled while it runs, not while it waits.
+#
+# Enabled with SNET_TUI_PROFILE=1 or `python main.py --profile`. Files go to a directory per
+# session under ~/.snet/tui/profiles, with index.jsonl listing every profiled call and its time.
+#
+# Usage:
+#   python -m app.profiling [DIR]   slowest profiled calls of the session in DIR (default: latest)
+#   python -m pstats FILE           a single profile
+
+ENABLED = os.environ.get("SNET_TUI_PROFILE", "0") not in ("", "0")
+PROFILE_DIR = os.path.join(os.environ.get("SNET_TUI_DATA_DIR", os.path.join(os.path.expanduser("~"), ".snet", "tui")), "profiles")
+
+# Screen methods profiled
+SCREEN_METHODS = ("compose", "on_mount")
+
+session_dir = None
+_ids = itertools.count(1)
+_lock = threading.Lock()
+_wrapped_classes = set()
+
+
+def enable(directory=None):
+    # Starts profiling for the rest of the session, returns the directory the profiles go to
+    global session_dir
+    if session_dir is not None:
+        return session_dir
+    session_dir = directory or os.path.join(PROFILE_DIR, f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}")
+    os.makedirs(session_dir, exist_ok=True)
+
+    # Screen classes are wrapped when first instantiated, which also covers the sections' lazily
+    # imported modules
+    screen_init = Screen.__init__
+
+    @functools.wraps(screen_init)
+    def init(self, *args, **kwargs):
+        _wrap_screen_class(type(self))
+        screen_init(self, *args, **kwargs)
+
+    Screen.__init__ = init
+    atexit.register(lambda: print(f"Profiles written to {session_dir}", file=sys.stderr))
+    return session_dir
+
+
+def _wrap_screen_class(cls):
+    if cls in _wrapped_classes:
+        return
+    _wrapped_classes.add(cls)
+    for base in cls.__bases__:
+        if issubclass(base, Screen) and base is not Screen:
+            _wrap_screen_class(base)
+    for name in SCREEN_METHODS:
+        if name in vars(cls):
+            setattr(cls, name, _profiled_method(name, vars(cls)[name]))
+
+
+def _profiled_method(name, method):
+    # The action is named after the screen's class, not the class defining the method
+    def action(self):
+        return f"{type(self).__name__}.{name}"
+    return profiled(action, method)
+
+
+def _enable(profiler):
+    # Python 3.12 allows one active profiler at a time, calls overlapping one go unprofiled
+    try:
+        profiler.enable()
+        return True
+    except ValueError:
+        return False
+
+
+def _save(action, profiler, seconds):
+    with _lock:
+        path = os.path.join(session_dir, f"{next(_ids):04d}-{action}.pstats")
+    try:
+        profiler.dump_stats(path)
+        with _lock, open(os.path.join(session_dir, "index.jsonl"), "a") as f:
+            f.write(json.dumps({"time": time.time(), "action": action, "seconds": seconds, "file": os.path.basename(path)}) + "\n")
+    except OSError:
+        pass
+
+
+class _ProfiledSteps:
+    # Awaitable running a coroutine one step at a time with the profiler on, so the time it spends
+    # waiting (and whatever else the event loop runs meanwhile) is left out
+    def __init__(self, coroutine, profiler):
+        self.coroutine = coroutine
+        self.profiler = profiler
+        self.seconds = 0.0
+
+    def __await__(self):
+        value, error = None, None
+        while True:
+            start = time.perf_counter()
+            profiling = _enable(self.profiler)
+            try:
+                if error is not None:
+                    yielded = self.coroutine.throw(error)
+                else:
+                    yielded = self.coroutine.send(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                if profiling:
+                    self.profiler.disable()
+                self.seconds += time.perf_counter() - start
+            value, error = None, None
+            try:
+                value = yield yielded
+            except BaseException as e:
+                error = e
+
+
+def profiled(action, function):
+    # Wraps function (plain, generator or async) to profile each call once profiling is enabled.
+    # action is the name of the profile, or a function of the call's arguments returning it.
+    def name(args, kwargs):
+        return action(*args, **kwargs) if callable(action) else action
+
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            if session_dir is None:
+                return await function(*args, **kwargs)
+            profiler = cProfile.Profile()
+            steps = _ProfiledSteps(function(*args, **kwargs), profiler)
+            try:
+                return await steps
+            finally:
+                _save(name(args, kwargs), profiler, steps.seconds)
+    elif inspect.isgeneratorfunction(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if session_dir is None:
+                return (yield from function(*args, **kwargs))
+            profiler = cProfile.Profile()
+            generator = function(*args, **kwargs)
+            seconds = 0.0
+            try:
+                while True:
+                    # Only the generator's own steps, not what its consumer does between them
+                    start = time.perf_counter()
+                    profiling = _enable(profiler)
+                    try:
+                        item = next(generator)
+                    except StopIteration as stop:
+                        return stop.value
+                    finally:
+                        if profiling:
+                            profiler.disable()
+                        seconds += time.perf_counter() - start
+                    yield item
+            finally:
+                _save(name(args, kwargs), profiler, seconds)
+    else:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if session_dir is None:
+                return function(*args, **kwargs)
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiling = _enable(profiler)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                if profiling:
+                    profiler.disable()
+                _save(name(args, kwargs), profiler, time.perf_counter() - start)
+    return wrapper
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else None
+    if directory is None:
+        sessions = sorted(os.listdir(PROFILE_DIR)) if os.path.isdir(PROFILE_DIR) else []
+        if not sessions:
+            print("No profiles recorded")
+            return 1
+        directory = os.path.join(PROFILE_DIR, sessions[-1])
+    try:
+        with open(os.path.join(directory, "index.jsonl")) as f:
+            calls = [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        print(f"Error: no profiles in {directory}")
+        return 42
+    print(directory)
+    for call in sorted(calls, key=lambda call: call["seconds"], reverse=True)[:20]:
+        print(f"{call['seconds'] * 1000:10.1f} ms  {call['action']:<50} {call['file']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
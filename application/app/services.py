@@ -0,0 +1,2162 @@
+from textual import work, on
+from textual.app import ComposeResult
+from textual.containers import Grid, Horizontal, ScrollableContainer
+from textual.screen import Screen
+from textual.widgets import Button, Header, Label, Input, Select, RadioButton, RadioSet, DataTable
+from app.frontend import LoadJob, load, popup_output_page, conditional_input_page, exit_page
+from app.organization import filecoin_key_page
+import app.frontend as fe
+import back.backend as be
+import back.aio as aio
+import time
+
+# Services section: service metadata, publishing and the marketplace, imported when the section is first opened
+
+class services_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Services Page", id="services_page_title"),
+                Horizontal(
+                    Button(label="Metadata", id="services_metadata_button"),
+                    Button(label="Manage", id="services_page_manage_button"),
+                    id="services_page_button_div"
+                ),
+                Horizontal(
+                    Button(label="View All", id="services_view_all_button"),
+                    id="services_page_lower_button_div"
+                ),
+                Button(label="FileCoin Key", id="services_page_filecoin_key_button"),
+                id="services_page_content",
+                classes="content_page"
+            ),
+            id="services_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "services_metadata_button":
+            self.app.push_screen(services_metadata_page())
+        elif event.button.id == "services_page_manage_button":
+            self.app.push_screen(services_manage_page())
+        elif event.button.id == "services_view_all_button":
+            self.app.push_screen(services_view_all_page())
+        elif event.button.id == "services_page_filecoin_key_button":
+            self.app.push_screen(filecoin_key_page())
+
+class services_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service Metadata Page", id="manage_services_metadata_page_title"),
+                Horizontal(
+                    Button(label="Init. Service Metadata", id="services_metadata_init_button", classes="manage_services_metadata_page_button"),
+                    Button(label="Set", id="services_set_button", classes="manage_services_metadata_page_button"),
+                    Button(label="Add/Remove", id="services_add_remove_button", classes="manage_services_metadata_page_button"),
+                    id="manage_services_metadata_page_upper_div",
+                    classes="manage_services_metadata_page_div"
+                ),
+                Horizontal(
+                    Button(label="Update", id="services_update_button", classes="manage_services_metadata_page_button"),
+                    Button(label="Get", id="services_get_button", classes="manage_services_metadata_page_button"),  
+                    id="manage_services_metadata_page_lower_div",
+                    classes="manage_services_metadata_page_div"
+                ),
+                Button("Back", id="services_metadata_back_button"),
+                id="manage_services_metadata_page_content",
+                classes="content_page"
+            ),
+            id="manage_services_metadata_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "services_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "services_metadata_init_button":
+            self.app.push_screen(init_service_metadata_page())
+        elif event.button.id == "services_set_button":
+            self.app.push_screen(service_metadata_set_page())
+        elif event.button.id == "services_add_remove_button":
+            self.app.push_screen(service_metadata_add_remove_page())
+        elif event.button.id == "services_update_button":
+            self.app.push_screen(service_metadata_update_page())
+        elif event.button.id == "services_get_button":
+            self.app.push_screen(service_metadata_get_page())
+
+class init_service_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service Metadata Initialization Page", id="init_service_metadata_page_title"),
+                Horizontal(
+                    Label("Service Path", id="init_service_metadata_service_path_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="Service directory (Path to Service)", id="init_service_metadata_service_path_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_service_path_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Proto Directory", id="init_service_metadata_proto_dir_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="Directory which contains protobuf files", id="init_service_metadata_proto_dir_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_proto_dir_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Display Name", id="init_service_metadata_display_name_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="Service display name", id="init_service_metadata_display_name_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_display_name_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="init_service_metadata_file_name_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Service metadata json file (default service_metadata.json)", id="init_service_metadata_file_name_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_file_name_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="init_service_metadata_mpe_addr_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from “networks”", id="init_service_metadata_mpe_addr_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_mpe_addr_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group Name", id="init_service_metadata_pay_group_name_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="Name of the first payment group", id="init_service_metadata_pay_group_name_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_pay_group_name_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Endpoints", id="init_service_metadata_endpoints_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Endpoints for the first group. Default: []", id="init_service_metadata_endpoints_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_endpoints_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Fixed Price", id="init_service_metadata_price_label", classes="init_service_metadata_page_label"),
+                    Input(placeholder="Set fixed price in AGIX token for all methods", id="init_service_metadata_price_input", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_price_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Encoding Type", id="init_service_metadata_enc_type_label", classes="init_service_metadata_page_label"),
+                    Select(options=((line, line) for line in """proto\njson""".splitlines()), prompt="Select Encoding Type", id="init_service_metadata_enc_type_select", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_enc_type_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Service Type", id="init_service_metadata_serv_type_label", classes="init_service_metadata_page_label"),
+                    Select(options=((line, line) for line in """grpc\njsonrpc\nprocess""".splitlines()), prompt="Select Service Type", id="init_service_metadata_serv_type_select", classes="init_service_metadata_page_input"),
+                    id="init_service_metadata_serv_type_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                Label("File Storage Selection", id="init_service_metadata_file_storage_label", classes="init_service_metadata_page_label"),
+                RadioSet(
+                    RadioButton(label="IPFS", id="init_service_metadata_file_storage_ipfs_radio", classes="init_service_metadata_page_radio", value=True),
+                    RadioButton(label="Filecoin", id="init_service_metadata_file_storage_filecoin_radio", classes="init_service_metadata_page_radio"),
+                    id="init_service_metadata_file_storage_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="init_service_metadata_back_button"),
+                    Button(label="Initialize Service Metadata", id="init_service_metadata_confirm_button"),
+                    id="init_service_metadata_page_button_div",
+                    classes="init_service_metadata_page_div"
+                ),
+                id="init_service_metadata_page_content",
+                classes="content_page"
+            ),
+            id="init_service_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "init_service_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "init_service_metadata_confirm_button":
+            service_path = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_service_path_div").get_child_by_id("init_service_metadata_service_path_input").value
+            proto_path = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_proto_dir_div").get_child_by_id("init_service_metadata_proto_dir_input").value
+            service_display = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_display_name_div").get_child_by_id("init_service_metadata_display_name_input").value
+            metadata_file = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_file_name_div").get_child_by_id("init_service_metadata_file_name_input").value
+            mpe_addr = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_mpe_addr_div").get_child_by_id("init_service_metadata_mpe_addr_input").value
+            pay_group_name = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_pay_group_name_div").get_child_by_id("init_service_metadata_pay_group_name_input").value
+            endpoints = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_endpoints_div").get_child_by_id("init_service_metadata_endpoints_input").value
+            fixed_price = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_price_div").get_child_by_id("init_service_metadata_price_input").value
+            enc_type = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_enc_type_div").get_child_by_id("init_service_metadata_enc_type_select").value
+            serv_type = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_serv_type_div").get_child_by_id("init_service_metadata_serv_type_select").value
+            ipfs = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_file_storage_radio_set").get_child_by_id("init_service_metadata_file_storage_ipfs_radio").value
+            filecoin = self.get_child_by_id("init_service_metadata_page").get_child_by_id("init_service_metadata_page_content").get_child_by_id("init_service_metadata_file_storage_radio_set").get_child_by_id("init_service_metadata_file_storage_filecoin_radio").value
+
+            if enc_type == Select.BLANK:
+                enc_type = "proto"
+            if serv_type == Select.BLANK:
+                serv_type = "grpc"
+            
+            params = {
+                "service_path": service_path,
+                "proto_path": proto_path,
+                "service_display": service_display,
+                "metadata_file": metadata_file,
+                "mpe_addr": mpe_addr,
+                "pay_group_name": pay_group_name,
+                "endpoints": endpoints,
+                "fixed_price": fixed_price,
+                "enc_type": enc_type,
+                "serv_type": serv_type,
+                "ipfs": ipfs,
+                "filecoin": filecoin
+            }
+            self.app.submit(LoadJob(load.init_service_metadata, params, on_result=self.on_res, aprx_time="5s."))
+
+class service_metadata_set_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            Grid(
+                Label("Service Metadata Set Page", id="service_metadata_set_page_title"),
+                Horizontal(
+                    Button("Set model", id="service_metadata_set_model_button", classes="services_metadata_set_page_button"),
+                    Button("Set fixed price", id="service_metadata_set_fixed_price_button", classes="services_metadata_set_page_button"),
+                    Button("Set method price", id="service_metadata_set_method_price_button", classes="services_metadata_set_page_button"),
+                    id="service_metadata_set_upper_div",
+                    classes="service_metadata_set_div"
+                ),
+                Horizontal(
+                    Button("Set free calls", id="service_metadata_set_free_calls_button", classes="services_metadata_set_page_button"),
+                    Button("Set freecall signer address", id="service_metadata_set_freecall_signer_button", classes="services_metadata_set_page_button"),
+                    id="service_metadata_set_lower_div",
+                    classes="service_metadata_set_div"
+                ),
+                Button("Back", id="service_metadata_set_back_button"),
+                id="service_metadata_set_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_set_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_set_model_button":
+            self.app.push_screen(service_metadata_set_model_page())
+        elif event.button.id == "service_metadata_set_fixed_price_button":
+            self.app.push_screen(service_metadata_set_fixed_price_page())
+        elif event.button.id == "service_metadata_set_method_price_button":
+            self.app.push_screen(service_metadata_set_method_price_page())
+        elif event.button.id == "service_metadata_set_free_calls_button":
+            self.app.push_screen(service_metadata_set_free_calls_page())
+        elif event.button.id == "service_metadata_set_freecall_signer_button":
+            self.app.push_screen(service_metadata_set_freecall_signer_page())
+        elif event.button.id == "service_metadata_set_back_button":
+            self.app.pop_screen()
+
+class service_metadata_set_model_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Set Service Model Page", id="service_metadata_set_model_page_title"),
+                Horizontal(
+                    Label("Proto Directory", id="service_metadata_set_model_proto_dir_label", classes="service_metadata_set_model_page_label"),
+                    Input(placeholder="Directory which contains protobuf files", id="service_metadata_set_model_proto_dir_input", classes="service_metadata_set_model_page_input"),
+                    id="service_metadata_set_model_proto_dir_div",
+                    classes="service_metadata_set_model_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_set_model_file_label", classes="service_metadata_set_model_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_set_model_file_input", classes="service_metadata_set_model_page_input"),
+                    id="service_metadata_set_model_file_div",
+                    classes="service_metadata_set_model_page_div"
+                ),
+                Label("File Storage Selection", id="service_metadata_set_model_file_storage_label", classes="service_metadata_set_model_page_label"),
+                RadioSet(
+                    RadioButton(label="IPFS", id="service_metadata_set_model_file_storage_ipfs_radio", classes="service_metadata_set_model_page_radio", value=True),
+                    RadioButton(label="Filecoin", id="service_metadata_set_model_file_storage_filecoin_radio", classes="service_metadata_set_model_page_radio"),
+                    id="service_metadata_set_model_file_storage_radio_set"
+                ),
+                Horizontal(
+                    Button("Back", id="service_metadata_set_model_back_button"),
+                    Button("Set Model", id="service_metadata_set_model_confirm_button"),
+                    id="service_metadata_set_model_page_button_div",
+                    classes="service_metadata_set_model_page_div"
+                ),
+                id="service_metadata_set_model_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_set_model_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_set_model_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_set_model_confirm_button":
+            proto_dir = self.get_child_by_id("service_metadata_set_model_page").get_child_by_id("service_metadata_set_model_page_content").get_child_by_id("service_metadata_set_model_proto_dir_div").get_child_by_id("service_metadata_set_model_proto_dir_input").value
+            metadata_file = self.get_child_by_id("service_metadata_set_model_page").get_child_by_id("service_metadata_set_model_page_content").get_child_by_id("service_metadata_set_model_file_div").get_child_by_id("service_metadata_set_model_file_input").value
+            ipfs = self.get_child_by_id("service_metadata_set_model_page").get_child_by_id("service_metadata_set_model_page_content").get_child_by_id("service_metadata_set_model_file_storage_radio_set").get_child_by_id("service_metadata_set_model_file_storage_ipfs_radio").value
+            filecoin = self.get_child_by_id("service_metadata_set_model_page").get_child_by_id("service_metadata_set_model_page_content").get_child_by_id("service_metadata_set_model_file_storage_radio_set").get_child_by_id("service_metadata_set_model_file_storage_filecoin_radio").value
+
+            params = {
+                "proto_dir": proto_dir,
+                "metadata_file": metadata_file,
+                "ipfs": ipfs,
+                "filecoin": filecoin
+            }
+            self.app.submit(LoadJob(load.service_metadata_set_model, params, on_result=self.on_res, aprx_time="5s."))
+
+
+class service_metadata_set_fixed_price_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Set Service Fixed Price Page", id="service_metadata_set_fixed_price_page_title"),
+                Horizontal(
+                    Label("Group Name", id="service_metadata_set_fixed_price_group_label", classes="service_metadata_set_fixed_price_page_label"),
+                    Input(placeholder="Group name for fixed price method", id="service_metadata_set_fixed_price_group_input", classes="service_metadata_set_fixed_price_page_input"),
+                    id="service_metadata_set_fixed_price_group_div",
+                    classes="service_metadata_set_fixed_price_page_div"
+                ),
+                Horizontal(
+                    Label("Fixed Price", id="service_metadata_set_fixed_price_amount_label", classes="service_metadata_set_fixed_price_page_label"),
+                    Input(placeholder="Fixed price in AGIX token for all methods", id="service_metadata_set_fixed_price_amount_input", classes="service_metadata_set_fixed_price_page_input"),
+                    id="service_metadata_set_fixed_price_amount_div",
+                    classes="service_metadata_set_fixed_price_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_set_fixed_price_file_label", classes="service_metadata_set_fixed_price_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_set_fixed_price_file_input", classes="service_metadata_set_fixed_price_page_input"),
+                    id="service_metadata_set_fixed_price_file_div",
+                    classes="service_metadata_set_fixed_price_page_div"
+                ),
+                Horizontal(
+                    Button("Back", id="service_metadata_set_fixed_price_back_button"),
+                    Button("Set Fixed Price", id="service_metadata_set_fixed_price_confirm_button"),
+                    id="service_metadata_set_fixed_price_page_button_div",
+                    classes="service_metadata_set_fixed_price_page_div"
+                ),
+                id="service_metadata_set_fixed_price_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_set_fixed_price_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page()) 
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_set_fixed_price_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_set_fixed_price_confirm_button":
+            group_name = self.get_child_by_id("service_metadata_set_fixed_price_page").get_child_by_id("service_metadata_set_fixed_price_page_content").get_child_by_id("service_metadata_set_fixed_price_group_div").get_child_by_id("service_metadata_set_fixed_price_group_input").value
+            price = self.get_child_by_id("service_metadata_set_fixed_price_page").get_child_by_id("service_metadata_set_fixed_price_page_content").get_child_by_id("service_metadata_set_fixed_price_amount_div").get_child_by_id("service_metadata_set_fixed_price_amount_input").value
+            metadata_file = self.get_child_by_id("service_metadata_set_fixed_price_page").get_child_by_id("service_metadata_set_fixed_price_page_content").get_child_by_id("service_metadata_set_fixed_price_file_div").get_child_by_id("service_metadata_set_fixed_price_file_input").value
+
+            params = {
+                "group_name": group_name,
+                "price": price,
+                "metadata_file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_set_fixed_price, params, on_result=self.on_res, aprx_time="5s."))
+
+class service_metadata_set_method_price_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Set Service Method Price Page", id="service_metadata_set_method_price_page_title"),
+                Horizontal(
+                    Label("Group Name", id="service_metadata_set_method_price_group_label", classes="service_metadata_set_method_price_page_label"),
+                    Input(placeholder="Group Name", id="service_metadata_set_method_price_group_input", classes="service_metadata_set_method_price_page_input"),
+                    id="service_metadata_set_method_price_group_div",
+                    classes="service_metadata_set_method_price_page_div"
+                ),
+                Horizontal(
+                    Label("Package Name", id="service_metadata_set_method_price_package_label", classes="service_metadata_set_method_price_page_label"),
+                    Input(placeholder="Package Name", id="service_metadata_set_method_price_package_input", classes="service_metadata_set_method_price_page_input"),
+                    id="service_metadata_set_method_price_package_div",
+                    classes="service_metadata_set_method_price_page_div"
+                ),
+                Horizontal(
+                    Label("Service Name", id="service_metadata_set_method_price_service_label", classes="service_metadata_set_method_price_page_label"),
+                    Input(placeholder="Service Name", id="service_metadata_set_method_price_service_input", classes="service_metadata_set_method_price_page_input"),
+                    id="service_metadata_set_method_price_service_div",
+                    classes="service_metadata_set_method_price_page_div"
+                ),
+                Horizontal(
+                    Label("Method Name", id="service_metadata_set_method_price_method_label", classes="service_metadata_set_method_price_page_label"),
+                    Input(placeholder="Method Name", id="service_metadata_set_method_price_method_input", classes="service_metadata_set_method_price_page_input"),
+                    id="service_metadata_set_method_price_method_div",
+                    classes="service_metadata_set_method_price_page_div"
+                ),
+                Horizontal(
+                    Label("Fixed Price", id="service_metadata_set_method_price_amount_label", classes="service_metadata_set_method_price_page_label"),
+                    Input(placeholder="Set fixed price in AGIX token for all methods", id="service_metadata_set_method_price_amount_input", classes="service_metadata_set_method_price_page_input"),
+                    id="service_metadata_set_method_price_amount_div",
+                    classes="service_metadata_set_method_price_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_set_method_price_file_label", classes="service_metadata_set_method_price_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_set_method_price_file_input", classes="service_metadata_set_method_price_page_input"),
+                    id="service_metadata_set_method_price_file_div",
+                    classes="service_metadata_set_method_price_page_div"
+                ),
+                Horizontal(
+                    Button("Back", id="service_metadata_set_method_price_back_button"),
+                    Button("Set Method Price", id="service_metadata_set_method_price_confirm_button"),
+                    id="service_metadata_set_method_price_page_button_div",
+                    classes="service_metadata_set_method_price_page_div"
+                ),
+                id="service_metadata_set_method_price_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_set_method_price_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_set_method_price_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_set_method_price_confirm_button":
+            group_name = self.get_child_by_id("service_metadata_set_method_price_page").get_child_by_id("service_metadata_set_method_price_page_content").get_child_by_id("service_metadata_set_method_price_group_div").get_child_by_id("service_metadata_set_method_price_group_input").value
+            package_name = self.get_child_by_id("service_metadata_set_method_price_page").get_child_by_id("service_metadata_set_method_price_page_content").get_child_by_id("service_metadata_set_method_price_package_div").get_child_by_id("service_metadata_set_method_price_package_input").value
+            service_name = self.get_child_by_id("service_metadata_set_method_price_page").get_child_by_id("service_metadata_set_method_price_page_content").get_child_by_id("service_metadata_set_method_price_service_div").get_child_by_id("service_metadata_set_method_price_service_input").value
+            method_name = self.get_child_by_id("service_metadata_set_method_price_page").get_child_by_id("service_metadata_set_method_price_page_content").get_child_by_id("service_metadata_set_method_price_method_div").get_child_by_id("service_metadata_set_method_price_method_input").value
+            price = self.get_child_by_id("service_metadata_set_method_price_page").get_child_by_id("service_metadata_set_method_price_page_content").get_child_by_id("service_metadata_set_method_price_amount_div").get_child_by_id("service_metadata_set_method_price_amount_input").value
+            metadata_file = self.get_child_by_id("service_metadata_set_method_price_page").get_child_by_id("service_metadata_set_method_price_page_content").get_child_by_id("service_metadata_set_method_price_file_div").get_child_by_id("service_metadata_set_method_price_file_input").value
+            
+            params = {
+                "group_name": group_name,
+                "package_name": package_name,
+                "service_name": service_name,
+                "method_name": method_name,
+                "price": price,
+                "metadata_file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_set_method_price, params, on_result=self.on_res, aprx_time="5s."))
+
+class service_metadata_set_free_calls_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service Set Free Calls Page", id="service_metadata_set_free_calls_page_title"),
+                Horizontal(
+                    Label("Group Name", id="service_metadata_set_free_calls_group_label", classes="service_metadata_set_free_calls_page_label"),
+                    Input(placeholder="Group Name", id="service_metadata_set_free_calls_group_input", classes="service_metadata_set_free_calls_page_input"),
+                    id="service_metadata_set_free_calls_group_div",
+                    classes="service_metadata_set_free_calls_page_div"
+                ),
+                Horizontal(
+                    Label("Num. of Free Calls", id="service_metadata_set_free_calls_num_label", classes="service_metadata_set_free_calls_page_label"),
+                    Input(placeholder="Number of free calls", id="service_metadata_set_free_calls_num_input", classes="service_metadata_set_free_calls_page_input"),
+                    id="service_metadata_set_free_calls_num_div",
+                    classes="service_metadata_set_free_calls_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_set_free_calls_file_label", classes="service_metadata_set_free_calls_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_set_free_calls_file_input", classes="service_metadata_set_free_calls_page_input"),
+                    id="service_metadata_set_free_calls_file_div",
+                    classes="service_metadata_set_free_calls_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="service_metadata_set_free_calls_back_button"),
+                    Button(label="Set Free Calls", id="service_metadata_set_free_calls_confirm_button"),
+                    id="service_metadata_set_free_calls_button_div",
+                    classes="service_metadata_set_free_calls_page_div"
+                ),
+                id="service_metadata_set_free_calls_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_set_free_calls_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_set_free_calls_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_set_free_calls_confirm_button":
+            group_name = self.get_child_by_id("service_metadata_set_free_calls_page").get_child_by_id("service_metadata_set_free_calls_page_content").get_child_by_id("service_metadata_set_free_calls_group_div").get_child_by_id("service_metadata_set_free_calls_group_input").value
+            free_calls = self.get_child_by_id("service_metadata_set_free_calls_page").get_child_by_id("service_metadata_set_free_calls_page_content").get_child_by_id("service_metadata_set_free_calls_num_div").get_child_by_id("service_metadata_set_free_calls_num_input").value
+            metadata_file = self.get_child_by_id("service_metadata_set_free_calls_page").get_child_by_id("service_metadata_set_free_calls_page_content").get_child_by_id("service_metadata_set_free_calls_file_div").get_child_by_id("service_metadata_set_free_calls_file_input").value
+            
+            params = {
+                "group_name": group_name,
+                "free_calls": free_calls,
+                "metadata_file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_set_free_calls, params, on_result=self.on_res, aprx_time="10s."))
+
+class service_metadata_set_freecall_signer_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service Freecall Signer Page", id="service_metadata_set_freecall_signer_page_title"),
+                Horizontal(
+                    Label("Payment Group", id="service_metadata_set_freecall_signer_group_label", classes="service_metadata_set_freecall_signer_page_label"),
+                    Input(placeholder="Name of the payment group to which we want to set freecalls", id="service_metadata_set_freecall_signer_group_input", classes="service_metadata_set_freecall_signer_page_input"),
+                    id="service_metadata_set_freecall_signer_group_div",
+                    classes="service_metadata_set_freecall_signer_page_div"
+                ),
+                Horizontal(
+                    Label("Signer Address", id="service_metadata_set_freecall_signer_addr_label", classes="service_metadata_set_freecall_signer_page_label"),
+                    Input(placeholder="Signer Address - This is used to define the public key address used for validating signatures requested specially for free call. To be obtained as part of curation process", id="service_metadata_set_freecall_signer_addr_input", classes="service_metadata_set_freecall_signer_page_input"),
+                    id="service_metadata_set_freecall_signer_addr_div",
+                    classes="service_metadata_set_freecall_signer_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_set_freecall_signer_file_label", classes="service_metadata_set_freecall_signer_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_set_freecall_signer_file_input", classes="service_metadata_set_freecall_signer_page_input"),
+                    id="service_metadata_set_freecall_signer_file_div",
+                    classes="service_metadata_set_freecall_signer_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="service_metadata_set_freecall_signer_back_button"),
+                    Button(label="Set Signer Address", id="service_metadata_set_freecall_signer_confirm_button"),
+                    id="service_metadata_set_freecall_signer_button_div",
+                    classes="service_metadata_set_freecall_signer_page_div"
+                ),
+                id="service_metadata_set_freecall_signer_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_set_freecall_signer_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_set_freecall_signer_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_set_freecall_signer_confirm_button":
+            group_name = self.get_child_by_id("service_metadata_set_freecall_signer_page").get_child_by_id("service_metadata_set_freecall_signer_page_content").get_child_by_id("service_metadata_set_freecall_signer_group_div").get_child_by_id("service_metadata_set_freecall_signer_group_input").value
+            signer_addr = self.get_child_by_id("service_metadata_set_freecall_signer_page").get_child_by_id("service_metadata_set_freecall_signer_page_content").get_child_by_id("service_metadata_set_freecall_signer_addr_div").get_child_by_id("service_metadata_set_freecall_signer_addr_input").value
+            metadata_file = self.get_child_by_id("service_metadata_set_freecall_signer_page").get_child_by_id("service_metadata_set_freecall_signer_page_content").get_child_by_id("service_metadata_set_freecall_signer_file_div").get_child_by_id("service_metadata_set_freecall_signer_file_input").value
+            
+            params = {
+                "group_name": group_name,
+                "signer_addr": signer_addr,
+                "metadata_file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_set_freecall_signer, params, on_result=self.on_res, aprx_time="5s."))
+
+class service_metadata_add_remove_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            Grid(
+                Label("Service Metadata Add/Remove Page", id="service_metadata_add_remove_page_title"),
+                Horizontal(
+                    Button(label="Add Service Description", id="services_metadata_add_desc_button", classes="services_metadata_add_remove_button"),
+                    Button("Add/Remove Service Metadata Groups", id="services_metadata_add_remove_groups_button", classes="services_metadata_add_remove_button"),
+                    Button("Add/Remove Daemon Address", id="services_metadata_add_remove_daemon_button", classes="services_metadata_add_remove_button"),
+                    id="services_metadata_add_remove_upper_div",
+                    classes="services_metadata_add_remove_div"
+                ),
+                Horizontal(
+                    Button("Add/Remove Service Metadata Assets", id="services_metadata_add_remove_assets_button", classes="services_metadata_add_remove_button"),
+                    Button("Add/Remove Service Metadata Media", id="services_metadata_add_remove_media_button", classes="services_metadata_add_remove_button"),
+                    id="services_metadata_add_remove_lower_div",
+                    classes="services_metadata_add_remove_div"
+                ),
+                Button("Back", id="service_metadata_add_remove_back_button"),
+                id="service_metadata_add_remove_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_add_remove_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_add_remove_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "services_metadata_add_desc_button":
+            self.app.push_screen(add_desc_service_metadata_page())
+        elif event.button.id == "services_metadata_add_remove_groups_button":
+            self.app.push_screen(service_metadata_add_remove_group_page())
+        elif event.button.id == "services_metadata_add_remove_daemon_button":
+            self.app.push_screen(service_metadata_add_remove_daemon_addr_page())
+        elif event.button.id == "services_metadata_add_remove_assets_button":
+            self.app.push_screen(service_metadata_add_remove_assets_page())
+        elif event.button.id == "services_metadata_add_remove_media_button":
+            self.app.push_screen(service_metadata_add_remove_media_page())
+
+class add_desc_service_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Add Description Page", id="add_desc_service_metadata_page_title"),
+                Horizontal(
+                    Label("Long Description", id="add_desc_service_metadata_long_label", classes="add_desc_service_metadata_page_label"),
+                    Input(placeholder="Description of the service and what it does", id="add_desc_service_metadata_long_input", classes="add_desc_service_metadata_page_input"),
+                    id="add_desc_service_metadata_long_div",
+                    classes="add_desc_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Short Description", id="add_desc_service_metadata_short_label", classes="add_desc_service_metadata_page_label"),
+                    Input(placeholder="Short overview of the service", id="add_desc_service_metadata_short_input", classes="add_desc_service_metadata_page_input"),
+                    id="add_desc_service_metadata_short_div",
+                    classes="add_desc_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("URL", id="add_desc_service_metadata_url_label", classes="add_desc_service_metadata_page_label"),
+                    Input(placeholder="URL to provide more details of the service", id="add_desc_service_metadata_url_input", classes="add_desc_service_metadata_page_input"),
+                    id="add_desc_service_metadata_url_div",
+                    classes="add_desc_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="add_desc_service_metadata_meta_file_label", classes="add_desc_service_metadata_page_label"),
+                    Input(placeholder="Service metadata json file path", id="add_desc_service_metadata_meta_file_input", classes="add_desc_service_metadata_page_input"),
+                    id="add_desc_service_metadata_meta_file_div",
+                    classes="add_desc_service_metadata_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="add_desc_service_metadata_back_button"),
+                    Button(label="Add Service Description", id="add_desc_service_metadata_confirm_button"),
+                    id="add_desc_service_metadata_button_div",
+                    classes="add_desc_service_metadata_page_div"
+                ),
+                id="add_desc_service_metadata_page_content",
+                classes="content_page"
+            ),
+            id="add_desc_service_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "add_desc_service_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "add_desc_service_metadata_confirm_button":
+            long_desc = self.get_child_by_id("add_desc_service_metadata_page").get_child_by_id("add_desc_service_metadata_page_content").get_child_by_id("add_desc_service_metadata_long_div").get_child_by_id("add_desc_service_metadata_long_input").value
+            short_desc = self.get_child_by_id("add_desc_service_metadata_page").get_child_by_id("add_desc_service_metadata_page_content").get_child_by_id("add_desc_service_metadata_short_div").get_child_by_id("add_desc_service_metadata_short_input").value
+            url = self.get_child_by_id("add_desc_service_metadata_page").get_child_by_id("add_desc_service_metadata_page_content").get_child_by_id("add_desc_service_metadata_url_div").get_child_by_id("add_desc_service_metadata_url_input").value
+            metadata_file = self.get_child_by_id("add_desc_service_metadata_page").get_child_by_id("add_desc_service_metadata_page_content").get_child_by_id("add_desc_service_metadata_meta_file_div").get_child_by_id("add_desc_service_metadata_meta_file_input").value
+            
+            params = {
+                "long_desc": long_desc,
+                "short_desc": short_desc,
+                "url": url,
+                "metadata_file": metadata_file
+            }
+            self.app.submit(LoadJob(load.add_desc_service_metadata, params, on_result=self.on_res, aprx_time="5s."))
+
+class service_metadata_add_remove_group_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Manage Service Group Page", id="service_metadata_add_remove_group_page_title"),
+                Horizontal(
+                    Label("Payment Group", id="service_metadata_add_remove_group_group_label", classes="service_metadata_add_remove_group_page_label"),
+                    Input(placeholder="Name of the payment group to be added/removed", id="service_metadata_add_remove_group_group_input", classes="service_metadata_add_remove_group_page_input"),
+                    id="service_metadata_add_remove_group_group_div",
+                    classes="service_metadata_add_remove_group_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_add_remove_group_file_label", classes="service_metadata_add_remove_group_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_add_remove_group_file_input", classes="service_metadata_add_remove_group_page_input"),
+                    id="service_metadata_add_remove_group_file_div",
+                    classes="service_metadata_add_remove_group_page_div"
+                ),
+                Horizontal(
+                    Button("Remove Group", id="service_metadata_add_remove_group_remove_button"),
+                    Button("Add Group", id="service_metadata_add_remove_group_add_button"),
+                    id="service_metadata_add_remove_group_button_div",
+                    classes="service_metadata_add_remove_group_page_div"
+                ),
+                Button("Back", id="service_metadata_add_remove_group_back_button"),
+                id="service_metadata_add_remove_group_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_add_remove_group_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        group_name = self.get_child_by_id("service_metadata_add_remove_group_page").get_child_by_id("service_metadata_add_remove_group_page_content").get_child_by_id("service_metadata_add_remove_group_group_div").get_child_by_id("service_metadata_add_remove_group_group_input").value
+        metadata_file = self.get_child_by_id("service_metadata_add_remove_group_page").get_child_by_id("service_metadata_add_remove_group_page_content").get_child_by_id("service_metadata_add_remove_group_file_div").get_child_by_id("service_metadata_add_remove_group_file_input").value
+
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_add_remove_group_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_add_remove_group_add_button":
+            params = {
+                "group_name": group_name,
+                "metadata_file": metadata_file,
+                "operation": "add"
+            }
+            self.app.submit(LoadJob(load.service_metadata_add_remove_group, params, on_result=self.on_res, aprx_time="10s."))
+        elif event.button.id == "service_metadata_add_remove_group_remove_button":
+            params = {
+                "group_name": group_name,
+                "metadata_file": metadata_file,
+                "operation": "remove"
+            }
+            self.app.submit(LoadJob(load.service_metadata_add_remove_group, params, on_result=self.on_res, aprx_time="10s."))
+
+class service_metadata_add_remove_daemon_addr_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service Daemon Address Page", id="service_metadata_add_remove_daemon_addr_page_title"),
+                Horizontal(
+                    Label("Payment Group", id="service_metadata_add_remove_daemon_addr_group_label", classes="service_metadata_add_remove_daemon_addr_page_label"),
+                    Input(placeholder="Name of the payment group to be added/removed", id="service_metadata_add_remove_daemon_addr_group_input", classes="service_metadata_add_remove_daemon_addr_page_input"),
+                    id="service_metadata_add_remove_daemon_addr_group_div",
+                    classes="service_metadata_add_remove_daemon_addr_page_div"
+                ),
+                Horizontal(
+                    Label("Daemon Addresses", id="service_metadata_add_remove_daemon_addr_endpoint_label", classes="service_metadata_add_remove_daemon_addr_page_label"),
+                    Input(placeholder="[NOT REQUIRED FOR DELETE] Ethereum public addresses of daemon", id="service_metadata_add_remove_daemon_addr_endpoint_input", classes="service_metadata_add_remove_daemon_addr_page_input"),
+                    id="service_metadata_add_remove_daemon_addr_endpoint_div",
+                    classes="service_metadata_add_remove_daemon_addr_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_add_remove_daemon_addr_file_label", classes="service_metadata_add_remove_daemon_addr_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_add_remove_daemon_addr_file_input", classes="service_metadata_add_remove_daemon_addr_page_input"),
+                    id="service_metadata_add_remove_daemon_addr_file_div",
+                    classes="service_metadata_add_remove_daemon_addr_page_div"
+                ),
+                Horizontal(
+                    Button("Remove ALL Daemon Addresses (NOTE: EVERY addr)", id="service_metadata_add_remove_daemon_addr_remove_button"),
+                    Button("Add Daemon Address", id="service_metadata_add_remove_daemon_addr_add_button"),
+                    id="service_metadata_add_remove_daemon_addr_button_div",
+                    classes="service_metadata_add_remove_daemon_addr_page_div"
+                ),
+                Button("Back", id="service_metadata_add_remove_daemon_addr_back_button"),
+                id="service_metadata_add_remove_daemon_addr_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_add_remove_daemon_addr_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        group_name = self.get_child_by_id("service_metadata_add_remove_daemon_addr_page").get_child_by_id("service_metadata_add_remove_daemon_addr_page_content").get_child_by_id("service_metadata_add_remove_daemon_addr_group_div").get_child_by_id("service_metadata_add_remove_daemon_addr_group_input").value
+        daemon_addr = self.get_child_by_id("service_metadata_add_remove_daemon_addr_page").get_child_by_id("service_metadata_add_remove_daemon_addr_page_content").get_child_by_id("service_metadata_add_remove_daemon_addr_endpoint_div").get_child_by_id("service_metadata_add_remove_daemon_addr_endpoint_input").value
+        metadata_file = self.get_child_by_id("service_metadata_add_remove_daemon_addr_page").get_child_by_id("service_metadata_add_remove_daemon_addr_page_content").get_child_by_id("service_metadata_add_remove_daemon_addr_file_div").get_child_by_id("service_metadata_add_remove_daemon_addr_file_input").value
+
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_add_remove_daemon_addr_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_add_remove_daemon_addr_add_button":
+            params = {
+                "group_name": group_name,
+                "daemon_addr": daemon_addr,
+                "metadata_file": metadata_file,
+                "operation": "add"
+            }
+            self.app.submit(LoadJob(load.service_metadata_add_remove_daemon_addr, params, on_result=self.on_res, aprx_time="5s."))
+        elif event.button.id == "service_metadata_add_remove_daemon_addr_remove_button":
+            params = {
+                "group_name": group_name,
+                "daemon_addr": daemon_addr,
+                "metadata_file": metadata_file,
+                "operation": "remove"
+            }
+            self.app.submit(LoadJob(load.service_metadata_add_remove_daemon_addr, params, on_result=self.on_res, aprx_time="5s."))
+
+class service_metadata_add_remove_assets_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Manage Service Assets Page", id="service_metadata_add_remove_assets_page_title"),
+                Horizontal(
+                    Label("Asset Path", id="service_metadata_add_remove_assets_path_label", classes="service_metadata_add_remove_assets_page_label"),
+                    Input(placeholder="[NOT REQUIRED FOR DELETE ALL] Asset file path", id="service_metadata_add_remove_assets_path_input", classes="service_metadata_add_remove_assets_page_input"),
+                    id="service_metadata_add_remove_assets_path_div",
+                    classes="service_metadata_add_remove_assets_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_add_remove_assets_file_label", classes="service_metadata_add_remove_assets_page_label"),
+                    Input(placeholder="Service metadata json file", id="service_metadata_add_remove_assets_file_input", classes="service_metadata_add_remove_assets_page_input"),
+                    id="service_metadata_add_remove_assets_file_div",
+                    classes="service_metadata_add_remove_assets_page_div"
+                ),
+                Horizontal(
+                    Label("Asset Type", id="service_metadata_add_remove_assets_type_label", classes="service_metadata_add_remove_assets_page_label"),
+                    Select(options=((line, line) for line in """hero_image\nimages""".splitlines()), prompt="Select Asset Type", id="service_metadata_add_remove_assets_type_select", classes="service_metadata_add_remove_assets_page_select"),
+                    id="service_metadata_add_remove_assets_type_div",
+                    classes="service_metadata_add_remove_assets_page_div"
+                ),
+                Horizontal(
+                    Button("Remove ALL Assets of type (NOTE: EVERY asset)", id="service_metadata_add_remove_assets_remove_button"),
+                    Button("Add Asset", id="service_metadata_add_remove_assets_add_button"),
+                    id="service_metadata_add_remove_assets_button_div",
+                    classes="service_metadata_add_remove_assets_page_div"
+                ),
+                Button("Back", id="service_metadata_add_remove_assets_back_button"),
+                id="service_metadata_add_remove_assets_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_add_remove_assets_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output, errCode = result
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        asset_type = self.get_child_by_id("service_metadata_add_remove_assets_page").get_child_by_id("service_metadata_add_remove_assets_page_content").get_child_by_id("service_metadata_add_remove_assets_type_div").get_child_by_id("service_metadata_add_remove_assets_type_select").value
+        metadata_file = self.get_child_by_id("service_metadata_add_remove_assets_page").get_child_by_id("service_metadata_add_remove_assets_page_content").get_child_by_id("service_metadata_add_remove_assets_file_div").get_child_by_id("service_metadata_add_remove_assets_file_input").value
+
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_add_remove_assets_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_add_remove_assets_add_button":
+            asset_path = self.get_child_by_id("service_metadata_add_remove_assets_page").get_child_by_id("service_metadata_add_remove_assets_page_content").get_child_by_id("service_metadata_add_remove_assets_path_div").get_child_by_id("service_metadata_add_remove_assets_path_input").value
+            params = {
+                "asset_path": asset_path,
+                "asset_type": asset_type,
+                "metadata_file": metadata_file,
+                "operation": "add"
+            }
+            self.app.submit(LoadJob(load.service_metadata_add_remove_assets, params, on_result=self.on_res, aprx_time="5s."))
+        elif event.button.id == "service_metadata_add_remove_assets_remove_button":
+            params = {
+                "asset_type": asset_type,
+                "metadata_file": metadata_file,
+                "operation": "remove"
+            }
+            self.app.submit(LoadJob(load.service_metadata_add_remove_assets, params, on_result=self.on_res, aprx_time="5s."))
+
+class service_metadata_add_remove_media_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Add/Remove Service Media Page", id="service_metadata_add_remove_media_page_title"),
+                Horizontal(
+                    Label("Media URL", id="service_metadata_add_media_url_label", classes="service_metadata_add_remove_media_page_label"),
+                    Input(placeholder="Media url endpoint", id="service_metadata_add_media_url_input", classes="service_metadata_add_remove_media_page_input"),
+                    id="service_metadata_add_remove_media_url_div",
+                    classes="service_metadata_add_remove_media_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_add_media_file_label", classes="service_metadata_add_remove_media_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_add_media_file_input", classes="service_metadata_add_remove_media_page_input"),
+                    id="service_metadata_add_remove_media_file_div",
+                    classes="service_metadata_add_remove_media_page_div"
+                ),
+                Label("Run Options", id="service_metadata_add_remove_media_page_run_options_label"),
+                RadioButton(label="Media is hero-image", id="service_metadata_add_media_hero_radio", classes="service_metadata_add_remove_media_page_radio"),
+                Horizontal(
+                    Button("Remove ALL Media (NOTE: EVERY media file)", id="service_metadata_add_remove_media_remove_button"),
+                    Button("Add Media", id="service_metadata_add_remove_media_add_button"),
+                    id="service_metadata_add_remove_media_button_div",
+                    classes="service_metadata_add_remove_media_page_div"
+                ),
+                Button("Back", id="service_metadata_add_remove_media_back_button"),
+                id="service_metadata_add_remove_media_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_add_remove_media_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        metadata_file = self.get_child_by_id("service_metadata_add_remove_media_page").get_child_by_id("service_metadata_add_remove_media_page_content").get_child_by_id("service_metadata_add_remove_media_file_div").get_child_by_id("service_metadata_add_media_file_input").value
+
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_add_remove_media_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_add_remove_media_remove_button":
+            params = {
+                "operation": "remove", 
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_media_operation, params, on_result=self.on_res, aprx_time="10s."))
+        elif event.button.id == "service_metadata_add_remove_media_add_button":
+            url = self.get_child_by_id("service_metadata_add_remove_media_page").get_child_by_id("service_metadata_add_remove_media_page_content").get_child_by_id("service_metadata_add_remove_media_url_div").get_child_by_id("service_metadata_add_media_url_input").value
+            hero_image = self.get_child_by_id("service_metadata_add_remove_media_page").get_child_by_id("service_metadata_add_remove_media_page_content").get_child_by_id("service_metadata_add_remove_media_hero_div").get_child_by_id("service_metadata_add_media_hero_radio").value
+            params = {
+                "operation": "add",
+                "url": url, 
+                "hero": hero_image, 
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_media_operation, params, on_result=self.on_res, aprx_time="10s."))
+
+class service_metadata_update_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            Grid(
+                Label("Service Metadata Blockchain Update Page", id="service_metadata_update_page_title"),
+                Horizontal(
+                    Button("Update Service Daemon Address", id="service_metadata_update_daemon_button", classes="service_metadata_update_button"),
+                    Button("Validate Metadata", id="service_metadata_update_validate_button", classes="service_metadata_update_button"),
+                    id="service_metadata_update_div"
+                ),
+                Button("Update Metadata", id="service_metadata_update_metadata_button", classes="service_metadata_update_button"),
+                Button("Back", id="service_metadata_update_back_button"),
+                id="service_metadata_update_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_update_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_update_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_update_daemon_button":
+            self.app.push_screen(service_metadata_update_daemon_addr_page())
+        elif event.button.id == "service_metadata_update_validate_button":
+            self.app.push_screen(service_metadata_update_validate_metadata_page())
+        elif event.button.id == "service_metadata_update_metadata_button":
+            self.app.push_screen(service_metadata_update_metadata_page())
+
+class service_metadata_update_daemon_addr_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Update Service Daemon Address Page", id="service_metadata_update_daemon_addr_page_title"),
+                Horizontal(
+                    Label("Payment Group", id="service_metadata_update_daemon_addr_group_label", classes="service_metadata_update_daemon_addr_page_label"),
+                    Input(placeholder="Name of the payment group to which we want to update daemon addresses for", id="service_metadata_update_daemon_addr_group_input", classes="service_metadata_update_daemon_addr_page_input"),
+                    id="service_metadata_update_daemon_addr_group_div",
+                    classes="service_metadata_update_daemon_addr_page_div"
+                ),
+                Horizontal(
+                    Label("Daemon Addresses", id="service_metadata_update_daemon_addr_endpoint_label", classes="service_metadata_update_daemon_addr_page_label"),
+                    Input(placeholder="Daemon addresses", id="service_metadata_update_daemon_addr_endpoint_input", classes="service_metadata_update_daemon_addr_page_input"),
+                    id="service_metadata_update_daemon_addr_endpoint_div",
+                    classes="service_metadata_update_daemon_addr_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_update_daemon_addr_file_label", classes="service_metadata_update_daemon_addr_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_update_daemon_addr_file_input", classes="service_metadata_update_daemon_addr_page_input"),
+                    id="service_metadata_update_daemon_addr_file_div",
+                    classes="service_metadata_update_daemon_addr_page_div"
+                ),
+                Horizontal(
+                    Button("Back", id="service_metadata_update_daemon_addr_back_button"),
+                    Button("Update Daemon Address", id="service_metadata_update_daemon_addr_update_button"),
+                    id="service_metadata_update_daemon_addr_button_div",
+                    classes="service_metadata_update_daemon_addr_page_div"
+                ),
+                id="service_metadata_update_daemon_addr_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_update_daemon_addr_page"
+        )
+    
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_update_daemon_addr_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_update_daemon_addr_update_button":
+            group_name = self.get_child_by_id("service_metadata_update_daemon_addr_page").get_child_by_id("service_metadata_update_daemon_addr_page_content").get_child_by_id("service_metadata_update_daemon_addr_group_div").get_child_by_id("service_metadata_update_daemon_addr_group_input").value
+            daemon_addr = self.get_child_by_id("service_metadata_update_daemon_addr_page").get_child_by_id("service_metadata_update_daemon_addr_page_content").get_child_by_id("service_metadata_update_daemon_addr_endpoint_div").get_child_by_id("service_metadata_update_daemon_addr_endpoint_input").value
+            metadata_file = self.get_child_by_id("service_metadata_update_daemon_addr_page").get_child_by_id("service_metadata_update_daemon_addr_page_content").get_child_by_id("service_metadata_update_daemon_addr_file_div").get_child_by_id("service_metadata_update_daemon_addr_file_input").value
+
+            params = {
+                "group_name": group_name,
+                "daemon_addr": daemon_addr,
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_update_daemon_addr, params, on_result=self.on_res, aprx_time="10s."))
+
+class service_metadata_update_validate_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Validate Service Metadata Page", id="service_metadata_update_validate_metadata_page_title"),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_update_validate_metadata_file_label", classes="service_metadata_update_validate_metadata_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_update_validate_metadata_file_input", classes="service_metadata_update_validate_metadata_page_input"),
+                    id="service_metadata_update_validate_metadata_file_div",
+                    classes="service_metadata_update_validate_metadata_page_div"
+                ),
+                Horizontal(
+                    Button("Back", id="service_metadata_update_validate_metadata_back_button"),
+                    Button("Validate Metadata", id="service_metadata_update_validate_metadata_validate_button"),
+                    id="service_metadata_update_validate_metadata_button_div",
+                    classes="service_metadata_update_validate_metadata_page_div"
+                ),
+                id="service_metadata_update_validate_metadata_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_update_validate_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_update_validate_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_update_validate_metadata_validate_button":
+            metadata_file = self.get_child_by_id("service_metadata_update_validate_metadata_page").get_child_by_id("service_metadata_update_validate_metadata_page_content").get_child_by_id("service_metadata_update_validate_metadata_file_div").get_child_by_id("service_metadata_update_validate_metadata_file_input").value
+
+            params = {
+                "file": metadata_file
+            }
+            self.app.submit(LoadJob(load.service_metadata_update_validate_metadata, params, on_result=self.on_res, aprx_time="15s."))
+
+class service_metadata_update_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Update Service Metadata Page", id="service_metadata_update_metadata_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="service_metadata_update_metadata_org_id_label", classes="service_metadata_update_metadata_page_label"),
+                    Input(placeholder="Your Organization ID", id="service_metadata_update_metadata_org_id_input", classes="service_metadata_update_metadata_page_input"),
+                    id="service_metadata_update_metadata_org_id_div",
+                    classes="service_metadata_update_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Service ID", id="service_metadata_update_metadata_service_id_label", classes="service_metadata_update_metadata_page_label"),
+                    Input(placeholder="Your Service ID", id="service_metadata_update_metadata_service_id_input", classes="service_metadata_update_metadata_page_input"),
+                    id="service_metadata_update_metadata_service_id_div",
+                    classes="service_metadata_update_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_update_metadata_file_label", classes="service_metadata_update_metadata_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_update_metadata_file_input", classes="service_metadata_update_metadata_page_input"),
+                    id="service_metadata_update_metadata_file_div",
+                    classes="service_metadata_update_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Contract", id="service_metadata_update_metadata_reg_contract_label", classes="service_metadata_update_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] if not specified we read address from 'networks'", id="service_metadata_update_metadata_reg_contract_input", classes="service_metadata_update_metadata_page_input"),
+                    id="service_metadata_update_metadata_reg_contract_div",
+                    classes="service_metadata_update_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="service_metadata_update_metadata_mpe_label", classes="service_metadata_update_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] if not specified we read address from 'networks'", id="service_metadata_update_metadata_mpe_input", classes="service_metadata_update_metadata_page_input"),
+                    id="service_metadata_update_metadata_mpe_div",
+                    classes="service_metadata_update_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="service_metadata_update_metadata_index_label", classes="service_metadata_update_metadata_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="service_metadata_update_metadata_index_input", classes="service_metadata_update_metadata_page_input"),
+                    id="service_metadata_update_metadata_index_div",
+                    classes="service_metadata_update_metadata_page_div"
+                ),
+                Label("Run Options", id="service_metadata_update_metadata_page_run_options_label"),
+                RadioButton(label="Update MPE Address in metadata before publishing service", id="service_metadata_update_metadata_update_mpe_radio", classes="service_metadata_update_metadata_page_radio"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="service_metadata_update_metadata_quiet_radio", classes="service_metadata_update_metadata_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="service_metadata_update_metadata_verbose_radio", classes="service_metadata_update_metadata_page_radio"),
+                    id="service_metadata_update_metadata_radio_set"
+                ),
+                Label("File Storage Selection", id="service_metadata_update_metadata_file_storage_label", classes="service_metadata_update_metadata_page_label"),
+                RadioSet(
+                    RadioButton(label="IPFS", id="service_metadata_update_metadata_file_storage_ipfs_radio", classes="service_metadata_update_metadata_page_radio", value=True),
+                    RadioButton(label="Filecoin", id="service_metadata_update_metadata_file_storage_filecoin_radio", classes="service_metadata_update_metadata_page_radio"),
+                    id="service_metadata_update_metadata_file_storage_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="service_metadata_update_metadata_back_button"),
+                    Button(label="Update Metadata", id="service_metadata_update_metadata_confirm_button"),
+                    id="service_metadata_update_metadata_button_div",
+                    classes="service_metadata_update_metadata_page_div"
+                ),
+                id="service_metadata_update_metadata_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_update_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="1 minute"))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_update_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_update_metadata_confirm_button":
+            org_id = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_org_id_div").get_child_by_id("service_metadata_update_metadata_org_id_input").value
+            service_id = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_service_id_div").get_child_by_id("service_metadata_update_metadata_service_id_input").value
+            metadata_file = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_file_div").get_child_by_id("service_metadata_update_metadata_file_input").value
+            reg_addr = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_reg_contract_div").get_child_by_id("service_metadata_update_metadata_reg_contract_input").value
+            mpe_addr = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_mpe_div").get_child_by_id("service_metadata_update_metadata_mpe_input").value
+            update_mpe = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_update_mpe_radio").value
+            index = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_index_div").get_child_by_id("service_metadata_update_metadata_index_input").value
+            quiet = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_radio_set").get_child_by_id("service_metadata_update_metadata_quiet_radio").value
+            verbose = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_radio_set").get_child_by_id("service_metadata_update_metadata_verbose_radio").value
+            ipfs = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_file_storage_radio_set").get_child_by_id("service_metadata_update_metadata_file_storage_ipfs_radio").value
+            filecoin = self.get_child_by_id("service_metadata_update_metadata_page").get_child_by_id("service_metadata_update_metadata_page_content").get_child_by_id("service_metadata_update_metadata_file_storage_radio_set").get_child_by_id("service_metadata_update_metadata_file_storage_filecoin_radio").value
+
+            params = {
+                "org_id": org_id,
+                "service_id": service_id,
+                "metadata_file": metadata_file,
+                "reg_addr": reg_addr,
+                "mpe_addr": mpe_addr,
+                "update_mpe": update_mpe,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose,
+                "ipfs": ipfs,
+                "filecoin": filecoin
+            }
+            self.app.submit(LoadJob(load.service_metadata_update_metadata, params, on_result=self.on_res, aprx_time="30s."))
+
+class service_metadata_get_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            Grid(
+                Label("Service Metadata Get Page", id="service_metadata_get_page_title"),
+                Horizontal(
+                    Button("Service Status", id="service_metadata_get_status_button", classes="service_metadata_get_page_button"),
+                    Button("API Metadata", id="service_metadata_get_metadata_button", classes="service_metadata_get_page_button"),
+                    id="service_metadata_get_page_div"
+                ),
+                Button("API Registry", id="service_metadata_get_registry_button", classes="service_metadata_get_page_button"),
+                Button("Back", id="service_metadata_get_back_button"),
+                id="service_metadata_get_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_get_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_get_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_get_status_button":
+            self.app.push_screen(service_metadata_get_service_status_page())
+        elif event.button.id == "service_metadata_get_metadata_button":
+            self.app.push_screen(service_metadata_get_api_metadata_page())
+        elif event.button.id == "service_metadata_get_registry_button":
+            self.app.push_screen(service_metadata_get_api_registry_page())
+
+class service_metadata_get_service_status_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service Status Page", id="service_metadata_get_service_status_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="service_metadata_get_service_status_org_id_label", classes="service_metadata_get_service_status_page_label"),
+                    Input(placeholder="Organization ID", id="service_metadata_get_service_status_org_id_input", classes="service_metadata_get_service_status_page_input"),
+                    id="service_metadata_get_service_status_org_id_div",
+                    classes="service_metadata_get_service_status_page_div"
+                ),
+                Horizontal(
+                    Label("Service ID", id="service_metadata_get_service_status_service_id_label", classes="service_metadata_get_service_status_page_label"),
+                    Input(placeholder="Service ID", id="service_metadata_get_service_status_service_id_input", classes="service_metadata_get_service_status_page_input"),
+                    id="service_metadata_get_service_status_service_id_div",
+                    classes="service_metadata_get_service_status_page_div"
+                ),
+                Horizontal(
+                    Label("Payment Group", id="service_metadata_get_service_status_group_label", classes="service_metadata_get_service_status_page_label"),
+                    Input(placeholder="[OPTIONAL] Name of the payment group. Parameter should be specified only for services with several payment groups", id="service_metadata_get_service_status_group_input", classes="service_metadata_get_service_status_page_input"),
+                    id="service_metadata_get_service_status_group_div",
+                    classes="service_metadata_get_service_status_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Contract", id="service_metadata_get_service_status_reg_contract_label", classes="service_metadata_get_service_status_page_label"),
+                    Input(placeholder="[OPTIONAL] if not specified we read address from 'networks'", id="service_metadata_get_service_status_reg_contract_input", classes="service_metadata_get_service_status_page_input"),
+                    id="service_metadata_get_service_status_reg_contract_div",
+                    classes="service_metadata_get_service_status_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="service_metadata_get_service_status_back_button"),
+                    Button(label="Get Service Status", id="service_metadata_get_service_status_confirm_button"),
+                    id="service_metadata_get_service_status_button_div",
+                    classes="service_metadata_get_service_status_page_div"
+                ),
+                id="service_metadata_get_service_status_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_get_service_status_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_get_service_status_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_get_service_status_confirm_button":
+            org_id = self.get_child_by_id("service_metadata_get_service_status_page").get_child_by_id("service_metadata_get_service_status_page_content").get_child_by_id("service_metadata_get_service_status_org_id_div").get_child_by_id("service_metadata_get_service_status_org_id_input").value
+            service_id = self.get_child_by_id("service_metadata_get_service_status_page").get_child_by_id("service_metadata_get_service_status_page_content").get_child_by_id("service_metadata_get_service_status_service_id_div").get_child_by_id("service_metadata_get_service_status_service_id_input").value
+            reg_addr = self.get_child_by_id("service_metadata_get_service_status_page").get_child_by_id("service_metadata_get_service_status_page_content").get_child_by_id("service_metadata_get_service_status_reg_contract_div").get_child_by_id("service_metadata_get_service_status_reg_contract_input").value
+            pay_group = self.get_child_by_id("service_metadata_get_service_status_page").get_child_by_id("service_metadata_get_service_status_page_content").get_child_by_id("service_metadata_get_service_status_group_div").get_child_by_id("service_metadata_get_service_status_group_input").value
+
+            params = {
+                "org_id": org_id,
+                "service_id": service_id,
+                "reg_addr": reg_addr,
+                "group": pay_group,
+            }           
+            self.app.submit(LoadJob(load.get_service_status, params, on_result=self.on_res, aprx_time="10s."))
+
+class service_metadata_get_api_metadata_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service API Metadata Page", id="service_metadata_get_api_metadata_page_title"),
+                Horizontal(
+                    Label("Proto Directory", id="service_metadata_get_api_metadata_proto_dir_label", classes="service_metadata_get_api_metadata_page_label"),
+                    Input(placeholder="Directory to which extract api (model)", id="service_metadata_get_api_metadata_proto_dir_input", classes="service_metadata_get_api_metadata_page_input"),
+                    id="service_metadata_get_api_metadata_proto_dir_div",
+                    classes="service_metadata_get_api_metadata_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="service_metadata_get_api_metadata_file_label", classes="service_metadata_get_api_metadata_page_label"),
+                    Input(placeholder="Service metadata json file path", id="service_metadata_get_api_metadata_file_input", classes="service_metadata_get_api_metadata_page_input"),
+                    id="service_metadata_get_api_metadata_file_div",
+                    classes="service_metadata_get_api_metadata_page_div"
+                ),
+                Horizontal(
+                    Button("Back", id="service_metadata_get_api_metadata_back_button"),
+                    Button("Get API Metadata", id="service_metadata_get_api_metadata_confirm_button"),
+                    id="service_metadata_get_api_metadata_button_div",
+                    classes="service_metadata_get_api_metadata_page_div"
+                ),
+                id="service_metadata_get_api_metadata_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_get_api_metadata_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_get_api_metadata_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_get_api_metadata_confirm_button":
+            proto_dir = self.get_child_by_id("service_metadata_get_api_metadata_page").get_child_by_id("service_metadata_get_api_metadata_page_content").get_child_by_id("service_metadata_get_api_metadata_proto_dir_div").get_child_by_id("service_metadata_get_api_metadata_proto_dir_input").value
+            metadata_file = self.get_child_by_id("service_metadata_get_api_metadata_page").get_child_by_id("service_metadata_get_api_metadata_page_content").get_child_by_id("service_metadata_get_api_metadata_file_div").get_child_by_id("service_metadata_get_api_metadata_file_input").value
+            params = {
+                "proto": proto_dir,
+                "file": metadata_file
+            }       
+            self.app.submit(LoadJob(load.get_api_metadata, params, on_result=self.on_res, aprx_time="15s."))
+
+class service_metadata_get_api_registry_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service API Registry Page", id="service_metadata_get_api_registry_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="service_metadata_get_api_registry_org_id_label", classes="service_metadata_get_api_registry_page_label"),
+                    Input(placeholder="Your Organization ID", id="service_metadata_get_api_registry_org_id_input", classes="service_metadata_get_api_registry_page_input"),
+                    id="service_metadata_get_api_registry_org_id_div",
+                    classes="service_metadata_get_api_registry_page_div"
+                ),
+                Horizontal(
+                    Label("Service ID", id="service_metadata_get_api_registry_service_id_label", classes="service_metadata_get_api_registry_page_label"),
+                    Input(placeholder="Your Service ID", id="service_metadata_get_api_registry_service_id_input", classes="service_metadata_get_api_registry_page_input"),
+                    id="service_metadata_get_api_registry_service_id_div",
+                    classes="service_metadata_get_api_registry_page_div"
+                ),
+                Horizontal(
+                    Label("Proto Directory", id="service_metadata_get_api_registry_proto_dir_label", classes="service_metadata_get_api_registry_page_label"),
+                    Input(placeholder="Directory to which extract api (model)", id="service_metadata_get_api_registry_proto_dir_input", classes="service_metadata_get_api_registry_page_input"),
+                    id="service_metadata_get_api_registry_proto_dir_div",
+                    classes="service_metadata_get_api_registry_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Contract", id="service_metadata_get_api_registry_reg_contract_label", classes="service_metadata_get_api_registry_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from 'networks'", id="service_metadata_get_api_registry_reg_contract_input", classes="service_metadata_get_api_registry_page_input"),
+                    id="service_metadata_get_api_registry_reg_contract_div",
+                    classes="service_metadata_get_api_registry_page_div"
+                ),
+                Horizontal(
+                    Button(label="Back", id="service_metadata_get_api_registry_back_button"),
+                    Button(label="Get API Registry", id="service_metadata_get_api_registry_confirm_button"),
+                    id="service_metadata_get_api_registry_button_div",
+                    classes="service_metadata_get_api_registry_page_div"
+                ),
+                id="service_metadata_get_api_registry_page_content",
+                classes="content_page"
+            ),
+            id="service_metadata_get_api_registry_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            fe.popup_output = output
+            self.app.push_screen(popup_output_page())
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "service_metadata_get_api_registry_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "service_metadata_get_api_registry_confirm_button":
+            org_id = self.get_child_by_id("service_metadata_get_api_registry_page").get_child_by_id("service_metadata_get_api_registry_page_content").get_child_by_id("service_metadata_get_api_registry_org_id_div").get_child_by_id("service_metadata_get_api_registry_org_id_input").value
+            service_id = self.get_child_by_id("service_metadata_get_api_registry_page").get_child_by_id("service_metadata_get_api_registry_page_content").get_child_by_id("service_metadata_get_api_registry_service_id_div").get_child_by_id("service_metadata_get_api_registry_service_id_input").value
+            proto_dir = self.get_child_by_id("service_metadata_get_api_registry_page").get_child_by_id("service_metadata_get_api_registry_page_content").get_child_by_id("service_metadata_get_api_registry_proto_dir_div").get_child_by_id("service_metadata_get_api_registry_proto_dir_input").value
+            reg_addr = self.get_child_by_id("service_metadata_get_api_registry_page").get_child_by_id("service_metadata_get_api_registry_page_content").get_child_by_id("service_metadata_get_api_registry_reg_contract_div").get_child_by_id("service_metadata_get_api_registry_reg_contract_input").value
+
+            params = {
+                "org_id": org_id,
+                "service_id": service_id,
+                "reg_addr": reg_addr,
+                "proto": proto_dir,           
+            }            
+            self.app.submit(LoadJob(load.get_api_registry, params, on_result=self.on_res, aprx_time="15s."))
+
+class services_manage_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            Grid(
+                Label("Manage Services Page", id="services_manage_page_title"),
+                Horizontal(
+                    Button(label="Publish Service", id="services_manage_create_button", classes="services_manage_page_button"),
+                    Button(label="Delete Service", id="services_manage_delete_button", classes="services_manage_page_button"),
+                    id="services_manage_page_div"
+                ),
+                Button("Back", id="services_manage_back_button", classes="services_manage_page_button"),
+                id="services_manage_page_content",
+                classes="content_page"
+            ),
+            id="services_manage_page"
+        )
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "services_manage_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "services_manage_create_button":
+            self.app.push_screen(publish_service_page())
+        elif event.button.id == "services_manage_delete_button":
+            self.app.push_screen(delete_service_page())
+
+class publish_service_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Service Publishing Page", id="publish_service_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="publish_service_org_id_label", classes="publish_service_page_label"),
+                    Input(placeholder="Your Organization ID", id="publish_service_org_id_input", classes="publish_service_page_input"),
+                    id="publish_service_org_id_div",
+                    classes="publish_service_page_div"
+                ),
+                Horizontal(
+                    Label("Service ID", id="publish_service_service_id_label", classes="publish_service_page_label"),
+                    Input(placeholder="Your Service ID", id="publish_service_service_id_input", classes="publish_service_page_input"),
+                    id="publish_service_service_id_div",
+                    classes="publish_service_page_div"
+                ),
+                Horizontal(
+                    Label("Metadata File", id="publish_service_file_label", classes="publish_service_page_label"),
+                    Input(placeholder="Service metadata json file path", id="publish_service_file_input", classes="publish_service_page_input"),
+                    id="publish_service_file_div",
+                    classes="publish_service_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Contract", id="publish_service_reg_contract_label", classes="publish_service_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from 'networks'", id="publish_service_reg_contract_input", classes="publish_service_page_input"),
+                    id="publish_service_reg_contract_div",
+                    classes="publish_service_page_div"
+                ),
+                Horizontal(
+                    Label("MPE Address", id="publish_service_mpe_label", classes="publish_service_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of MultiPartyEscrow contract, if not specified we read address from 'networks'", id="publish_service_mpe_input", classes="publish_service_page_input"),
+                    id="publish_service_mpe_div",
+                    classes="publish_service_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="publish_service_index_label", classes="publish_service_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="publish_service_index_input", classes="publish_service_page_input"),
+                    id="publish_service_index_div",
+                    classes="publish_service_page_div"
+                ),
+                Label("Run Options", id="publish_service_page_run_options_label"),
+                RadioButton(label="Update MPE Address in metadata before publishing service", id="publish_service_update_mpe_radio", classes="publish_service_page_radio"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="publish_service_quiet_radio", classes="publish_service_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="publish_service_verbose_radio", classes="publish_service_page_radio"),
+                    id="publish_service_radio_set"
+                ),
+                Label("File Storage Selection", id="publish_service_file_storage_label", classes="publish_service_page_label"),
+                RadioSet(
+                    RadioButton(label="IPFS", id="publish_service_file_storage_ipfs_radio", classes="publish_service_page_radio", value=True),
+                    RadioButton(label="Filecoin", id="publish_service_file_storage_filecoin_radio", classes="publish_service_page_radio"),
+                    id="publish_service_file_storage_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="publish_service_back_button"),
+                    Button(label="Publish Service", id="publish_service_confirm_button"),
+                    id="publish_service_button_div",
+                    classes="publish_service_page_div"
+                ),
+                id="publish_service_page_content",
+                classes="content_page"
+            ),
+            id="publish_service_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="20s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())    
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "publish_service_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "publish_service_confirm_button":
+            org_id = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_org_id_div").get_child_by_id("publish_service_org_id_input").value
+            service_id = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_service_id_div").get_child_by_id("publish_service_service_id_input").value
+            metadata_file = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_file_div").get_child_by_id("publish_service_file_input").value
+            reg_addr = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_reg_contract_div").get_child_by_id("publish_service_reg_contract_input").value
+            mpe_addr = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_mpe_div").get_child_by_id("publish_service_mpe_input").value
+            update_mpe = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_update_mpe_radio").value
+            index = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_index_div").get_child_by_id("publish_service_index_input").value
+            quiet = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_radio_set").get_child_by_id("publish_service_quiet_radio").value
+            verbose = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_radio_set").get_child_by_id("publish_service_verbose_radio").value
+            ipfs = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_file_storage_radio_set").get_child_by_id("publish_service_file_storage_ipfs_radio").value
+            filecoin = self.get_child_by_id("publish_service_page").get_child_by_id("publish_service_page_content").get_child_by_id("publish_service_file_storage_radio_set").get_child_by_id("publish_service_file_storage_filecoin_radio").value
+
+            params = {
+                "org_id": org_id,
+                "serv_id": service_id,
+                "file": metadata_file,
+                "reg_addr": reg_addr,
+                "mpe_addr": mpe_addr,
+                "update_mpe": update_mpe,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose,
+                "ipfs": ipfs,
+                "filecoin": filecoin
+            }
+            self.app.submit(LoadJob(load.publish_service, params, on_result=self.on_res, aprx_time="20s."))
+
+class delete_service_page(Screen):
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("Delete a Service Page", id="delete_service_page_title"),
+                Horizontal(
+                    Label("Organization ID", id="delete_service_org_id_label", classes="delete_service_page_label"),
+                    Input(placeholder="Your Organization ID", id="delete_service_org_id_input", classes="delete_service_page_input"),
+                    id="delete_service_org_id_div",
+                    classes="delete_service_page_div"
+                ),
+                Horizontal(
+                    Label("Service ID", id="delete_service_service_id_label", classes="delete_service_page_label"),
+                    Input(placeholder="Your Service ID", id="delete_service_service_id_input", classes="delete_service_page_input"),
+                    id="delete_service_service_id_div",
+                    classes="delete_service_page_div"
+                ),
+                Horizontal(
+                    Label("Registry Contract", id="delete_service_reg_contract_label", classes="delete_service_page_label"),
+                    Input(placeholder="[OPTIONAL] Address of Registry contract, if not specified we read address from 'networks'", id="delete_service_reg_contract_input", classes="delete_service_page_input"),
+                    id="delete_service_reg_contract_div",
+                    classes="delete_service_page_div"
+                ),
+                Horizontal(
+                    Label("Wallet Index", id="delete_service_index_label", classes="delete_service_page_label"),
+                    Input(placeholder="[OPTIONAL] Wallet index of account to use for signing (defaults to session.identity.default_wallet_index)", id="delete_service_index_input", classes="delete_service_page_input"),
+                    id="delete_service_index_div",
+                    classes="delete_service_page_div"
+                ),
+                Label("Run Options", id="delete_service_page_run_options_label"),
+                RadioSet(
+                    RadioButton(label="Quiet transaction printing", id="delete_service_quiet_radio", classes="delete_service_page_radio"),
+                    RadioButton(label="Verbose transaction printing", id="delete_service_verbose_radio", classes="delete_service_page_radio"),
+                    id="delete_service_radio_set"
+                ),
+                Horizontal(
+                    Button(label="Back", id="delete_service_back_button"),
+                    Button(label="Delete Service", id="delete_service_confirm_button"),
+                    id="delete_service_button_div",
+                    classes="delete_service_page_div"
+                ),
+                id="delete_service_page_content",
+                classes="content_page"
+            ),
+            id="delete_service_page"
+        )
+
+    def on_res(self, result) -> None:
+        if result == "param_error":
+            fe.popup_output = "DEV ERROR: Did not supply correct parameters for load"
+            self.app.push_screen(popup_output_page())
+        elif result == "cancel":
+            pass
+        else:
+            output = result[0]
+            errCode = result[1]
+            command = result[2]
+            if errCode == 0:
+                self.app.push_screen(conditional_input_page(command, output, aprx_time="20s."))
+            else:
+                fe.popup_output = output
+                self.app.push_screen(popup_output_page())   
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "delete_service_back_button":
+            self.app.pop_screen()
+        elif event.button.id == "delete_service_confirm_button":
+            org_id = self.get_child_by_id("delete_service_page").get_child_by_id("delete_service_page_content").get_child_by_id("delete_service_org_id_div").get_child_by_id("delete_service_org_id_input").value
+            service_id = self.get_child_by_id("delete_service_page").get_child_by_id("delete_service_page_content").get_child_by_id("delete_service_service_id_div").get_child_by_id("delete_service_service_id_input").value
+            reg_addr = self.get_child_by_id("delete_service_page").get_child_by_id("delete_service_page_content").get_child_by_id("delete_service_reg_contract_div").get_child_by_id("delete_service_reg_contract_input").value
+            index = self.get_child_by_id("delete_service_page").get_child_by_id("delete_service_page_content").get_child_by_id("delete_service_index_div").get_child_by_id("delete_service_index_input").value
+            quiet = self.get_child_by_id("delete_service_page").get_child_by_id("delete_service_page_content").get_child_by_id("delete_service_radio_set").get_child_by_id("delete_service_quiet_radio").value
+            verbose = self.get_child_by_id("delete_service_page").get_child_by_id("delete_service_page_content").get_child_by_id("delete_service_radio_set").get_child_by_id("delete_service_verbose_radio").value
+
+            params = {
+                "org_id": org_id,
+                "serv_id": service_id,
+                "reg_addr": reg_addr,
+                "index": index,
+                "quiet": quiet,
+                "verbose": verbose
+            }
+            self.app.submit(LoadJob(load.delete_service, params, on_result=self.on_res, aprx_time="20s."))
+
+class services_view_all_page(Screen):
+    # Seconds of typing pause before searching
+    SEARCH_DEBOUNCE = 0.15
+
+    market_data = {}
+    market_index = None
+    search_timer = None
+    # Organizations currently in the table (the search results), and the column it is sorted by
+    shown_data = {}
+    sort_column = None
+    sort_reverse = False
+
+    def compose(self) -> ComposeResult:
+        yield Header()
+        yield Horizontal(
+            be.nav_sidebar_vert("serv"),
+            ScrollableContainer(
+                Label("View All Page", id="services_view_all_title"),
+                Label("", id="services_view_all_staleness_label"),
+                Horizontal(
+                    Input(placeholder="Search for Organization or Service", id="services_view_all_search_input"),
+                    Button(label="Reset", id="services_view_all_reset_button"),
+                    id="services_view_all_search_div"
+                ),
+                Label("", id="services_view_all_result_label"),
+                Horizontal(
+                    DataTable(id="services_view_all_org_table", cursor_type="row", zebra_stripes=True),
+                    DataTable(id="services_view_all_service_table", cursor_type="row", zebra_stripes=True),
+                    id="services_view_all_tables"
+                ),
+                Button(label="Back", id="services_view_all_back_button"),
+                id="services_view_all_page_content",
+                classes="content_page"
+            ),
+            id="services_view_all_page"
+        )
+
+    def init_print(self, output) -> None:
+        if output == "retrieve_error":
+            fe.popup_output = "ERROR: Could not retrieve marketplace data"
+            self.app.switch_screen(popup_output_page())
+        elif output == "cancel":
+            self.app.pop_screen()
+        else:
+            self.set_market_data(output)
+            self.query_one("#services_view_all_staleness_label", expect_type=Label).update("Marketplace refreshed just now")
+
+    def on_mount(self) -> None:
+        org_table = self.query_one("#services_view_all_org_table", expect_type=DataTable)
+        org_table.add_column("Organization", key="org")
+        org_table.add_column("Services", key="services")
+        org_table.add_column("Status", key="status")
+        self.query_one("#services_view_all_service_table", expect_type=DataTable).add_column("Service", key="service")
+
+        # Open from the on-disk snapshot when there is one and bring it up to date in the background
+        data, refreshed_at = be.load_marketplace_snapshot()
+        if data is not None:
+            self.set_market_data(data)
+            self.query_one("#services_view_all_staleness_label", expect_type=Label).update(f"Marketplace snapshot from {be.format_age(time.time() - refreshed_at)}, refreshing...")
+            self.refresh_snapshot()
+        else:
+            self.app.submit(LoadJob(load.services_view_all_init, on_result=self.init_print, aprx_time="4 minutes", background=True))
+
+    @work(exclusive=True)
+    async def refresh_snapshot(self) -> None:
+        output, errCode = await aio.refresh_marketplace()
+        label = self.query_one("#services_view_all_staleness_label", expect_type=Label)
+        if errCode != 0:
+            label.update("Marketplace snapshot could not be refreshed, showing the last saved data")
+        else:
+            self.set_market_data(output)
+            label.update("Marketplace refreshed just now")
+
+    def set_market_data(self, data) -> None:
+        self.market_data = data
+        self.market_index = be.MarketplaceIndex(data)
+        self.show_market_data()
+
+    def show_market_data(self) -> None:
+        # The tables only draw the rows on screen, so a full registry costs no more to show than a search
+        search_phrase = self.get_child_by_id("services_view_all_page").get_child_by_id("services_view_all_page_content").get_child_by_id("services_view_all_search_div").get_child_by_id("services_view_all_search_input").value
+        self.shown_data = self.market_index.search(search_phrase) if self.market_index else {}
+
+        org_table = self.query_one("#services_view_all_org_table", expect_type=DataTable)
+        org_table.clear()
+        for row in be.marketplace_table_rows(self.shown_data):
+            org_table.add_row(*row, key=row[0])
+        if self.sort_column:
+            org_table.sort(self.sort_column, reverse=self.sort_reverse)
+
+        result_label = self.query_one("#services_view_all_result_label", expect_type=Label)
+        if len(self.shown_data) == 0:
+            result_label.update("Could not find any Organizations or Services with that search phrase")
+            self.show_services(None)
+        else:
+            result_label.update(f"{len(self.shown_data)} organizations")
+            self.show_services(org_table.coordinate_to_cell_key(org_table.cursor_coordinate).row_key.value)
+
+    def show_services(self, org_id) -> None:
+        # Services are only laid out for the highlighted organization
+        service_table = self.query_one("#services_view_all_service_table", expect_type=DataTable)
+        service_table.clear()
+        if org_id in self.shown_data:
+            service_table.add_rows(be.marketplace_service_rows(self.shown_data[org_id]))
+
+    @on(DataTable.RowHighlighted, "#services_view_all_org_table")
+    def on_org_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        self.show_services(event.row_key.value)
+
+    @on(DataTable.HeaderSelected, "#services_view_all_org_table")
+    def on_org_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        # Selecting the sorted column again flips the order
+        column = event.column_key.value
+        self.sort_reverse = not self.sort_reverse if self.sort_column == column else False
+        self.sort_column = column
+        event.data_table.sort(column, reverse=self.sort_reverse)
+
+    @on(Input.Changed)
+    def on_input_changed(self, event: Input.Changed) -> None:
+        # Search once typing pauses rather than on every keystroke
+        if self.search_timer is not None:
+            self.search_timer.stop()
+        self.search_timer = self.set_timer(self.SEARCH_DEBOUNCE, self.show_market_data)
+
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "account_page_nav":
+            self.app.navigate("account")
+        elif event.button.id == "organization_page_nav":
+            self.app.navigate("organization")
+        elif event.button.id == "services_page_nav":
+            self.app.navigate("services")
+        elif event.button.id == "client_page_nav":
+            self.app.navigate("client")
+        elif event.button.id == "custom_command_page_nav":
+            self.app.navigate("custom_command")
+        elif event.button.id == "exit_page_nav":
+            self.app.push_screen(exit_page())
+        elif event.button.id == "services_view_all_reset_button":
+            self.get_child_by_id("services_view_all_page").get_child_by_id("services_view_all_page_content").get_child_by_id("services_view_all_search_div").get_child_by_id("services_view_all_search_input").clear()            
+        elif event.button.id == "services_view_all_back_button":
+            self.app.pop_screen() 
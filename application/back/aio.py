@@ -0,0 +1,281 @@
+import asyncio
+import codecs
+import contextlib
+import subprocess
+import threading
+import back.backend as be
+import back.engine as engine
+import back.jobs as jobs
+
+# asyncio versions of the backend commands, for workers running on Textual's event loop.
+#
+# Subprocesses are started with their pipes owned by the loop and awaited, so no OS thread is
+# parked on a process while it runs and fanning out many commands is just a gather(). Engine
+# commands go to the same engine.pool as the rest of the TUI, each from a thread, so there is
+# only one set of warm workers. Cancelling a command is cancelling the task that awaits it: the
+# process is killed on the way out of the coroutine.
+#
+# Results have the same shape as the matching functions in back.backend.
+
+# Buffer limit of the pipe readers
+STREAM_LIMIT = 16 * 1024 * 1024
+READ_SIZE = 4096
+
+
+# Cancel functions of the engine commands running in threads
+_engine_commands = set()
+
+
+async def _engine_run(argv, input_text, workdir, on_start, emit, on_usage):
+    # Runs the command on the shared engine.pool, in a thread, so the async workers use the same
+    # warm processes as the rest of the TUI. Output is passed to the loop as it is produced.
+    # Returns (stdout, stderr, return_code), or None if the engine is unavailable.
+    loop = asyncio.get_running_loop()
+    lock = threading.Lock()
+    state = {"cancel": None, "cancelled": False}
+
+    def started(pid, cancel):
+        with lock:
+            state["cancel"] = cancel
+            cancelled = state["cancelled"]
+        if cancelled:
+            cancel()
+        else:
+            loop.call_soon_threadsafe(on_start, pid)
+
+    def cancel():
+        # Kills the command once, whether it has started yet or not
+        with lock:
+            if state["cancelled"]:
+                return
+            state["cancelled"] = True
+            cancel = state["cancel"]
+        if cancel:
+            cancel()
+
+    def run():
+        result = None
+        for kind, value in engine.stream(argv, input_text, workdir, started):
+            if kind == "result":
+                result = value
+            elif state["cancelled"]:
+                continue
+            elif kind == "usage":
+                if on_usage:
+                    loop.call_soon_threadsafe(on_usage, value)
+            else:
+                loop.call_soon_threadsafe(emit, kind, value)
+        return result
+
+    _engine_commands.add(cancel)
+    try:
+        return await asyncio.to_thread(run)
+    except asyncio.CancelledError:
+        cancel()
+        raise
+    finally:
+        _engine_commands.discard(cancel)
+
+
+def _task_canceller(task):
+    # Job cancel function for a task, safe to call from any thread and more than once
+    loop = task.get_loop()
+    requested = threading.Event()
+
+    def cancel():
+        if not requested.is_set():
+            requested.set()
+            loop.call_soon_threadsafe(task.cancel)
+    return cancel
+
+
+async def run_shell_command(command, input_text=None, workdir=None):
+    # Returns (output, return_code) like backend.run_shell_command, streaming to backend.output_sink()
+    # and sharing its cache of read results
+    sink = be.current_output_sink()
+    if input_text is None:
+        cached = be.cached_output(command, workdir)
+        if cached is not None:
+            if sink is not None:
+                sink("stdout", cached)
+            return cached, 0
+
+    job = jobs.registry.start(command)
+    cancel = _task_canceller(asyncio.current_task())
+    jobs.registry.attach(job, None, cancel)
+
+    output = {"stdout": [], "stderr": []}
+
+    def emit(name, text):
+        output[name].append(text)
+        job.saw_output(text)
+        if sink is not None:
+            sink(name, text)
+
+    return_code = -1
+    cancelled = False
+    try:
+        return_code = await _run(command, input_text, workdir, lambda pid: jobs.registry.attach(job, pid, cancel), emit, job.set_usage)
+    except asyncio.CancelledError:
+        cancelled = True
+        raise
+    finally:
+        job.output = "".join(output["stdout"]) or "".join(output["stderr"])
+        jobs.registry.finish(job, return_code, cancelled)
+    be.remember_output(command, workdir, job.output, return_code)
+    return job.output, return_code
+
+
+async def _run(command, input_text, workdir, on_start, emit, on_usage=None):
+    if be.exec_mode in ("engine", "fork"):
+        argv = engine.snet_argv(command)
+        if argv is not None:
+            result = await _engine_run(argv, input_text, workdir, on_start, emit, on_usage)
+            if result is not None:
+                stdout, stderr, return_code = result
+                if return_code == -1 and stderr:
+                    emit("stderr", stderr)
+                return return_code
+
+    # Started with Popen rather than asyncio's subprocess API, whose child watcher would reap the
+    # process and lose its resource usage. The pipes are still read on the loop, only the final
+    # wait4() (once both pipes are closed) runs in a thread.
+    try:
+        argv = engine.command_argv(command)
+        process = subprocess.Popen(argv if argv is not None else command, shell=argv is None, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=workdir)
+    except Exception as e:
+        emit("stderr", str(e))
+        return 1
+    on_start(process.pid)
+
+    try:
+        loop = asyncio.get_running_loop()
+        stdout = await _pipe_reader(loop, process.stdout)
+        stderr = await _pipe_reader(loop, process.stderr)
+        stdin, _ = await loop.connect_write_pipe(asyncio.Protocol, process.stdin)
+        if input_text:
+            stdin.write(input_text.encode("utf-8"))
+        stdin.close()
+        await asyncio.gather(
+            _read_stream(stdout, "stdout", emit),
+            _read_stream(stderr, "stderr", emit)
+        )
+        usage = await asyncio.to_thread(be._reap, process)
+        if on_usage:
+            on_usage(usage)
+        return process.returncode
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await asyncio.to_thread(process.wait)
+
+
+async def _pipe_reader(loop, pipe):
+    reader = asyncio.StreamReader(limit=STREAM_LIMIT)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+    return reader
+
+
+async def _read_stream(stream, name, emit):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        data = await stream.read(READ_SIZE)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            emit(name, text)
+
+
+async def stop():
+    # Kills the engine commands still running, the loop would otherwise wait for their threads
+    for cancel in list(_engine_commands):
+        cancel()
+
+
+async def check_cli():
+    output, errCode = await run_shell_command('snet')
+    return be.cli_found(output), output, errCode
+
+
+async def network_list():
+    output, errCode = await run_shell_command('snet --print-traceback network list')
+    return be.parse_network_list(output, errCode), errCode
+
+
+async def check_account_balance():
+    output, errCode = await run_shell_command('snet --print-traceback account balance')
+    return be.balance_found(output), output, errCode
+
+
+async def identity_check():
+    output, errCode = await run_shell_command('snet --print-traceback account print')
+    return be.identity_found(output), output, errCode
+
+
+async def wallet_dict_create():
+    check, output, errCode = await check_account_balance()
+    if check:
+        return be.parse_wallet_dict(output), 0
+    return {}, 1
+
+
+async def print_organization_info(registry_address=None, wallet_index=None):
+    output, errCode = await run_shell_command(be.organization_info_command(registry_address, wallet_index))
+    return be.organization_info_output(output, errCode), errCode
+
+
+async def channel_print_initialized(only_id=None, filter_sender=None, filter_signer=None, filter_my=None, mpe_addr=None, registry=None, wallet_index=None):
+    command = be.channel_print_initialized_command(only_id, filter_sender, filter_signer, filter_my, mpe_addr, registry, wallet_index)
+    output, errCode = await run_shell_command(command)
+    return be.format_initialized_channels(output, errCode), errCode
+
+
+async def initialized_channels(only_id=None, filter_sender=None, filter_signer=None, filter_my=None, mpe_addr=None, registry=None, wallet_index=None):
+    command = be.channel_print_initialized_command(only_id, filter_sender, filter_signer, filter_my, mpe_addr, registry, wallet_index)
+    output, errCode = await run_shell_command(command)
+    return (be.parse_initialized_channels(output) if errCode == 0 else output), errCode
+
+
+async def list_organizations():
+    org_list, err_code = await run_shell_command("snet organization list")
+    if err_code != 0:
+        return f"Error fetching organizations: {org_list}", err_code
+    return {org_id: None for org_id in be.parse_listing(org_list) if len(org_id) > 0}, 0
+
+
+async def fetch_services(org_ids):
+    limit = asyncio.Semaphore(be.fanout_limit)
+
+    async def fetch(org_id):
+        async with limit:
+            services_list, err_code = await run_shell_command(f"snet organization list-services {org_id}")
+        return be.services_entry(services_list, err_code)
+
+    burst = engine.burst(min(be.fanout_limit, len(org_ids))) if be.exec_mode in ("engine", "fork") else contextlib.nullcontext()
+    with burst:
+        # gather keeps the order of org_ids whatever order the commands finish in
+        entries = await asyncio.gather(*(fetch(org_id) for org_id in org_ids))
+    return dict(zip(org_ids, entries))
+
+
+async def get_all_organizations_and_services():
+    listing, err_code = await list_organizations()
+    if err_code != 0:
+        return listing, err_code
+    return await fetch_services(list(listing)), 0
+
+
+async def refresh_marketplace():
+    # The Registry reader blocks on HTTP, it runs in a thread
+    organizations = await asyncio.to_thread(be.read_registry_organizations)
+    if organizations is not None:
+        return await asyncio.to_thread(be.save_registry_refresh, organizations), 0
+
+    listing, err_code = await list_organizations()
+    if err_code != 0:
+        return listing, err_code
+    stale, known = be.marketplace_refresh_plan(listing)
+    fetched = await fetch_services(stale)
+    # Writing the snapshot is file I/O, kept off the loop as well
+    return await asyncio.to_thread(be.save_marketplace_refresh, listing, fetched, known), 0
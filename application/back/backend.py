@@ -1,11 +1,87 @@
 import subprocess
 from textual.widgets import Button, Select
 from textual.containers import Vertical
+import back.engine as engine
+import back.jobs as jobs
+import back.snapshot as snapshot
+import back.durations as durations
+import back.metrics as metrics
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
+import decimal
+import threading
+import configparser
+import codecs
+import base64
+import json
+import queue
+import time
 import re
+import os
+import shlex
+import sqlite3
+import sys
 
 # Stable build v0.1
 
-current_process = None
+# How snet commands are executed:
+#   "engine"     - dispatched to a long-lived worker that has the snet CLI already imported (default)
+#   "fork"       - a pre-warmed fork server runs every command in its own fork() child
+#   "subprocess" - a fresh `snet` process per command
+# Commands the engine cannot run (non-snet commands, shell operators) always use a subprocess
+exec_mode = os.environ.get("SNET_TUI_EXEC_MODE", "engine")
+# Number of warm workers, and how many commands a worker runs before it is restarted (0 = never)
+pool_size = int(os.environ.get("SNET_TUI_POOL_SIZE", "1"))
+recycle_after = int(os.environ.get("SNET_TUI_RECYCLE_AFTER", "0"))
+engine.configure(pool_size, exec_mode == "fork", recycle_after)
+# Commands a fan-out (such as loading the marketplace) runs at the same time
+fanout_limit = max(1, int(os.environ.get("SNET_TUI_FANOUT", "8")))
+
+# Confirmed transactions run in the background, up to tx_concurrency commands at once. The engine
+# workers hand out nonces locally (see back/txnonce.py) so they do not collide; a subprocess has no
+# such hook and runs them one at a time. SNET_TUI_TX_PIPELINE=0 waits for each one instead.
+tx_pipeline_enabled = os.environ.get("SNET_TUI_TX_PIPELINE", "1") != "0"
+tx_concurrency = max(1, int(os.environ.get("SNET_TUI_TX_CONCURRENCY", "4"))) if exec_mode in ("engine", "fork") else 1
+
+# Output chunks buffered between a streaming command and its reader
+STREAM_BUFFER_CHUNKS = 256
+
+# Read-only commands whose successful output is reused, and for how many seconds. Entries are kept
+# per identity and network, and dropped whenever any other snet command succeeds.
+# SNET_TUI_CACHE=0 turns the cache off.
+cache_enabled = os.environ.get("SNET_TUI_CACHE", "1") != "0"
+CACHE_TTLS = {
+    ("account", "balance"): 30,
+    ("account", "print"): 300,
+    ("identity", "list"): 300,
+    ("network", "list"): 300,
+    ("organization", "list"): 300,
+    ("organization", "list-my"): 120,
+    ("organization", "list-services"): 300,
+    ("organization", "print-metadata"): 300,
+    ("channel", "print-initialized"): 60
+}
+SNET_CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".snet", "config")
+# Where the TUI keeps its own files
+TUI_DATA_DIR = os.environ.get("SNET_TUI_DATA_DIR", os.path.join(os.path.expanduser("~"), ".snet", "tui"))
+
+# Marketplace snapshot, and how old (seconds) an organization's services may get before a
+# refresh fetches them again when the registry listing cannot tell whether they changed
+marketplace_snapshot = snapshot.MarketplaceSnapshot(os.path.join(TUI_DATA_DIR, "marketplace.db"))
+
+# Wall time of every command, by command family and network, see durations.py
+command_durations = durations.DurationHistograms(os.path.join(TUI_DATA_DIR, "durations.db"))
+MARKETPLACE_ORG_MAX_AGE = 24 * 3600
+# Treasurer claims sent as multiChannelClaim transactions, see back/batch_claim.py
+BATCH_CLAIM_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "batch_claim.py")
+# Local index of MultiPartyEscrow channel events, opened on first use (it needs eth_abi)
+channel_index = None
+_channel_index_lock = threading.Lock()
+
+_output_sink = contextvars.ContextVar("output_sink", default=None)
 
 condCommDict = set({
     "account deposit",
@@ -93,17 +169,186 @@ condCommDict = set({
     "treasurer claim-expired"
 })
     
+def _terminate(process):
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
 def run_shell_command(command, input_text=None, workdir=None):
-    global current_process 
-    
+    sink = _output_sink.get()
+    if input_text is None:
+        output = cached_output(command, workdir)
+        if output is not None:
+            if sink is not None:
+                sink("stdout", output)
+            return output, 0
+
+    if sink is not None:
+        streamed = stream_shell_command(command, input_text, workdir)
+        output = {"stdout": [], "stderr": []}
+        for name, text in streamed:
+            output[name].append(text)
+            sink(name, text)
+        streamed.job.output = "".join(output["stdout"]) or "".join(output["stderr"])
+        remember_output(command, workdir, streamed.job.output, streamed.return_code)
+        return streamed.job.output, streamed.return_code
+
+    job = jobs.registry.start(command)
+    output, return_code = _run_job(job, command, input_text, workdir)
+    job.output = output
+    jobs.registry.finish(job, return_code)
+    remember_output(command, workdir, output, return_code)
+    return output, return_code
+
+_cache = {}
+_cache_lock = threading.Lock()
+_snet_config_cache = {"mtime": None, "config": configparser.ConfigParser()}
+
+def _snet_config():
+    # The snet CLI config, only re-read when the file changes
+    try:
+        mtime = os.path.getmtime(SNET_CONFIG_PATH)
+    except OSError:
+        return configparser.ConfigParser()
+    if _snet_config_cache["mtime"] != mtime:
+        config = configparser.ConfigParser()
+        try:
+            config.read(SNET_CONFIG_PATH)
+        except configparser.Error:
+            config = configparser.ConfigParser()
+        _snet_config_cache["mtime"], _snet_config_cache["config"] = mtime, config
+    return _snet_config_cache["config"]
+
+def _session_config():
+    config = _snet_config()
+    return dict(config["session"]) if config.has_section("session") else {}
+
+def _active_session():
+    # What a read depends on besides its arguments: the identity, the network and the contracts
+    # set with `snet set`
+    session = _session_config()
+    return session.get("identity"), session.get("network"), active_registry(), session.get("current_multipartyescrow_at")
+
+def active_network():
+    return _session_config().get("network")
+
+def active_registry():
+    # Registry set with `snet set current_registry_at`, otherwise the network's default one
+    return _session_config().get("current_registry_at") or "default"
+
+def _cache_key(command, workdir=None):
+    # Returns (key, ttl) for a cacheable read, (None, None) for anything else. The key is the
+    # command's arguments without --print-traceback, which only changes how errors are printed.
+    argv = engine.snet_argv(command)
+    if argv is None:
+        return None, None
+    argv = [arg for arg in argv if arg != "--print-traceback"]
+    ttl = CACHE_TTLS.get(tuple(argv[:2]))
+    if ttl is None:
+        return None, None
+    return (tuple(argv), workdir) + _active_session(), ttl
+
+def cached_output(command, workdir=None):
+    if not cache_enabled:
+        return None
+    key, ttl = _cache_key(command, workdir)
+    if key is None:
+        return None
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry is None or time.monotonic() - entry[0] > ttl:
+        return None
+    return entry[1]
+
+def remember_output(command, workdir, output, return_code):
+    # Keeps a successful read, or drops everything once a state-changing command has succeeded
+    if not cache_enabled or return_code != 0:
+        return
+    key, ttl = _cache_key(command, workdir)
+    if key is not None:
+        with _cache_lock:
+            _cache[key] = (time.monotonic(), output)
+    elif _changes_state(command):
+        invalidate_cache()
+
+def _changes_state(command):
+    # condCommDict commands, plus identity, network and `snet set`/`unset` changes (they alter
+    # `identity list` and friends, or the contracts the reads go to)
+    argv = engine.snet_argv(command)
+    if argv is None:
+        # Batched treasurer claims
+        argv = engine.command_argv(command)
+        return argv is not None and len(argv) > 1 and argv[1] == BATCH_CLAIM_SCRIPT
+    argv = [arg for arg in argv if not arg.startswith("-")]
+    if argv[:1] == ["contract"]:
+        return " ".join(argv[:3]) in condCommDict
+    return " ".join(argv[:2]) in condCommDict or argv[:1] in (["identity"], ["network"], ["set"], ["unset"])
+
+def invalidate_cache():
+    with _cache_lock:
+        _cache.clear()
+
+def _communicate(process, input_text=None):
+    # Popen.communicate() without its wait(), so that _reap() gets to wait for the child
+    output = {}
+    def read(name, pipe):
+        output[name] = pipe.read()
+        pipe.close()
+    readers = [threading.Thread(target=read, args=(name, pipe), daemon=True) for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr))]
+    for reader in readers:
+        reader.start()
+    try:
+        if input_text:
+            process.stdin.write(input_text)
+        process.stdin.close()
+    except OSError:
+        pass
+    for reader in readers:
+        reader.join()
+    return output["stdout"], output["stderr"]
+
+def _reap(process):
+    # Waits for the child with os.wait4, which also gives its resource usage, and sets its returncode
+    # as wait() would. Returns the usage, or None without wait4 or if the child was reaped elsewhere
+    # (_terminate() waits for it too).
+    if not hasattr(os, "wait4"):
+        process.wait()
+        return None
+    try:
+        _, status, rusage = os.wait4(process.pid, 0)
+    except ChildProcessError:
+        process.wait()
+        return None
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return engine.resource_usage(rusage)
+
+def _run_job(job, command, input_text=None, workdir=None):
+    if exec_mode in ("engine", "fork"):
+        argv = engine.snet_argv(command)
+        if argv is not None:
+            on_start = lambda pid, cancel: jobs.registry.attach(job, pid, cancel)
+            result = engine.run(argv, input_text, workdir, on_start, job.set_usage)
+            if result is not None:
+                stdout, stderr, return_code = result
+                if stdout:
+                    return stdout, return_code
+                elif stderr:
+                    return stderr, return_code
+                else:
+                    return "", return_code
+
     try:
         if workdir != None:
-            current_process = subprocess.Popen(args=command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=workdir)
+            process = subprocess.Popen(args=command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=workdir)
         else:
-            current_process = subprocess.Popen(args=command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            process = subprocess.Popen(args=command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        jobs.registry.attach(job, process.pid, lambda: _terminate(process))
 
-        stdout, stderr = current_process.communicate(input=input_text)
-        return_code = current_process.returncode
+        stdout, stderr = _communicate(process, input_text)
+        job.set_usage(_reap(process))
+        return_code = process.returncode
         
         if stdout:
             return stdout, return_code
@@ -115,41 +360,572 @@ def run_shell_command(command, input_text=None, workdir=None):
     except Exception as e:
         return str(e), 1
 
-def cancel_current_process():
-    global current_process
-    if current_process:
-        current_process.terminate()
+class StreamedCommand:
+    # Runs a command and yields its output while it is produced. Iterating gives (stream, text)
+    # pairs where stream is "stdout" or "stderr" and text is at most one line (a trailing partial
+    # line, such as a "(y/n)" prompt, comes through as soon as it is written). return_code is set
+    # once iteration has finished. At most STREAM_BUFFER_CHUNKS chunks are buffered, a slow
+    # reader slows the command down instead of growing memory.
+    # An interactive command keeps its stdin open instead of reading input_text, ("input", "") is
+    # yielded when it waits on a "(y/n)" question and answer() writes the reply.
+    def __init__(self, command, input_text=None, workdir=None, interactive=False):
+        self.command = command
+        self.input_text = input_text
+        self.workdir = workdir
+        self.interactive = interactive
+        self.return_code = None
+        self.job = None
+        self.stdin_writer = None
+
+    def answer(self, text):
+        if self.stdin_writer:
+            self.stdin_writer(text)
+
+    def _set_stdin_writer(self, writer):
+        self.stdin_writer = writer
+
+    def __iter__(self):
+        self.job = jobs.registry.start(self.command)
+        try:
+            for name, text in self._chunks():
+                if name != "input":
+                    self.job.saw_output(text)
+                yield name, text
+        finally:
+            jobs.registry.finish(self.job, self.return_code if self.return_code is not None else -1)
+
+    def _chunks(self):
+        on_start = lambda pid, cancel: jobs.registry.attach(self.job, pid, cancel)
+
+        if exec_mode in ("engine", "fork"):
+            argv = engine.snet_argv(self.command)
+            if argv is not None:
+                on_stdin = self._set_stdin_writer if self.interactive else None
+                for kind, value in engine.stream(argv, self.input_text, self.workdir, on_start, on_stdin):
+                    if kind == "input":
+                        yield "input", ""
+                        continue
+                    if kind == "usage":
+                        self.job.set_usage(value)
+                        continue
+                    if kind == "result":
+                        self.return_code = value[2]
+                        if value[2] == -1 and value[1]:
+                            yield "stderr", value[1]
+                        return
+                    for line in value.splitlines(keepends=True):
+                        yield kind, line
+
+        try:
+            process = subprocess.Popen(args=self.command, shell=True, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=self.workdir)
+        except Exception as e:
+            self.return_code = 1
+            yield "stderr", str(e)
+            return
+        on_start(process.pid, lambda: _terminate(process))
+
+        chunks = queue.Queue(maxsize=STREAM_BUFFER_CHUNKS)
+        readers = [
+            threading.Thread(target=_read_stream, args=(process.stdout, "stdout", chunks), daemon=True),
+            threading.Thread(target=_read_stream, args=(process.stderr, "stderr", chunks), daemon=True)
+        ]
+        if self.interactive:
+            self._set_stdin_writer(lambda text: _answer_stdin(process.stdin, text))
+        else:
+            readers.append(threading.Thread(target=_write_stdin, args=(process.stdin, self.input_text), daemon=True))
+        for reader in readers:
+            reader.start()
+
         try:
-            current_process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            current_process.kill()
-        current_process = None
+            open_streams = 2
+            pending = {"stdout": "", "stderr": ""}
+            while open_streams > 0:
+                name, text = chunks.get()
+                if text is None:
+                    open_streams -= 1
+                    text = ""
+                lines = (pending[name] + text).splitlines(keepends=True)
+                pending[name] = ""
+                if len(lines) > 0 and not lines[-1].endswith("\n"):
+                    pending[name] = lines.pop()
+                for line in lines:
+                    yield name, line
+                # A partial line (e.g. a prompt) is only passed on once nothing more is waiting
+                for stream in pending:
+                    if pending[stream] and (chunks.empty() or open_streams == 0):
+                        prompt = self.interactive and "(y/n)" in pending[stream]
+                        yield stream, pending[stream]
+                        pending[stream] = ""
+                        if prompt and open_streams > 0:
+                            yield "input", ""
+            self.job.set_usage(_reap(process))
+            self.return_code = process.returncode
+        finally:
+            if process.poll() is None:
+                _terminate(process)
+
+def _read_stream(pipe, name, chunks):
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        data = os.read(pipe.fileno(), 4096)
+        if not data:
+            break
+        text = decoder.decode(data)
+        if text:
+            chunks.put((name, text))
+    pipe.close()
+    chunks.put((name, None))
+
+def _write_stdin(pipe, input_text):
+    try:
+        if input_text:
+            pipe.write(input_text.encode("utf-8"))
+        pipe.close()
+    except OSError:
+        pass
+
+def _answer_stdin(pipe, text):
+    # Interactive commands keep stdin open, they may ask again
+    try:
+        pipe.write(text.encode("utf-8"))
+        pipe.flush()
+    except (OSError, ValueError):
+        pass
+
+def stream_shell_command(command, input_text=None, workdir=None):
+    return StreamedCommand(command, input_text, workdir)
+
+@contextlib.contextmanager
+def output_sink(callback):
+    # Commands run inside the block (by this thread or task) stream their output to callback(stream, text)
+    # as it is produced. run_shell_command still returns the whole output when they finish.
+    token = _output_sink.set(callback)
+    try:
+        yield
+    finally:
+        _output_sink.reset(token)
+
+def current_output_sink():
+    return _output_sink.get()
+
+def start_shell_command(command, input_text=None, workdir=None):
+    # Runs the command in the background and returns its job ID straight away,
+    # collect the result with wait_job()
+    job = jobs.registry.start(command)
+
+    def runner():
+        output, return_code = _run_job(job, command, input_text, workdir)
+        job.output = output
+        jobs.registry.finish(job, return_code)
+        remember_output(command, workdir, output, return_code)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return job.id
+
+def wait_job(job_id, timeout=None):
+    job = jobs.registry.wait(job_id, timeout)
+    if job is None:
+        return "ERROR: Unknown job", 1
+    if not job.finished.is_set():
+        return "ERROR: Job is still running", 1
+    if job.state == jobs.CANCELLED:
+        return "Process cancelled", 1
+    return job.output, job.return_code
+
+def cancel_job(job_id):
+    if jobs.registry.cancel(job_id):
         return "Process cancelled", 0
     return "No process to cancel", 1
 
+def cancel_jobs(owner):
+    # Cancels every running job started under jobs.owner_scope(owner)
+    if len(jobs.registry.cancel_owner(owner)) > 0:
+        return "Process cancelled", 0
+    return "No process to cancel", 1
+
+def _record_duration(job):
+    if job.state == jobs.DONE and job.timed:
+        command_durations.record(durations.command_family(job.command), active_network() or "unknown", job.elapsed())
+
+jobs.registry.add_finish_listener(_record_duration)
+
+if metrics.ENABLED:
+    jobs.registry.add_finish_listener(lambda job: metrics.command_metrics.record(job, active_network() or "unknown"))
+
+def record_task_duration(task, seconds):
+    # Load screen tasks are kept as families of their own, "task <name>"
+    try:
+        command_durations.record(f"task {task}", active_network() or "unknown", seconds)
+    except sqlite3.Error:
+        pass
+
+def estimate_task_duration(task):
+    # (p50, p90, runs) of the load screen task, or None without enough runs
+    try:
+        return command_durations.estimate(f"task {task}", active_network() or "unknown")
+    except sqlite3.Error:
+        return None
+
+def list_jobs(state=None):
+    return jobs.registry.list(state=state)
+
+def get_job(job_id):
+    return jobs.registry.get(job_id)
+
+def warm_up():
+    if exec_mode in ("engine", "fork"):
+        engine.warm_up()
+
+# Commands that stopped at their "(y/n)" question, by command line, and how long (seconds)
+# one may wait for the user before it is answered "n"
+_confirmations = {}
+_confirmations_lock = threading.Lock()
+CONFIRM_TIMEOUT = 600
+
+class PendingConfirmation:
+    # A command kept alive at its "(y/n)" question. Answering it resumes the same process, so the
+    # preview and the transaction are a single execution.
+    def __init__(self, command, streamed, chunks):
+        self.command = command
+        self.streamed = streamed
+        self.chunks = chunks
+        self.answered = False
+        self.lock = threading.Lock()
+        self.timer = threading.Timer(CONFIRM_TIMEOUT, self.expire)
+        self.timer.daemon = True
+
+    def expire(self):
+        with _confirmations_lock:
+            if _confirmations.get(self.command) is self:
+                del _confirmations[self.command]
+        self.answer(False)
+
+    def answer(self, confirm):
+        # Returns the output the command printed after the answer and its return code,
+        # or None if it was already answered
+        with self.lock:
+            if self.answered:
+                return None
+            self.answered = True
+            self.timer.cancel()
+            # From here on the job belongs to whoever answered, so their Cancel reaches it
+            self.streamed.job.owner = jobs.current_owner()
+            # The CLI asks once per transaction (an approve before a deposit, a claim per channel),
+            # every question gets the same answer until the command exits
+            parts = []
+            waiting = True
+            while waiting:
+                self.streamed.answer("y\n" if confirm else "n\n")
+                output, waiting = _collect(self.chunks, self.streamed)
+                parts.append(output)
+            output = "".join(parts)
+            self.streamed.job.output = output
+            remember_output(self.command, self.streamed.workdir, output, self.streamed.return_code)
+            return output, self.streamed.return_code
+
+def _collect(chunks, streamed):
+    # Reads chunks until the command ends or waits on its "(y/n)" question, returns (output, waiting)
+    sink = _output_sink.get()
+    output = {"stdout": [], "stderr": []}
+    for name, text in chunks:
+        if name == "input":
+            if "(y/n)" in "".join(output["stdout"] + output["stderr"]):
+                return "".join(output["stdout"]) or "".join(output["stderr"]), True
+            # Any other question gets an empty answer, as it would with nothing on stdin
+            streamed.answer("")
+            continue
+        output[name].append(text)
+        if sink is not None:
+            sink(name, text)
+    return "".join(output["stdout"]) or "".join(output["stderr"]), False
+
+def run_confirmable(command, workdir=None):
+    # Runs a command that asks "(y/n)" before acting. If it reaches the question it is kept waiting
+    # there and errCode is 0, answer it with confirm_command() or decline_command().
+    # Returns (output, errCode), output being everything printed up to the question.
+    streamed = StreamedCommand(command, workdir=workdir, interactive=True)
+    chunks = iter(streamed)
+    output, waiting = _collect(chunks, streamed)
+    if not waiting:
+        streamed.job.output = output
+        return output, streamed.return_code
+
+    # Waiting on the user from here, so the run says nothing about how long the command takes
+    streamed.job.timed = False
+    pending = PendingConfirmation(command, streamed, chunks)
+    with _confirmations_lock:
+        previous = _confirmations.get(command)
+        _confirmations[command] = pending
+    if previous:
+        previous.answer(False)
+    pending.timer.start()
+    return output, 0
+
+def confirm_command(command, confirm=True):
+    # Answers the command left waiting by run_confirmable(). If it is no longer waiting (timed out,
+    # or it never got to the question) confirming runs it again with --yes.
+    with _confirmations_lock:
+        pending = _confirmations.pop(command, None)
+    if pending:
+        result = pending.answer(confirm)
+        if result is not None:
+            return result
+    if confirm:
+        return run_shell_command(command=f"{command} --yes")
+    return "Cancelled", 0
+
+def pending_confirmation(owner):
+    # The command of one of owner's jobs that is waiting at its "(y/n)" question, or None
+    with _confirmations_lock:
+        for command, pending in _confirmations.items():
+            if pending.streamed.job.owner is owner and not pending.answered:
+                return command
+    return None
+
+def decline_command(command):
+    # Answers "n" in the background, for screens that do not wait on the result
+    threading.Thread(target=confirm_command, args=(command, False), daemon=True).start()
+
+TX_NONCE_RE = re.compile(r"Transaction nonce: (\d+)")
+TX_HASH_RE = re.compile(r"transactionHash['\"]?:\s*['\"]?(?:HexBytes\(['\"])?(0x[0-9a-fA-F]{64})")
+TX_SENT_RE = re.compile(r"Transaction hash: (0x[0-9a-fA-F]{64})")
+
+# Seconds between receipt checks, and how long a transaction is followed before it is reported as
+# still pending and dropped
+RECEIPT_POLL_INTERVAL = 2
+RECEIPT_TIMEOUT = 1800
+
+# Called with (message, severity) from background threads when a transaction or job completes
+_notification_listeners = []
+
+def add_notification_listener(listener):
+    _notification_listeners.append(listener)
+
+def notify(message, severity="information"):
+    for listener in list(_notification_listeners):
+        try:
+            listener(message, severity)
+        except Exception:
+            pass
+
+class ReceiptWatcher:
+    # Follows broadcast transactions on one background thread. Every RECEIPT_POLL_INTERVAL the
+    # receipts of all pending transactions are fetched in one batch request, and each outcome is
+    # reported as a notification as soon as it is mined, whatever the command is still doing.
+    def __init__(self, interval=RECEIPT_POLL_INTERVAL):
+        self.interval = interval
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def watch(self, tx_hash, job):
+        # Returns False if there is no RPC endpoint to poll, the job's end is reported instead then
+        endpoint = rpc_endpoint()
+        if not endpoint:
+            return False
+        with self.lock:
+            self.pending.setdefault(tx_hash, (job, endpoint, time.monotonic()))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._loop, name="receipts", daemon=True)
+                self.thread.start()
+        return True
+
+    def _loop(self):
+        import back.registry as registry
+        while True:
+            time.sleep(self.interval)
+            with self.lock:
+                if not self.pending:
+                    self.thread = None
+                    return
+                watched = dict(self.pending)
+            by_endpoint = collections.defaultdict(list)
+            for tx_hash, (_, endpoint, _) in watched.items():
+                by_endpoint[endpoint].append(tx_hash)
+            for endpoint, tx_hashes in by_endpoint.items():
+                try:
+                    receipts = registry.RpcClient(endpoint).receipts(tx_hashes)
+                except registry.RegistryError:
+                    # Node unreachable, tried again on the next round
+                    receipts = {}
+                for tx_hash in tx_hashes:
+                    self._check(tx_hash, watched[tx_hash], receipts.get(tx_hash))
+
+    def _check(self, tx_hash, entry, receipt):
+        job, _, since = entry
+        short = f"{tx_hash[:10]}…"
+        if receipt is None:
+            if time.monotonic() - since < RECEIPT_TIMEOUT:
+                return
+            notify(f"Transaction {short} of job {job.id} still has no receipt, no longer following it", "warning")
+        else:
+            block = int(receipt["blockNumber"], 16)
+            if int(receipt.get("status", "0x1"), 16) == 1:
+                outcome = f"mined in block {block}"
+                notify(f"Transaction {short} of job {job.id} {outcome}")
+            else:
+                outcome = f"reverted in block {block}"
+                notify(f"Transaction {short} of job {job.id} {outcome}", "error")
+            if job.state == jobs.RUNNING:
+                job.status = f"tx {short} {outcome}"
+        with self.lock:
+            self.pending.pop(tx_hash, None)
+
+receipt_watcher = ReceiptWatcher()
+
+class TransactionPipeline:
+    # Confirms state-changing commands in the background so the UI never waits on a receipt, and
+    # several commands can have transactions in flight. Each command's job carries its progress
+    # in job.status: queued, then the nonce of every transaction sent, then the outcome.
+    def __init__(self, concurrency):
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="tx")
+        self.concurrency = concurrency
+        # Commands submitted and not finished yet, and the engine pool burst held while there are any
+        self.active = 0
+        self.burst = None
+        self.lock = threading.Lock()
+
+    def submit(self, command):
+        # Confirms a command left waiting by run_confirmable(), or runs it again with --yes if it is
+        # no longer waiting. Returns its job ID straight away.
+        with _confirmations_lock:
+            pending = _confirmations.pop(command, None)
+        if pending is not None:
+            pending.timer.cancel()
+            job = pending.streamed.job
+            task = functools.partial(self._confirm, pending)
+        else:
+            job = jobs.registry.start(f"{command} --yes")
+            task = functools.partial(self._run, job, f"{command} --yes")
+        job.status = "queued"
+        with self.lock:
+            self.active += 1
+            if self.burst is None and exec_mode in ("engine", "fork"):
+                # A worker per transaction on top of the pool the reads use, so a confirmed
+                # transaction never waits behind a slow read, nor the reads behind the pipeline
+                self.burst = engine.burst(pool_size + self.concurrency)
+                self.burst.__enter__()
+        self.executor.submit(contextvars.copy_context().run, self._finished_after, task)
+        return job.id
+
+    def _finished_after(self, task):
+        try:
+            task()
+        finally:
+            with self.lock:
+                self.active -= 1
+                if self.active == 0 and self.burst is not None:
+                    self.burst.__exit__(None, None, None)
+                    self.burst = None
+
+    def _confirm(self, pending):
+        job = pending.streamed.job
+        tracker = _TransactionTracker(job)
+        job.status = "submitting"
+        with output_sink(tracker.feed):
+            result = pending.answer(True)
+        if result is None:
+            job.status = "timed out at confirmation"
+        else:
+            tracker.finish(result[1])
+
+    def _run(self, job, command):
+        tracker = _TransactionTracker(job)
+        job.status = "submitting"
+        output, return_code = _run_job(job, command)
+        job.output = output
+        jobs.registry.finish(job, return_code)
+        remember_output(command, None, output, return_code)
+        tracker.feed("stdout", output)
+        tracker.finish(return_code)
+
+class _TransactionTracker:
+    # Follows a command's output and keeps its job's status up to date,
+    # and hands every broadcast transaction to the receipt watcher
+    def __init__(self, job):
+        self.job = job
+        self.nonces = []
+        self.hashes = []
+        self.watched = False
+
+    def feed(self, name, text):
+        self.nonces.extend(TX_NONCE_RE.findall(text))
+        sent = [tx_hash for tx_hash in TX_SENT_RE.findall(text) if tx_hash not in self.hashes]
+        self.hashes.extend(sent)
+        self.hashes.extend(tx_hash for tx_hash in TX_HASH_RE.findall(text) if tx_hash not in self.hashes)
+        for tx_hash in sent:
+            self.watched = receipt_watcher.watch(tx_hash, self.job) or self.watched
+        if sent:
+            self.job.status = f"tx {sent[-1][:10]}… sent, waiting for receipt"
+        elif self.nonces:
+            self.job.status = f"nonce {', '.join(self.nonces)}: waiting for receipt"
+
+    def finish(self, return_code):
+        outcome = "confirmed" if return_code == 0 else "failed"
+        details = [f"nonce {', '.join(self.nonces)}"] if self.nonces else []
+        details += [f"tx {tx_hash[:10]}…" for tx_hash in self.hashes]
+        self.job.status = f"{outcome} ({'; '.join(details)})" if details else outcome
+        # Mined transactions are already reported by the watcher
+        if return_code != 0:
+            notify(f"Job {self.job.id} failed: {self.job.command}", "error")
+        elif not self.watched:
+            notify(f"Job {self.job.id} {outcome}: {self.job.command}")
+
+tx_pipeline = TransactionPipeline(tx_concurrency)
+
+def pipelined(command):
+    # Whether confirming the command goes through the pipeline. Only commands waiting at their
+    # "(y/n)" question do, the others never got to a transaction (view-only calls print their
+    # result straight away). `client call` prints the service's reply, which the user waits for anyway.
+    with _confirmations_lock:
+        waiting = command in _confirmations
+    argv = engine.command_argv(command) or []
+    argv = [arg for arg in argv if not arg.startswith("-")]
+    return tx_pipeline_enabled and waiting and argv[1:3] != ["client", "call"]
+
+def submit_transaction(command):
+    return tx_pipeline.submit(command)
+
+# Output parsers, shared by the blocking helpers below and their async versions in back.aio
+
+def cli_found(output):
+    return "error: the following arguments are required: COMMAND" in output
+
+def parse_network_list(output, errCode):
+    if errCode == 0:
+        return re.findall(r'(?m)^\s*([a-zA-Z]+)\s*:$', output)
+    return ["Unable to find network list"]
+
+def balance_found(output):
+    return "    account:" in output
+
+def identity_found(output):
+    return "Please create your first" not in output
+
+def parse_wallet_dict(output):
+    matches = re.findall(r'(\w+):\s*(\S+)', output)
+    return {key: value for key, value in matches}
+
 def check_cli():
     output, errCode = run_shell_command('snet')
-    if "error: the following arguments are required: COMMAND" in output:
+    if cli_found(output):
         return True, output, errCode
     return False, output, errCode
 
 def network_list():
     output, errCode = run_shell_command('snet --print-traceback network list')
-    if errCode == 0:
-        network_list = re.findall(r'(?m)^\s*([a-zA-Z]+)\s*:$', output)
-    else:
-        network_list = ["Unable to find network list"]
+    network_list = parse_network_list(output, errCode)
     return network_list, errCode
 
 def check_account_balance():
     output, errCode = run_shell_command('snet --print-traceback account balance')
-    if "    account:" in output:
+    if balance_found(output):
         return True, output, errCode
     return False, output, errCode
 
 def identity_check():
     output, errCode = run_shell_command('snet --print-traceback account print')
-    if "Please create your first" in output:
+    if not identity_found(output):
         return False, output, errCode
     else:
         return True, output, errCode
@@ -183,8 +959,7 @@ def nav_sidebar_vert(focus_button) -> Vertical:
 def wallet_dict_create():
     check, output, errCode = check_account_balance()
     if check:
-        matches = re.findall(r'(\w+):\s*(\S+)', output)
-        return {key: value for key, value in matches}, 0
+        return parse_wallet_dict(output), 0
     else:
         return {}, 1
 
@@ -237,9 +1012,7 @@ def account_deposit(agi_amount, contract_address, mpe_address, wallet_index, qui
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
 
@@ -270,9 +1043,7 @@ def account_withdraw(agi_amount, mpe_address, wallet_index, quiet, verbose, view
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
 
@@ -306,9 +1077,7 @@ def account_transfer(reciever_addr, agi_amount, mpe_address, wallet_index, quiet
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
 
@@ -475,9 +1244,7 @@ def update_org_metadata(org_id, file_name, mem_list, index, quiet, verbose, ipfs
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -515,9 +1282,7 @@ def create_organization(org_id, metadata_file, members, index, quiet, verbose, r
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -545,16 +1310,14 @@ def delete_organization(org_id, wallet_index, quiet, verbose, registry_address,
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
             output = "Organization successfully deleted!"
     return output, errCode, command 
 
-def print_organization_info(registry_address=None, wallet_index=None):
+def organization_info_command(registry_address=None, wallet_index=None):
     # snet organization list-my [-h] [--registry-at REGISTRY_ADDRESS]
     #                       [--wallet-index WALLET_INDEX]
     command = "snet --print-traceback organization list-my"
@@ -562,11 +1325,16 @@ def print_organization_info(registry_address=None, wallet_index=None):
         command += f" --registry-at {registry_address}"
     if wallet_index and len(wallet_index) > 0:
         command += f" --wallet-index {wallet_index}"
+    return command
 
-    output, errCode = run_shell_command(command)
+def organization_info_output(output, errCode):
     if len(output) == 0 and errCode != 0:
         output = f"ERROR: Unable to find organizations, ensure you have created one\nCLI Output: {output}"
-    return output, errCode
+    return output
+
+def print_organization_info(registry_address=None, wallet_index=None):
+    output, errCode = run_shell_command(organization_info_command(registry_address, wallet_index))
+    return organization_info_output(output, errCode), errCode
 
 def add_org_metadata_group(group_name, pay_addr, endpoints, payment_expiration_threshold, pay_chann_storage_type, pay_chann_conn_to, pay_chann_req_to, metadata_file, reg_addr):
     # snet organization add-group [-h]
@@ -743,9 +1511,7 @@ def publish_service(org_id, service_id, metadata_file, reg_addr, mpe_addr, updat
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -775,64 +1541,230 @@ def delete_service(org_id, service_id, reg_addr, index, quiet, verbose, view=Fal
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
             output = "Service successfully deleted!"
     return output, errCode, command 
 
-def get_all_organizations_and_services():
+def parse_listing(output):
+    # `organization list` and `organization list-services` print a header line, then one ID per line
+    return [line.strip() for line in output.split('\n')[1:]]
+
+def services_entry(services_list, err_code):
+    if err_code != 0:
+        return f"Error fetching services: {services_list}"
+    return parse_listing(services_list)
+
+def list_organizations():
+    # Returns ({org_id: fingerprint}, errCode) in registry order. The CLI listing carries no
+    # fingerprint (None), so snapshot refreshes fall back to the age of each entry.
     org_list, err_code = run_shell_command("snet organization list")
     if err_code != 0:
         return f"Error fetching organizations: {org_list}", err_code
+    return {org_id: None for org_id in parse_listing(org_list) if len(org_id) > 0}, 0
 
-    org_ids = [line.strip() for line in org_list.split('\n')[1:]]
-
-    marketplace_data = {}
+def fetch_services(org_ids):
+    # Returns {org_id: services or error string} in the order of org_ids, fetched in parallel
+    if len(org_ids) == 0:
+        return {}
 
-    for org_id in org_ids:
-        if len(org_id) > 0:
-            services_list, err_code = run_shell_command(f"snet organization list-services {org_id}")
-            if err_code != 0:
-                marketplace_data[org_id] = f"Error fetching services: {services_list}"
-            else:
-                services = [line.strip() for line in services_list.split('\n')[1:]]
-                marketplace_data[org_id] = services
+    def fetch(org_id):
+        services_list, err_code = run_shell_command(f"snet organization list-services {org_id}")
+        return services_entry(services_list, err_code)
 
-    return marketplace_data, 0
+    concurrency = min(fanout_limit, len(org_ids))
+    workers = engine.burst(concurrency) if exec_mode in ("engine", "fork") else contextlib.nullcontext()
+    with workers, concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # Each task gets a copy of this thread's context, so its job owner and output sink carry over
+        futures = [executor.submit(contextvars.copy_context().run, fetch, org_id) for org_id in org_ids]
+        return {org_id: future.result() for org_id, future in zip(org_ids, futures)}
 
-def search_organizations_and_services(data, phrase):
-    results = {}
-    phrase = phrase.lower()
+def get_all_organizations_and_services():
+    listing, err_code = list_organizations()
+    if err_code != 0:
+        return listing, err_code
+    return fetch_services(list(listing)), 0
+
+def marketplace_snapshot_key():
+    return active_network() or "default", active_registry()
+
+def load_marketplace_snapshot():
+    # Returns (data, refreshed_at) from disk, or (None, None) if this network and registry have none yet
+    network, registry = marketplace_snapshot_key()
+    return marketplace_snapshot.load(network, registry)
+
+def marketplace_refresh_plan(listing):
+    # Organizations a refresh has to fetch: new ones, failed ones, ones whose fingerprint changed and,
+    # without fingerprints, ones older than MARKETPLACE_ORG_MAX_AGE
+    network, registry = marketplace_snapshot_key()
+    known = marketplace_snapshot.entries(network, registry)
+    now = time.time()
+    stale = []
+    for org_id, fingerprint in listing.items():
+        entry = known.get(org_id)
+        if entry is None or entry[2] or entry[0] != fingerprint:
+            stale.append(org_id)
+        elif fingerprint is None and now - entry[1] > MARKETPLACE_ORG_MAX_AGE:
+            stale.append(org_id)
+    return stale, known
+
+def save_marketplace_refresh(listing, fetched, known):
+    # A failed re-fetch keeps the services already on disk, the organization is retried next time
+    fetched = {org_id: entry for org_id, entry in fetched.items() if not (isinstance(entry, str) and org_id in known and not known[org_id][2])}
+    network, registry = marketplace_snapshot_key()
+    marketplace_snapshot.update(network, registry, listing, fetched)
+    return marketplace_snapshot.load(network, registry)[0]
+
+def rpc_endpoint():
+    return _snet_config().get(f"network.{active_network()}", "default_eth_rpc_endpoint", fallback=None)
+
+def registry_reader():
+    # Reads the active network's Registry directly over JSON-RPC, None if there is no RPC endpoint
+    # configured or the reader's dependencies are missing (the CLI is used instead then)
+    endpoint = rpc_endpoint()
+    if not endpoint:
+        return None
+    try:
+        # Loaded on first use, eth_abi is only needed here
+        import back.registry as registry
+    except ImportError:
+        return None
+    return registry.RegistryReader(endpoint, _session_config().get("current_registry_at"))
+
+# Why the last marketplace refresh listed through the CLI instead of the Registry, None if it did not
+registry_fallback_reason = None
+
+def read_registry_organizations():
+    # Returns {org_id: (fingerprint, services)} straight from the Registry, or None to fall back to the CLI
+    global registry_fallback_reason
+    reader = registry_reader()
+    if reader is None:
+        registry_fallback_reason = "no RPC endpoint for the network, or eth_abi is missing"
+        return None
+    try:
+        organizations = reader.organizations()
+    except Exception as e:
+        # Reported once, not on every refresh while the node stays unreachable
+        reason = f"{type(e).__name__}: {e}"
+        if reason != registry_fallback_reason:
+            notify(f"Could not read the Registry ({reason}), the marketplace is listed through the CLI instead", "warning")
+        registry_fallback_reason = reason
+        return None
+    registry_fallback_reason = None
+    return organizations
+
+def save_registry_refresh(organizations):
+    # The Registry entries already carry the services, only the changed ones are written
+    listing = {org_id: fingerprint for org_id, (fingerprint, services) in organizations.items()}
+    stale, known = marketplace_refresh_plan(listing)
+    return save_marketplace_refresh(listing, {org_id: organizations[org_id][1] for org_id in stale}, known)
+
+def refresh_marketplace():
+    # Brings the on-disk snapshot up to date, returns (data, errCode) like get_all_organizations_and_services
+    organizations = read_registry_organizations()
+    if organizations is not None:
+        return save_registry_refresh(organizations), 0
+
+    listing, err_code = list_organizations()
+    if err_code != 0:
+        return listing, err_code
+    stale, known = marketplace_refresh_plan(listing)
+    return save_marketplace_refresh(listing, fetch_services(stale), known), 0
+
+def format_age(seconds):
+    if seconds < 60:
+        return "just now"
+    elif seconds < 3600:
+        return f"{int(seconds // 60)}m ago"
+    elif seconds < 86400:
+        return f"{int(seconds // 3600)}h {int(seconds % 3600 // 60)}m ago"
+    return f"{int(seconds // 86400)}d ago"
+
+class MarketplaceIndex:
+    # Trigram index over organization and service IDs for searching the marketplace as you type.
+    # Matches are ranked (exact, then prefix, then substring) and a phrase that extends the previous
+    # one is only checked against the previous matches.
+    def __init__(self, data):
+        self.data = data
+        self.names = []
+        self.owners = []
+        self.trigrams = collections.defaultdict(set)
+        for org_id, services in data.items():
+            self._add(org_id, org_id, None)
+            if isinstance(services, str):
+                # Fetch errors stay searchable, like they were without the index
+                self._add(services, org_id, None)
+            else:
+                for service in services:
+                    if service:
+                        self._add(service, org_id, service)
+        self.last_phrase = ""
+        self.last_matches = None
+
+    def _add(self, name, org_id, service):
+        position = len(self.names)
+        lowered = name.lower()
+        self.names.append(lowered)
+        self.owners.append((org_id, service))
+        for i in range(len(lowered) - 2):
+            self.trigrams[lowered[i:i + 3]].add(position)
+
+    def _candidates(self, phrase):
+        if self.last_matches is not None and self.last_phrase and phrase.startswith(self.last_phrase):
+            return self.last_matches
+        if len(phrase) >= 3:
+            postings = sorted((self.trigrams.get(phrase[i:i + 3], set()) for i in range(len(phrase) - 2)), key=len)
+            return set.intersection(*postings)
+        return range(len(self.names))
+
+    def search(self, phrase):
+        # Organizations whose ID matches with all their services, the others with only their matching
+        # services, best matches first
+        phrase = phrase.lower()
+        if len(phrase) == 0:
+            self.last_phrase, self.last_matches = "", None
+            return self.data
+
+        matches = {position for position in self._candidates(phrase) if phrase in self.names[position]}
+        self.last_phrase, self.last_matches = phrase, matches
+
+        ranks = {}
+        org_matches = set()
+        service_matches = collections.defaultdict(set)
+        for position in matches:
+            org_id, service = self.owners[position]
+            name = self.names[position]
+            rank = 0 if name == phrase else 1 if name.startswith(phrase) else 2
+            ranks[org_id] = min(ranks.get(org_id, rank), rank)
+            if service is None:
+                org_matches.add(org_id)
+            else:
+                service_matches[org_id].add(service)
 
-    for org_id, services in data.items():
-        org_matches = phrase in org_id.lower()
-        if isinstance(services, str):
-            if org_matches or phrase in services.lower():
+        results = {}
+        for org_id in sorted(ranks, key=lambda org_id: (ranks[org_id], org_id.lower())):
+            services = self.data[org_id]
+            if org_id in org_matches:
                 results[org_id] = services
-        else:
-            matching_services = [service for service in services if phrase in service.lower()]
-            if org_matches or matching_services:
-                results[org_id] = services if org_matches else matching_services
-
-    return results
+            else:
+                results[org_id] = [service for service in services if service in service_matches[org_id]]
+        return results
 
-def format_marketplace_data(data):
-    output = []
+def marketplace_table_rows(data):
+    # (org_id, service count, status) per organization, for the View All table
     for org_id, services in data.items():
-        output.append(f"Organization ID: {org_id}")
         if isinstance(services, str):
-            output.append(f"  {services}")
-        elif services:
-            for service in services:
-                output.append(f"  {service}")
+            yield org_id, 0, "Fetch failed"
         else:
-            output.append("  No services found")
-        output.append("")
-    return "\n".join(output)
+            yield org_id, len([service for service in services if service]), "OK"
+
+def marketplace_service_rows(services):
+    if isinstance(services, str):
+        return [(services,)]
+    rows = [(service,) for service in services if service]
+    return rows if rows else [("No services found",)]
 
 def add_org_members(org_id, mem_list, index, quiet, verbose, view=False):
     # snet organization add-members [-h] 
@@ -854,9 +1786,7 @@ def add_org_members(org_id, mem_list, index, quiet, verbose, view=False):
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -883,9 +1813,7 @@ def remove_org_members(org_id, mem_list, index, quiet, verbose, view=False):
 
      # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -914,9 +1842,7 @@ def change_org_owner(org_id, new_addr, index, quiet, verbose, view=False):
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -933,7 +1859,14 @@ def change_org_owner(org_id, new_addr, index, quiet, verbose, view=False):
 #     output, errCode = run_shell_command(command)
 #     return output, errCode
 
-def treasurer_claim(channels, endpoint, wallet_index, quiet, verbose, view=False):
+def batch_claim_command(command, batch_size):
+    # The same treasurer command, but claiming batch_size channels per multiChannelClaim transaction
+    return f"{shlex.quote(sys.executable)} {shlex.quote(BATCH_CLAIM_SCRIPT)} --chunk-size {batch_size} {command[len('snet '):]}"
+
+def valid_batch_size(batch_size):
+    return not batch_size or (batch_size.isdecimal() and int(batch_size) > 0)
+
+def treasurer_claim(channels, endpoint, wallet_index, quiet, verbose, view=False, batch_size=None):
     # snet treasurer claim [-h] --endpoint ENDPOINT 
     #                  [--wallet-index WALLET_INDEX] [--yes]
     #                  [--quiet | --verbose]
@@ -942,6 +1875,8 @@ def treasurer_claim(channels, endpoint, wallet_index, quiet, verbose, view=False
         return "ERROR: Channels list is required", 42
     if not endpoint or len(endpoint) == 0:
         return "ERROR: Endpoint is required", 42
+    if not valid_batch_size(batch_size):
+        return "ERROR: Invalid claim batch size, must be a whole number > 0", 42, None
 
     command = f"snet --print-traceback treasurer claim --endpoint {endpoint} {channels}"
     if wallet_index and len(wallet_index) > 0:
@@ -951,23 +1886,26 @@ def treasurer_claim(channels, endpoint, wallet_index, quiet, verbose, view=False
     elif verbose:
         command += " --verbose"
 
+    if batch_size:
+        command = batch_claim_command(command, batch_size)
+
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
             output = "Payments successfully claimed from channels!"
     return output, errCode, command 
 
-def treasurer_claim_all(endpoint, wallet_index, quiet, verbose, view=False):
+def treasurer_claim_all(endpoint, wallet_index, quiet, verbose, view=False, batch_size=None):
     # snet treasurer claim-all [-h] --endpoint ENDPOINT 
     #                      [--wallet-index WALLET_INDEX] [--yes]
     #                      [--quiet | --verbose]
     if not endpoint or len(endpoint) == 0:
         return "ERROR: Endpoint is required", 42
+    if not valid_batch_size(batch_size):
+        return "ERROR: Invalid claim batch size, must be a whole number > 0", 42, None
 
     command = f"snet --print-traceback treasurer claim-all --endpoint {endpoint}"
     if wallet_index and len(wallet_index) > 0:
@@ -977,18 +1915,19 @@ def treasurer_claim_all(endpoint, wallet_index, quiet, verbose, view=False):
     elif verbose:
         command += " --verbose"
 
+    if batch_size:
+        command = batch_claim_command(command, batch_size)
+
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
             output = "All available payments successfully claimed!"
     return output, errCode, command 
 
-def treasurer_claim_expr(threshold: str, endpoint, wallet_index, quiet, verbose, view=False):
+def treasurer_claim_expr(threshold: str, endpoint, wallet_index, quiet, verbose, view=False, batch_size=None):
     # snet treasurer claim-expired [-h]
     #                          [--expiration-threshold EXPIRATION_THRESHOLD]
     #                          --endpoint ENDPOINT 
@@ -997,6 +1936,8 @@ def treasurer_claim_expr(threshold: str, endpoint, wallet_index, quiet, verbose,
 
     if endpoint is None or len(endpoint) <= 0:
         return "ERROR: Endpoint is required", 42
+    if not valid_batch_size(batch_size):
+        return "ERROR: Invalid claim batch size, must be a whole number > 0", 42, None
 
     command = f"snet --print-traceback treasurer claim-expired  --endpoint {endpoint}"
 
@@ -1015,11 +1956,12 @@ def treasurer_claim_expr(threshold: str, endpoint, wallet_index, quiet, verbose,
     elif verbose:
         command += " --verbose"
 
+    if batch_size:
+        command = batch_claim_command(command, batch_size)
+
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -1396,9 +2338,7 @@ def service_metadata_update_update_metadata(org_id, service_id, metadata_file, r
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
         if len(output) == 0 and errCode == 0:
@@ -1508,9 +2448,7 @@ def client_call(org_id, serv_id, group_name, method, params, proto_serv=None, mp
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes")
 
@@ -1701,10 +2639,8 @@ def channel_open_init(org_id, group_name, agi_amount, expr, registry, force, sig
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
-        elif "already exists" in output:
+        output, errCode = run_confirmable(command)
+        if "(y/n)" not in output and "already exists" in output:
             errCode = 1
     else:
         output, errCode = run_shell_command(command=f"{command} --yes") 
@@ -1769,9 +2705,7 @@ def channel_open_init_metadata(org_id, group_name, agi_amount, expr, registry, f
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes") 
 
@@ -1816,9 +2750,7 @@ def channel_extend_add(channel_id, mpe_addr, expr, force, agi_amount, wallet_ind
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes") 
 
@@ -1874,15 +2806,13 @@ def channel_extend_add_org(org_id, group_name, registry, mpe_addr, channel_id, f
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes") 
 
     return output, errCode, command
 
-def channel_print_initialized(only_id=None, filter_sender=None, filter_signer=None, filter_my=None, mpe_addr=None, registry=None, wallet_index=None):
+def channel_print_initialized_command(only_id=None, filter_sender=None, filter_signer=None, filter_my=None, mpe_addr=None, registry=None, wallet_index=None):
     # snet channel print-initialized [-h] [--only-id]
     #                            [--filter-sender | --filter-signer | --filter-my]
     #                            [--multipartyescrow-at MULTIPARTYESCROW_AT]
@@ -1906,47 +2836,101 @@ def channel_print_initialized(only_id=None, filter_sender=None, filter_signer=No
         command += f" --wallet-index {wallet_index}"
     if registry and len(registry) > 0:
         command += f" --registry-at {registry}"
+    return command
+
+# Columns of the initialized channels table, as (ChannelRecord field, title)
+CHANNEL_COLUMNS = [
+    ("channel_id", "Channel ID"),
+    ("org_id", "Organization"),
+    ("group_name", "Group"),
+    ("nonce", "Nonce"),
+    ("value", "Value (AGIX)"),
+    ("expiration", "Expiration (block)")
+]
+
+class ChannelRecord:
+    # One channel from `snet channel print-initialized`. nonce, value (a Decimal, in AGIX) and
+    # expiration are None when only IDs were printed.
+    __slots__ = ("channel_id", "org_id", "group_name", "nonce", "value", "expiration")
+
+    def __init__(self, channel_id, org_id, group_name, nonce=None, value=None, expiration=None):
+        self.channel_id = channel_id
+        self.org_id = org_id
+        self.group_name = group_name
+        self.nonce = nonce
+        self.value = value
+        self.expiration = expiration
+
+    def row(self):
+        return tuple("" if getattr(self, field) is None else getattr(self, field) for field, _ in CHANNEL_COLUMNS)
+
+    def matches(self, phrase):
+        phrase = phrase.lower()
+        return phrase in str(self.channel_id) or phrase in self.org_id.lower() or phrase in self.group_name.lower()
+
+    def __repr__(self):
+        return f"ChannelRecord({self.channel_id}, {self.org_id!r}, {self.group_name!r})"
+
+def parse_initialized_channels(output):
+    # The header is "#organization_id service_id group_name channel_id nonce value(AGIX) expiration(blocks)",
+    # but the rows are "org_id group_name channel_id nonce value expiration" (no service_id), or
+    # "org_id group_name channel_id" with --only-id. Rows are read from both ends so a group name
+    # with spaces in it stays whole.
+    channels = []
+    full = None
+    for line in output.splitlines():
+        if line.startswith("#"):
+            full = "nonce" in line
+            continue
+        parts = line.split()
+        try:
+            if full and len(parts) >= 6:
+                channels.append(ChannelRecord(int(parts[-4]), parts[0], " ".join(parts[1:-4]), int(parts[-3]), decimal.Decimal(parts[-2]), int(parts[-1])))
+            elif full is False and len(parts) >= 3:
+                channels.append(ChannelRecord(int(parts[-1]), parts[0], " ".join(parts[1:-1])))
+        except (ValueError, decimal.InvalidOperation):
+            continue
+    return channels
+
+def filter_channels(channels, phrase):
+    phrase = phrase.strip()
+    if not phrase:
+        return channels
+    return [channel for channel in channels if channel.matches(phrase)]
+
+def format_initialized_channels(output, errCode):
+    # Padded text version of the channels, for the command output pages
+    if errCode != 0:
+        return output
+    channels = parse_initialized_channels(output)
+    if not channels:
+        return output
+    return format_channel_records(channels)
+
+def format_channel_records(channels):
+    if not channels:
+        return "No initialized channels"
+    columns = CHANNEL_COLUMNS if channels[0].nonce is not None else CHANNEL_COLUMNS[:3]
+    rows = [[str(cell) for cell in channel.row()[:len(columns)]] for channel in channels]
+    header = [title for _, title in columns]
+    widths = [max(len(header[i]), max(len(row[i]) for row in rows)) for i in range(len(columns))]
+
+    formatted_header = " | ".join(col.ljust(width) for col, width in zip(header, widths))
+    formatted_data = [" | ".join(col.ljust(width) for col, width in zip(row, widths)) for row in rows]
+    return f"{formatted_header}\n{'-' * len(formatted_header)}\n" + "\n".join(formatted_data)
+
+def channel_print_initialized(only_id=None, filter_sender=None, filter_signer=None, filter_my=None, mpe_addr=None, registry=None, wallet_index=None):
+    command = channel_print_initialized_command(only_id, filter_sender, filter_signer, filter_my, mpe_addr, registry, wallet_index)
 
     # Run command
     output, errCode = run_shell_command(command)
+    return format_initialized_channels(output, errCode), errCode
 
-    # Format output
-    if errCode == 0:
-        lines = output.strip().split('\n')
-        if len(lines) > 1:
-            header = lines[0]
-            data_lines = lines[1:]
-
-            # Split the header
-            header_cols = header.split()
-
-            # Function to split data lines correctly
-            def split_line(line):
-                parts = line.split(maxsplit=7)  # Split into 8 parts max
-                if len(parts) < 8:
-                    # If service_id is missing, insert an empty string
-                    parts.insert(1, '')
-                return parts
-
-            # Split the data lines
-            data_cols = [split_line(line) for line in data_lines]
-
-            # Determine the maximum width for each column
-            col_widths = [max(len(str(row[i])) for row in [header_cols] + data_cols) for i in range(len(header_cols))]
-
-            # Format the header
-            formatted_header = " | ".join(col.ljust(width) for col, width in zip(header_cols, col_widths))
-
-            # Format the data rows
-            formatted_data = [" | ".join(col.ljust(width) for col, width in zip(row, col_widths)) for row in data_cols]
-
-            # Combine everything
-            separator = "-" * len(formatted_header)
-            formatted_output = f"{formatted_header}\n{separator}\n" + "\n".join(formatted_data)
-
-            return formatted_output, errCode
-        
-    return output, errCode
+def initialized_channels(only_id=None, filter_sender=None, filter_signer=None, filter_my=None, mpe_addr=None, registry=None, wallet_index=None):
+    # Same command as channel_print_initialized, returning the ChannelRecords instead of the text
+    command = channel_print_initialized_command(only_id, filter_sender, filter_signer, filter_my, mpe_addr, registry, wallet_index)
+    output, errCode = run_shell_command(command)
+    return (parse_initialized_channels(output) if errCode == 0 else output), errCode
 
 def channel_print_initialized_filter_org(org_id, group_name, registry, only_id, filter_sender, filter_signer, filter_my, mpe_addr, wallet_index):
     # snet channel print-initialized-filter-org [-h] [--registry-at REGISTRY_AT]
@@ -1984,6 +2968,110 @@ def channel_print_initialized_filter_org(org_id, group_name, registry, only_id,
     output, errCode = run_shell_command(command)
     return output, errCode
 
+def channel_lookup(mpe_addr=None):
+    # Finds channels through the local MPE event index, None if there is no RPC endpoint configured
+    # or the index's dependencies are missing (the CLI is used instead then)
+    global channel_index
+    endpoint = rpc_endpoint()
+    if not endpoint:
+        return None
+    try:
+        import back.mpe_index as mpe_index
+    except ImportError:
+        return None
+    with _channel_index_lock:
+        if channel_index is None:
+            channel_index = mpe_index.ChannelIndex(os.path.join(TUI_DATA_DIR, "channels.db"))
+    mpe_addr = mpe_addr or _session_config().get("current_multipartyescrow_at")
+    return mpe_index.ChannelLookup(channel_index, endpoint, mpe_addr or None)
+
+def account_address(wallet_index=None):
+    command = "snet account print"
+    if wallet_index and len(wallet_index) > 0:
+        command += f" --wallet-index {wallet_index}"
+    output, errCode = run_shell_command(command)
+    address = output.split()[-1] if errCode == 0 and output.strip() else ""
+    return address if re.fullmatch(r"0x[0-9a-fA-F]{40}", address) else None
+
+def payment_group_id(org_id, group_name, registry=None):
+    # Hex ID of an organization's payment group, from the organization's metadata
+    command = f"snet organization print-metadata {org_id}"
+    if registry and len(registry) > 0:
+        command += f" --registry-at {registry}"
+    output, errCode = run_shell_command(command)
+    if errCode != 0:
+        return None
+    try:
+        for group in json.loads(output).get("groups", []):
+            if group.get("group_name") == group_name:
+                return "0x" + base64.b64decode(group["group_id"]).hex()
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return None
+
+def cogs_to_agix(cogs):
+    # Same rendering as the CLI's cogs2stragix
+    with decimal.localcontext() as context:
+        context.prec = 100
+        return format(decimal.Decimal(cogs) / 10 ** 8, "f")
+
+def indexed_channels(mpe_addr, wallet_index, filters):
+    # Returns ({channel_id: opened_block}, lookup, latest block) for the channels matching `filters`
+    # (sender, recipient, group as (org_id, group_name, registry)), or None to fall back to the CLI.
+    # An empty sender or recipient is the identity's own address, as in the CLI.
+    lookup = channel_lookup(mpe_addr)
+    if lookup is None:
+        return None
+    filters = dict(filters)
+    for key in ("sender", "recipient"):
+        if key in filters and not filters[key]:
+            filters[key] = account_address(wallet_index)
+            if filters[key] is None:
+                return None
+    if "group" in filters:
+        filters["group_id"] = payment_group_id(*filters.pop("group"))
+        if filters["group_id"] is None:
+            return None
+    try:
+        channels, latest = lookup.find(**filters)
+    except Exception:
+        return None
+    return channels, lookup, latest
+
+def indexed_channel_listing(only_id, mpe_addr, wallet_index, filters):
+    # The output of `snet channel print-all-filter-*`, built from the local index plus one batched
+    # read of the channels' current state. None to fall back to the CLI.
+    found = indexed_channels(mpe_addr, wallet_index, filters)
+    if found is None:
+        return None
+    channels, lookup, latest = found
+    channel_ids = sorted(channels)
+    if only_id:
+        return "#channelId\n" + "".join(f"{channel_id}\n" for channel_id in channel_ids)
+    try:
+        states = lookup.states(channel_ids, latest)
+    except Exception:
+        return None
+    lines = ["#channelId nonce recipient groupId(base64) value(AGIX) expiration(blocks)"]
+    for channel_id in channel_ids:
+        state = states[channel_id]
+        group_id = base64.b64encode(state["group_id"]).decode("ascii")
+        lines.append(f"{channel_id} {state['nonce']} {state['recipient']} {group_id} {cogs_to_agix(state['value'])} {state['expiration']}")
+    return "\n".join(lines) + "\n"
+
+def indexed_claimable_channels(mpe_addr, wallet_index):
+    # {channel_id: opened_block} of the identity's channels that claim-timeout-all would claim
+    # (expired with funds left), or None to leave the scan to the CLI
+    found = indexed_channels(mpe_addr, wallet_index, {"sender": None})
+    if found is None:
+        return None
+    channels, lookup, latest = found
+    try:
+        states = lookup.states(channels, latest)
+    except Exception:
+        return None
+    return {channel_id: channels[channel_id] for channel_id, state in states.items() if state["value"] > 0 and state["expiration"] < latest}
+
 def channel_print_all_filter_sender(only_id, mpe_addr, from_block, sender, wallet_index):
     # snet channel print-all-filter-sender [-h] [--only-id]
     #                                  [--multipartyescrow-at MULTIPARTYESCROW_AT]
@@ -1991,6 +3079,12 @@ def channel_print_all_filter_sender(only_id, mpe_addr, from_block, sender, walle
     #                                  [--wallet-index WALLET_INDEX]
     #                                  [--sender SENDER]
 
+    # Without a starting block, answer from the local event index
+    if not from_block:
+        output = indexed_channel_listing(only_id, mpe_addr, wallet_index, {"sender": sender})
+        if output is not None:
+            return output, 0
+
     # Construct command
     command = "snet --print-traceback channel print-all-filter-sender"
 
@@ -2016,6 +3110,12 @@ def channel_print_all_filter_recipient(only_id, mpe_addr, from_block, recipient,
     #                                     [--wallet-index WALLET_INDEX]
     #                                     [--recipient RECIPIENT]
 
+    # Without a starting block, answer from the local event index
+    if not from_block:
+        output = indexed_channel_listing(only_id, mpe_addr, wallet_index, {"recipient": recipient})
+        if output is not None:
+            return output, 0
+
     # Construct command
     command = "snet --print-traceback channel print-all-filter-recipient"
 
@@ -2048,6 +3148,12 @@ def channel_print_all_filter_group(org_id, group_name, registry, only_id, mpe_ad
     if not group_name or len(group_name) == 0:
         return "ERROR: Group name is required", 42
 
+    # Without a starting block, answer from the local event index
+    if not from_block:
+        output = indexed_channel_listing(only_id, mpe_addr, wallet_index, {"group": (org_id, group_name, registry)})
+        if output is not None:
+            return output, 0
+
     # Construct command
     command = f"snet --print-traceback channel print-all-filter-group {org_id} {group_name}"
     if registry and len(registry) > 0:
@@ -2080,6 +3186,12 @@ def channel_print_all_filter_group_sender(org_id, group_name, registry, only_id,
     if not group_name or len(group_name) == 0:
         return "ERROR: Group name is required", 42
 
+    # Without a starting block, answer from the local event index
+    if not from_block:
+        output = indexed_channel_listing(only_id, mpe_addr, wallet_index, {"sender": sender, "group": (org_id, group_name, registry)})
+        if output is not None:
+            return output, 0
+
     # Construct command
     command = f"snet --print-traceback channel print-all-filter-group-sender {org_id} {group_name}"
     if registry and len(registry) > 0:
@@ -2122,9 +3234,7 @@ def channel_claim_timeout(channel_id, mpe_addr, wallet_index, quiet, verbose, vi
 
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes") 
 
@@ -2136,6 +3246,14 @@ def channel_claim_timeout_all(mpe_addr, from_block, wallet_index, quiet, verbose
     #                            [--wallet-index WALLET_INDEX] [--yes]
     #                            [--quiet | --verbose] [--from-block FROM_BLOCK]
 
+    # Without a starting block, the local event index tells which channels are claimable, the CLI
+    # then only scans from the oldest of them
+    claimable = None
+    if not from_block:
+        claimable = indexed_claimable_channels(mpe_addr, wallet_index)
+        if claimable:
+            from_block = str(min(claimable.values()))
+
     # Construct command
     command = "snet --print-traceback channel claim-timeout-all"
     
@@ -2150,11 +3268,12 @@ def channel_claim_timeout_all(mpe_addr, from_block, wallet_index, quiet, verbose
     elif verbose:
         command += " --verbose"
 
+    if claimable == {}:
+        return "No expired channels with funds left to claim", 0, command
+
     # Run command
     if view:
-        output, errCode = run_shell_command(command=command, input_text="n\n")
-        if len(output) > 0 and "(y/n)" in output:
-            errCode = 0
+        output, errCode = run_confirmable(command)
     else:
         output, errCode = run_shell_command(command=f"{command} --yes") 
 
@@ -2192,13 +3311,9 @@ def custom_conditional_command(root, sub, args, cwd, traceback, view):
 
     if view:
         if cwd and len(cwd) > 0:
-            output, errCode = run_shell_command(cmd, input_text="n\n", workdir=cwd)
-            if len(output) > 0 and "(y/n)" in output:
-                errCode = 0
+            output, errCode = run_confirmable(cmd, workdir=cwd)
         else:
-            output, errCode = run_shell_command(cmd, input_text="n\n")
-            if len(output) > 0 and "(y/n)" in output:
-                errCode = 0
+            output, errCode = run_confirmable(cmd)
     else:
         if cwd and len(cwd) > 0:
             output, errCode = run_shell_command(command=f"{command} --yes", workdir=cwd) 
@@ -0,0 +1,75 @@
+import sys
+from snet.cli import arguments
+from snet.cli.config import Config
+from snet.cli.commands.mpe_treasurer import MPETreasurerCommand
+
+# Runs `snet treasurer claim | claim-all | claim-expired`, but submits the payments signed by the
+# daemon with MultiPartyEscrow.multiChannelClaim, up to --chunk-size channels per transaction,
+# instead of one channelClaim transaction (and receipt wait) per channel. Everything else, the
+# daemon calls, the checks and the "(y/n)" confirmation, is the CLI's own code. The confirmation is
+# asked once for the whole claim, not once per transaction.
+#
+# Usage:
+#   python batch_claim.py [--chunk-size N] [--print-traceback] treasurer claim-all --endpoint ENDPOINT ...
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+class BatchClaimTreasurerCommand(MPETreasurerCommand):
+    chunk_size = DEFAULT_CHUNK_SIZE
+
+    def _blockchain_claim(self, payments):
+        for start in range(0, len(payments), self.chunk_size):
+            chunk = payments[start:start + self.chunk_size]
+            channel_ids, amounts, v, r, s = [], [], [], [], []
+            for payment in chunk:
+                sig = payment["signature"]
+                if len(sig) != 65:
+                    raise Exception("Length of signature is incorrect: %i instead of 65" % len(sig))
+                channel_ids.append(payment["channel_id"])
+                amounts.append(payment["amount"])
+                v.append(int(sig[-1]) % 27 + 27)
+                r.append(sig[:32])
+                s.append(sig[32:64])
+            self._printout("Claiming %i channels in one transaction: %s" % (len(chunk), " ".join(map(str, channel_ids))))
+            # Same amounts as channelClaim: claim everything signed, nothing is sent back
+            self.transact_contract_command(
+                "MultiPartyEscrow", "multiChannelClaim", [channel_ids, amounts, amounts, [False] * len(chunk), v, r, s])
+            # The claim was confirmed once, the CLI would ask again for every chunk
+            self.args.yes = True
+
+
+def main():
+    argv = sys.argv[1:]
+    chunk_size = DEFAULT_CHUNK_SIZE
+    if "--chunk-size" in argv:
+        i = argv.index("--chunk-size")
+        try:
+            chunk_size = int(argv[i + 1])
+        except (IndexError, ValueError):
+            chunk_size = 0
+        del argv[i:i + 2]
+    if chunk_size <= 0:
+        print("Error: --chunk-size must be a number > 0")
+        return 42
+
+    try:
+        conf = Config()
+        args = arguments.get_root_parser(conf).parse_args(argv)
+        if getattr(args, "cmd", None) is not MPETreasurerCommand:
+            print("Error: only treasurer commands can be batched")
+            return 42
+        BatchClaimTreasurerCommand.chunk_size = chunk_size
+        getattr(BatchClaimTreasurerCommand(conf, args), args.fn)()
+    except Exception as e:
+        if argv and argv[0] == "--print-traceback":
+            raise
+        print("Error:", e)
+        print("If you want to see full Traceback then run:")
+        print("python batch_claim.py --print-traceback [parameters]")
+        return 42
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,159 @@
+import json
+import os
+import re
+import shlex
+import sqlite3
+import sys
+import threading
+import time
+
+# Wall times of finished commands, kept per command family ("account balance", "client call", ...)
+# and network as histograms with fixed bucket bounds. The load screen estimates how long its task
+# will take from them, and comparing a family's p50/p90 before and after upgrading the CLI or
+# switching RPC provider shows whether it got slower.
+#
+# Usage:
+#   python durations.py           p50/p90 of every command family
+#   python durations.py --reset   forget every recorded duration
+
+# Upper bounds of the buckets in seconds, the last bucket takes everything slower
+BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 7.5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 300, 600, 1200)
+
+# Fewer runs than this give no estimate
+MIN_SAMPLES = 3
+
+DATA_DIR = os.environ.get("SNET_TUI_DATA_DIR", os.path.join(os.path.expanduser("~"), ".snet", "tui"))
+DB_PATH = os.path.join(DATA_DIR, "durations.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    family TEXT NOT NULL,
+    network TEXT NOT NULL,
+    counts TEXT NOT NULL,
+    total REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (family, network)
+);
+"""
+
+
+def command_family(command):
+    # "snet account balance --wallet-index 0" -> "account balance", the same for the TUI's scripts
+    # running a CLI command ("python batch_claim.py --chunk-size 50 treasurer claim-all ...")
+    try:
+        words = shlex.split(command)
+    except ValueError:
+        words = command.split()
+    length = 1
+    for i, word in enumerate(words):
+        if word == "snet" or word.endswith(".py"):
+            words, length = words[i + 1:], 2
+            break
+    words = [word for word in words if re.match(r"[a-z]", word)]
+    return " ".join(words[:length]) or "other"
+
+
+def bucket_index(seconds):
+    for i, bound in enumerate(BUCKETS):
+        if seconds <= bound:
+            return i
+    return len(BUCKETS)
+
+
+def percentile(counts, q):
+    # Interpolated within the bucket holding the q-th run
+    rank = q * sum(counts)
+    seen = 0
+    for i, count in enumerate(counts):
+        if count and seen + count >= rank:
+            if i == len(BUCKETS):
+                return BUCKETS[-1]
+            lower = BUCKETS[i - 1] if i > 0 else 0
+            return lower + (BUCKETS[i] - lower) * (rank - seen) / count
+        seen += count
+    return BUCKETS[-1]
+
+
+class DurationHistograms:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = None
+
+    def _connect(self):
+        if self.db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            # Statistics, losing the last few runs on a crash is fine
+            self.db.execute("PRAGMA synchronous = OFF")
+            self.db.executescript(SCHEMA)
+        return self.db
+
+    def _counts(self, db, family, network):
+        row = db.execute("SELECT counts, total FROM durations WHERE family = ? AND network = ?", (family, network)).fetchone()
+        if row is None:
+            return [0] * (len(BUCKETS) + 1), 0.0
+        return json.loads(row[0]), row[1]
+
+    def record(self, family, network, seconds):
+        with self.lock:
+            db = self._connect()
+            with db:
+                counts, total = self._counts(db, family, network)
+                counts[bucket_index(seconds)] += 1
+                db.execute(
+                    "INSERT OR REPLACE INTO durations (family, network, counts, total, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (family, network, json.dumps(counts), total + seconds, time.time())
+                )
+
+    def estimate(self, family, network):
+        # (p50, p90, runs) in seconds, None until there are MIN_SAMPLES runs
+        with self.lock:
+            counts, _ = self._counts(self._connect(), family, network)
+        runs = sum(counts)
+        if runs < MIN_SAMPLES:
+            return None
+        return percentile(counts, 0.5), percentile(counts, 0.9), runs
+
+    def rows(self):
+        # (family, network, runs, mean, p50, p90) of every family
+        with self.lock:
+            rows = self._connect().execute("SELECT family, network, counts, total FROM durations ORDER BY network, family").fetchall()
+        result = []
+        for family, network, counts, total in rows:
+            counts = json.loads(counts)
+            runs = sum(counts)
+            result.append((family, network, runs, total / runs, percentile(counts, 0.5), percentile(counts, 0.9)))
+        return result
+
+    def reset(self):
+        with self.lock:
+            db = self._connect()
+            with db:
+                db.execute("DELETE FROM durations")
+
+
+def format_seconds(seconds):
+    if seconds < 10:
+        return f"{seconds:.1f}s"
+    if seconds < 120:
+        return f"{seconds:.0f}s"
+    return f"{seconds / 60:.0f} minutes"
+
+
+def main():
+    histograms = DurationHistograms()
+    if "--reset" in sys.argv[1:]:
+        histograms.reset()
+        print("Recorded durations reset")
+        return 0
+    rows = histograms.rows()
+    if not rows:
+        print("No durations recorded")
+    for family, network, runs, mean, p50, p90 in rows:
+        print(f"{network:<10} {family:<40} runs {runs:>5}  mean {format_seconds(mean):>10}  p50 {format_seconds(p50):>10}  p90 {format_seconds(p90):>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,576 @@
+import atexit
+import contextlib
+import io
+import json
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import traceback
+
+try:
+    import resource
+except ImportError:
+    # No rusage (Windows), commands are reported without CPU time and memory
+    resource = None
+
+# In-process snet CLI execution engine.
+#
+# Spawning `snet` for every action means a fresh interpreter that re-imports web3, grpc and
+# protobuf each time. Instead, a long-lived worker process imports the snet CLI package once and
+# then dispatches parsed argument vectors straight to its command classes, capturing stdout and
+# stderr per call. The TUI talks to the worker over line-delimited JSON on the worker's stdin/stdout.
+#
+# With --fork the worker becomes a fork server: it still imports the CLI once, but every command
+# runs in a cheap fork() child that inherits the warm imports, keeping each command isolated.
+#
+# This file is both the client (imported by back.backend) and the worker (run as a script).
+
+# Operators that mean the command needs a real shell (pipes, redirects, lists, subshells)
+SHELL_OPERATORS = set("|&;<>()")
+
+
+def command_argv(command):
+    # Returns the argument vector of a plain command line, or None if it needs a real shell
+    # (variables, command substitution, operators)
+    if not isinstance(command, str) or "$" in command or "`" in command:
+        return None
+    try:
+        lexer = shlex.shlex(command, posix=True, punctuation_chars=True)
+        lexer.whitespace_split = True
+        argv = list(lexer)
+    except ValueError:
+        return None
+    if len(argv) == 0 or any(set(token) <= SHELL_OPERATORS for token in argv):
+        return None
+    # Same home directory expansion the shell would have done
+    return [os.path.expanduser(token) if token.startswith("~") else token for token in argv]
+
+
+def snet_argv(command):
+    # Returns the snet argument vector (without the leading "snet") if the command can be
+    # dispatched to the engine, otherwise None so the caller falls back to a subprocess
+    argv = command_argv(command)
+    if argv is None or argv[0] != "snet":
+        return None
+    return argv[1:]
+
+
+# ---------------------------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------------------------
+
+class _Capture(io.TextIOWrapper):
+    # Text stream with a real .buffer, some CLI code paths write bytes directly.
+    # With `emit` set nothing is kept, text is passed on as soon as a line ends or the stream
+    # is flushed (input() flushes its prompt, so "(y/n)" questions come through straight away).
+    def __init__(self, emit=None, name=None):
+        super().__init__(io.BytesIO(), encoding="utf-8", errors="replace", write_through=True)
+        self.emit = emit
+        self.stream_name = name
+        self.pending = ""
+
+    def write(self, text):
+        if self.emit is None:
+            return super().write(text)
+        self.pending += text
+        if "\n" in self.pending:
+            lines, self.pending = self.pending.rsplit("\n", 1)
+            self.emit(self.stream_name, lines + "\n")
+        return len(text)
+
+    def flush(self):
+        super().flush()
+        if self.emit is None:
+            return
+        data = self.buffer.getvalue()
+        if data:
+            self.buffer.seek(0)
+            self.buffer.truncate()
+            self.pending += data.decode("utf-8", errors="replace")
+        if self.pending:
+            text, self.pending = self.pending, ""
+            self.emit(self.stream_name, text)
+
+    def value(self):
+        self.flush()
+        if self.emit is not None:
+            return ""
+        return self.buffer.getvalue().decode("utf-8", errors="replace")
+
+
+class _AnswerInput(io.TextIOBase):
+    # stdin of an interactive request. A read tells the client the command is waiting for input,
+    # then takes the answer from the next {"input": text} message on the protocol pipe.
+    def __init__(self, source, write):
+        self.source = source
+        self.write_message = write
+
+    def readable(self):
+        return True
+
+    def readline(self, size=-1):
+        self.write_message({"waiting": "stdin"})
+        line = self.source.readline()
+        try:
+            return json.loads(line).get("input") or ""
+        except (ValueError, AttributeError):
+            return ""
+
+    def read(self, size=-1):
+        return self.readline()
+
+
+def _load_cli():
+    from snet.cli import arguments
+    from snet.cli.config import Config
+    if os.environ.get("SNET_TUI_TX_PIPELINE", "1") != "0":
+        # Transactions take their nonces from the shared local allocator, see txnonce.py
+        try:
+            import txnonce
+        except ImportError:
+            from back import txnonce
+        txnonce.install()
+    return arguments, Config
+
+
+def execute(argv, input_text=None, workdir=None, cli=None, emit=None, stdin=None):
+    # Runs one snet command in this interpreter, mirroring snet.cli.main(), and returns
+    # (stdout, stderr, return_code). With emit(stream, text) the output is streamed instead
+    # and the returned stdout/stderr are empty. stdin replaces input_text as the command's input.
+    arguments, Config = cli if cli else _load_cli()
+    out, err = _Capture(emit, "stdout"), _Capture(emit, "stderr")
+    saved = sys.stdin, sys.stdout, sys.stderr
+    saved_cwd = os.getcwd()
+    return_code = 0
+
+    if stdin is None:
+        stdin = io.StringIO(input_text or "")
+    sys.stdin, sys.stdout, sys.stderr = stdin, out, err
+    try:
+        if workdir:
+            os.chdir(workdir)
+        try:
+            config = Config()
+            parser = arguments.get_root_parser(config)
+            try:
+                args = parser.parse_args(argv)
+            except TypeError:
+                args = parser.parse_args(argv + ["-h"])
+            getattr(args.cmd(config, args), args.fn)()
+        except SystemExit:
+            raise
+        except Exception as e:
+            if len(argv) > 0 and argv[0] == "--print-traceback":
+                traceback.print_exc()
+                return_code = 1
+            else:
+                print("Error:", e)
+                print("If you want to see full Traceback then run:")
+                print("snet --print-traceback [parameters]")
+                return_code = 42
+    except SystemExit as e:
+        if e.code is None:
+            return_code = 0
+        elif isinstance(e.code, int):
+            return_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            return_code = 1
+    except BaseException:
+        traceback.print_exc()
+        return_code = 1
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved
+        os.chdir(saved_cwd)
+
+    return out.value(), err.value(), return_code
+
+
+def resource_usage(rusage):
+    # {"cpu": user + system seconds, "maxrss": peak resident set in bytes} of a struct_rusage
+    maxrss = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+    return {"cpu": rusage.ru_utime + rusage.ru_stime, "maxrss": maxrss}
+
+
+def _message_writer(stream):
+    def write(message):
+        stream.write(json.dumps(message) + "\n")
+        stream.flush()
+    return write
+
+
+def _run_request(write, request, cli):
+    # Executes one request and writes its messages: streamed chunks (if asked for), then the result
+    emit = None
+    if request.get("stream"):
+        emit = lambda name, text: write({"stream": name, "text": text})
+    stdin = None
+    if request.get("interactive"):
+        # Answers arrive on the protocol pipe (a fork child reads the pipe it inherited)
+        stdin = _AnswerInput(sys.stdin, write)
+    before = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+    stdout, stderr, return_code = execute(request["argv"], request.get("input"), request.get("cwd"), cli, emit, stdin)
+    result = {"stdout": stdout, "stderr": stderr, "code": return_code}
+    if before:
+        # CPU time of this command. The peak memory is the worker's own so far, not the command's,
+        # so it is left out (a fork child's usage is replaced by its wait4() result)
+        after = resource.getrusage(resource.RUSAGE_SELF)
+        cpu = after.ru_utime + after.ru_stime - before.ru_utime - before.ru_stime
+        result["usage"] = {"cpu": cpu, "maxrss": None}
+    write(result)
+
+
+def _fork_execute(write, request, cli):
+    # Runs the command in a fork() child that inherits the warm imports, so nothing the command
+    # does can leak into the server. The child pid is reported first so the client can cancel it,
+    # then everything the child writes is relayed as is.
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        try:
+            with os.fdopen(write_fd, "w", encoding="utf-8") as child_out:
+                _run_request(_message_writer(child_out), request, cli)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    write({"pid": pid})
+    result = None
+    with os.fdopen(read_fd, "r", encoding="utf-8") as child_in:
+        for line in child_in:
+            message = json.loads(line)
+            if "code" in message:
+                # Held back until the child is reaped, to report its exact resource usage
+                result = message
+            else:
+                write(message)
+    if resource:
+        _, _, rusage = os.wait4(pid, 0)
+        usage = resource_usage(rusage)
+    else:
+        os.waitpid(pid, 0)
+        usage = None
+    if result is None:
+        result = {"stdout": "", "stderr": "Process cancelled", "code": -1}
+    elif usage:
+        result["usage"] = usage
+    write(result)
+
+
+def serve(fork=False):
+    # Keep a private handle on the protocol pipe and point fd 1 at stderr, so nothing the CLI
+    # prints outside of sys.stdout can corrupt the protocol
+    proto = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    write = _message_writer(proto)
+
+    try:
+        cli = _load_cli()
+    except Exception as e:
+        write({"ready": False, "error": str(e)})
+        return 1
+    write({"ready": True})
+
+    fork = fork and hasattr(os, "fork")
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        if "argv" not in request:
+            # An answer that arrived after its command was gone
+            continue
+        if fork:
+            _fork_execute(write, request, cli)
+        else:
+            _run_request(write, request, cli)
+    return 0
+
+
+# ---------------------------------------------------------------------------------------------
+# Client side
+# ---------------------------------------------------------------------------------------------
+
+class EngineWorker:
+    def __init__(self, fork=False, recycle_after=0):
+        self.fork = fork
+        self.recycle_after = recycle_after
+        self.commands_run = 0
+        self.process = None
+        self.child_pid = None
+        self.lock = threading.Lock()
+        self.failed = False
+
+    def start(self):
+        # Starts the worker if needed, returns False if the snet CLI cannot be loaded in-process
+        if self.process and self.process.poll() is None:
+            return True
+        if self.failed or getattr(sys, "frozen", False):
+            return False
+        args = [sys.executable, os.path.abspath(__file__)]
+        if self.fork:
+            args.append("--fork")
+        try:
+            self.process = subprocess.Popen(
+                args=args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8"
+            )
+            handshake = json.loads(self.process.stdout.readline() or "{}")
+        except (OSError, ValueError):
+            handshake = {}
+        if not handshake.get("ready"):
+            self.failed = True
+            self.stop()
+            return False
+        self.commands_run = 0
+        return True
+
+    def run(self, argv, input_text=None, workdir=None, on_start=None, on_usage=None):
+        # Returns (stdout, stderr, return_code), or None if the engine is unavailable.
+        # on_start(pid, cancel) is called once the command is running, on_usage(usage) with the
+        # command's resource_usage() when the worker reports it.
+        with self.lock:
+            return self.run_locked(argv, input_text, workdir, on_start, on_usage)
+
+    def run_locked(self, argv, input_text=None, workdir=None, on_start=None, on_usage=None):
+        # Same as run(), for callers already holding self.lock
+        result = None
+        for kind, value in self.messages(argv, input_text, workdir, on_start):
+            if kind == "result":
+                result = value
+            elif kind == "usage" and on_usage:
+                on_usage(value)
+        return result
+
+    def messages(self, argv, input_text=None, workdir=None, on_start=None, stream=False, interactive=False):
+        # Generator over one command's exchange with the worker, for callers holding self.lock.
+        # Yields ("stdout" | "stderr", text) chunks while streaming, ("usage", usage) if the worker
+        # measured the command, then ("result", (stdout, stderr, code)).
+        # An interactive command yields ("input", None) when it waits for input, answer it with send_input().
+        # Yields nothing if the engine is unavailable.
+        if not self.start():
+            return
+        process = self.process
+        result = None
+        usage = None
+        try:
+            request = {"argv": argv, "input": input_text, "cwd": workdir, "stream": stream, "interactive": interactive}
+            process.stdin.write(json.dumps(request) + "\n")
+            process.stdin.flush()
+            if not self.fork and on_start:
+                on_start(process.pid, self.cancel)
+            for line in process.stdout:
+                message = json.loads(line)
+                if "pid" in message:
+                    self.child_pid = message["pid"]
+                    if on_start:
+                        on_start(self.child_pid, self.cancel)
+                elif "stream" in message:
+                    yield message["stream"], message["text"]
+                elif "waiting" in message:
+                    yield "input", None
+                else:
+                    result = message["stdout"], message["stderr"], message["code"]
+                    usage = message.get("usage")
+                    break
+        except (OSError, ValueError):
+            pass
+        except GeneratorExit:
+            # Abandoned mid-command, the rest of its messages would desync the protocol
+            self.stop()
+            raise
+        finally:
+            self.child_pid = None
+        if result is None:
+            # Worker died mid-command (crash or cancellation), it is restarted on the next call
+            self.stop()
+            result = "", "Process cancelled", -1
+        else:
+            self.commands_run += 1
+            if self.recycle_after > 0 and self.commands_run >= self.recycle_after:
+                self.stop()
+        if usage:
+            yield "usage", usage
+        yield "result", result
+
+    def send_input(self, text):
+        # Answers an interactive command waiting for input
+        process = self.process
+        if process:
+            try:
+                process.stdin.write(json.dumps({"input": text}) + "\n")
+                process.stdin.flush()
+            except OSError:
+                pass
+
+    def cancel(self):
+        # In fork mode only the command's child is killed, the warm server survives
+        child_pid = self.child_pid
+        if child_pid:
+            try:
+                os.kill(child_pid, 9)
+                return
+            except OSError:
+                pass
+        self.stop()
+
+    def stop(self):
+        process = self.process
+        self.process = None
+        if process:
+            try:
+                process.kill()
+                process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+
+
+class WorkerPool:
+    # Fixed-size pool of engine workers, a command goes to the first idle one
+    def __init__(self, size=1, fork=False, recycle_after=0):
+        self.workers = [EngineWorker(fork, recycle_after) for _ in range(max(1, size))]
+        self.lock = threading.Lock()
+        # Notified each time a worker's lock is released or a worker is added
+        self.released = threading.Condition(self.lock)
+
+    def _acquire(self):
+        # Waits for an idle worker and returns it with its lock held
+        with self.released:
+            while True:
+                for worker in self.workers:
+                    if worker.lock.acquire(blocking=False):
+                        return worker
+                self.released.wait()
+
+    def _release(self, worker):
+        worker.lock.release()
+        with self.released:
+            self.released.notify()
+
+    def run(self, argv, input_text=None, workdir=None, on_start=None, on_usage=None):
+        worker = self._acquire()
+        try:
+            return worker.run_locked(argv, input_text, workdir, on_start, on_usage)
+        finally:
+            self._release(worker)
+
+    def stream(self, argv, input_text=None, workdir=None, on_start=None, on_stdin=None):
+        # Streaming version of run(), see EngineWorker.messages(). With on_stdin the command is
+        # interactive: on_stdin(send) is called with the function that answers its input requests.
+        worker = self._acquire()
+        if on_stdin:
+            on_stdin(worker.send_input)
+        waiting = False
+        try:
+            for kind, value in worker.messages(argv, input_text, workdir, on_start, stream=True, interactive=on_stdin is not None):
+                if kind == "input" and not waiting:
+                    # The command may wait on the user for a long time, a fresh worker takes its place
+                    # in the pool meanwhile and this one is retired once the command is done
+                    waiting = True
+                    self._replace(worker)
+                yield kind, value
+        finally:
+            worker.lock.release()
+            if waiting:
+                worker.stop()
+            else:
+                with self.released:
+                    self.released.notify()
+
+    def _replace(self, worker):
+        replacement = EngineWorker(worker.fork, worker.recycle_after)
+        with self.released:
+            self.workers[self.workers.index(worker)] = replacement
+            self.released.notify()
+        threading.Thread(target=self._warm, args=(replacement,), daemon=True).start()
+
+    def grow(self, size):
+        # Adds workers until the pool has `size` of them, returns how many were added
+        with self.released:
+            template = self.workers[0]
+            added = [EngineWorker(template.fork, template.recycle_after) for _ in range(size - len(self.workers))]
+            self.workers.extend(added)
+            self.released.notify_all()
+        return len(added)
+
+    def shrink(self, count):
+        # Retires `count` workers, each as soon as one is idle
+        for _ in range(count):
+            worker = self._acquire()
+            with self.lock:
+                self.workers.remove(worker)
+            worker.stop()
+            worker.lock.release()
+
+    def _warm(self, worker):
+        # Commands wait for the worker while it starts, and are woken once it is ready
+        with worker.lock:
+            worker.start()
+        with self.released:
+            self.released.notify()
+
+    def warm_up(self):
+        for worker in self.workers:
+            threading.Thread(target=self._warm, args=(worker,), daemon=True).start()
+
+    def stop(self):
+        for worker in self.workers:
+            worker.stop()
+
+
+pool = None
+
+
+def configure(size=1, fork=False, recycle_after=0):
+    global pool
+    if pool:
+        pool.stop()
+    pool = WorkerPool(size, fork, recycle_after)
+    return pool
+
+
+def run(argv, input_text=None, workdir=None, on_start=None, on_usage=None):
+    if pool is None:
+        configure()
+    return pool.run(argv, input_text, workdir, on_start, on_usage)
+
+
+def stream(argv, input_text=None, workdir=None, on_start=None, on_stdin=None):
+    if pool is None:
+        configure()
+    return pool.stream(argv, input_text, workdir, on_start, on_stdin)
+
+
+@contextlib.contextmanager
+def burst(size):
+    # Runs the block with at least `size` workers for parallel commands, the extra ones are
+    # retired in the background afterwards
+    if pool is None:
+        configure()
+    current = pool
+    added = current.grow(size)
+    try:
+        yield
+    finally:
+        if added > 0:
+            threading.Thread(target=current.shrink, args=(added,), daemon=True).start()
+
+
+def warm_up():
+    # Import the CLI in the background so the first command does not pay for it
+    if pool is None:
+        configure()
+    pool.warm_up()
+
+
+atexit.register(lambda: pool and pool.stop())
+
+
+if __name__ == "__main__":
+    sys.exit(serve(fork="--fork" in sys.argv[1:]))
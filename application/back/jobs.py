@@ -0,0 +1,180 @@
+import contextlib
+import contextvars
+import itertools
+import re
+import threading
+import time
+
+# Registry of running and finished commands. Every command started through the backend gets a
+# job ID, so several commands can run at the same time and each one can still be listed, waited
+# on or cancelled on its own.
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Finished jobs kept around for listing
+HISTORY_SIZE = 100
+
+# Values of these options are secrets, they are replaced in the command kept by the job (it is
+# listed on the Jobs page). A value runs until the next option, a mnemonic may be several words.
+SECRET_OPTIONS_RE = re.compile(r"(--(?:private-key|mnemonic)(?:=|\s+))(?:'[^']*'|\"[^\"]*\"|.+?)(?=\s+--|\s*$)")
+
+
+def redact(command):
+    return SECRET_OPTIONS_RE.sub(r"\1***", command)
+
+
+# Per thread / per asyncio task, so concurrent workers never see each other's owner
+_owner = contextvars.ContextVar("job_owner", default=None)
+
+
+@contextlib.contextmanager
+def owner_scope(owner):
+    # Tags every job started inside the block (by this thread or task) with `owner`
+    token = _owner.set(owner)
+    try:
+        yield
+    finally:
+        _owner.reset(token)
+
+
+def current_owner():
+    return _owner.get()
+
+
+class Job:
+    def __init__(self, job_id, command, owner=None):
+        self.id = job_id
+        self.command = redact(command)
+        self.owner = owner
+        self.pid = None
+        self.state = RUNNING
+        self.return_code = None
+        self.output = None
+        # Free-form progress shown next to the state, e.g. a transaction's nonce
+        self.status = None
+        self.start_time = time.time()
+        self.end_time = None
+        # False when the wall time is not the command's own, e.g. it waited on the user
+        self.timed = True
+        self.cancel_func = None
+        self.finished = threading.Event()
+        # Measurements (see back/metrics.py), None when the way the command ran cannot tell:
+        # seconds until it had a process and until its first output, the size of its output, and
+        # the child's CPU seconds and peak memory in bytes
+        self.spawn_latency = None
+        self.first_output_latency = None
+        self.output_bytes = 0
+        self.cpu_time = None
+        self.max_rss = None
+
+    def elapsed(self):
+        end = self.end_time if self.end_time else time.time()
+        return end - self.start_time
+
+    def saw_output(self, text):
+        # Called with every chunk of output of a streamed command
+        if self.first_output_latency is None:
+            self.first_output_latency = time.time() - self.start_time
+        self.output_bytes += len(text.encode("utf-8", "replace"))
+
+    def set_usage(self, usage):
+        # usage is engine.resource_usage(), or None
+        if usage:
+            self.cpu_time, self.max_rss = usage["cpu"], usage["maxrss"]
+
+    def __repr__(self):
+        return f"Job({self.id}, {self.state}, pid={self.pid}, {self.command!r})"
+
+
+class JobRegistry:
+    def __init__(self):
+        self.jobs = {}
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.finish_listeners = []
+
+    def add_finish_listener(self, listener):
+        # listener(job) is called on the finishing thread once a job ends
+        self.finish_listeners.append(listener)
+
+    def start(self, command):
+        with self.lock:
+            job = Job(next(self.ids), command, _owner.get())
+            self.jobs[job.id] = job
+            self._prune()
+        return job
+
+    def attach(self, job, pid, cancel_func):
+        # Called once the job has a process behind it. If the job was cancelled before that,
+        # the process is stopped straight away.
+        with self.lock:
+            job.pid = pid
+            job.cancel_func = cancel_func
+            if pid is not None and job.spawn_latency is None:
+                job.spawn_latency = time.time() - job.start_time
+            cancelled = job.state == CANCELLED
+        if cancelled:
+            cancel_func()
+
+    def finish(self, job, return_code, cancelled=False):
+        with self.lock:
+            job.return_code = return_code
+            job.end_time = time.time()
+            if job.output_bytes == 0 and job.output:
+                job.output_bytes = len(job.output.encode("utf-8", "replace"))
+            if cancelled:
+                job.state = CANCELLED
+            elif job.state == RUNNING:
+                job.state = DONE if return_code == 0 else FAILED
+            job.cancel_func = None
+        job.finished.set()
+        for listener in list(self.finish_listeners):
+            try:
+                listener(job)
+            except Exception:
+                pass
+
+    def cancel(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None or job.state != RUNNING:
+                return False
+            job.state = CANCELLED
+            cancel_func = job.cancel_func
+        if cancel_func:
+            cancel_func()
+        return True
+
+    def cancel_owner(self, owner):
+        cancelled = [job.id for job in self.list(state=RUNNING, owner=owner) if self.cancel(job.id)]
+        return cancelled
+
+    def wait(self, job_id, timeout=None):
+        job = self.get(job_id)
+        if job:
+            job.finished.wait(timeout)
+        return job
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def list(self, state=None, owner=None):
+        with self.lock:
+            jobs = list(self.jobs.values())
+        if state:
+            jobs = [job for job in jobs if job.state == state]
+        if owner is not None:
+            jobs = [job for job in jobs if job.owner is owner]
+        return jobs
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self.jobs.items() if job.state != RUNNING]
+        for job_id in finished[:max(0, len(finished) - HISTORY_SIZE)]:
+            del self.jobs[job_id]
+
+
+registry = JobRegistry()
@@ -0,0 +1,161 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import threading
+import back.durations as durations
+
+# Measurements of every finished command (see jobs.Job): wall time, time until it had a process
+# and until its first output, exit code, output size, and the child's CPU time and peak memory.
+# Each command is appended as one JSON line to a rotating file, and the totals of the session are
+# kept in a Prometheus textfile-collector file. Every session writes its own .prom file, so
+# node_exporter can scrape all sessions on a shared host when SNET_TUI_METRICS_DIR is its
+# --collector.textfile.directory.
+#
+# Commands are identified by their family ("account balance"), never by the command line, which
+# can hold keys and other secrets.
+#
+# Environment:
+#   SNET_TUI_METRICS      set to 1 to turn the export on (it is off by default)
+#   SNET_TUI_METRICS_DIR  directory of commands.jsonl and the .prom files (default ~/.snet/tui/metrics)
+
+ENABLED = os.environ.get("SNET_TUI_METRICS", "0") == "1"
+METRICS_DIR = os.environ.get("SNET_TUI_METRICS_DIR", os.path.join(durations.DATA_DIR, "metrics"))
+
+JSONL_MAX_BYTES = 5 * 1024 * 1024
+JSONL_BACKUPS = 3
+
+PROM_PREFIX = "snet_tui"
+
+
+def _label_value(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(labels):
+    return "{" + ",".join(f'{name}="{_label_value(value)}"' for name, value in labels) + "}"
+
+
+class CommandMetrics:
+    def __init__(self, directory=METRICS_DIR, session=None):
+        self.directory = directory
+        self.session = session or str(os.getpid())
+        self.prom_path = os.path.join(directory, f"{PROM_PREFIX}_{self.session}.prom")
+        self.lock = threading.Lock()
+        self.log = None
+        # (family, network, state) -> totals
+        self.totals = {}
+
+    def _logger(self):
+        if self.log is None:
+            os.makedirs(self.directory, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(
+                os.path.join(self.directory, "commands.jsonl"), maxBytes=JSONL_MAX_BYTES, backupCount=JSONL_BACKUPS, encoding="utf-8"
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self.log = logging.getLogger(f"snet_tui.metrics.{self.session}")
+            self.log.propagate = False
+            self.log.setLevel(logging.INFO)
+            self.log.addHandler(handler)
+        return self.log
+
+    def record(self, job, network):
+        family = durations.command_family(job.command)
+        entry = {
+            "time": job.end_time,
+            "session": self.session,
+            "job": job.id,
+            "family": family,
+            "network": network,
+            "state": job.state,
+            "exit_code": job.return_code,
+            "wall_seconds": job.elapsed(),
+            "spawn_seconds": job.spawn_latency,
+            "first_output_seconds": job.first_output_latency,
+            "output_bytes": job.output_bytes,
+            "cpu_seconds": job.cpu_time,
+            "max_rss_bytes": job.max_rss,
+            "waited_on_user": not job.timed
+        }
+        with self.lock:
+            self._add(entry)
+            try:
+                self._logger().info(json.dumps(entry))
+                self._write_prom()
+            except OSError:
+                pass
+        return entry
+
+    def _add(self, entry):
+        key = (entry["family"], entry["network"], entry["state"])
+        totals = self.totals.get(key)
+        if totals is None:
+            totals = self.totals[key] = {
+                "count": 0, "buckets": [0] * (len(durations.BUCKETS) + 1), "wall": 0.0,
+                "spawn": [0, 0.0], "first_output": [0, 0.0], "output_bytes": 0, "cpu": 0.0, "max_rss": 0
+            }
+        totals["count"] += 1
+        totals["buckets"][durations.bucket_index(entry["wall_seconds"])] += 1
+        totals["wall"] += entry["wall_seconds"]
+        for name in ("spawn", "first_output"):
+            if entry[f"{name}_seconds"] is not None:
+                totals[name][0] += 1
+                totals[name][1] += entry[f"{name}_seconds"]
+        totals["output_bytes"] += entry["output_bytes"]
+        totals["cpu"] += entry["cpu_seconds"] or 0
+        totals["max_rss"] = max(totals["max_rss"], entry["max_rss_bytes"] or 0)
+
+    def prom_text(self):
+        metrics = {
+            "commands_total": ("counter", "Commands finished, by command family, network and state.", []),
+            "command_duration_seconds": ("histogram", "Wall time of the commands.", []),
+            "command_spawn_seconds": ("summary", "Time until the command had a process.", []),
+            "command_first_output_seconds": ("summary", "Time until the command's first output, streamed commands only.", []),
+            "command_output_bytes_total": ("counter", "Output of the commands.", []),
+            "command_cpu_seconds_total": ("counter", "User and system CPU time of the commands.", []),
+            "command_max_rss_bytes": ("gauge", "Largest peak resident memory of a command.", [])
+        }
+        for (family, network, state), totals in sorted(self.totals.items()):
+            labels = [("session", self.session), ("family", family), ("network", network), ("state", state)]
+            metrics["commands_total"][2].append(("", labels, totals["count"]))
+            cumulative = 0
+            for bound, count in zip(list(durations.BUCKETS) + ["+Inf"], totals["buckets"]):
+                cumulative += count
+                metrics["command_duration_seconds"][2].append(("_bucket", labels + [("le", bound)], cumulative))
+            metrics["command_duration_seconds"][2].append(("_sum", labels, totals["wall"]))
+            metrics["command_duration_seconds"][2].append(("_count", labels, totals["count"]))
+            for name in ("spawn", "first_output"):
+                count, total = totals[name]
+                metrics[f"command_{name}_seconds"][2].append(("_sum", labels, total))
+                metrics[f"command_{name}_seconds"][2].append(("_count", labels, count))
+            metrics["command_output_bytes_total"][2].append(("", labels, totals["output_bytes"]))
+            metrics["command_cpu_seconds_total"][2].append(("", labels, totals["cpu"]))
+            metrics["command_max_rss_bytes"][2].append(("", labels, totals["max_rss"]))
+
+        lines = []
+        for name, (kind, help_text, samples) in metrics.items():
+            lines.append(f"# HELP {PROM_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {PROM_PREFIX}_{name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{PROM_PREFIX}_{name}{suffix}{_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def _write_prom(self):
+        # The collector may read at any time, so the file is replaced in one go
+        tmp_path = f"{self.prom_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prom_text())
+        os.replace(tmp_path, self.prom_path)
+
+    def remove_prom(self):
+        # A finished session's totals would otherwise be scraped forever
+        try:
+            os.remove(self.prom_path)
+        except OSError:
+            pass
+
+
+command_metrics = CommandMetrics()
+if ENABLED:
+    atexit.register(command_metrics.remove_prom)
@@ -0,0 +1,286 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, keccak, to_checksum_address
+import back.registry as registry
+
+# Local index of MultiPartyEscrow channel events, kept in SQLite with a checkpoint (last indexed
+# block) per chain and MPE address.
+#
+# Without --from-block the `snet channel print-all-filter-*` commands scan the MPE events from the
+# start of the chain on every call. With the index the first use scans once from the contract's
+# deployment block, after that only the blocks since the checkpoint are fetched and the filters
+# are answered from the local tables.
+#
+# Only blocks CONFIRMATIONS deep are stored, so a reorg never leaves stale events behind; the few
+# newer blocks are scanned again on every lookup.
+#
+# Usage (from the application directory):
+#   python -m back.mpe_index RPC_URL [MPE_ADDRESS]
+
+# Blocks per eth_getLogs request, halved when the node refuses a range as too large
+LOG_BLOCK_RANGE = 5000
+CONFIRMATIONS = 12
+
+CHANNELS = function_signature_to_4byte_selector("channels(uint256)")
+# nonce, sender, signer, recipient, groupId, value, expiration
+CHANNEL_TYPES = ["uint256", "address", "address", "address", "bytes32", "uint256", "uint256"]
+
+# topic0 -> (name, types of the indexed arguments, names and types of the data arguments)
+EVENTS = {
+    "0x" + keccak(text=signature).hex(): (name, indexed, data)
+    for signature, name, indexed, data in [
+        (
+            "ChannelOpen(uint256,uint256,address,address,address,bytes32,uint256,uint256)", "ChannelOpen",
+            [("sender", "address"), ("recipient", "address"), ("group_id", "bytes32")],
+            [("channel_id", "uint256"), ("nonce", "uint256"), ("signer", "address"), ("amount", "uint256"), ("expiration", "uint256")]
+        ),
+        (
+            "ChannelClaim(uint256,uint256,address,uint256,uint256,uint256,uint256)", "ChannelClaim",
+            [("channel_id", "uint256"), ("recipient", "address")],
+            [("nonce", "uint256"), ("claim_amount", "uint256"), ("planned_amount", "uint256"), ("send_back_amount", "uint256"), ("keep_amount", "uint256")]
+        ),
+        (
+            "ChannelSenderClaim(uint256,uint256,uint256)", "ChannelSenderClaim",
+            [("channel_id", "uint256")],
+            [("nonce", "uint256"), ("claim_amount", "uint256")]
+        ),
+        (
+            "ChannelExtend(uint256,uint256)", "ChannelExtend",
+            [("channel_id", "uint256")],
+            [("new_expiration", "uint256")]
+        ),
+        (
+            "ChannelAddFunds(uint256,uint256)", "ChannelAddFunds",
+            [("channel_id", "uint256")],
+            [("additional_funds", "uint256")]
+        )
+    ]
+}
+CHANNEL_OPEN = next(topic for topic, (name, _, _) in EVENTS.items() if name == "ChannelOpen")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    chain_id INTEGER NOT NULL,
+    mpe TEXT NOT NULL,
+    last_block INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, mpe)
+);
+CREATE TABLE IF NOT EXISTS channels (
+    chain_id INTEGER NOT NULL,
+    mpe TEXT NOT NULL,
+    channel_id INTEGER NOT NULL,
+    sender TEXT NOT NULL,
+    signer TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    group_id TEXT NOT NULL,
+    opened_block INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, mpe, channel_id)
+);
+CREATE INDEX IF NOT EXISTS channels_sender ON channels (chain_id, mpe, sender);
+CREATE INDEX IF NOT EXISTS channels_recipient ON channels (chain_id, mpe, recipient);
+CREATE INDEX IF NOT EXISTS channels_group ON channels (chain_id, mpe, group_id);
+CREATE TABLE IF NOT EXISTS events (
+    chain_id INTEGER NOT NULL,
+    mpe TEXT NOT NULL,
+    block INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    args TEXT NOT NULL,
+    PRIMARY KEY (chain_id, mpe, block, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_channel ON events (chain_id, mpe, channel_id);
+"""
+
+
+def decode_log(log):
+    # Returns (name, args, block, log_index), args with addresses lowercased and group IDs as hex.
+    # None for events that are not channel events.
+    topics = log.get("topics", [])
+    if not topics or topics[0] not in EVENTS:
+        return None
+    name, indexed, data = EVENTS[topics[0]]
+    args = {}
+    for (arg, arg_type), topic in zip(indexed, topics[1:]):
+        args[arg] = decode([arg_type], bytes.fromhex(topic[2:]))[0]
+    for (arg, _), value in zip(data, decode([arg_type for _, arg_type in data], bytes.fromhex(log["data"][2:]))):
+        args[arg] = value
+    for arg, value in args.items():
+        if isinstance(value, bytes):
+            args[arg] = "0x" + value.hex()
+        elif isinstance(value, str):
+            args[arg] = value.lower()
+    return name, args, int(log["blockNumber"], 16), int(log["logIndex"], 16)
+
+
+class ChannelIndex:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = None
+
+    def _connect(self):
+        if self.db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            self.db.executescript(SCHEMA)
+        return self.db
+
+    def checkpoint(self, chain_id, mpe):
+        with self.lock:
+            row = self._connect().execute("SELECT last_block FROM checkpoints WHERE chain_id = ? AND mpe = ?", (chain_id, mpe)).fetchone()
+        return row[0] if row else None
+
+    def store(self, chain_id, mpe, events, last_block):
+        # Saves decoded events and moves the checkpoint in one transaction, an interrupted scan
+        # resumes from the previous checkpoint
+        with self.lock:
+            db = self._connect()
+            with db:
+                for name, args, block, log_index in events:
+                    if name == "ChannelOpen":
+                        db.execute(
+                            "INSERT OR REPLACE INTO channels VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            (chain_id, mpe, args["channel_id"], args["sender"], args["signer"], args["recipient"], args["group_id"], block)
+                        )
+                    db.execute(
+                        "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (chain_id, mpe, block, log_index, args["channel_id"], name, json.dumps({arg: str(value) for arg, value in args.items()}))
+                    )
+                db.execute("INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)", (chain_id, mpe, last_block))
+
+    def channels(self, chain_id, mpe, sender=None, recipient=None, group_id=None):
+        # {channel_id: opened_block} of the indexed channels matching every filter given
+        query = "SELECT channel_id, opened_block FROM channels WHERE chain_id = ? AND mpe = ?"
+        params = [chain_id, mpe]
+        for column, value in (("sender", sender), ("recipient", recipient), ("group_id", group_id)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value.lower())
+        with self.lock:
+            return dict(self._connect().execute(query, params).fetchall())
+
+    def events(self, chain_id, mpe, channel_id):
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT name, args, block FROM events WHERE chain_id = ? AND mpe = ? AND channel_id = ? ORDER BY block, log_index",
+                (chain_id, mpe, channel_id)
+            ).fetchall()
+        return [(name, json.loads(args), block) for name, args, block in rows]
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
+
+
+class ChannelLookup(registry.RpcClient):
+    # Answers channel filters for one MPE contract from the index, catching it up first
+    def __init__(self, index, rpc_url, mpe_address=None, batch_size=registry.BATCH_SIZE):
+        super().__init__(rpc_url, batch_size)
+        self.index = index
+        self.mpe_address = mpe_address
+        self.start_block = 0
+        self.chain = None
+
+    def _contract(self):
+        if self.chain is None:
+            self.chain = self.chain_id()
+            if self.mpe_address is None:
+                network = registry.contract_network("MultiPartyEscrow", self.chain)
+                self.mpe_address = network["address"]
+                # Nothing happened on the contract before it was deployed
+                receipt = self._rpc("eth_getTransactionReceipt", [network["transactionHash"]])
+                if receipt:
+                    self.start_block = int(receipt["blockNumber"], 16)
+            self.mpe_address = self.mpe_address.lower()
+        return self.chain, self.mpe_address
+
+    def logs(self, from_block, to_block, topics=None):
+        # Decoded channel events between two blocks (inclusive), LOG_BLOCK_RANGE blocks per request
+        chain, mpe = self._contract()
+        events = []
+        step = LOG_BLOCK_RANGE
+        start = from_block
+        while start <= to_block:
+            end = min(start + step - 1, to_block)
+            try:
+                logs = self._rpc("eth_getLogs", [{
+                    "address": mpe,
+                    "fromBlock": hex(start),
+                    "toBlock": hex(end),
+                    "topics": topics or [list(EVENTS)]
+                }])
+            except registry.RegistryError:
+                if step == 1:
+                    raise
+                step = max(1, step // 2)
+                continue
+            events.extend(event for event in map(decode_log, logs) if event is not None)
+            start = end + 1
+        return events
+
+    def catch_up(self):
+        # Indexes every confirmed block since the checkpoint, returns the latest block number
+        chain, mpe = self._contract()
+        latest = self.block_number()
+        confirmed = latest - CONFIRMATIONS
+        checkpoint = self.index.checkpoint(chain, mpe)
+        start = self.start_block if checkpoint is None else checkpoint + 1
+        while start <= confirmed:
+            end = min(start + LOG_BLOCK_RANGE * 10 - 1, confirmed)
+            self.index.store(chain, mpe, self.logs(start, end), end)
+            start = end + 1
+        return latest
+
+    def find(self, sender=None, recipient=None, group_id=None):
+        # Returns ({channel_id: opened_block}, latest block) of the channels matching the filters,
+        # including ones opened in blocks too recent to be indexed
+        chain, mpe = self._contract()
+        latest = self.catch_up()
+        channels = self.index.channels(chain, mpe, sender, recipient, group_id)
+        checkpoint = self.index.checkpoint(chain, mpe)
+        tail_start = self.start_block if checkpoint is None else checkpoint + 1
+        for name, args, block, _ in self.logs(tail_start, latest, [CHANNEL_OPEN]):
+            if all(value is None or args[arg] == value.lower() for arg, value in (("sender", sender), ("recipient", recipient), ("group_id", group_id))):
+                channels[args["channel_id"]] = block
+        return channels, latest
+
+    def states(self, channel_ids, block="latest"):
+        # Current on-chain state of each channel, read with batched eth_calls
+        chain, mpe = self._contract()
+        channel_ids = list(channel_ids)
+        results = self.eth_call_batch(mpe, [CHANNELS + encode(["uint256"], [channel_id]) for channel_id in channel_ids], block)
+        states = {}
+        for channel_id, data in zip(channel_ids, results):
+            nonce, sender, signer, recipient, group_id, value, expiration = decode(CHANNEL_TYPES, data)
+            states[channel_id] = {
+                "nonce": nonce,
+                "sender": to_checksum_address(sender),
+                "signer": to_checksum_address(signer),
+                "recipient": to_checksum_address(recipient),
+                "group_id": group_id,
+                "value": value,
+                "expiration": expiration
+            }
+        return states
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python -m back.mpe_index RPC_URL [MPE_ADDRESS]")
+        return 1
+    data_dir = os.environ.get("SNET_TUI_DATA_DIR", os.path.join(os.path.expanduser("~"), ".snet", "tui"))
+    lookup = ChannelLookup(ChannelIndex(os.path.join(data_dir, "channels.db")), sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    channels, latest = lookup.find()
+    print(f"{len(channels)} channels indexed up to block {latest} for {lookup.mpe_address}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
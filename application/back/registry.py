@@ -0,0 +1,181 @@
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+import sys
+import urllib.request
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
+
+# Reads the SingularityNET Registry contract straight from an Ethereum node over JSON-RPC.
+#
+# Instead of one `snet organization list-services` process per organization, the view functions
+# are called with eth_call and the calls are sent as JSON-RPC batches: listing the whole
+# marketplace takes two round trips plus one per BATCH_SIZE organizations. Every call of one
+# listing is made against the same block, so the result is consistent.
+#
+# Usage (for example against a local anvil chain with the Registry deployed):
+#   python application/back/registry.py RPC_URL [REGISTRY_ADDRESS]
+
+# eth_calls per JSON-RPC batch request
+BATCH_SIZE = 100
+RPC_TIMEOUT = 30
+
+LIST_ORGANIZATIONS = function_signature_to_4byte_selector("listOrganizations()")
+GET_ORGANIZATION = function_signature_to_4byte_selector("getOrganizationById(bytes32)")
+# found, id, orgMetadataURI, owner, members, serviceIds
+ORGANIZATION_TYPES = ["bool", "bytes32", "bytes", "address", "address[]", "bytes32[]"]
+
+
+class RegistryError(Exception):
+    pass
+
+
+def bytes32_to_str(value):
+    return value.rstrip(b"\0").decode("utf-8", errors="replace")
+
+
+def contract_network(name, chain_id):
+    # The snet CLI's deployment record ({"address", "transactionHash", ...}) of contract `name` on
+    # this chain. Newer CLIs ship the networks files in snet.contracts, older ones in snet.cli.
+    for package, parts in (("snet.contracts", ("resources", "networks")), ("snet.cli", ("resources", "contracts", "networks"))):
+        try:
+            spec = importlib.util.find_spec(package)
+        except ImportError:
+            spec = None
+        if spec is None or spec.origin is None:
+            continue
+        path = os.path.join(os.path.dirname(spec.origin), *parts, f"{name}.json")
+        try:
+            with open(path) as f:
+                return json.load(f)[str(chain_id)]
+        except (OSError, ValueError, KeyError):
+            continue
+    raise RegistryError(f"No default {name} address for chain {chain_id}")
+
+
+def default_registry_address(chain_id):
+    # Address the snet CLI itself uses for this chain
+    return contract_network("Registry", chain_id)["address"]
+
+
+class RpcClient:
+    # Minimal JSON-RPC client, eth_calls are sent BATCH_SIZE per request
+    def __init__(self, rpc_url, batch_size=BATCH_SIZE):
+        self.rpc_url = rpc_url
+        self.batch_size = batch_size
+        self.ids = itertools.count(1)
+
+    def _post(self, payload):
+        request = urllib.request.Request(
+            self.rpc_url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=RPC_TIMEOUT) as response:
+                return json.loads(response.read())
+        except (OSError, ValueError) as e:
+            raise RegistryError(f"RPC request to {self.rpc_url} failed: {e}")
+
+    def _rpc(self, method, params):
+        response = self._post({"jsonrpc": "2.0", "id": next(self.ids), "method": method, "params": params})
+        if not isinstance(response, dict) or "result" not in response:
+            raise RegistryError(f"{method} failed: {response}")
+        return response["result"]
+
+    def chain_id(self):
+        return int(self._rpc("eth_chainId", []), 16)
+
+    def block_number(self):
+        return int(self._rpc("eth_blockNumber", []), 16)
+
+    def eth_call_batch(self, address, calls, block="latest"):
+        # eth_call every calldata in `calls` on `address`, BATCH_SIZE per request,
+        # returns the raw results in the same order
+        if isinstance(block, int):
+            block = hex(block)
+        results = []
+        for start in range(0, len(calls), self.batch_size):
+            payload = [
+                {"jsonrpc": "2.0", "id": next(self.ids), "method": "eth_call", "params": [{"to": address, "data": "0x" + data.hex()}, block]}
+                for data in calls[start:start + self.batch_size]
+            ]
+            responses = self._post(payload)
+            if not isinstance(responses, list):
+                # Nodes without batch support answer with a single error object
+                raise RegistryError(f"Batch request failed: {responses}")
+            by_id = {response.get("id"): response for response in responses}
+            for request in payload:
+                response = by_id.get(request["id"])
+                if response is None or "result" not in response:
+                    raise RegistryError(f"eth_call failed: {response}")
+                results.append(bytes.fromhex(response["result"][2:]))
+        return results
+
+    def receipts(self, tx_hashes):
+        # {tx_hash: receipt, or None while the transaction is pending}, BATCH_SIZE hashes per request
+        tx_hashes = list(tx_hashes)
+        receipts = {}
+        for start in range(0, len(tx_hashes), self.batch_size):
+            chunk = tx_hashes[start:start + self.batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "id": next(self.ids), "method": "eth_getTransactionReceipt", "params": [tx_hash]}
+                for tx_hash in chunk
+            ]
+            responses = self._post(payload)
+            if not isinstance(responses, list):
+                raise RegistryError(f"Batch request failed: {responses}")
+            by_id = {response.get("id"): response for response in responses}
+            for tx_hash, request in zip(chunk, payload):
+                response = by_id.get(request["id"])
+                if response is None or "result" not in response:
+                    raise RegistryError(f"eth_getTransactionReceipt failed: {response}")
+                receipt = response["result"]
+                receipts[tx_hash] = receipt if receipt and receipt.get("blockHash") else None
+        return receipts
+
+
+class RegistryReader(RpcClient):
+    def __init__(self, rpc_url, registry_address=None, batch_size=BATCH_SIZE):
+        super().__init__(rpc_url, batch_size)
+        self.registry_address = registry_address
+
+    def _address(self):
+        if self.registry_address is None:
+            self.registry_address = default_registry_address(self.chain_id())
+        return self.registry_address
+
+    def call_batch(self, calls, block="latest"):
+        return self.eth_call_batch(self._address(), calls, block)
+
+    def organizations(self):
+        # Returns {org_id: (fingerprint, service_ids)} in registry order. The fingerprint is a hash of
+        # the organization's whole registry entry, it changes whenever its metadata, owner, members
+        # or services do.
+        block = self._rpc("eth_blockNumber", [])
+        raw_ids = decode(["bytes32[]"], self.call_batch([LIST_ORGANIZATIONS], block)[0])[0]
+        entries = self.call_batch([GET_ORGANIZATION + encode(["bytes32"], [raw_id]) for raw_id in raw_ids], block)
+
+        organizations = {}
+        for raw_id, data in zip(raw_ids, entries):
+            found, _, metadata_uri, owner, members, service_ids = decode(ORGANIZATION_TYPES, data)
+            if found:
+                fingerprint = hashlib.sha1(data).hexdigest()
+                organizations[bytes32_to_str(raw_id)] = (fingerprint, [bytes32_to_str(service_id) for service_id in service_ids])
+        return organizations
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python registry.py RPC_URL [REGISTRY_ADDRESS]")
+        return 1
+    reader = RegistryReader(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    for org_id, (fingerprint, service_ids) in reader.organizations().items():
+        print(f"{org_id} ({fingerprint[:12]}): {', '.join(service_ids) if service_ids else 'no services'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
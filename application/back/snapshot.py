@@ -0,0 +1,102 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# On-disk snapshot of the marketplace (organization -> services), one per network and Registry
+# address. The View All page opens straight from it, and a refresh only re-fetches organizations
+# that are new, changed or failed last time.
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    network TEXT NOT NULL,
+    registry TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    PRIMARY KEY (network, registry)
+);
+CREATE TABLE IF NOT EXISTS organizations (
+    network TEXT NOT NULL,
+    registry TEXT NOT NULL,
+    org_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    fingerprint TEXT,
+    services TEXT,
+    error TEXT,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (network, registry, org_id)
+);
+"""
+
+
+class MarketplaceSnapshot:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = None
+
+    def _connect(self):
+        if self.db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            self.db.executescript(SCHEMA)
+        return self.db
+
+    def load(self, network, registry):
+        # Returns (data, refreshed_at) with data in listing order, or (None, None) if there is no snapshot.
+        # An organization's value is its list of services, or the error string from fetching them.
+        with self.lock:
+            db = self._connect()
+            row = db.execute("SELECT refreshed_at FROM snapshots WHERE network = ? AND registry = ?", (network, registry)).fetchone()
+            if row is None:
+                return None, None
+            rows = db.execute(
+                "SELECT org_id, services, error FROM organizations WHERE network = ? AND registry = ? ORDER BY position",
+                (network, registry)
+            ).fetchall()
+        data = {org_id: error if error is not None else json.loads(services) for org_id, services, error in rows}
+        return data, row[0]
+
+    def entries(self, network, registry):
+        # {org_id: (fingerprint, fetched_at, failed)}, what a refresh compares the registry against
+        with self.lock:
+            rows = self._connect().execute(
+                "SELECT org_id, fingerprint, fetched_at, error IS NOT NULL FROM organizations WHERE network = ? AND registry = ?",
+                (network, registry)
+            ).fetchall()
+        return {org_id: (fingerprint, fetched_at, bool(failed)) for org_id, fingerprint, fetched_at, failed in rows}
+
+    def update(self, network, registry, listing, fetched):
+        # listing is {org_id: fingerprint} in registry order, fetched has the new services (or error
+        # string) of the organizations that were fetched again. Organizations no longer listed are dropped.
+        now = time.time()
+        with self.lock:
+            db = self._connect()
+            with db:
+                known = {row[0] for row in db.execute(
+                    "SELECT org_id FROM organizations WHERE network = ? AND registry = ?", (network, registry)
+                )}
+                db.executemany(
+                    "DELETE FROM organizations WHERE network = ? AND registry = ? AND org_id = ?",
+                    [(network, registry, org_id) for org_id in known - set(listing)]
+                )
+                for position, (org_id, fingerprint) in enumerate(listing.items()):
+                    if org_id in fetched:
+                        entry = fetched[org_id]
+                        services, error = (None, entry) if isinstance(entry, str) else (json.dumps(entry), None)
+                        db.execute(
+                            "INSERT OR REPLACE INTO organizations VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            (network, registry, org_id, position, fingerprint, services, error, now)
+                        )
+                    elif org_id in known:
+                        db.execute(
+                            "UPDATE organizations SET position = ? WHERE network = ? AND registry = ? AND org_id = ?",
+                            (position, network, registry, org_id)
+                        )
+                db.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)", (network, registry, now))
+
+    def close(self):
+        with self.lock:
+            if self.db is not None:
+                self.db.close()
+                self.db = None
@@ -0,0 +1,168 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # No cross-process lock (Windows), commands in one worker still share the allocator
+    fcntl = None
+
+# Local nonce management for the snet CLI's transactions, installed into the engine workers.
+#
+# The CLI takes the account's confirmed transaction count as the nonce and then waits for the
+# receipt, so a second command started before the first one is mined gets the same nonce and is
+# rejected. Here every transaction gets its nonce from one allocator shared by all worker
+# processes (a locked JSON file), so several commands can have transactions in flight at once.
+#
+# A nonce whose transaction never reached the node is given back and reused by the next
+# transaction. If a process died holding one, the gap is closed after STALE_AFTER seconds by
+# starting again from the node's pending count.
+#
+# The hash of every broadcast transaction is printed as well, so the TUI can follow the receipt
+# on its own instead of waiting for the command.
+#
+# Usage:
+#   python txnonce.py           show the allocator state
+#   python txnonce.py --reset   forget every allocated nonce
+
+STALE_AFTER = 60
+
+DATA_DIR = os.environ.get("SNET_TUI_DATA_DIR", os.path.join(os.path.expanduser("~"), ".snet", "tui"))
+STATE_PATH = os.path.join(DATA_DIR, "nonces.json")
+
+# Printed to the command's error stream when a transaction is handed its nonce, the TUI reads it
+# to show the transaction's status
+NONCE_MARKER = "Transaction nonce:"
+TX_HASH_MARKER = "Transaction hash:"
+
+
+class NonceAllocator:
+    def __init__(self, path=STATE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def _update(self, change):
+        # Runs change(state) on the state file under the process and file locks
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self.lock, open(self.path, "a+") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    state = json.loads(f.read() or "{}")
+                except ValueError:
+                    state = {}
+                result = change(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                f.flush()
+                return result
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def reserve(self, key, pending):
+        # Next nonce for `key` (chain and address), pending being the node's pending transaction count
+        def change(state):
+            entry = state.setdefault(key, {"next": pending, "free": [], "updated": 0})
+            if entry["next"] > pending and time.time() - entry["updated"] > STALE_AFTER:
+                entry["next"], entry["free"] = pending, []
+            free = sorted(nonce for nonce in entry["free"] if nonce >= pending)
+            nonce = free.pop(0) if free else max(entry["next"], pending)
+            entry["free"] = free
+            entry["next"] = max(entry["next"], nonce + 1)
+            entry["updated"] = time.time()
+            return nonce
+        return self._update(change)
+
+    def release(self, key, nonce, pending):
+        # Gives back a nonce whose transaction the node never received
+        def change(state):
+            entry = state.get(key)
+            if entry is None or nonce < pending:
+                return
+            if nonce + 1 == entry["next"]:
+                entry["next"] = nonce
+            elif nonce not in entry["free"]:
+                entry["free"].append(nonce)
+        self._update(change)
+
+    def reset(self):
+        self._update(lambda state: state.clear())
+
+    def state(self):
+        return self._update(lambda state: dict(state))
+
+
+allocator = NonceAllocator()
+
+
+def _with_local_nonce(transact):
+    @functools.wraps(transact)
+    def wrapper(self, transaction, out_f):
+        if getattr(self, "w3", None) is None:
+            return transact(self, transaction, out_f)
+        address = self.get_address()
+        key = f"{self.w3.eth.chain_id}:{address.lower()}"
+        nonce = allocator.reserve(key, self.w3.eth.get_transaction_count(address, "pending"))
+        transaction["nonce"] = nonce
+        print(f"{NONCE_MARKER} {nonce}", file=out_f, flush=True)
+        try:
+            return transact(self, transaction, out_f)
+        except BaseException:
+            try:
+                allocator.release(key, nonce, self.w3.eth.get_transaction_count(address, "pending"))
+            except Exception:
+                pass
+            raise
+    wrapper.local_nonce = True
+    return wrapper
+
+
+def _announcing_hash(wait_for_receipt):
+    # The CLI sends the transaction and waits for its receipt without ever printing the hash
+    @functools.wraps(wait_for_receipt)
+    def wrapper(txn_hash, w3):
+        tx_hash = txn_hash if isinstance(txn_hash, str) else bytes(txn_hash).hex()
+        print(f"{TX_HASH_MARKER} 0x{tx_hash.removeprefix('0x')}", file=sys.stderr, flush=True)
+        return wait_for_receipt(txn_hash, w3)
+    wrapper.announces_hash = True
+    return wrapper
+
+
+def install():
+    # Wraps transact() of every identity provider of the loaded snet CLI, and the receipt wait
+    # they all end in
+    from snet.cli import identity
+    if not getattr(identity.send_and_wait_for_transaction_receipt, "announces_hash", False):
+        identity.send_and_wait_for_transaction_receipt = _announcing_hash(identity.send_and_wait_for_transaction_receipt)
+    providers = list(identity.IdentityProvider.__subclasses__())
+    while providers:
+        provider = providers.pop()
+        providers.extend(provider.__subclasses__())
+        if "transact" in vars(provider) and not getattr(provider.transact, "local_nonce", False):
+            provider.transact = _with_local_nonce(provider.transact)
+
+
+def main():
+    if "--reset" in sys.argv[1:]:
+        allocator.reset()
+        print("Nonce allocator reset")
+        return 0
+    state = allocator.state()
+    if not state:
+        print("No nonces allocated")
+    for key, entry in state.items():
+        free = f", free {entry['free']}" if entry["free"] else ""
+        print(f"{key}: next {entry['next']}{free}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import back.backend as be
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Compares a cold `snet` spawn per command against the pre-warmed fork server.
+# Usage: python application/benchmark.py [ROUNDS]
+#
+# With `startup` it checks the TUI's import-time budget instead, and exits with 1 if it is exceeded.
+# Usage: python application/benchmark.py startup [ROUNDS]
+
+BENCHMARKS = {
+    "check_cli": be.check_cli,
+    "identity_check": be.identity_check,
+    "wallet_dict_create": be.wallet_dict_create,
+}
+
+def run_mode(mode, rounds):
+    be.exec_mode = mode
+    # Every round has to run the command, not read the previous round's output from the cache
+    be.cache_enabled = False
+    be.engine.configure(be.pool_size, mode == "fork", be.recycle_after)
+    if mode != "subprocess":
+        # Pay for the CLI import once, outside of the measurements
+        be.check_cli()
+
+    timings = {}
+    for name, func in BENCHMARKS.items():
+        samples = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+        timings[name] = samples
+    return timings
+
+# Seconds allowed for importing app.frontend, which is all the welcome screen needs. The sections'
+# modules and the image libraries must not be imported by then. tests/test_startup.py checks both.
+STARTUP_BUDGET = 0.35
+LAZY_MODULES = ["app.account", "app.organization", "app.services", "app.client", "app.custom", "PIL", "rich_pixels"]
+
+STARTUP_PROBE = f"""
+import sys, time
+start = time.perf_counter()
+import app.frontend
+print(time.perf_counter() - start)
+print(",".join(name for name in {LAZY_MODULES!r} if name in sys.modules))
+"""
+
+def check_startup(rounds):
+    # Every round is a fresh interpreter, nothing is imported yet
+    samples = []
+    eager = set()
+    for _ in range(rounds):
+        result = subprocess.run([sys.executable, "-c", STARTUP_PROBE], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True)
+        if result.returncode != 0:
+            print(result.stderr)
+            return 1
+        elapsed, imported = result.stdout.strip().split("\n") + [""] * (2 - len(result.stdout.strip().split("\n")))
+        samples.append(float(elapsed))
+        eager.update(filter(None, imported.split(",")))
+    median = statistics.median(samples)
+    print(f"import app.frontend: {median:.3f}s median of {rounds}, budget {STARTUP_BUDGET:.3f}s")
+    if eager:
+        print(f"Imported at startup, should be lazy: {', '.join(sorted(eager))}")
+    return 1 if median > STARTUP_BUDGET or eager else 0
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "startup":
+        sys.exit(check_startup(int(sys.argv[2]) if len(sys.argv) > 2 else 5))
+
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    results = {mode: run_mode(mode, rounds) for mode in ("subprocess", "fork")}
+
+    print(f"{'command':<20} {'cold spawn (s)':>16} {'warm fork (s)':>16} {'speedup':>9}")
+    for name in BENCHMARKS:
+        cold = statistics.median(results["subprocess"][name])
+        warm = statistics.median(results["fork"][name])
+        speedup = cold / warm if warm > 0 else float("inf")
+        print(f"{name:<20} {cold:>16.3f} {warm:>16.3f} {speedup:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,9 @@
+import sys
+import app.profiling as profiling
 import app.frontend as frontend
 
+if profiling.ENABLED or "--profile" in sys.argv[1:]:
+    profiling.enable()
+
 if __name__ == "__main__":
-    frontend.Singularity_Net_TUI().run()
\ No newline at end of file
+    frontend.Singularity_Net_TUI().run()
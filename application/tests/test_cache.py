@@ -0,0 +1,75 @@
+import pytest
+import back.backend as be
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    # Empty cache, a fixed session, and a clock the test moves
+    clock = [100.0]
+    monkeypatch.setattr(be, "cache_enabled", True)
+    monkeypatch.setattr(be, "_cache", {})
+    monkeypatch.setattr(be, "_session_config", lambda: {"identity": "alice", "network": "sepolia"})
+    monkeypatch.setattr(be.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_cache_key_of_reads(cache):
+    key, ttl = be._cache_key("snet account balance --wallet-index 1")
+    assert key == (("account", "balance", "--wallet-index", "1"), None, "alice", "sepolia", "default", None)
+    assert ttl == be.CACHE_TTLS[("account", "balance")]
+
+
+def test_cache_key_ignores_print_traceback(cache):
+    assert be._cache_key("snet --print-traceback organization list", "/tmp") == be._cache_key("snet organization list", "/tmp")
+    assert be._cache_key("snet organization list", "/tmp") != be._cache_key("snet organization list")
+
+
+@pytest.mark.parametrize("name, value", [("identity", "bob"), ("network", "mainnet"), ("current_registry_at", "0x1"), ("current_multipartyescrow_at", "0x2")])
+def test_cache_key_per_session(cache, monkeypatch, name, value):
+    key, _ = be._cache_key("snet organization list")
+    session = {"identity": "alice", "network": "sepolia", name: value}
+    monkeypatch.setattr(be, "_session_config", lambda: session)
+    assert be._cache_key("snet organization list")[0] != key
+
+
+@pytest.mark.parametrize("command", ["snet account deposit 1 --yes", "snet client call org svc group method {}", "ls -la", "snet"])
+def test_no_cache_key_for_other_commands(cache, command):
+    assert be._cache_key(command) == (None, None)
+
+
+def test_read_is_reused_until_its_ttl(cache):
+    be.remember_output("snet account balance", None, "AGIX: 1", 0)
+    cache[0] += be.CACHE_TTLS[("account", "balance")]
+    assert be.cached_output("snet account balance") == "AGIX: 1"
+    cache[0] += 0.1
+    assert be.cached_output("snet account balance") is None
+
+
+def test_failed_read_is_not_kept(cache):
+    be.remember_output("snet account balance", None, "Error", 1)
+    assert be.cached_output("snet account balance") is None
+
+
+def test_state_change_drops_the_cache(cache):
+    be.remember_output("snet account balance", None, "AGIX: 1", 0)
+    be.remember_output("snet account deposit 1", None, "done", 0)
+    assert be.cached_output("snet account balance") is None
+
+
+@pytest.mark.parametrize("command", ["snet set current_registry_at 0x1", "snet unset current_multipartyescrow_at", "snet network sepolia"])
+def test_session_change_drops_the_cache(cache, command):
+    be.remember_output("snet organization list", None, "org", 0)
+    be.remember_output(command, None, "", 0)
+    assert be.cached_output("snet organization list") is None
+
+
+def test_failed_state_change_keeps_the_cache(cache):
+    be.remember_output("snet account balance", None, "AGIX: 1", 0)
+    be.remember_output("snet account deposit 1", None, "reverted", 1)
+    assert be.cached_output("snet account balance") == "AGIX: 1"
+
+
+def test_cache_disabled(cache, monkeypatch):
+    monkeypatch.setattr(be, "cache_enabled", False)
+    be.remember_output("snet account balance", None, "AGIX: 1", 0)
+    assert be.cached_output("snet account balance") is None
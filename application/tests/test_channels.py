@@ -0,0 +1,60 @@
+import decimal
+import back.backend as be
+
+FULL_OUTPUT = """#organization_id service_id group_name channel_id nonce value(AGIX) expiration(blocks)
+snet default_group 12 0 1.5 19000000
+my-org my group 7 3 0.00000001 18500000
+"""
+
+ONLY_ID_OUTPUT = """#organization_id group_name channel_id
+snet default_group 12
+my-org my group 7
+"""
+
+
+def test_parse_full_rows():
+    channels = be.parse_initialized_channels(FULL_OUTPUT)
+    assert [channel.row() for channel in channels] == [
+        (12, "snet", "default_group", 0, decimal.Decimal("1.5"), 19000000),
+        (7, "my-org", "my group", 3, decimal.Decimal("0.00000001"), 18500000)
+    ]
+
+
+def test_parse_only_id_rows():
+    channels = be.parse_initialized_channels(ONLY_ID_OUTPUT)
+    assert [(channel.channel_id, channel.org_id, channel.group_name) for channel in channels] == [(12, "snet", "default_group"), (7, "my-org", "my group")]
+    assert all(channel.nonce is None and channel.value is None and channel.expiration is None for channel in channels)
+
+
+def test_parse_skips_unreadable_rows():
+    output = FULL_OUTPUT + "snet default_group twelve 0 1.5 19000000\nsnet default_group 13 0 lots 19000000\nshort row\n"
+    assert [channel.channel_id for channel in be.parse_initialized_channels(output)] == [12, 7]
+
+
+def test_parse_without_header():
+    # Rows are only read once the header says which format they are in
+    assert be.parse_initialized_channels("snet default_group 12 0 1.5 19000000\n") == []
+    assert be.parse_initialized_channels("") == []
+
+
+def test_filter_channels():
+    channels = be.parse_initialized_channels(FULL_OUTPUT)
+    assert be.filter_channels(channels, "  ") == channels
+    assert [channel.channel_id for channel in be.filter_channels(channels, "MY ")] == [7]
+    assert [channel.channel_id for channel in be.filter_channels(channels, "12")] == [12]
+    assert [channel.channel_id for channel in be.filter_channels(channels, "default")] == [12]
+    assert be.filter_channels(channels, "nothing") == []
+
+
+def test_format_channel_records():
+    lines = be.format_channel_records(be.parse_initialized_channels(ONLY_ID_OUTPUT)).split("\n")
+    assert lines[0] == "Channel ID | Organization | Group        "
+    assert set(lines[1]) == {"-"} and len(lines[1]) == len(lines[0])
+    assert lines[2:] == ["12         | snet         | default_group", "7          | my-org       | my group     "]
+    assert be.format_channel_records([]) == "No initialized channels"
+
+
+def test_format_initialized_channels_passes_errors_through():
+    assert be.format_initialized_channels("Error: no identity", 1) == "Error: no identity"
+    assert be.format_initialized_channels("no channels\n", 0) == "no channels\n"
+    assert be.format_initialized_channels(FULL_OUTPUT, 0).startswith("Channel ID | Organization | Group         | Nonce")
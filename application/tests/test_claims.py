@@ -0,0 +1,18 @@
+import pytest
+import back.backend as be
+
+
+@pytest.mark.parametrize("batch_size, valid", [
+    (None, True),
+    ("", True),
+    ("1", True),
+    ("50", True),
+    ("0", False),
+    ("-5", False),
+    ("2.5", False),
+    ("ten", False),
+    (" 5", False),
+    ("²", False)
+])
+def test_valid_batch_size(batch_size, valid):
+    assert be.valid_batch_size(batch_size) == valid
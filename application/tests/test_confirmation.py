@@ -0,0 +1,46 @@
+import sys
+import pytest
+import back.backend as be
+import back.durations as durations
+
+# A CLI that asks once per transaction, like `account deposit` with an approve first
+TWO_QUESTIONS = """
+for name in ("approve", "deposit"):
+    print(f"{name} transaction")
+    if input("Proceed? (y/n): ") != "y":
+        print("Cancelled")
+        raise SystemExit(0)
+    print(f"{name} sent")
+"""
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    monkeypatch.setattr(be, "exec_mode", "subprocess")
+    monkeypatch.setattr(be, "cache_enabled", False)
+    monkeypatch.setattr(be, "command_durations", durations.DurationHistograms(str(tmp_path / "durations.db")))
+    script = tmp_path / "fake_cli.py"
+    script.write_text(TWO_QUESTIONS)
+    return f"{sys.executable} {script}"
+
+
+def test_every_question_is_answered(cli):
+    output, errCode = be.run_confirmable(cli)
+    assert (output, errCode) == ("approve transaction\nProceed? (y/n): ", 0)
+    output, errCode = be.confirm_command(cli)
+    assert errCode == 0
+    assert output == "approve sent\ndeposit transaction\nProceed? (y/n): deposit sent\n"
+    assert be.get_job(max(job.id for job in be.list_jobs())).return_code == 0
+
+
+def test_declined_command_stops(cli):
+    be.run_confirmable(cli)
+    assert be.confirm_command(cli, False) == ("Cancelled\n", 0)
+
+
+def test_command_without_question_is_not_kept(cli, tmp_path):
+    script = tmp_path / "view.py"
+    script.write_text("print('balance 1')")
+    command = f"{sys.executable} {script}"
+    assert be.run_confirmable(command) == ("balance 1\n", 0)
+    assert be.pending_confirmation(None) is None
@@ -0,0 +1,72 @@
+import pytest
+import back.durations as durations
+
+
+@pytest.mark.parametrize("command, family", [
+    ("snet account balance --wallet-index 0", "account balance"),
+    ("snet --print-traceback client call org svc group method params.json", "client call"),
+    ("python batch_claim.py --chunk-size 50 treasurer claim-all --endpoint http://x", "treasurer claim-all"),
+    ("task account_info", "task"),
+    ("", "other")
+])
+def test_command_family(command, family):
+    assert durations.command_family(command) == family
+
+
+def test_bucket_index():
+    assert durations.bucket_index(0) == 0
+    assert durations.bucket_index(0.25) == 0
+    assert durations.bucket_index(0.26) == 1
+    assert durations.bucket_index(durations.BUCKETS[-1]) == len(durations.BUCKETS) - 1
+    assert durations.bucket_index(durations.BUCKETS[-1] + 1) == len(durations.BUCKETS)
+
+
+def counts(*seconds):
+    result = [0] * (len(durations.BUCKETS) + 1)
+    for value in seconds:
+        result[durations.bucket_index(value)] += 1
+    return result
+
+
+def test_percentile_interpolates_within_the_bucket():
+    # Four runs in the (1, 2] bucket, the median is half way through it
+    assert durations.percentile(counts(1.5, 1.5, 1.5, 1.5), 0.5) == pytest.approx(1.5)
+    assert durations.percentile(counts(1.5, 1.5, 1.5, 1.5), 0.9) == pytest.approx(1.9)
+
+
+def test_percentile_across_buckets():
+    runs = counts(0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 4, 4)
+    assert durations.percentile(runs, 0.5) == pytest.approx(0.25 * 5 / 8)
+    assert durations.percentile(runs, 0.9) == pytest.approx(3 + 2 * 1 / 2)
+
+
+def test_percentile_of_the_overflow_bucket():
+    assert durations.percentile(counts(5000), 0.5) == durations.BUCKETS[-1]
+    assert durations.percentile(counts(), 0.5) == durations.BUCKETS[-1]
+
+
+def test_estimate_needs_min_samples(tmp_path):
+    histograms = durations.DurationHistograms(str(tmp_path / "durations.db"))
+    for _ in range(durations.MIN_SAMPLES - 1):
+        histograms.record("account balance", "sepolia", 1.5)
+    assert histograms.estimate("account balance", "sepolia") is None
+    histograms.record("account balance", "sepolia", 1.5)
+    p50, p90, runs = histograms.estimate("account balance", "sepolia")
+    assert (p50, p90, runs) == (pytest.approx(1.5), pytest.approx(1.9), durations.MIN_SAMPLES)
+    assert histograms.estimate("account balance", "mainnet") is None
+
+
+def test_rows_and_reset(tmp_path):
+    histograms = durations.DurationHistograms(str(tmp_path / "durations.db"))
+    histograms.record("client call", "mainnet", 2)
+    histograms.record("client call", "mainnet", 4)
+    family, network, runs, mean, _, _ = histograms.rows()[0]
+    assert (family, network, runs, mean) == ("client call", "mainnet", 2, 3)
+    histograms.reset()
+    assert histograms.rows() == []
+
+
+def test_format_seconds():
+    assert durations.format_seconds(1.23) == "1.2s"
+    assert durations.format_seconds(42.4) == "42s"
+    assert durations.format_seconds(300) == "5 minutes"
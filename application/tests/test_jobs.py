@@ -0,0 +1,20 @@
+import pytest
+import back.jobs as jobs
+
+
+@pytest.mark.parametrize("command, redacted", [
+    ("snet identity create me key --network sepolia --private-key 0xabc123", "snet identity create me key --network sepolia --private-key ***"),
+    ("snet identity create me mnemonic --network sepolia --mnemonic word one two three", "snet identity create me mnemonic --network sepolia --mnemonic ***"),
+    ("snet identity create me mnemonic --mnemonic 'word one two' --network sepolia", "snet identity create me mnemonic --mnemonic *** --network sepolia"),
+    ("snet identity create me key --private-key=0xabc --network sepolia", "snet identity create me key --private-key=*** --network sepolia"),
+    ("snet account balance --wallet-index 0", "snet account balance --wallet-index 0")
+])
+def test_secrets_are_redacted(command, redacted):
+    assert jobs.redact(command) == redacted
+
+
+def test_job_keeps_the_redacted_command():
+    registry = jobs.JobRegistry()
+    job = registry.start("snet identity create me key --private-key 0xabc123")
+    assert "0xabc123" not in job.command
+    assert "0xabc123" not in repr(job)
@@ -0,0 +1,133 @@
+import pytest
+
+pytest.importorskip("eth_abi")
+from eth_abi import encode
+import back.registry as registry
+
+
+class StubReader(registry.RegistryReader):
+    # Answers the JSON-RPC requests from `answer(request)` instead of a node, and keeps every payload
+    def __init__(self, answer, batch_size=registry.BATCH_SIZE):
+        super().__init__("http://node", "0x" + "11" * 20, batch_size)
+        self.answer = answer
+        self.payloads = []
+
+    def _post(self, payload):
+        self.payloads.append(payload)
+        if isinstance(payload, list):
+            return [self.answer(request) for request in payload]
+        return self.answer(payload)
+
+
+def echo(request):
+    # The result of an eth_call is its calldata
+    return {"jsonrpc": "2.0", "id": request["id"], "result": request["params"][0]["data"]}
+
+
+def test_eth_call_batch_splits_into_batches():
+    reader = StubReader(echo, batch_size=2)
+    calls = [bytes([i]) for i in range(5)]
+    assert reader.call_batch(calls, 7) == calls
+    assert [len(payload) for payload in reader.payloads] == [2, 2, 1]
+    assert {request["params"][1] for payload in reader.payloads for request in payload} == {"0x7"}
+    assert all(request["params"][0]["to"] == reader.registry_address for payload in reader.payloads for request in payload)
+
+
+def test_eth_call_batch_maps_responses_by_id():
+    reader = StubReader(echo)
+    post = reader._post
+    # Nodes may answer a batch in any order
+    reader._post = lambda payload: list(reversed(post(payload)))
+    calls = [b"a", b"b", b"c"]
+    assert reader.call_batch(calls) == calls
+
+
+def test_eth_call_batch_error_object():
+    def answer(request):
+        if request["params"][0]["data"] == "0x02":
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": "execution reverted"}}
+        return echo(request)
+    with pytest.raises(registry.RegistryError, match="execution reverted"):
+        StubReader(answer).call_batch([b"\x01", b"\x02"])
+
+
+def test_eth_call_batch_missing_response():
+    reader = StubReader(echo)
+    post = reader._post
+    reader._post = lambda payload: post(payload)[1:]
+    with pytest.raises(registry.RegistryError):
+        reader.call_batch([b"a", b"b"])
+
+
+def test_eth_call_batch_without_batch_support():
+    reader = StubReader(echo)
+    reader._post = lambda payload: {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch not supported"}}
+    with pytest.raises(registry.RegistryError, match="batch not supported"):
+        reader.call_batch([b"a"])
+
+
+def bytes32(text):
+    return text.encode("utf-8").ljust(32, b"\0")
+
+
+ORGANIZATIONS = {
+    bytes32("snet"): (True, b"ipfs://snet", ["example-service", "translation"]),
+    bytes32("gone"): (False, b"", []),
+    bytes32("empty-org"): (True, b"ipfs://empty", [])
+}
+
+
+def registry_node(request):
+    if request["method"] == "eth_blockNumber":
+        return {"jsonrpc": "2.0", "id": request["id"], "result": "0x10"}
+    data = bytes.fromhex(request["params"][0]["data"][2:])
+    selector, argument = data[:4], data[4:]
+    if selector == registry.LIST_ORGANIZATIONS:
+        result = encode(["bytes32[]"], [list(ORGANIZATIONS)])
+    else:
+        assert selector == registry.GET_ORGANIZATION
+        found, metadata_uri, services = ORGANIZATIONS[argument]
+        owner = "0x" + "22" * 20
+        result = encode(registry.ORGANIZATION_TYPES, [found, argument, metadata_uri, owner, [owner], [bytes32(service) for service in services]])
+    return {"jsonrpc": "2.0", "id": request["id"], "result": "0x" + result.hex()}
+
+
+def test_organizations():
+    reader = StubReader(registry_node)
+    organizations = reader.organizations()
+    assert list(organizations) == ["snet", "empty-org"]
+    assert organizations["snet"][1] == ["example-service", "translation"]
+    assert organizations["empty-org"][1] == []
+    assert len(organizations["snet"][0]) == 40
+    # Every call of the listing is made against the block it started at
+    assert {request["params"][1] for payload in reader.payloads if isinstance(payload, list) for request in payload} == {"0x10"}
+
+
+def test_fingerprint_follows_the_entry():
+    first = StubReader(registry_node).organizations()
+    ORGANIZATIONS[bytes32("snet")] = (True, b"ipfs://snet-v2", ["example-service", "translation"])
+    try:
+        second = StubReader(registry_node).organizations()
+    finally:
+        ORGANIZATIONS[bytes32("snet")] = (True, b"ipfs://snet", ["example-service", "translation"])
+    assert first["snet"][0] != second["snet"][0]
+    assert first["empty-org"] == second["empty-org"]
+
+
+def test_fallback_reason_is_recorded(monkeypatch):
+    import back.backend as be
+
+    def unreachable(request):
+        raise registry.RegistryError("RPC request to http://node failed: timed out")
+    notified = []
+    monkeypatch.setattr(be, "registry_reader", lambda: StubReader(unreachable))
+    monkeypatch.setattr(be, "notify", lambda message, severity="information": notified.append(severity))
+    monkeypatch.setattr(be, "registry_fallback_reason", None)
+    assert be.read_registry_organizations() is None
+    assert be.read_registry_organizations() is None
+    assert be.registry_fallback_reason == "RegistryError: RPC request to http://node failed: timed out"
+    assert notified == ["warning"]
+
+    monkeypatch.setattr(be, "registry_reader", lambda: StubReader(registry_node))
+    assert list(be.read_registry_organizations()) == ["snet", "empty-org"]
+    assert be.registry_fallback_reason is None
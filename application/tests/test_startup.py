@@ -0,0 +1,27 @@
+import os
+import statistics
+import subprocess
+import sys
+import benchmark
+
+APPLICATION_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUNDS = 3
+
+
+def import_frontend():
+    # (seconds, modules of LAZY_MODULES imported) of `import app.frontend` in a fresh interpreter
+    result = subprocess.run([sys.executable, "-c", benchmark.STARTUP_PROBE], cwd=APPLICATION_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    elapsed, imported = (result.stdout.split("\n") + [""])[:2]
+    return float(elapsed), set(filter(None, imported.split(",")))
+
+
+def test_startup_budget():
+    samples = [import_frontend() for _ in range(ROUNDS)]
+    assert statistics.median(seconds for seconds, _ in samples) <= benchmark.STARTUP_BUDGET
+
+
+def test_sections_and_images_are_lazy():
+    _, imported = import_frontend()
+    assert imported == set()
+    assert {"app.account", "app.client", "app.services", "app.organization", "app.custom", "PIL", "rich_pixels"} <= set(benchmark.LAZY_MODULES)
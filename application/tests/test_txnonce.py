@@ -0,0 +1,67 @@
+import pytest
+import back.txnonce as txnonce
+
+KEY = "11155111:0xabc"
+
+
+@pytest.fixture
+def allocator(tmp_path):
+    return txnonce.NonceAllocator(str(tmp_path / "nonces.json"))
+
+
+def test_consecutive_nonces_before_any_is_mined(allocator):
+    assert [allocator.reserve(KEY, 5) for _ in range(3)] == [5, 6, 7]
+
+
+def test_starts_from_the_pending_count(allocator):
+    assert allocator.reserve(KEY, 5) == 5
+    # Transactions sent by another wallet moved the account past the allocator
+    assert allocator.reserve(KEY, 9) == 9
+    assert allocator.reserve(KEY, 9) == 10
+
+
+def test_released_nonce_is_reused(allocator):
+    first, second, third = (allocator.reserve(KEY, 0) for _ in range(3))
+    allocator.release(KEY, second, 0)
+    assert allocator.reserve(KEY, 0) == second
+    assert allocator.reserve(KEY, 0) == third + 1
+
+
+def test_releasing_the_last_nonce_moves_next_back(allocator):
+    allocator.reserve(KEY, 0)
+    last = allocator.reserve(KEY, 0)
+    allocator.release(KEY, last, 0)
+    assert allocator.state()[KEY]["free"] == []
+    assert allocator.reserve(KEY, 0) == last
+
+
+def test_released_nonces_below_the_pending_count_are_ignored(allocator):
+    for _ in range(3):
+        allocator.reserve(KEY, 0)
+    allocator.release(KEY, 1, 2)
+    assert allocator.state()[KEY]["free"] == []
+    assert allocator.reserve(KEY, 2) == 3
+
+
+def test_stale_gap_is_closed(allocator, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(txnonce.time, "time", lambda: now)
+    for _ in range(3):
+        allocator.reserve(KEY, 0)
+    # A process died holding nonces 1 and 2, only 0 reached the node
+    assert allocator.reserve(KEY, 1) == 3
+    now += txnonce.STALE_AFTER + 1
+    assert allocator.reserve(KEY, 1) == 1
+
+
+def test_accounts_are_independent(allocator):
+    allocator.reserve(KEY, 4)
+    assert allocator.reserve("1:0xdef", 0) == 0
+    assert allocator.reserve(KEY, 4) == 5
+
+
+def test_state_survives_a_new_allocator(allocator):
+    allocator.reserve(KEY, 7)
+    assert txnonce.NonceAllocator(allocator.path).reserve(KEY, 7) == 8
+    allocator.reset()
+    assert allocator.state() == {}